@@ -296,6 +296,17 @@ class Configuration(object):
                            * mysql
                            * sqlite
 
+    :cvar str RAMSTK_SQLITE_PROFILE: The performance profile used for SQLite
+                                     databases.  Options are:
+
+                                     * default - SQLite's own settings.
+                                     * safe - rollback journal with full
+                                              synchronization.
+                                     * performance - WAL journal with
+                                                     normal synchronization
+                                                     and larger caches.
+
+                                     Default value is *performance*.
     :cvar str RAMSTK_LOCALE: The language locale to use with RAMSTK.  Default value
                           is *en_US*.
     :cvar str RAMSTK_OS: The operating system RAMSTK is currently running on.
@@ -362,6 +373,7 @@ class Configuration(object):
     RAMSTK_MODE_SOURCE = 1  # 1=FMD-97
     RAMSTK_COM_BACKEND = ''
     RAMSTK_BACKEND = ''
+    RAMSTK_SQLITE_PROFILE = 'performance'
     RAMSTK_REPORT_SIZE = 'letter'
     RAMSTK_HR_MULTIPLIER = 1000000.0
     RAMSTK_DEC_PLACES = 6
@@ -558,6 +570,7 @@ class Configuration(object):
         _config.set('Backend', 'host', 'localhost')
         _config.set('Backend', 'socket', 3306)
         _config.set('Backend', 'database', '')
+        _config.set('Backend', 'profile', 'performance')
         _config.set('Backend', 'user', '')
         _config.set('Backend', 'password', '')
 
@@ -637,6 +650,12 @@ class Configuration(object):
             self.RAMSTK_PROG_INFO['user'] = _config.get('Backend', 'user')
             self.RAMSTK_PROG_INFO['password'] = _config.get(
                 'Backend', 'password')
+            # Configuration files written before the SQLite performance
+            # profile was added use the performance profile.
+            try:
+                self.RAMSTK_SQLITE_PROFILE = _config.get('Backend', 'profile')
+            except ConfigParser.NoOptionError:
+                pass
 
             self.RAMSTK_DATA_DIR = _config.get('Directories', 'datadir')
             self.RAMSTK_ICON_DIR = _config.get('Directories', 'icondir')
@@ -730,6 +749,7 @@ class Configuration(object):
             _config.set('Backend', 'user', self.RAMSTK_PROG_INFO['user'])
             _config.set('Backend', 'password',
                         self.RAMSTK_PROG_INFO['password'])
+            _config.set('Backend', 'profile', self.RAMSTK_SQLITE_PROFILE)
 
             _config.add_section('Directories')
             _config.set('Directories', 'datadir', self.RAMSTK_DATA_DIR)
@@ -208,20 +208,30 @@ class Model(object):
 
         return _error_code, _msg
 
-    def do_open_program(self, database):
+    def do_open_program(self, database, **kwargs):
         """
         Open an RAMSTK Program database for analyses.
 
         :param str database: the RFC1738 URL path to the database to connect
                              with.
+        :keyword str profile: the name of the SQLite performance profile to
+                              use.  Default is the profile in the RAMSTK
+                              configuration.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
+        try:
+            _profile = kwargs['profile']
+        except KeyError:
+            _profile = RAMSTK.RAMSTK_CONFIGURATION.RAMSTK_SQLITE_PROFILE
         _error_code = 0
         _msg = 'RAMSTK SUCCESS: Opening RAMSTK Program database {0:s}.'.\
             format(database)
 
-        if not self.program_dao.db_connect(database):
+        if not self.program_dao.db_connect(database, profile=_profile):
+            # Databases created by older versions of RAMSTK don't have the
+            # indexes the data models use to load their trees.
+            self.program_dao.db_create_indexes()
             program_session = self.program_dao.RAMSTK_SESSION
             program_session.configure(
                 bind=self.program_dao.engine,
@@ -630,7 +640,8 @@ class RAMSTK(object):
                         ':///' + \
                         self.RAMSTK_CONFIGURATION.RAMSTK_COM_INFO['database']
         _dao = DAO()
-        _dao.db_connect(_database)
+        _dao.db_connect(
+            _database, profile=self.RAMSTK_CONFIGURATION.RAMSTK_SQLITE_PROFILE)
 
         # Create an instance of the RAMSTK Data Model and load global constants.
         self.ramstk_model = Model(_dao, DAO())
@@ -736,7 +747,9 @@ class RAMSTK(object):
 
         # If the database was successfully opened, create an instance of each
         # of the slave data controllers.
-        _error_code, _msg = self.ramstk_model.do_open_program(_database)
+        _error_code, _msg = self.ramstk_model.do_open_program(
+            _database,
+            profile=self.RAMSTK_CONFIGURATION.RAMSTK_SQLITE_PROFILE)
         if _error_code == 0:
             pub.sendMessage('requestOpen')
             self.dic_controllers['revision'] = dtcRevision(
@@ -15,6 +15,356 @@ from . import (Capacitor, Connection, Crystal, Filter, Fuse, Inductor,
 
 _ = gettext.gettext
 
+# Constants used in the dormant hazard rate calculations.
+# First key is the category ID; second key is the active environment ID;
+# third key is the dormant environment ID.
+_dic_hr_dormant = {
+    1: {
+        1: {
+            2: 0.08
+        },
+        2: {
+            2: 0.08
+        },
+        3: {
+            2: 0.08
+        },
+        4: {
+            2: 0.05,
+            3: 0.06
+        },
+        5: {
+            2: 0.05,
+            3: 0.06
+        },
+        6: {
+            1: 0.06,
+            2: 0.04
+        },
+        7: {
+            1: 0.06,
+            2: 0.04
+        },
+        8: {
+            1: 0.06,
+            2: 0.04
+        },
+        9: {
+            1: 0.06,
+            2: 0.04
+        },
+        10: {
+            1: 0.06,
+            2: 0.04
+        },
+        11: {
+            2: 0.3,
+            4: 0.1
+        }
+    },
+    2: {
+        1: {
+            2: [0.04, 0.05]
+        },
+        2: {
+            2: [0.04, 0.05]
+        },
+        3: {
+            2: [0.04, 0.05]
+        },
+        4: {
+            2: [0.03, 0.03],
+            3: [0.04, 0.05]
+        },
+        5: {
+            2: [0.03, 0.03],
+            3: [0.04, 0.05]
+        },
+        6: {
+            1: [0.05, 0.06],
+            2: [0.01, 0.02]
+        },
+        7: {
+            1: [0.05, 0.06],
+            2: [0.01, 0.02]
+        },
+        8: {
+            1: [0.05, 0.06],
+            2: [0.01, 0.02]
+        },
+        9: {
+            1: [0.05, 0.06],
+            2: [0.01, 0.02]
+        },
+        10: {
+            1: [0.05, 0.06],
+            2: [0.01, 0.02]
+        },
+        11: {
+            2: [0.8, 1.0],
+            4: [0.2, 0.2]
+        }
+    },
+    3: {
+        1: {
+            2: 0.2
+        },
+        2: {
+            2: 0.2
+        },
+        3: {
+            2: 0.2
+        },
+        4: {
+            2: 0.06,
+            3: 0.1
+        },
+        5: {
+            2: 0.06,
+            3: 0.1
+        },
+        6: {
+            1: 0.06,
+            2: 0.2
+        },
+        7: {
+            1: 0.06,
+            2: 0.2
+        },
+        8: {
+            1: 0.06,
+            2: 0.2
+        },
+        9: {
+            1: 0.06,
+            2: 0.2
+        },
+        10: {
+            1: 0.06,
+            2: 0.2
+        },
+        11: {
+            2: 1.0,
+            4: 0.5
+        }
+    },
+    4: {
+        1: {
+            2: 0.1
+        },
+        2: {
+            2: 0.1
+        },
+        3: {
+            2: 0.1
+        },
+        4: {
+            2: 0.04,
+            3: 0.1
+        },
+        5: {
+            2: 0.04,
+            3: 0.1
+        },
+        6: {
+            1: 0.1,
+            2: 0.03
+        },
+        7: {
+            1: 0.1,
+            2: 0.03
+        },
+        8: {
+            1: 0.1,
+            2: 0.03
+        },
+        9: {
+            1: 0.1,
+            2: 0.03
+        },
+        10: {
+            1: 0.1,
+            2: 0.03
+        },
+        11: {
+            2: 0.4,
+            4: 0.2
+        }
+    },
+    5: {
+        1: {
+            2: 0.2
+        },
+        2: {
+            2: 0.2
+        },
+        3: {
+            2: 0.2
+        },
+        4: {
+            2: 0.3,
+            3: 0.3
+        },
+        5: {
+            2: 0.3,
+            3: 0.3
+        },
+        6: {
+            1: 0.2,
+            2: 0.2
+        },
+        7: {
+            1: 0.2,
+            2: 0.2
+        },
+        8: {
+            1: 0.2,
+            2: 0.2
+        },
+        9: {
+            1: 0.2,
+            2: 0.2
+        },
+        10: {
+            1: 0.2,
+            2: 0.2
+        },
+        11: {
+            2: 1.0,
+            4: 0.5
+        }
+    },
+    6: {
+        1: {
+            2: 0.2
+        },
+        2: {
+            2: 0.2
+        },
+        3: {
+            2: 0.2
+        },
+        4: {
+            2: 0.08,
+            3: 0.3
+        },
+        5: {
+            2: 0.08,
+            3: 0.3
+        },
+        6: {
+            1: 0.2,
+            2: 0.04
+        },
+        7: {
+            1: 0.2,
+            2: 0.04
+        },
+        8: {
+            1: 0.2,
+            2: 0.04
+        },
+        9: {
+            1: 0.2,
+            2: 0.04
+        },
+        10: {
+            1: 0.2,
+            2: 0.04
+        },
+        11: {
+            2: 0.9,
+            4: 0.4
+        }
+    },
+    7: {
+        1: {
+            2: 0.4
+        },
+        2: {
+            2: 0.4
+        },
+        3: {
+            2: 0.4
+        },
+        4: {
+            2: 0.2,
+            3: 0.4
+        },
+        5: {
+            2: 0.2,
+            3: 0.4
+        },
+        6: {
+            1: 0.2,
+            2: 0.1
+        },
+        7: {
+            1: 0.2,
+            2: 0.1
+        },
+        8: {
+            1: 0.2,
+            2: 0.1
+        },
+        9: {
+            1: 0.2,
+            2: 0.1
+        },
+        10: {
+            1: 0.2,
+            2: 0.1
+        },
+        11: {
+            2: 1.0,
+            4: 0.8
+        }
+    },
+    8: {
+        1: {
+            2: 0.005
+        },
+        2: {
+            2: 0.005
+        },
+        3: {
+            2: 0.005
+        },
+        4: {
+            2: 0.003,
+            3: 0.008
+        },
+        5: {
+            2: 0.003,
+            3: 0.008
+        },
+        6: {
+            1: 0.0005,
+            2: 0.003
+        },
+        7: {
+            1: 0.0005,
+            2: 0.003
+        },
+        8: {
+            1: 0.0005,
+            2: 0.003
+        },
+        9: {
+            1: 0.0005,
+            2: 0.003
+        },
+        10: {
+            1: 0.0005,
+            2: 0.003
+        },
+        11: {
+            2: 0.03,
+            4: 0.02
+        }
+    }
+}
+
 
 def calculate(**attributes):
     """
@@ -175,354 +525,6 @@ def do_calculate_dormant_hazard_rate(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # First key is the category ID; second key is the active environment ID;
-    # third key is the dormant environment ID.
-    _dic_hr_dormant = {
-        1: {
-            1: {
-                2: 0.08
-            },
-            2: {
-                2: 0.08
-            },
-            3: {
-                2: 0.08
-            },
-            4: {
-                2: 0.05,
-                3: 0.06
-            },
-            5: {
-                2: 0.05,
-                3: 0.06
-            },
-            6: {
-                1: 0.06,
-                2: 0.04
-            },
-            7: {
-                1: 0.06,
-                2: 0.04
-            },
-            8: {
-                1: 0.06,
-                2: 0.04
-            },
-            9: {
-                1: 0.06,
-                2: 0.04
-            },
-            10: {
-                1: 0.06,
-                2: 0.04
-            },
-            11: {
-                2: 0.3,
-                4: 0.1
-            }
-        },
-        2: {
-            1: {
-                2: [0.04, 0.05]
-            },
-            2: {
-                2: [0.04, 0.05]
-            },
-            3: {
-                2: [0.04, 0.05]
-            },
-            4: {
-                2: [0.03, 0.03],
-                3: [0.04, 0.05]
-            },
-            5: {
-                2: [0.03, 0.03],
-                3: [0.04, 0.05]
-            },
-            6: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            7: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            8: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            9: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            10: {
-                1: [0.05, 0.06],
-                2: [0.01, 0.02]
-            },
-            11: {
-                2: [0.8, 1.0],
-                4: [0.2, 0.2]
-            }
-        },
-        3: {
-            1: {
-                2: 0.2
-            },
-            2: {
-                2: 0.2
-            },
-            3: {
-                2: 0.2
-            },
-            4: {
-                2: 0.06,
-                3: 0.1
-            },
-            5: {
-                2: 0.06,
-                3: 0.1
-            },
-            6: {
-                1: 0.06,
-                2: 0.2
-            },
-            7: {
-                1: 0.06,
-                2: 0.2
-            },
-            8: {
-                1: 0.06,
-                2: 0.2
-            },
-            9: {
-                1: 0.06,
-                2: 0.2
-            },
-            10: {
-                1: 0.06,
-                2: 0.2
-            },
-            11: {
-                2: 1.0,
-                4: 0.5
-            }
-        },
-        4: {
-            1: {
-                2: 0.1
-            },
-            2: {
-                2: 0.1
-            },
-            3: {
-                2: 0.1
-            },
-            4: {
-                2: 0.04,
-                3: 0.1
-            },
-            5: {
-                2: 0.04,
-                3: 0.1
-            },
-            6: {
-                1: 0.1,
-                2: 0.03
-            },
-            7: {
-                1: 0.1,
-                2: 0.03
-            },
-            8: {
-                1: 0.1,
-                2: 0.03
-            },
-            9: {
-                1: 0.1,
-                2: 0.03
-            },
-            10: {
-                1: 0.1,
-                2: 0.03
-            },
-            11: {
-                2: 0.4,
-                4: 0.2
-            }
-        },
-        5: {
-            1: {
-                2: 0.2
-            },
-            2: {
-                2: 0.2
-            },
-            3: {
-                2: 0.2
-            },
-            4: {
-                2: 0.3,
-                3: 0.3
-            },
-            5: {
-                2: 0.3,
-                3: 0.3
-            },
-            6: {
-                1: 0.2,
-                2: 0.2
-            },
-            7: {
-                1: 0.2,
-                2: 0.2
-            },
-            8: {
-                1: 0.2,
-                2: 0.2
-            },
-            9: {
-                1: 0.2,
-                2: 0.2
-            },
-            10: {
-                1: 0.2,
-                2: 0.2
-            },
-            11: {
-                2: 1.0,
-                4: 0.5
-            }
-        },
-        6: {
-            1: {
-                2: 0.2
-            },
-            2: {
-                2: 0.2
-            },
-            3: {
-                2: 0.2
-            },
-            4: {
-                2: 0.08,
-                3: 0.3
-            },
-            5: {
-                2: 0.08,
-                3: 0.3
-            },
-            6: {
-                1: 0.2,
-                2: 0.04
-            },
-            7: {
-                1: 0.2,
-                2: 0.04
-            },
-            8: {
-                1: 0.2,
-                2: 0.04
-            },
-            9: {
-                1: 0.2,
-                2: 0.04
-            },
-            10: {
-                1: 0.2,
-                2: 0.04
-            },
-            11: {
-                2: 0.9,
-                4: 0.4
-            }
-        },
-        7: {
-            1: {
-                2: 0.4
-            },
-            2: {
-                2: 0.4
-            },
-            3: {
-                2: 0.4
-            },
-            4: {
-                2: 0.2,
-                3: 0.4
-            },
-            5: {
-                2: 0.2,
-                3: 0.4
-            },
-            6: {
-                1: 0.2,
-                2: 0.1
-            },
-            7: {
-                1: 0.2,
-                2: 0.1
-            },
-            8: {
-                1: 0.2,
-                2: 0.1
-            },
-            9: {
-                1: 0.2,
-                2: 0.1
-            },
-            10: {
-                1: 0.2,
-                2: 0.1
-            },
-            11: {
-                2: 1.0,
-                4: 0.8
-            }
-        },
-        8: {
-            1: {
-                2: 0.005
-            },
-            2: {
-                2: 0.005
-            },
-            3: {
-                2: 0.005
-            },
-            4: {
-                2: 0.003,
-                3: 0.008
-            },
-            5: {
-                2: 0.003,
-                3: 0.008
-            },
-            6: {
-                1: 0.0005,
-                2: 0.003
-            },
-            7: {
-                1: 0.0005,
-                2: 0.003
-            },
-            8: {
-                1: 0.0005,
-                2: 0.003
-            },
-            9: {
-                1: 0.0005,
-                2: 0.003
-            },
-            10: {
-                1: 0.0005,
-                2: 0.003
-            },
-            11: {
-                2: 0.03,
-                4: 0.02
-            }
-        }
-    }
     _msg = ''
 
     try:
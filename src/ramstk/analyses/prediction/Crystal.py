@@ -11,6 +11,22 @@ import gettext
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Index is the environment ID.
+_lst_lambda_b = [
+    0.032, 0.096, 0.32, 0.19, 0.51, 0.38, 0.54, 0.70, 0.90, 0.74, 0.016,
+    0.42, 1.0, 16.0
+]
+_lst_piQ_count = [1.0, 2.1]
+
+# Constants used in the part stress calculations.
+_lst_piE = [
+    1.0, 3.0, 10.0, 6.0, 16.0, 12.0, 17.0, 22.0, 28.0, 23.0, 0.5, 13.0,
+    32.0, 500.0
+]
+_lst_piQ_stress = [1.0, 3.4]
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -23,13 +39,6 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Index is the environment ID.
-    _lst_lambda_b = [
-        0.032, 0.096, 0.32, 0.19, 0.51, 0.38, 0.54, 0.70, 0.90, 0.74, 0.016,
-        0.42, 1.0, 16.0
-    ]
-    _lst_piQ = [1.0, 2.1]
     _msg = ''
 
     # Select the base hazard rate.
@@ -41,7 +50,7 @@ def calculate_217f_part_count(**attributes):
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = _lst_piQ_count[attributes['quality_id'] - 1]
     except IndexError:
         attributes['piQ'] = 0.0
 
@@ -78,11 +87,6 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _lst_piE = [
-        1.0, 3.0, 10.0, 6.0, 16.0, 12.0, 17.0, 22.0, 28.0, 23.0, 0.5, 13.0,
-        32.0, 500.0
-    ]
-    _lst_piQ = [1.0, 3.4]
     _msg = ''
 
     # Calculate the base hazard rate.
@@ -95,7 +99,7 @@ def calculate_217f_part_stress(**attributes):
 
     # Determine the quality factor (piQ).
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = _lst_piQ_stress[attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
 
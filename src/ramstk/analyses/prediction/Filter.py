@@ -11,6 +11,32 @@ import gettext
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Type ID is the key.  Index is the environment ID.
+_dic_lambda_b_count = {
+    1: [
+        0.022, 0.044, 0.13, 0.088, 0.20, 0.15, 0.20, 0.24, 0.29, 0.24,
+        0.018, 0.15, 0.33, 2.6
+    ],
+    2: [
+        0.12, 0.24, 0.72, 0.48, 1.1, 0.84, 1.1, 1.3, 1.6, 1.3, 0.096, 0.84,
+        1.8, 1.4
+    ],
+    3: [
+        0.27, 0.54, 1.6, 1.1, 2.4, 1.9, 2.4, 3.0, 3.5, 3.0, 0.22, 1.9, 4.1,
+        32.0
+    ]
+}
+_lst_piQ = [1.0, 2.9]
+
+# Constants used in the part stress calculations.
+_dic_lambda_b_stress = {1: 0.022, 2: 0.12, 3: 0.12, 4: 0.27}
+_lst_piE = [
+    1.0, 2.0, 6.0, 4.0, 9.0, 7.0, 9.0, 11.0, 13.0, 11.0, 0.8, 7.0, 15.0,
+    120.0
+]
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -23,28 +49,11 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Type ID is the key.  Index is the environment ID.
-    _dic_lambda_b = {
-        1: [
-            0.022, 0.044, 0.13, 0.088, 0.20, 0.15, 0.20, 0.24, 0.29, 0.24,
-            0.018, 0.15, 0.33, 2.6
-        ],
-        2: [
-            0.12, 0.24, 0.72, 0.48, 1.1, 0.84, 1.1, 1.3, 1.6, 1.3, 0.096, 0.84,
-            1.8, 1.4
-        ],
-        3: [
-            0.27, 0.54, 1.6, 1.1, 2.4, 1.9, 2.4, 3.0, 3.5, 3.0, 0.22, 1.9, 4.1,
-            32.0
-        ]
-    }
-    _lst_piQ = [1.0, 2.9]
     _msg = ''
 
     # Select the base hazard rate.
     try:
-        attributes['lambda_b'] = _dic_lambda_b[attributes['type_id']][
+        attributes['lambda_b'] = _dic_lambda_b_count[attributes['type_id']][
             attributes['environment_active_id'] - 1]
     except (KeyError, IndexError):
         attributes['lambda_b'] = 0.0
@@ -88,17 +97,11 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_lambda_b = {1: 0.022, 2: 0.12, 3: 0.12, 4: 0.27}
-    _lst_piE = [
-        1.0, 2.0, 6.0, 4.0, 9.0, 7.0, 9.0, 11.0, 13.0, 11.0, 0.8, 7.0, 15.0,
-        120.0
-    ]
-    _lst_piQ = [1.0, 2.9]
     _msg = ''
 
     # Determine the base hazard rate.
     try:
-        attributes['lambda_b'] = _dic_lambda_b[attributes['type_id']]
+        attributes['lambda_b'] = _dic_lambda_b_stress[attributes['type_id']]
     except (KeyError, IndexError):
         attributes['lambda_b'] = 0.0
 
@@ -11,6 +11,20 @@ import gettext
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Index is the environment ID.
+_lst_lambda_b = [
+    0.01, 0.02, 0.06, 0.05, 0.11, 0.09, 0.12, 0.15, 0.18, 0.18, 0.009, 0.1,
+    0.21, 2.3
+]
+
+# Constants used in the part stress calculations.
+_lst_piE = [
+    1.0, 2.0, 8.0, 5.0, 11.0, 9.0, 12.0, 15.0, 18.0, 16.0, 0.9, 10.0, 21.0,
+    230.0
+]
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -23,12 +37,6 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Index is the environment ID.
-    _lst_lambda_b = [
-        0.01, 0.02, 0.06, 0.05, 0.11, 0.09, 0.12, 0.15, 0.18, 0.18, 0.009, 0.1,
-        0.21, 2.3
-    ]
     _msg = ''
 
     # Select the base hazard rate.
@@ -64,10 +72,6 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _lst_piE = [
-        1.0, 2.0, 8.0, 5.0, 11.0, 9.0, 12.0, 15.0, 18.0, 16.0, 0.9, 10.0, 21.0,
-        230.0
-    ]
     _msg = ''
 
     # Determine the environmental factor (piE).
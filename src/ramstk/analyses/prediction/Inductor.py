@@ -13,6 +13,109 @@ from math import exp
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id, second key is the family id.  Current
+# subcategory IDs are:
+#
+#    1. Transformer
+#    2. Coil
+#
+# These keys return a list of base hazard rates.  The hazard rate to use is
+# selected from the list depending on the active environment.
+_dic_lambda_b = {
+    1: {
+        1: [
+            0.0035, 0.023, 0.049, 0.019, 0.065, 0.027, 0.037, 0.041, 0.052,
+            0.11, 0.0018, 0.053, 0.16, 2.3
+        ],
+        2: [
+            0.0071, 0.046, 0.097, 0.038, 0.13, 0.055, 0.073, 0.081, 0.10,
+            0.22, 0.035, 0.11, 0.31, 4.7
+        ],
+        3: [
+            0.023, 0.16, 0.35, 0.13, 0.45, 0.21, 0.27, 0.35, 0.45, 0.82,
+            0.011, 0.37, 1.2, 16.0
+        ],
+        4: [
+            0.028, 0.18, 0.39, 0.15, 0.52, 0.22, 0.29, 0.33, 0.42, 0.88,
+            0.015, 0.42, 1.2, 19.0
+        ]
+    },
+    2: {
+        1: [
+            0.0017, 0.0073, 0.023, 0.0091, 0.031, 0.011, 0.015, 0.016,
+            0.022, 0.052, 0.00083, 0.25, 0.073, 1.1
+        ],
+        2: [
+            0.0033, 0.015, 0.046, 0.018, 0.061, 0.022, 0.03, 0.033, 0.044,
+            0.10, 0.0017, 0.05, 0.15, 2.2
+        ]
+    }
+}
+# List containing piQ values for parts count method.  The list positions
+# corrspond to the following quality levels:
+#
+#   0. Established reliability
+#   1. Non-established reliability MIL-SPEC
+#   2. Non-established reliability non-MIL
+#
+# The quality_id attribute is used to select the proper value of piQ.
+_lst_piQ = [0.25, 1.0, 10.0]
+
+# Constants used in the part stress calculations.
+_dic_ref_temp = {
+    1: {
+        1: 329.0,
+        2: 352.0,
+        3: 364.0,
+        4: 400.0,
+        5: 398.0,
+        6: 477.0
+    },
+    2: {
+        1: 329.0,
+        2: 352.0,
+        3: 364.0,
+        4: 409.0
+    }
+}
+_dic_factors = {
+    1: {
+        1: [0.0018, 15.6],
+        2: [0.002, 14.0],
+        3: [0.0018, 8.7],
+        4: [0.002, 10.0],
+        5: [0.00125, 3.8],
+        6: [0.00159, 8.4]
+    },
+    2: {
+        1: [0.000335, 15.6],
+        2: [0.000379, 14.0],
+        3: [0.000319, 8.7],
+        4: [0.00035, 10.0]
+    }
+}
+_dic_piQ = {
+    1: {
+        1: [1.5, 5.0],
+        2: [3.0, 7.5],
+        3: [8.0, 30.0],
+        4: [12.0, 30.0]
+    },
+    2: [0.03, 0.1, 0.3, 1.0, 4.0, 20.0]
+}
+_dic_piE = {
+    1: [
+        1.0, 6.0, 12.0, 5.0, 16.0, 6.0, 8.0, 7.0, 9.0, 24.0, 0.5, 13.0,
+        34.0, 610.0
+    ],
+    2: [
+        1.0, 4.0, 12.0, 5.0, 16.0, 5.0, 7.0, 6.0, 8.0, 24.0, 0.5, 13.0,
+        34.0, 610.0
+    ]
+}
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -27,56 +130,6 @@ def calculate_217f_part_count(**attributes):
     """
     _msg = ''
 
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id, second key is the family id.  Current
-    # subcategory IDs are:
-    #
-    #    1. Transformer
-    #    2. Coil
-    #
-    # These keys return a list of base hazard rates.  The hazard rate to use is
-    # selected from the list depending on the active environment.
-    _dic_lambda_b = {
-        1: {
-            1: [
-                0.0035, 0.023, 0.049, 0.019, 0.065, 0.027, 0.037, 0.041, 0.052,
-                0.11, 0.0018, 0.053, 0.16, 2.3
-            ],
-            2: [
-                0.0071, 0.046, 0.097, 0.038, 0.13, 0.055, 0.073, 0.081, 0.10,
-                0.22, 0.035, 0.11, 0.31, 4.7
-            ],
-            3: [
-                0.023, 0.16, 0.35, 0.13, 0.45, 0.21, 0.27, 0.35, 0.45, 0.82,
-                0.011, 0.37, 1.2, 16.0
-            ],
-            4: [
-                0.028, 0.18, 0.39, 0.15, 0.52, 0.22, 0.29, 0.33, 0.42, 0.88,
-                0.015, 0.42, 1.2, 19.0
-            ]
-        },
-        2: {
-            1: [
-                0.0017, 0.0073, 0.023, 0.0091, 0.031, 0.011, 0.015, 0.016,
-                0.022, 0.052, 0.00083, 0.25, 0.073, 1.1
-            ],
-            2: [
-                0.0033, 0.015, 0.046, 0.018, 0.061, 0.022, 0.03, 0.033, 0.044,
-                0.10, 0.0017, 0.05, 0.15, 2.2
-            ]
-        }
-    }
-
-    # List containing piQ values for parts count method.  The list positions
-    # corrspond to the following quality levels:
-    #
-    #   0. Established reliability
-    #   1. Non-established reliability MIL-SPEC
-    #   2. Non-established reliability non-MIL
-    #
-    # The quality_id attribute is used to select the proper value of piQ.
-    _lst_piQ = [0.25, 1.0, 10.0]
-
     # Select the base hazard rate.
     try:
         _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']][attributes[
@@ -131,57 +184,6 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_ref_temp = {
-        1: {
-            1: 329.0,
-            2: 352.0,
-            3: 364.0,
-            4: 400.0,
-            5: 398.0,
-            6: 477.0
-        },
-        2: {
-            1: 329.0,
-            2: 352.0,
-            3: 364.0,
-            4: 409.0
-        }
-    }
-    _dic_factors = {
-        1: {
-            1: [0.0018, 15.6],
-            2: [0.002, 14.0],
-            3: [0.0018, 8.7],
-            4: [0.002, 10.0],
-            5: [0.00125, 3.8],
-            6: [0.00159, 8.4]
-        },
-        2: {
-            1: [0.000335, 15.6],
-            2: [0.000379, 14.0],
-            3: [0.000319, 8.7],
-            4: [0.00035, 10.0]
-        }
-    }
-    _dic_piQ = {
-        1: {
-            1: [1.5, 5.0],
-            2: [3.0, 7.5],
-            3: [8.0, 30.0],
-            4: [12.0, 30.0]
-        },
-        2: [0.03, 0.1, 0.3, 1.0, 4.0, 20.0]
-    }
-    _dic_piE = {
-        1: [
-            1.0, 6.0, 12.0, 5.0, 16.0, 6.0, 8.0, 7.0, 9.0, 24.0, 0.5, 13.0,
-            34.0, 610.0
-        ],
-        2: [
-            1.0, 4.0, 12.0, 5.0, 16.0, 5.0, 7.0, 6.0, 8.0, 24.0, 0.5, 13.0,
-            34.0, 610.0
-        ]
-    }
     _msg = ''
 
     attributes = calculate_hot_spot_temperature(**attributes)
@@ -13,377 +13,452 @@ from math import exp, log
 
 _ = gettext.gettext
 
-
-def calculate_217f_part_count(**attributes):
-    """
-    Calculate the part count hazard rate for a integrated circuit.
-
-    This function calculates the MIL-HDBK-217F hazard rate using the parts
-    count method.
-
-    :return: (attributes, _msg); the keyword argument (hardware attribute)
-             dictionary with updated values and the error message, if any.
-    :rtype: (dict, str)
-    """
-    _msg = ''
-
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id, second key is the technology id, third
-    # key is an index based on the number of elements in the device.  Current
-    # subcategory IDs are:
-    #
-    #    1. Linear
-    #    2. Logic
-    #    3. PAL/PLA
-    #    4. Microprocessor/Microcontroller
-    #    5. Memory, ROM
-    #    6. Memory, EEPROM
-    #    7. Memory, DRAM
-    #    8. Memory, SRAM
-    #    9. GaAs
-    #   10. VHSIC, VLSI (see section 5.3 of MIL-HDBK-217F for determination)
-    #
-    # Technology IDs are BiPolar/MOS (1 - 8), MMIC/Digital (9).
-    #
-    # These keys pairs return a list of base hazard rates.  The hazard rate to
-    # use is selected from the list depending on the active environment.
-    _dic_lambda_b = {
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id, second key is the technology id, third
+# key is an index based on the number of elements in the device.  Current
+# subcategory IDs are:
+#
+#    1. Linear
+#    2. Logic
+#    3. PAL/PLA
+#    4. Microprocessor/Microcontroller
+#    5. Memory, ROM
+#    6. Memory, EEPROM
+#    7. Memory, DRAM
+#    8. Memory, SRAM
+#    9. GaAs
+#   10. VHSIC, VLSI (see section 5.3 of MIL-HDBK-217F for determination)
+#
+# Technology IDs are BiPolar/MOS (1 - 8), MMIC/Digital (9).
+#
+# These keys pairs return a list of base hazard rates.  The hazard rate to
+# use is selected from the list depending on the active environment.
+_dic_lambda_b = {
+    1: {
         1: {
-            1: {
-                1: [
-                    0.0095, 0.024, 0.039, 0.034, 0.049, 0.057, 0.062, 0.12,
-                    0.13, 0.076, 0.0095, 0.044, 0.096, 1.1
-                ],
-                2: [
-                    0.0170, 0.041, 0.065, 0.054, 0.078, 0.100, 0.110, 0.22,
-                    0.24, 0.130, 0.0170, 0.072, 0.150, 1.4
-                ],
-                3: [
-                    0.0330, 0.074, 0.110, 0.092, 0.130, 0.190, 0.190, 0.41,
-                    0.44, 0.220, 0.0330, 0.120, 0.260, 2.0
-                ],
-                4: [
-                    0.0500, 0.120, 0.180, 0.150, 0.210, 0.300, 0.300, 0.63,
-                    0.67, 0.350, 0.0500, 0.190, 0.410, 3.4
-                ]
-            },
-            2: {
-                1: [
-                    0.0095, 0.024, 0.039, 0.034, 0.049, 0.057, 0.062, 0.12,
-                    0.13, 0.076, 0.0095, 0.044, 0.096, 1.1
-                ],
-                2: [
-                    0.0170, 0.041, 0.065, 0.054, 0.078, 0.100, 0.110, 0.22,
-                    0.24, 0.130, 0.0170, 0.072, 0.150, 1.4
-                ],
-                3: [
-                    0.0330, 0.074, 0.110, 0.092, 0.130, 0.190, 0.190, 0.41,
-                    0.44, 0.220, 0.0330, 0.120, 0.260, 2.0
-                ],
-                4: [
-                    0.0500, 0.120, 0.180, 0.150, 0.210, 0.300, 0.300, 0.63,
-                    0.67, 0.350, 0.0500, 0.190, 0.410, 3.4
-                ]
-            }
+            1: [
+                0.0095, 0.024, 0.039, 0.034, 0.049, 0.057, 0.062, 0.12,
+                0.13, 0.076, 0.0095, 0.044, 0.096, 1.1
+            ],
+            2: [
+                0.0170, 0.041, 0.065, 0.054, 0.078, 0.100, 0.110, 0.22,
+                0.24, 0.130, 0.0170, 0.072, 0.150, 1.4
+            ],
+            3: [
+                0.0330, 0.074, 0.110, 0.092, 0.130, 0.190, 0.190, 0.41,
+                0.44, 0.220, 0.0330, 0.120, 0.260, 2.0
+            ],
+            4: [
+                0.0500, 0.120, 0.180, 0.150, 0.210, 0.300, 0.300, 0.63,
+                0.67, 0.350, 0.0500, 0.190, 0.410, 3.4
+            ]
         },
         2: {
-            1: {
-                1: [
-                    0.0036, 0.012, 0.024, 0.024, 0.035, 0.025, 0.030, 0.032,
-                    0.049, 0.047, 0.0036, 0.030, 0.069, 1.20
-                ],
-                2: [
-                    0.0060, 0.020, 0.038, 0.037, 0.055, 0.039, 0.048, 0.051,
-                    0.077, 0.074, 0.0060, 0.046, 0.110, 1.90
-                ],
-                3: [
-                    0.0110, 0.035, 0.066, 0.065, 0.097, 0.070, 0.085, 0.091,
-                    0.140, 0.130, 0.0110, 0.082, 0.190, 3.30
-                ],
-                4: [
-                    0.0330, 0.120, 0.220, 0.220, 0.330, 0.230, 0.280, 0.300,
-                    0.460, 0.440, 0.0330, 0.280, 0.650, 12.0
-                ],
-                5: [
-                    0.0520, 0.170, 0.330, 0.330, 0.480, 0.340, 0.420, 0.450,
-                    0.680, 0.650, 0.0520, 0.410, 0.950, 17.0
-                ],
-                6: [
-                    0.0750, 0.230, 0.440, 0.430, 0.630, 0.460, 0.560, 0.610,
-                    0.900, 0.850, 0.0750, 0.530, 1.200, 21.0
-                ]
-            },
-            2: {
-                1: [
-                    0.0057, 0.015, 0.027, 0.027, 0.039, 0.029, 0.035, 0.039,
-                    0.056, 0.052, 0.0057, 0.033, 0.074, 1.20
-                ],
-                2: [
-                    0.0100, 0.028, 0.045, 0.043, 0.062, 0.049, 0.057, 0.068,
-                    0.092, 0.083, 0.0100, 0.053, 0.120, 1.90
-                ],
-                3: [
-                    0.0190, 0.047, 0.080, 0.077, 0.110, 0.088, 0.100, 0.120,
-                    0.170, 0.150, 0.0190, 0.095, 0.210, 3.30
-                ],
-                4: [
-                    0.0490, 0.140, 0.250, 0.240, 0.360, 0.270, 0.320, 0.360,
-                    0.510, 0.480, 0.0490, 0.300, 0.690, 12.0
-                ],
-                5: [
-                    0.0840, 0.220, 0.390, 0.370, 0.540, 0.420, 0.490, 0.560,
-                    0.790, 0.720, 0.0840, 0.460, 1.000, 17.0
-                ],
-                6: [
-                    0.1300, 0.310, 0.530, 0.510, 0.730, 0.590, 0.690, 0.820,
-                    1.100, 0.980, 0.1300, 0.830, 1.400, 21.0
-                ]
-            }
-        },
-        3: {
-            1: {
-                1: [
-                    0.0061, 0.016, 0.029, 0.027, 0.040, 0.032, 0.037, 0.044,
-                    0.061, 0.054, 0.0061, 0.034, 0.076, 1.2
-                ],
-                2: [
-                    0.0110, 0.028, 0.048, 0.046, 0.065, 0.054, 0.063, 0.077,
-                    0.100, 0.089, 0.0110, 0.057, 0.120, 1.9
-                ],
-                3: [
-                    0.0220, 0.052, 0.087, 0.082, 0.120, 0.099, 0.110, 0.140,
-                    0.190, 0.160, 0.0220, 0.100, 0.220, 3.3
-                ]
-            },
-            2: {
-                1: [
-                    0.0046, 0.018, 0.035, 0.035, 0.052, 0.035, 0.044, 0.044,
-                    0.070, 0.070, 0.0046, 0.044, 0.100, 1.9
-                ],
-                2: [
-                    0.0056, 0.021, 0.042, 0.042, 0.062, 0.042, 0.052, 0.053,
-                    0.084, 0.083, 0.0056, 0.052, 0.120, 2.3
-                ],
-                3: [
-                    0.0061, 0.022, 0.043, 0.042, 0.063, 0.043, 0.054, 0.055,
-                    0.086, 0.084, 0.0081, 0.053, 0.130, 2.3
-                ],
-                4: [
-                    0.0095, 0.033, 0.064, 0.063, 0.094, 0.065, 0.080, 0.083,
-                    0.130, 0.130, 0.0095, 0.079, 0.190, 3.3
-                ]
-            }
-        },
-        4: {
-            1: {
-                1: [
-                    0.028, 0.061, 0.098, 0.091, 0.13, 0.12, 0.13, 0.17, 0.22,
-                    0.18, 0.028, 0.11, 0.24, 3.30
-                ],
-                2: [
-                    0.052, 0.110, 0.180, 0.160, 0.23, 0.21, 0.24, 0.32, 0.39,
-                    0.31, 0.052, 0.20, 0.41, 5.60
-                ],
-                3: [
-                    0.110, 0.230, 0.360, 0.330, 0.47, 0.44, 0.49, 0.65, 0.81,
-                    0.65, 0.110, 0.42, 0.86, 12.0
-                ]
-            },
-            2: {
-                1: [
-                    0.048, 0.089, 0.130, 0.120, 0.16, 0.16, 0.17, 0.24, 0.28,
-                    0.22, 0.048, 0.15, 0.28, 3.40
-                ],
-                2: [
-                    0.093, 0.170, 0.240, 0.220, 0.29, 0.30, 0.32, 0.45, 0.52,
-                    0.40, 0.093, 0.27, 0.50, 5.60
-                ],
-                3: [
-                    0.190, 0.340, 0.490, 0.450, 0.60, 0.61, 0.66, 0.90, 1.10,
-                    0.82, 0.190, 0.54, 1.00, 12.0
-                ]
-            }
+            1: [
+                0.0095, 0.024, 0.039, 0.034, 0.049, 0.057, 0.062, 0.12,
+                0.13, 0.076, 0.0095, 0.044, 0.096, 1.1
+            ],
+            2: [
+                0.0170, 0.041, 0.065, 0.054, 0.078, 0.100, 0.110, 0.22,
+                0.24, 0.130, 0.0170, 0.072, 0.150, 1.4
+            ],
+            3: [
+                0.0330, 0.074, 0.110, 0.092, 0.130, 0.190, 0.190, 0.41,
+                0.44, 0.220, 0.0330, 0.120, 0.260, 2.0
+            ],
+            4: [
+                0.0500, 0.120, 0.180, 0.150, 0.210, 0.300, 0.300, 0.63,
+                0.67, 0.350, 0.0500, 0.190, 0.410, 3.4
+            ]
+        }
+    },
+    2: {
+        1: {
+            1: [
+                0.0036, 0.012, 0.024, 0.024, 0.035, 0.025, 0.030, 0.032,
+                0.049, 0.047, 0.0036, 0.030, 0.069, 1.20
+            ],
+            2: [
+                0.0060, 0.020, 0.038, 0.037, 0.055, 0.039, 0.048, 0.051,
+                0.077, 0.074, 0.0060, 0.046, 0.110, 1.90
+            ],
+            3: [
+                0.0110, 0.035, 0.066, 0.065, 0.097, 0.070, 0.085, 0.091,
+                0.140, 0.130, 0.0110, 0.082, 0.190, 3.30
+            ],
+            4: [
+                0.0330, 0.120, 0.220, 0.220, 0.330, 0.230, 0.280, 0.300,
+                0.460, 0.440, 0.0330, 0.280, 0.650, 12.0
+            ],
+            5: [
+                0.0520, 0.170, 0.330, 0.330, 0.480, 0.340, 0.420, 0.450,
+                0.680, 0.650, 0.0520, 0.410, 0.950, 17.0
+            ],
+            6: [
+                0.0750, 0.230, 0.440, 0.430, 0.630, 0.460, 0.560, 0.610,
+                0.900, 0.850, 0.0750, 0.530, 1.200, 21.0
+            ]
         },
-        5: {
-            1: {
-                1: [
-                    0.010, 0.028, 0.050, 0.046, 0.067, 0.062, 0.070, 0.10,
-                    0.13, 0.096, 0.010, 0.058, 0.13, 1.9
-                ],
-                2: [
-                    0.017, 0.043, 0.071, 0.063, 0.091, 0.095, 0.110, 0.18,
-                    0.21, 0.140, 0.017, 0.081, 0.18, 2.3
-                ],
-                3: [
-                    0.028, 0.065, 0.100, 0.085, 0.120, 0.150, 0.180, 0.30,
-                    0.33, 0.190, 0.028, 0.110, 0.23, 2.3
-                ],
-                4: [
-                    0.053, 0.120, 0.180, 0.150, 0.210, 0.270, 0.290, 0.56,
-                    0.61, 0.330, 0.053, 0.190, 0.39, 3.4
-                ]
-            },
-            2: {
-                1: [
-                    0.0047, 0.018, 0.036, 0.035, 0.053, 0.037, 0.045, 0.048,
-                    0.074, 0.071, 0.0047, 0.044, 0.11, 1.9
-                ],
-                2: [
-                    0.0059, 0.022, 0.043, 0.042, 0.063, 0.045, 0.055, 0.060,
-                    0.090, 0.086, 0.0059, 0.053, 0.13, 2.3
-                ],
-                3: [
-                    0.0067, 0.023, 0.045, 0.044, 0.066, 0.048, 0.059, 0.068,
-                    0.099, 0.089, 0.0067, 0.055, 0.13, 2.3
-                ],
-                4: [
-                    0.0110, 0.036, 0.068, 0.066, 0.098, 0.075, 0.090, 0.110,
-                    0.150, 0.140, 0.0110, 0.083, 0.20, 3.3
-                ]
-            }
+        2: {
+            1: [
+                0.0057, 0.015, 0.027, 0.027, 0.039, 0.029, 0.035, 0.039,
+                0.056, 0.052, 0.0057, 0.033, 0.074, 1.20
+            ],
+            2: [
+                0.0100, 0.028, 0.045, 0.043, 0.062, 0.049, 0.057, 0.068,
+                0.092, 0.083, 0.0100, 0.053, 0.120, 1.90
+            ],
+            3: [
+                0.0190, 0.047, 0.080, 0.077, 0.110, 0.088, 0.100, 0.120,
+                0.170, 0.150, 0.0190, 0.095, 0.210, 3.30
+            ],
+            4: [
+                0.0490, 0.140, 0.250, 0.240, 0.360, 0.270, 0.320, 0.360,
+                0.510, 0.480, 0.0490, 0.300, 0.690, 12.0
+            ],
+            5: [
+                0.0840, 0.220, 0.390, 0.370, 0.540, 0.420, 0.490, 0.560,
+                0.790, 0.720, 0.0840, 0.460, 1.000, 17.0
+            ],
+            6: [
+                0.1300, 0.310, 0.530, 0.510, 0.730, 0.590, 0.690, 0.820,
+                1.100, 0.980, 0.1300, 0.830, 1.400, 21.0
+            ]
+        }
+    },
+    3: {
+        1: {
+            1: [
+                0.0061, 0.016, 0.029, 0.027, 0.040, 0.032, 0.037, 0.044,
+                0.061, 0.054, 0.0061, 0.034, 0.076, 1.2
+            ],
+            2: [
+                0.0110, 0.028, 0.048, 0.046, 0.065, 0.054, 0.063, 0.077,
+                0.100, 0.089, 0.0110, 0.057, 0.120, 1.9
+            ],
+            3: [
+                0.0220, 0.052, 0.087, 0.082, 0.120, 0.099, 0.110, 0.140,
+                0.190, 0.160, 0.0220, 0.100, 0.220, 3.3
+            ]
         },
-        6: {
-            2: {
-                1: [
-                    0.0049, 0.018, 0.036, 0.036, 0.053, 0.037, 0.046, 0.049,
-                    0.075, 0.072, 0.0048, 0.045, 0.11, 1.9
-                ],
-                2: [
-                    0.0061, 0.022, 0.044, 0.043, 0.064, 0.046, 0.056, 0.062,
-                    0.093, 0.087, 0.0062, 0.054, 0.13, 2.3
-                ],
-                3: [
-                    0.0072, 0.024, 0.048, 0.045, 0.067, 0.051, 0.061, 0.073,
-                    0.100, 0.092, 0.0072, 0.057, 0.13, 2.3
-                ],
-                4: [
-                    0.0120, 0.038, 0.071, 0.068, 0.100, 0.080, 0.095, 0.120,
-                    0.180, 0.140, 0.0120, 0.086, 0.20, 3.3
-                ]
-            }
+        2: {
+            1: [
+                0.0046, 0.018, 0.035, 0.035, 0.052, 0.035, 0.044, 0.044,
+                0.070, 0.070, 0.0046, 0.044, 0.100, 1.9
+            ],
+            2: [
+                0.0056, 0.021, 0.042, 0.042, 0.062, 0.042, 0.052, 0.053,
+                0.084, 0.083, 0.0056, 0.052, 0.120, 2.3
+            ],
+            3: [
+                0.0061, 0.022, 0.043, 0.042, 0.063, 0.043, 0.054, 0.055,
+                0.086, 0.084, 0.0081, 0.053, 0.130, 2.3
+            ],
+            4: [
+                0.0095, 0.033, 0.064, 0.063, 0.094, 0.065, 0.080, 0.083,
+                0.130, 0.130, 0.0095, 0.079, 0.190, 3.3
+            ]
+        }
+    },
+    4: {
+        1: {
+            1: [
+                0.028, 0.061, 0.098, 0.091, 0.13, 0.12, 0.13, 0.17, 0.22,
+                0.18, 0.028, 0.11, 0.24, 3.30
+            ],
+            2: [
+                0.052, 0.110, 0.180, 0.160, 0.23, 0.21, 0.24, 0.32, 0.39,
+                0.31, 0.052, 0.20, 0.41, 5.60
+            ],
+            3: [
+                0.110, 0.230, 0.360, 0.330, 0.47, 0.44, 0.49, 0.65, 0.81,
+                0.65, 0.110, 0.42, 0.86, 12.0
+            ]
         },
-        7: {
-            2: {
-                1: [
-                    0.0040, 0.014, 0.027, 0.027, 0.040, 0.029, 0.035, 0.040,
-                    0.059, 0.055, 0.0040, 0.034, 0.080, 1.4
-                ],
-                2: [
-                    0.0055, 0.019, 0.039, 0.034, 0.051, 0.039, 0.047, 0.056,
-                    0.079, 0.070, 0.0055, 0.043, 0.100, 1.7
-                ],
-                3: [
-                    0.0074, 0.023, 0.043, 0.040, 0.060, 0.049, 0.058, 0.076,
-                    0.100, 0.084, 0.0074, 0.051, 0.120, 1.9
-                ],
-                4: [
-                    0.0110, 0.032, 0.057, 0.053, 0.077, 0.070, 0.080, 0.120,
-                    0.150, 0.110, 0.0110, 0.067, 0.150, 2.3
-                ]
-            }
+        2: {
+            1: [
+                0.048, 0.089, 0.130, 0.120, 0.16, 0.16, 0.17, 0.24, 0.28,
+                0.22, 0.048, 0.15, 0.28, 3.40
+            ],
+            2: [
+                0.093, 0.170, 0.240, 0.220, 0.29, 0.30, 0.32, 0.45, 0.52,
+                0.40, 0.093, 0.27, 0.50, 5.60
+            ],
+            3: [
+                0.190, 0.340, 0.490, 0.450, 0.60, 0.61, 0.66, 0.90, 1.10,
+                0.82, 0.190, 0.54, 1.00, 12.0
+            ]
+        }
+    },
+    5: {
+        1: {
+            1: [
+                0.010, 0.028, 0.050, 0.046, 0.067, 0.062, 0.070, 0.10,
+                0.13, 0.096, 0.010, 0.058, 0.13, 1.9
+            ],
+            2: [
+                0.017, 0.043, 0.071, 0.063, 0.091, 0.095, 0.110, 0.18,
+                0.21, 0.140, 0.017, 0.081, 0.18, 2.3
+            ],
+            3: [
+                0.028, 0.065, 0.100, 0.085, 0.120, 0.150, 0.180, 0.30,
+                0.33, 0.190, 0.028, 0.110, 0.23, 2.3
+            ],
+            4: [
+                0.053, 0.120, 0.180, 0.150, 0.210, 0.270, 0.290, 0.56,
+                0.61, 0.330, 0.053, 0.190, 0.39, 3.4
+            ]
         },
-        8: {
-            1: {
-                1: [
-                    0.0075, 0.023, 0.043, 0.041, 0.060, 0.050, 0.058, 0.077,
-                    0.10, 0.084, 0.0075, 0.052, 0.12, 1.9
-                ],
-                2: [
-                    0.0120, 0.033, 0.058, 0.054, 0.079, 0.072, 0.083, 0.120,
-                    0.15, 0.110, 0.0120, 0.069, 0.15, 2.3
-                ],
-                3: [
-                    0.0180, 0.045, 0.074, 0.065, 0.095, 0.100, 0.110, 0.190,
-                    0.22, 0.140, 0.0180, 0.084, 0.18, 2.3
-                ],
-                4: [
-                    0.0330, 0.079, 0.130, 0.110, 0.160, 0.180, 0.200, 0.350,
-                    0.39, 0.240, 0.0330, 0.140, 0.30, 3.4
-                ]
-            },
-            2: {
-                1: [
-                    0.0079, 0.022, 0.038, 0.034, 0.050, 0.048, 0.054, 0.083,
-                    0.10, 0.073, 0.0079, 0.044, 0.098, 1.4
-                ],
-                2: [
-                    0.0140, 0.034, 0.057, 0.050, 0.073, 0.077, 0.085, 0.140,
-                    0.17, 0.110, 0.0140, 0.065, 0.140, 1.8
-                ],
-                3: [
-                    0.0230, 0.053, 0.084, 0.071, 0.100, 0.120, 0.130, 0.250,
-                    0.27, 0.160, 0.0230, 0.092, 0.190, 1.9
-                ],
-                4: [
-                    0.0430, 0.092, 0.140, 0.110, 0.160, 0.220, 0.230, 0.460,
-                    0.49, 0.260, 0.0430, 0.150, 0.300, 2.3
-                ]
-            }
+        2: {
+            1: [
+                0.0047, 0.018, 0.036, 0.035, 0.053, 0.037, 0.045, 0.048,
+                0.074, 0.071, 0.0047, 0.044, 0.11, 1.9
+            ],
+            2: [
+                0.0059, 0.022, 0.043, 0.042, 0.063, 0.045, 0.055, 0.060,
+                0.090, 0.086, 0.0059, 0.053, 0.13, 2.3
+            ],
+            3: [
+                0.0067, 0.023, 0.045, 0.044, 0.066, 0.048, 0.059, 0.068,
+                0.099, 0.089, 0.0067, 0.055, 0.13, 2.3
+            ],
+            4: [
+                0.0110, 0.036, 0.068, 0.066, 0.098, 0.075, 0.090, 0.110,
+                0.150, 0.140, 0.0110, 0.083, 0.20, 3.3
+            ]
+        }
+    },
+    6: {
+        2: {
+            1: [
+                0.0049, 0.018, 0.036, 0.036, 0.053, 0.037, 0.046, 0.049,
+                0.075, 0.072, 0.0048, 0.045, 0.11, 1.9
+            ],
+            2: [
+                0.0061, 0.022, 0.044, 0.043, 0.064, 0.046, 0.056, 0.062,
+                0.093, 0.087, 0.0062, 0.054, 0.13, 2.3
+            ],
+            3: [
+                0.0072, 0.024, 0.048, 0.045, 0.067, 0.051, 0.061, 0.073,
+                0.100, 0.092, 0.0072, 0.057, 0.13, 2.3
+            ],
+            4: [
+                0.0120, 0.038, 0.071, 0.068, 0.100, 0.080, 0.095, 0.120,
+                0.180, 0.140, 0.0120, 0.086, 0.20, 3.3
+            ]
+        }
+    },
+    7: {
+        2: {
+            1: [
+                0.0040, 0.014, 0.027, 0.027, 0.040, 0.029, 0.035, 0.040,
+                0.059, 0.055, 0.0040, 0.034, 0.080, 1.4
+            ],
+            2: [
+                0.0055, 0.019, 0.039, 0.034, 0.051, 0.039, 0.047, 0.056,
+                0.079, 0.070, 0.0055, 0.043, 0.100, 1.7
+            ],
+            3: [
+                0.0074, 0.023, 0.043, 0.040, 0.060, 0.049, 0.058, 0.076,
+                0.100, 0.084, 0.0074, 0.051, 0.120, 1.9
+            ],
+            4: [
+                0.0110, 0.032, 0.057, 0.053, 0.077, 0.070, 0.080, 0.120,
+                0.150, 0.110, 0.0110, 0.067, 0.150, 2.3
+            ]
+        }
+    },
+    8: {
+        1: {
+            1: [
+                0.0075, 0.023, 0.043, 0.041, 0.060, 0.050, 0.058, 0.077,
+                0.10, 0.084, 0.0075, 0.052, 0.12, 1.9
+            ],
+            2: [
+                0.0120, 0.033, 0.058, 0.054, 0.079, 0.072, 0.083, 0.120,
+                0.15, 0.110, 0.0120, 0.069, 0.15, 2.3
+            ],
+            3: [
+                0.0180, 0.045, 0.074, 0.065, 0.095, 0.100, 0.110, 0.190,
+                0.22, 0.140, 0.0180, 0.084, 0.18, 2.3
+            ],
+            4: [
+                0.0330, 0.079, 0.130, 0.110, 0.160, 0.180, 0.200, 0.350,
+                0.39, 0.240, 0.0330, 0.140, 0.30, 3.4
+            ]
         },
-        9: {
-            1: {
-                1: [
-                    0.019, 0.034, 0.046, 0.039, 0.052, 0.065, 0.068, 0.11,
-                    0.12, 0.076, 0.019, 0.049, 0.086, 0.61
-                ],
-                2: [
-                    0.025, 0.047, 0.067, 0.058, 0.079, 0.091, 0.097, 0.15,
-                    0.17, 0.11, 0.025, 0.073, 0.14, 1.3
-                ]
-            },
-            2: {
-                1: [
-                    0.0085, 0.030, 0.057, 0.057, 0.084, 0.060, 0.073, 0.080,
-                    0.12, 0.11, 0.0085, 0.071, 0.17, 3.0
-                ],
-                2: [
-                    0.0140, 0.053, 0.100, 0.100, 0.150, 0.110, 0.130, 0.140,
-                    0.22, 0.21, 0.0140, 0.130, 0.31, 5.5
-                ]
-            }
+        2: {
+            1: [
+                0.0079, 0.022, 0.038, 0.034, 0.050, 0.048, 0.054, 0.083,
+                0.10, 0.073, 0.0079, 0.044, 0.098, 1.4
+            ],
+            2: [
+                0.0140, 0.034, 0.057, 0.050, 0.073, 0.077, 0.085, 0.140,
+                0.17, 0.110, 0.0140, 0.065, 0.140, 1.8
+            ],
+            3: [
+                0.0230, 0.053, 0.084, 0.071, 0.100, 0.120, 0.130, 0.250,
+                0.27, 0.160, 0.0230, 0.092, 0.190, 1.9
+            ],
+            4: [
+                0.0430, 0.092, 0.140, 0.110, 0.160, 0.220, 0.230, 0.460,
+                0.49, 0.260, 0.0430, 0.150, 0.300, 2.3
+            ]
         }
-    }
-
-    # List containing piQ values for parts count method.  The list positions
-    # corrspond to the following quality levels:
-    #
-    #   0. Established reliability level S
-    #   1. Established reliability level B
-    #   2. Established reliability level B-1
-    #
-    # The quality_id attribute is used to select the proper value of piQ.
-    _lst_piQ = [0.25, 1.0, 2.0]
-
-    # Dictionary containing the number of element breakpoints for determining
-    # the base hazard rate list to use.
-    _dic_breakpoints = {
-        1: [100, 300, 1000],
-        2: [100, 1000, 3000, 10000, 30000],
-        3: {
-            1: [200, 1000],
-            2: [16000, 64000, 256000]
+    },
+    9: {
+        1: {
+            1: [
+                0.019, 0.034, 0.046, 0.039, 0.052, 0.065, 0.068, 0.11,
+                0.12, 0.076, 0.019, 0.049, 0.086, 0.61
+            ],
+            2: [
+                0.025, 0.047, 0.067, 0.058, 0.079, 0.091, 0.097, 0.15,
+                0.17, 0.11, 0.025, 0.073, 0.14, 1.3
+            ]
         },
-        4: [8, 16, 32],
-        5: [16000, 64000, 256000],
-        6: [16000, 64000, 256000],
-        7: [16000, 64000, 256000],
-        8: [16000, 64000, 256000],
-        9: {
+        2: {
             1: [
-                10,
+                0.0085, 0.030, 0.057, 0.057, 0.084, 0.060, 0.073, 0.080,
+                0.12, 0.11, 0.0085, 0.071, 0.17, 3.0
             ],
             2: [
-                1000,
+                0.0140, 0.053, 0.100, 0.100, 0.150, 0.110, 0.130, 0.140,
+                0.22, 0.21, 0.0140, 0.130, 0.31, 5.5
             ]
         }
     }
+}
+# List containing piQ values for parts count method.  The list positions
+# corrspond to the following quality levels:
+#
+#   0. Established reliability level S
+#   1. Established reliability level B
+#   2. Established reliability level B-1
+#
+# The quality_id attribute is used to select the proper value of piQ.
+lst_piQ = [0.25, 1.0, 2.0]
+# Dictionary containing the number of element breakpoints for determining
+# the base hazard rate list to use.
+_dic_breakpoints_count = {
+    1: [100, 300, 1000],
+    2: [100, 1000, 3000, 10000, 30000],
+    3: {
+        1: [200, 1000],
+        2: [16000, 64000, 256000]
+    },
+    4: [8, 16, 32],
+    5: [16000, 64000, 256000],
+    6: [16000, 64000, 256000],
+    7: [16000, 64000, 256000],
+    8: [16000, 64000, 256000],
+    9: {
+        1: [
+            10,
+        ],
+        2: [
+            1000,
+        ]
+    }
+}
+
+# Constants used in the part stress calculations.
+# Key is subcategory ID.  Value is a list of lists where the first index
+# is the technology ID to select the inner list and the second index is
+# determined by the number of elements.
+dic_c1 = {
+    1: [[0.01, 0.02, 0.04, 0.06], [0.01, 0.02, 0.04, 0.06]],
+    2: [[0.0025, 0.005, 0.01, 0.02, 0.04, 0.08],
+        [0.01, 0.02, 0.04, 0.08, 0.16, 0.29]],
+    3: [[0.01, 0.021, 0.042], [0.00085, 0.0017, 0.0034, 0.0068]],
+    4: [[0.06, 0.12, 0.24, 0.48], [0.14, 0.28, 0.56, 1.12]],
+    5: [[0.00065, 0.0013, 0.0026, 0.0052], [0.0094, 0.019, 0.038, 0.075]],
+    6: [[0.00085, 0.0017, 0.0034, 0.0068], [0.0, 0.0, 0.0, 0.0]],
+    7: [[0.0013, 0.0025, 0.005, 0.01], [0.0, 0.0, 0.0, 0.0]],
+    8: [[0.0078, 0.016, 0.031, 0.062], [0.0052, 0.011, 0.021, 0.042]],
+    9: [[4.5, 7.2], [25.0, 51.0]]
+}
+dic_c2 = {
+    1: [2.8E-4, 1.08],
+    2: [9.0E-5, 1.51],
+    3: [3.0E-5, 1.82],
+    4: [3.0E-5, 2.01],
+    5: [3.6E-4, 1.08]
+}
+dic_piA = {1: [1.0, 3.0, 3.0], 2: [1.0]}
+_dic_piPT = {1: 1.0, 7: 1.3, 2: 2.2, 8: 2.9, 3: 4.7, 9: 6.1}
+# Dictionary containing the number of element breakpoints for determining
+# the base hazard rate list to use.
+dic_breakpoints_stress = {
+    1: [100, 300, 1000],
+    2: [100, 1000, 3000, 10000, 30000],
+    3: {
+        1: [200, 1000],
+        2: [500, 1000, 5000]
+    },
+    4: [8, 16, 32],
+    5: [16000, 64000, 256000],
+    6: [16000, 64000, 256000],
+    7: [16000, 64000, 256000],
+    8: [16000, 64000, 256000],
+    9: {
+        1: [
+            10,
+        ],
+        2: [
+            1000,
+        ]
+    }
+}
+lst_piE = [
+    0.5, 2.0, 4.0, 4.0, 6.0, 4.0, 5.0, 5.0, 8.0, 8.0, 0.5, 5.0, 12.0, 220.0
+]
+
+# Constants used in the temperature factor (piT) calculations.
+# Key is the subcategory ID, value is Ea or list containing Ea values.
+dic_ea = {
+    1:
+    0.65,
+    2: [
+        0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.45, 0.45, 0.5, 0.5, 0.6,
+        0.6, 0.6
+    ],
+    3:
+    0.65,
+    4:
+    0.65,
+    5:
+    0.6,
+    6:
+    0.6,
+    7:
+    0.6,
+    8:
+    0.6,
+    9: [1.5, 1.4]
+}
+
+
+def calculate_217f_part_count(**attributes):
+    """
+    Calculate the part count hazard rate for a integrated circuit.
+
+    This function calculates the MIL-HDBK-217F hazard rate using the parts
+    count method.
+
+    :return: (attributes, _msg); the keyword argument (hardware attribute)
+             dictionary with updated values and the error message, if any.
+    :rtype: (dict, str)
+    """
+    _msg = ''
 
     try:
         if attributes['subcategory_id'] in [3, 9]:
-            _breaks = _dic_breakpoints[attributes['subcategory_id']][
+            _breaks = _dic_breakpoints_count[attributes['subcategory_id']][
                 attributes['technology_id']]
         else:
-            _breaks = _dic_breakpoints[attributes['subcategory_id']]
+            _breaks = _dic_breakpoints_count[attributes['subcategory_id']]
 
         _idx = -1
         for _idx, _value in enumerate(_breaks):
@@ -415,7 +490,7 @@ def calculate_217f_part_count(**attributes):
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+        attributes['piQ'] = lst_piQ[attributes['quality_id'] - 1]
     except IndexError:
         attributes['piQ'] = 0.0
 
@@ -442,57 +517,6 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Key is subcategory ID.  Value is a list of lists where the first index
-    # is the technology ID to select the inner list and the second index is
-    # determined by the number of elements.
-    _dic_c1 = {
-        1: [[0.01, 0.02, 0.04, 0.06], [0.01, 0.02, 0.04, 0.06]],
-        2: [[0.0025, 0.005, 0.01, 0.02, 0.04, 0.08],
-            [0.01, 0.02, 0.04, 0.08, 0.16, 0.29]],
-        3: [[0.01, 0.021, 0.042], [0.00085, 0.0017, 0.0034, 0.0068]],
-        4: [[0.06, 0.12, 0.24, 0.48], [0.14, 0.28, 0.56, 1.12]],
-        5: [[0.00065, 0.0013, 0.0026, 0.0052], [0.0094, 0.019, 0.038, 0.075]],
-        6: [[0.00085, 0.0017, 0.0034, 0.0068], [0.0, 0.0, 0.0, 0.0]],
-        7: [[0.0013, 0.0025, 0.005, 0.01], [0.0, 0.0, 0.0, 0.0]],
-        8: [[0.0078, 0.016, 0.031, 0.062], [0.0052, 0.011, 0.021, 0.042]],
-        9: [[4.5, 7.2], [25.0, 51.0]]
-    }
-    _dic_c2 = {
-        1: [2.8E-4, 1.08],
-        2: [9.0E-5, 1.51],
-        3: [3.0E-5, 1.82],
-        4: [3.0E-5, 2.01],
-        5: [3.6E-4, 1.08]
-    }
-    _dic_piA = {1: [1.0, 3.0, 3.0], 2: [1.0]}
-    _dic_piPT = {1: 1.0, 7: 1.3, 2: 2.2, 8: 2.9, 3: 4.7, 9: 6.1}
-    # Dictionary containing the number of element breakpoints for determining
-    # the base hazard rate list to use.
-    _dic_breakpoints = {
-        1: [100, 300, 1000],
-        2: [100, 1000, 3000, 10000, 30000],
-        3: {
-            1: [200, 1000],
-            2: [500, 1000, 5000]
-        },
-        4: [8, 16, 32],
-        5: [16000, 64000, 256000],
-        6: [16000, 64000, 256000],
-        7: [16000, 64000, 256000],
-        8: [16000, 64000, 256000],
-        9: {
-            1: [
-                10,
-            ],
-            2: [
-                1000,
-            ]
-        }
-    }
-    _lst_piQ = [0.25, 1.0, 2.0]
-    _lst_piE = [
-        0.5, 2.0, 4.0, 4.0, 6.0, 4.0, 5.0, 5.0, 8.0, 8.0, 0.5, 5.0, 12.0, 220.0
-    ]
     _msg = ''
 
     # Categorize the technology.
@@ -507,13 +531,13 @@ def calculate_217f_part_stress(**attributes):
     # Retrieve the value of C1.
     try:
         if attributes['subcategory_id'] == 3:
-            _breaks = _dic_breakpoints[attributes['subcategory_id']][
+            _breaks = dic_breakpoints_stress[attributes['subcategory_id']][
                 _technology]
         if attributes['subcategory_id'] == 9:
-            _breaks = _dic_breakpoints[attributes['subcategory_id']][
+            _breaks = dic_breakpoints_stress[attributes['subcategory_id']][
                 attributes['application_id']]
         else:
-            _breaks = _dic_breakpoints[attributes['subcategory_id']]
+            _breaks = dic_breakpoints_stress[attributes['subcategory_id']]
 
         _index = -1
         for _index, _value in enumerate(_breaks):
@@ -523,8 +547,8 @@ def calculate_217f_part_stress(**attributes):
             elif _diff >= 0:
                 break
 
-        attributes['C1'] = _dic_c1[attributes['subcategory_id']][_technology -
-                                                                 1][_index + 1]
+        attributes['C1'] = dic_c1[attributes['subcategory_id']][_technology -
+                                                                1][_index + 1]
 
     except KeyError:
         attributes['C1'] = 0.0
@@ -543,8 +567,8 @@ def calculate_217f_part_stress(**attributes):
 
     # Calculate the value of C2.
     try:
-        _f0 = _dic_c2[_package][0]
-        _f1 = _dic_c2[_package][1]
+        _f0 = dic_c2[_package][0]
+        _f1 = dic_c2[_package][1]
         attributes['C2'] = _f0 * (attributes['n_active_pins']**_f1)
     except KeyError:
         attributes['C2'] = 0.0
@@ -557,7 +581,7 @@ def calculate_217f_part_stress(**attributes):
         'piL'] = 0.01 * exp(5.35 - 0.35 * attributes['years_in_production'])
 
     # Determine the quality factor (piQ).
-    attributes['piQ'] = _lst_piQ[attributes['quality_id'] - 1]
+    attributes['piQ'] = lst_piQ[attributes['quality_id'] - 1]
 
     if attributes['piQ'] <= 0.0:
         _msg = _msg + 'RAMSTK WARNING: piQ is 0.0 when calculating ' \
@@ -565,7 +589,7 @@ def calculate_217f_part_stress(**attributes):
             '{0:d}'.format(attributes['hardware_id'])
 
     # Determine the environmental factor (piE).
-    attributes['piE'] = _lst_piE[attributes['environment_active_id'] - 1]
+    attributes['piE'] = lst_piE[attributes['environment_active_id'] - 1]
 
     if attributes['piE'] <= 0.0:
         _msg = _msg + 'RAMSTK WARNING: piE is 0.0 when calculating ' \
@@ -585,7 +609,7 @@ def calculate_217f_part_stress(**attributes):
              attributes['C2'] * attributes['piE'] + attributes['lambda_cyc']) *
             attributes['piQ'] * attributes['piL'])
     elif attributes['subcategory_id'] == 9:
-        attributes['piA'] = _dic_piA[attributes['type_id']][
+        attributes['piA'] = dic_piA[attributes['type_id']][
             attributes['application_id'] - 1]
         attributes['hazard_rate_active'] = (
             (attributes['C1'] * attributes['piT'] * attributes['piA'] +
@@ -748,39 +772,17 @@ def _calculate_lambda_cyclic(**attributes):
 
 def _calculate_temperature_factor(**attributes):
     """Calculate the temperature factor."""
-    # Key is the subcategory ID, value is Ea or list containing Ea values.
-    _dic_ea = {
-        1:
-        0.65,
-        2: [
-            0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.4, 0.45, 0.45, 0.5, 0.5, 0.6,
-            0.6, 0.6
-        ],
-        3:
-        0.65,
-        4:
-        0.65,
-        5:
-        0.6,
-        6:
-        0.6,
-        7:
-        0.6,
-        8:
-        0.6,
-        9: [1.5, 1.4]
-    }
     if attributes['subcategory_id'] == 2:
         _ref_temp = 296.0
-        _ea = _dic_ea[attributes['subcategory_id']][attributes['family_id'] -
-                                                    1]
+        _ea = dic_ea[attributes['subcategory_id']][attributes['family_id'] -
+                                                   1]
     elif attributes['subcategory_id'] == 9:
         _ref_temp = 423.0
-        _ea = _dic_ea[attributes['subcategory_id']][attributes['type_id'] - 1]
+        _ea = dic_ea[attributes['subcategory_id']][attributes['type_id'] - 1]
     else:
         _ref_temp = 296.0
         try:
-            _ea = _dic_ea[attributes['subcategory_id']]
+            _ea = dic_ea[attributes['subcategory_id']]
         except KeyError:
             _ea = 0.0
     attributes['temperature_junction'] = (
@@ -11,6 +11,25 @@ import gettext
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# Index is the environment ID.
+_dic_lambda_b = {
+    1: [
+        3.9, 7.8, 12.0, 12.0, 16.0, 16.0, 16.0, 19.0, 23.0, 19.0, 2.7,
+        16.0, 23.0, 100.0
+    ],
+    2: [
+        13.0, 26.0, 38.0, 38.0, 51.0, 51.0, 51.0, 64.0, 77.0, 64.0, 9.0,
+        51.0, 77.0, 350.0
+    ]
+}
+
+# Constants used in the part stress calculations.
+_lst_piE = [
+    1.0, 2.0, 3.0, 3.0, 4.0, 4.0, 4.0, 5.0, 6.0, 5.0, 0.7, 4.0, 6.0, 27.0
+]
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -23,18 +42,6 @@ def calculate_217f_part_count(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # Index is the environment ID.
-    _dic_lambda_b = {
-        1: [
-            3.9, 7.8, 12.0, 12.0, 16.0, 16.0, 16.0, 19.0, 23.0, 19.0, 2.7,
-            16.0, 23.0, 100.0
-        ],
-        2: [
-            13.0, 26.0, 38.0, 38.0, 51.0, 51.0, 51.0, 64.0, 77.0, 64.0, 9.0,
-            51.0, 77.0, 350.0
-        ]
-    }
     _msg = ''
 
     # Select the base hazard rate.
@@ -70,9 +77,6 @@ def calculate_217f_part_stress(**attributes):
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _lst_piE = [
-        1.0, 2.0, 3.0, 3.0, 4.0, 4.0, 4.0, 5.0, 6.0, 5.0, 0.7, 4.0, 6.0, 27.0
-    ]
     _msg = ''
 
     # Calculate the base hazard rate.
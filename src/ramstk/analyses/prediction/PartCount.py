@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.prediction.PartCount.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Batch MIL-HDBK-217F Parts Count Calculations Module."""
+
+import gettext
+
+import numpy as np
+import pandas as pd
+
+from . import Component
+
+_ = gettext.gettext
+
+# The number of active environment and quality IDs held in each compiled row.
+# Index zero is included because the scalar functions index their lists with
+# ID - 1, so an ID of zero selects the last entry of the list.
+_N_ENVIRONMENTS = 16
+_N_QUALITIES = 12
+
+# The attribute that selects the base hazard rate list within a subcategory.
+# First key is the category ID; second key is the subcategory ID (zero means
+# every subcategory).
+_DIC_SPECIFICATION_KEY = {
+    1: {
+        0: 'technology_id'
+    },
+    2: {
+        0: 'type_id'
+    },
+    3: {
+        0: 'specification_id'
+    },
+    4: {
+        0: 'specification_id'
+    },
+    5: {
+        0: 'family_id'
+    },
+    6: {
+        0: 'type_id'
+    },
+    7: {
+        0: 'construction_id'
+    },
+    8: {
+        0: 'type_id'
+    },
+    9: {
+        0: 'type_id'
+    },
+    10: {
+        0: 'specification_id',
+        2: 'type_id',
+        4: 'application_id'
+    }
+}
+
+# The compiled parts count tables.  The key is the (category ID, subcategory
+# ID, specification ID, number of elements) tuple; the value is a tuple of two
+# arrays, the base hazard rates indexed by active environment ID and the
+# quality factors indexed by quality ID.  Rows are compiled the first time a
+# key is seen.
+_DIC_PART_COUNT_TABLES = {}
+
+
+def get_specification_key(category_id, subcategory_id):
+    """
+    Retrieve the name of the attribute used as the specification ID.
+
+    :param int category_id: the component category ID.
+    :param int subcategory_id: the component subcategory ID.
+    :return: the name of the hardware attribute that selects the base hazard
+             rate list for the category and subcategory.
+    :rtype: str
+    """
+    try:
+        _dic_keys = _DIC_SPECIFICATION_KEY[category_id]
+    except KeyError:
+        return 'specification_id'
+
+    try:
+        return _dic_keys[subcategory_id]
+    except KeyError:
+        return _dic_keys[0]
+
+
+def do_build_columns(records):
+    """
+    Build the parts count input columns from a list of hardware attributes.
+
+    :param list records: the list of hardware attribute dicts, one per part.
+    :return: the columns needed by calculate_217f_part_count().
+    :rtype: :class:`pandas.DataFrame`
+    """
+    _columns = {
+        'category_id': [],
+        'subcategory_id': [],
+        'specification_id': [],
+        'environment_active_id': [],
+        'quality_id': [],
+        'n_elements': []
+    }
+    for _attributes in records:
+        _key = get_specification_key(_attributes['category_id'],
+                                     _attributes['subcategory_id'])
+        _columns['category_id'].append(_attributes['category_id'])
+        _columns['subcategory_id'].append(_attributes['subcategory_id'])
+        _columns['specification_id'].append(_attributes[_key])
+        _columns['environment_active_id'].append(
+            _attributes['environment_active_id'])
+        _columns['quality_id'].append(_attributes['quality_id'])
+        _columns['n_elements'].append(_attributes['n_elements'])
+
+    return pd.DataFrame(
+        _columns,
+        columns=[
+            'category_id', 'subcategory_id', 'specification_id',
+            'environment_active_id', 'quality_id', 'n_elements'
+        ])
+
+
+def _do_calculate_one(category_id, subcategory_id, specification_id,
+                      environment_active_id, quality_id, n_elements):
+    """
+    Calculate the parts count results for one part with the scalar functions.
+
+    Every specification attribute is set to the specification ID as each
+    category's scalar function only reads its own.
+
+    :return: (lambda_b, piQ, hazard_rate_active)
+    :rtype: (float, float, float)
+    """
+    _attributes = {
+        'hardware_id': 0,
+        'category_id': category_id,
+        'subcategory_id': subcategory_id,
+        'specification_id': specification_id,
+        'type_id': specification_id,
+        'family_id': specification_id,
+        'construction_id': specification_id,
+        'application_id': specification_id,
+        'technology_id': specification_id,
+        'environment_active_id': environment_active_id,
+        'quality_id': quality_id,
+        'n_elements': n_elements,
+        'lambda_b': 0.0,
+        'piQ': 1.0,
+        'hazard_rate_active': 0.0
+    }
+    _attributes, __ = Component.do_calculate_217f_part_count(**_attributes)
+
+    return (_attributes['lambda_b'], _attributes['piQ'],
+            _attributes['hazard_rate_active'])
+
+
+def _do_compile_row(key):
+    """
+    Compile the base hazard rates and quality factors for one table key.
+
+    Any entry the scalar functions cannot calculate is stored as NaN so the
+    parts that use it are calculated with the scalar functions instead.
+
+    :param tuple key: the (category ID, subcategory ID, specification ID,
+                      number of elements) tuple to compile.
+    :return: (_lambda_b, _piQ); the arrays of base hazard rates by active
+             environment ID and quality factors by quality ID.
+    :rtype: (:class:`numpy.ndarray`, :class:`numpy.ndarray`)
+    """
+    _category_id, _subcategory_id, _specification_id, _n_elements = key
+
+    _lambda_b = np.full(_N_ENVIRONMENTS, np.nan)
+    for _environment_id in range(_N_ENVIRONMENTS):
+        try:
+            _lambda_b[_environment_id] = _do_calculate_one(
+                _category_id, _subcategory_id, _specification_id,
+                _environment_id, 1, _n_elements)[0]
+        except (IndexError, KeyError, TypeError, ValueError):
+            pass
+
+    _piQ = np.full(_N_QUALITIES, np.nan)
+    for _quality_id in range(_N_QUALITIES):
+        try:
+            _piQ[_quality_id] = _do_calculate_one(
+                _category_id, _subcategory_id, _specification_id, 1,
+                _quality_id, _n_elements)[1]
+        except (IndexError, KeyError, TypeError, ValueError):
+            pass
+
+    return _lambda_b, _piQ
+
+
+def calculate_217f_part_count(columns):
+    """
+    Calculate the MIL-HDBK-217F parts count hazard rate for many parts at once.
+
+    The columns are category_id, subcategory_id, specification_id,
+    environment_active_id, quality_id and, for integrated circuits, n_elements.
+    The specification_id column holds the attribute returned by
+    get_specification_key() for each part; use do_build_columns() to build the
+    columns from hardware attribute dicts.
+
+    The base hazard rates and quality factors are looked up in tables compiled
+    from the scalar functions, so the results are identical to calling
+    Component.do_calculate_217f_part_count() on each part.  Parts whose IDs
+    fall outside the compiled tables are calculated with the scalar
+    functions.  The quality factor is 1.0 for parts whose model has no quality
+    factor.
+
+    :param columns: the parts count inputs, one entry per part.
+    :type columns: :class:`pandas.DataFrame` or dict of array-likes
+    :return: the lambda_b, piQ and hazard_rate_active arrays; a DataFrame with
+             the same index when a DataFrame is passed.
+    :rtype: dict or :class:`pandas.DataFrame`
+    """
+    _category = np.asarray(columns['category_id'], dtype=int)
+    _subcategory = np.asarray(columns['subcategory_id'], dtype=int)
+    _specification = np.asarray(columns['specification_id'], dtype=int)
+    _environment = np.asarray(columns['environment_active_id'], dtype=int)
+    _quality = np.asarray(columns['quality_id'], dtype=int)
+    try:
+        _n_elements = np.asarray(columns['n_elements'], dtype=int)
+    except KeyError:
+        _n_elements = np.zeros(len(_category), dtype=int)
+
+    # Only integrated circuits use the number of elements, so leave it out of
+    # the key for every other category to share the compiled rows.
+    _n_elements = np.where(_category == 1, _n_elements, 0)
+
+    _lambda_b = np.zeros(len(_category))
+    _piQ = np.ones(len(_category))
+
+    if len(_category) > 0:
+        _keys, _inverse = np.unique(
+            np.column_stack((_category, _subcategory, _specification,
+                             _n_elements)),
+            axis=0,
+            return_inverse=True)
+
+        _tbl_lambda_b = np.empty((len(_keys), _N_ENVIRONMENTS))
+        _tbl_piQ = np.empty((len(_keys), _N_QUALITIES))
+        for _idx, _key in enumerate(_keys):
+            _key = tuple(int(_k) for _k in _key)
+            try:
+                _row = _DIC_PART_COUNT_TABLES[_key]
+            except KeyError:
+                _row = _do_compile_row(_key)
+                _DIC_PART_COUNT_TABLES[_key] = _row
+            _tbl_lambda_b[_idx] = _row[0]
+            _tbl_piQ[_idx] = _row[1]
+
+        _in_table = ((_environment >= 0) & (_environment < _N_ENVIRONMENTS)
+                     & (_quality >= 0) & (_quality < _N_QUALITIES))
+        _lambda_b[_in_table] = _tbl_lambda_b[_inverse[_in_table],
+                                             _environment[_in_table]]
+        _piQ[_in_table] = _tbl_piQ[_inverse[_in_table], _quality[_in_table]]
+
+        for _idx in np.flatnonzero(~_in_table | np.isnan(_lambda_b)
+                                   | np.isnan(_piQ)):
+            _lambda_b[_idx], _piQ[_idx], __ = _do_calculate_one(
+                _category[_idx], _subcategory[_idx], _specification[_idx],
+                _environment[_idx], _quality[_idx], _n_elements[_idx])
+
+    _results = {
+        'lambda_b': _lambda_b,
+        'piQ': _piQ,
+        'hazard_rate_active': _lambda_b * _piQ
+    }
+
+    if isinstance(columns, pd.DataFrame):
+        _results = pd.DataFrame(
+            _results,
+            index=columns.index,
+            columns=['lambda_b', 'piQ', 'hazard_rate_active'])
+
+    return _results
@@ -0,0 +1,563 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.prediction.PartStress.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Batch MIL-HDBK-217F Part Stress Calculations Module."""
+
+import gettext
+
+import numpy as np
+import pandas as pd
+
+from . import (Capacitor, Component, IntegratedCircuit, Resistor,
+               Semiconductor)
+
+_ = gettext.gettext
+
+# The attributes read by the array expressions.
+_LST_INPUTS = [
+    'category_id', 'subcategory_id', 'specification_id', 'family_id',
+    'type_id', 'construction_id', 'configuration_id', 'quality_id',
+    'environment_active_id', 'n_elements', 'temperature_active',
+    'temperature_rated_max', 'power_ratio', 'voltage_ratio', 'capacitance',
+    'technology_id', 'application_id', 'package_id', 'n_active_pins',
+    'temperature_case', 'theta_jc', 'power_operating', 'power_rated',
+    'current_rated', 'years_in_production', 'lambda_b'
+]
+
+# The results calculated for each part.
+_LST_RESULTS = ['lambda_b', 'piQ', 'piE', 'hazard_rate_active']
+
+
+def _do_select(table, ids):
+    """
+    Select values from a table for an array of IDs.
+
+    A list is indexed with ID - 1, exactly like the scalar functions do,
+    including Python's wrap around for an ID of zero or less.  A dict is
+    indexed with the ID.  IDs that are not in the table, or that select None,
+    return NaN.
+
+    :param table: the list or dict to select values from.
+    :param ids: the array of IDs to select.
+    :type ids: :class:`numpy.ndarray`
+    :return: the selected values.
+    :rtype: :class:`numpy.ndarray`
+    """
+    if isinstance(table, dict):
+        _unique, _inverse = np.unique(ids, return_inverse=True)
+        _values = np.array(
+            [table.get(_id, None) for _id in _unique.tolist()], dtype=float)
+
+        return _values[_inverse]
+
+    _values = np.array(table, dtype=float)
+    _index = ids - 1
+    _valid = (_index >= -len(_values)) & (_index < len(_values))
+
+    return np.where(_valid, _values[np.where(_valid, _index, 0)], np.nan)
+
+
+def _do_group(*keys):
+    """
+    Group the positions of the rows that share the same key values.
+
+    :param keys: the arrays holding the key of each row.
+    :return: a list of (key, positions) tuples, one per distinct key.
+    :rtype: list
+    """
+    if len(keys[0]) == 0:
+        return []
+
+    _keys, _inverse = np.unique(
+        np.column_stack(keys), axis=0, return_inverse=True)
+    _order = np.argsort(_inverse, kind='mergesort')
+    _splits = np.cumsum(np.bincount(_inverse, minlength=len(_keys)))[:-1]
+
+    return zip([tuple(_key) for _key in _keys.tolist()],
+               np.split(_order, _splits))
+
+
+def _do_find_break(breaks, values):
+    """
+    Find the index of the first breakpoint at or above each value.
+
+    Values above the last breakpoint return the index of the last breakpoint.
+    This matches the loops over the breakpoints in the scalar functions.
+
+    :param list breaks: the ascending list of breakpoints.
+    :param values: the array of values to find the breakpoint for.
+    :type values: :class:`numpy.ndarray`
+    :return: the index of the breakpoint for each value.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.minimum(
+        np.searchsorted(breaks, values, side='left'),
+        len(breaks) - 1)
+
+
+def _do_calculate_resistors(columns, rows, results):
+    """
+    Calculate the part stress hazard rate for a group of resistors.
+
+    Resistors that need to be calculated with the scalar functions are left as
+    NaN in the results.
+
+    :param dict columns: the array of values for each input attribute.
+    :param rows: the positions of the resistors.
+    :type rows: :class:`numpy.ndarray`
+    :param results: the array of results to fill in, one row per part and one
+                    column per result.
+    :type results: :class:`numpy.ndarray`
+    :return: None
+    :rtype: None
+    """
+    _subcategory = columns['subcategory_id'][rows]
+    _specification = np.where(
+        np.in1d(_subcategory, [2, 6, 7]), columns['specification_id'][rows],
+        0)
+    _family = np.where(
+        np.in1d(_subcategory, [6, 7]), columns['family_id'][rows], 0)
+
+    for (_subcategory_id, _specification_id, _family_id), _positions in \
+            _do_group(_subcategory, _specification, _family):
+        _pos = rows[_positions]
+        try:
+            if _subcategory_id == 2:
+                _ref_temp = Resistor.dic_ref_temp[_subcategory_id][
+                    _specification_id]
+                _factors = Resistor.dic_factors[_subcategory_id][
+                    _specification_id]
+            elif _subcategory_id not in [4, 8]:
+                _ref_temp = Resistor.dic_ref_temp[_subcategory_id]
+                _factors = Resistor.dic_factors[_subcategory_id]
+
+            if _subcategory_id == 6:
+                _breaks = Resistor.dic_breakpoints[_subcategory_id][
+                    _specification_id - 1]
+            elif _subcategory_id not in [4, 8]:
+                _breaks = Resistor.dic_breakpoints[_subcategory_id]
+
+            if _subcategory_id in [6, 7]:
+                _lst_piR = Resistor.dic_piR[_subcategory_id][
+                    _specification_id - 1][_family_id - 1]
+            elif _subcategory_id not in [4, 8]:
+                _lst_piR = Resistor.dic_piR[_subcategory_id]
+
+            _lst_piQ = Resistor.dic_piQ[_subcategory_id]
+            _lst_piE = Resistor.dic_piE[_subcategory_id]
+        except (IndexError, KeyError):
+            continue
+
+        _temperature = columns['temperature_active'][_pos]
+        _power_ratio = columns['power_ratio'][_pos]
+        _n_elements = columns['n_elements'][_pos]
+
+        # Calculate the base hazard rate.
+        if _subcategory_id == 4:
+            _lambda_b = np.full(len(_pos), 0.00006)
+        elif _subcategory_id == 8:
+            _lambda_b = _do_select(Resistor.dic_factors[_subcategory_id],
+                                   columns['type_id'][_pos])
+        else:
+            _stress = (_power_ratio / _factors[3]) * (
+                (_temperature + 273.0) / 273.0)**_factors[4]
+            _lambda_b = _factors[0] * np.exp(_factors[1] * (
+                (_temperature + 273.0) / _ref_temp))**_factors[2] * np.exp(
+                    _stress**_factors[5])
+
+        _piQ = _do_select(_lst_piQ, columns['quality_id'][_pos])
+        _piE = _do_select(_lst_piE, columns['environment_active_id'][_pos])
+
+        # Calculate the active hazard rate.
+        _hazard_rate = _lambda_b * _piQ * _piE
+        if _subcategory_id == 4:
+            _piT = np.exp(-4056.0 * (
+                (1.0 / ((_temperature + 55.0 * _power_ratio) + 273.0)) -
+                1.0 / 298.0))
+            _hazard_rate = _hazard_rate * _piT * _n_elements
+        elif _subcategory_id != 8:
+            _piR = _do_select(_lst_piR,
+                              _do_find_break(_breaks, _n_elements) + 2)
+            if _subcategory_id > 8:
+                _piTAPS = (_n_elements**1.5 / 25.0) + 0.792
+                if _subcategory_id in [9, 10, 11, 12]:
+                    _v_breaks = [0.1, 0.2, 0.6, 0.7, 0.8, 0.9]
+                else:
+                    _v_breaks = [0.8, 0.9]
+                _piV = _do_select(
+                    Resistor.dic_piV[_subcategory_id],
+                    _do_find_break(_v_breaks, columns['voltage_ratio'][_pos]) +
+                    1)
+
+            if _subcategory_id in [9, 11, 13, 14, 15]:
+                _hazard_rate = _hazard_rate * _piTAPS * _piR * _piV
+            elif _subcategory_id in [10, 12]:
+                _piC = _do_select(Resistor.dic_piC[_subcategory_id],
+                                  columns['construction_id'][_pos])
+                _hazard_rate = (
+                    _hazard_rate * _piTAPS * _piC * _piR * _piV)
+            else:
+                _hazard_rate = _hazard_rate * _piR
+
+        results[_pos] = np.column_stack((_lambda_b, _piQ, _piE, _hazard_rate))
+
+
+def _do_calculate_capacitors(columns, rows, results):
+    """
+    Calculate the part stress hazard rate for a group of capacitors.
+
+    Capacitors that need to be calculated with the scalar functions are left
+    as NaN in the results.
+
+    :param dict columns: the array of values for each input attribute.
+    :param rows: the positions of the capacitors.
+    :type rows: :class:`numpy.ndarray`
+    :param results: the array of results to fill in, one row per part and one
+                    column per result.
+    :type results: :class:`numpy.ndarray`
+    :return: None
+    :rtype: None
+    """
+    for (_subcategory_id, _temperature_rated_max), _positions in _do_group(
+            columns['subcategory_id'][rows],
+            columns['temperature_rated_max'][rows]):
+        _subcategory_id = int(_subcategory_id)
+        _pos = rows[_positions]
+
+        # The series resistance factor is selected with the exact ratio of
+        # resistance to voltage, so leave those to the scalar function.
+        if _subcategory_id == 12:
+            continue
+
+        try:
+            _factors = Capacitor.dic_factors[_subcategory_id]
+            _lst_piQ = Capacitor.dic_piQ[_subcategory_id]
+            _lst_piE = Capacitor.dic_piE[_subcategory_id]
+        except KeyError:
+            continue
+
+        # Calculate the base hazard rate.
+        try:
+            _ref_temp = Capacitor.dic_ref_temp[_temperature_rated_max]
+            _lambda_b = _factors[0] * (
+                (columns['voltage_ratio'][_pos] / _factors[1])**_factors[2] +
+                1.0) * np.exp(_factors[3] * (
+                    (columns['temperature_active'][_pos] + 273.0) /
+                    _ref_temp)**_factors[4])
+        except KeyError:
+            _lambda_b = np.zeros(len(_pos))
+
+        _piCV = _factors[5] * columns['capacitance'][_pos]**_factors[6]
+        _piQ = _do_select(_lst_piQ, columns['quality_id'][_pos])
+        _piE = _do_select(_lst_piE, columns['environment_active_id'][_pos])
+
+        # Calculate the active hazard rate.
+        if _subcategory_id == 13:
+            _piC = _do_select(Capacitor.dic_piC,
+                              columns['construction_id'][_pos])
+            _hazard_rate = _lambda_b * _piCV * _piQ * _piE * _piC
+        elif _subcategory_id in [16, 17, 18]:
+            _hazard_rate = _lambda_b * _piQ * _piE
+        elif _subcategory_id == 19:
+            _piCF = _do_select(Capacitor.dic_piCF,
+                               columns['configuration_id'][_pos])
+            _hazard_rate = _lambda_b * _piCF * _piQ * _piE
+        else:
+            _hazard_rate = _lambda_b * _piCV * _piQ * _piE
+
+        results[_pos] = np.column_stack((_lambda_b, _piQ, _piE, _hazard_rate))
+
+
+def _do_calculate_integrated_circuits(columns, rows, results):
+    """
+    Calculate the part stress hazard rate for a group of integrated circuits.
+
+    Only linear, logic, microprocessor and GaAs integrated circuits are
+    calculated here.  The other subcategories, and integrated circuits that
+    need to be calculated with the scalar functions, are left as NaN in the
+    results.  The scalar function doesn't calculate lambda_b for integrated
+    circuits, so it is returned unchanged.
+
+    :param dict columns: the array of values for each input attribute.
+    :param rows: the positions of the integrated circuits.
+    :type rows: :class:`numpy.ndarray`
+    :param results: the array of results to fill in, one row per part and one
+                    column per result.
+    :type results: :class:`numpy.ndarray`
+    :return: None
+    :rtype: None
+    """
+    _subcategory = columns['subcategory_id'][rows]
+    _technology = np.where(
+        _subcategory == 2,
+        np.where(columns['technology_id'][rows] == 11, 2, 1),
+        columns['technology_id'][rows])
+    _application = np.where(_subcategory == 9,
+                            columns['application_id'][rows], 0)
+    _type = np.where(_subcategory == 9, columns['type_id'][rows], 0)
+
+    for (_subcategory_id, _technology_id, _application_id, _type_id), \
+            _positions in _do_group(_subcategory, _technology, _application,
+                                    _type):
+        _subcategory_id = int(_subcategory_id)
+        _pos = rows[_positions]
+
+        if _subcategory_id not in [1, 2, 4, 9]:
+            continue
+
+        _n_elements = columns['n_elements'][_pos]
+
+        # Retrieve the value of C1.
+        try:
+            if _subcategory_id == 9:
+                _breaks = IntegratedCircuit.dic_breakpoints_stress[
+                    _subcategory_id][_application_id]
+            else:
+                _breaks = IntegratedCircuit.dic_breakpoints_stress[
+                    _subcategory_id]
+            _C1 = _do_select(
+                IntegratedCircuit.dic_c1[_subcategory_id][int(
+                    _technology_id) - 1],
+                _do_find_break(_breaks, _n_elements) + 2)
+        except KeyError:
+            _C1 = np.zeros(len(_pos))
+        except IndexError:
+            continue
+
+        try:
+            if _subcategory_id == 2:
+                _ref_temp = 296.0
+                _ea = _do_select(IntegratedCircuit.dic_ea[_subcategory_id],
+                                 columns['family_id'][_pos])
+            elif _subcategory_id == 9:
+                _ref_temp = 423.0
+                _ea = IntegratedCircuit.dic_ea[_subcategory_id][int(
+                    _type_id) - 1]
+                _piA = IntegratedCircuit.dic_piA[_type_id][int(
+                    _application_id) - 1]
+            else:
+                _ref_temp = 296.0
+                _ea = IntegratedCircuit.dic_ea[_subcategory_id]
+        except (IndexError, KeyError):
+            continue
+
+        # Calculate the value of C2.
+        _package_id = columns['package_id'][_pos]
+        _package = np.where(
+            np.in1d(_package_id, [1, 2, 3]), 1,
+            np.where(_package_id == 4, 2,
+                     np.where(_package_id == 5, 3,
+                              np.where(_package_id == 6, 4, 5))))
+        _c2 = np.array(
+            [IntegratedCircuit.dic_c2[_key] for _key in range(1, 6)])
+        _C2 = _c2[_package - 1, 0] * (
+            columns['n_active_pins'][_pos]**_c2[_package - 1, 1])
+
+        # Calculate the temperature and learning factors.
+        _temperature_junction = (
+            columns['temperature_case'][_pos] +
+            columns['power_operating'][_pos] * columns['theta_jc'][_pos])
+        _piT = 0.1 * np.exp((-_ea / 8.617E-5) * (
+            (1.0 / (_temperature_junction + 273.0)) - (1.0 / _ref_temp)))
+        _piL = 0.01 * np.exp(
+            5.35 - 0.35 * columns['years_in_production'][_pos])
+
+        _piQ = _do_select(IntegratedCircuit.lst_piQ,
+                          columns['quality_id'][_pos])
+        _piE = _do_select(IntegratedCircuit.lst_piE,
+                          columns['environment_active_id'][_pos])
+
+        # Calculate the active hazard rate.
+        if _subcategory_id == 9:
+            _hazard_rate = (_C1 * _piT * _piA + _C2 * _piE) * _piQ * _piL
+        else:
+            _hazard_rate = (_C1 * _piT + _C2 * _piE) * _piQ * _piL
+
+        results[_pos] = np.column_stack((columns['lambda_b'][_pos], _piQ,
+                                         _piE, _hazard_rate))
+
+
+def _do_calculate_semiconductors(columns, rows, results):
+    """
+    Calculate the part stress hazard rate for a group of semiconductors.
+
+    High frequency bipolar and GaAs FET transistors, alphanumeric displays and
+    laser diodes are left as NaN in the results, as are semiconductors that
+    need to be calculated with the scalar functions.
+
+    :param dict columns: the array of values for each input attribute.
+    :param rows: the positions of the semiconductors.
+    :type rows: :class:`numpy.ndarray`
+    :param results: the array of results to fill in, one row per part and one
+                    column per result.
+    :type results: :class:`numpy.ndarray`
+    :return: None
+    :rtype: None
+    """
+    for (_subcategory_id, _type_id), _positions in _do_group(
+            columns['subcategory_id'][rows], columns['type_id'][rows]):
+        _subcategory_id = int(_subcategory_id)
+        _type_id = int(_type_id)
+        _pos = rows[_positions]
+
+        # The base hazard rate of these depends on the operating frequency,
+        # power or number of characters, so leave them to the scalar
+        # function.
+        if _subcategory_id in [7, 8, 12, 13]:
+            continue
+
+        # Calculate the base hazard rate.
+        try:
+            if _subcategory_id in [3, 5, 6, 10]:
+                _lambda_b = Semiconductor.dic_lambdab[_subcategory_id]
+            else:
+                _lambda_b = Semiconductor.dic_lambdab[_subcategory_id][
+                    _type_id - 1]
+        except KeyError:
+            _lambda_b = 0.0
+        except IndexError:
+            continue
+        _lambda_b = np.full(len(_pos), _lambda_b)
+
+        # Calculate the junction temperature and the temperature factor.
+        _temperature_case = columns['temperature_case'][_pos]
+        _temperature_case = np.where(
+            _temperature_case <= 0.0,
+            _do_select(Semiconductor.lst_temp_case,
+                       columns['environment_active_id'][_pos]),
+            _temperature_case)
+        _theta_jc = columns['theta_jc'][_pos]
+        _theta_jc = np.where(
+            _theta_jc <= 0.0,
+            _do_select(Semiconductor.lst_theta_jc,
+                       columns['package_id'][_pos]), _theta_jc)
+        _temperature_junction = (
+            _temperature_case + _theta_jc * columns['power_operating'][_pos])
+
+        try:
+            if _subcategory_id in [1, 2]:
+                _factor = Semiconductor.dic_piT[_subcategory_id][_type_id -
+                                                                 1]
+            else:
+                _factor = Semiconductor.dic_piT[_subcategory_id]
+            _piT = np.exp(-_factor * (1.0 /
+                                      (_temperature_junction + 273.0) -
+                                      1.0 / 298.0))
+        except (IndexError, KeyError):
+            _piT = np.zeros(len(_pos))
+
+        # Retrieve the quality and environmental factors.
+        try:
+            if _subcategory_id == 2:
+                _lst_piQ = Semiconductor.dic_piQ_stress[_subcategory_id][
+                    _type_id]
+            else:
+                _lst_piQ = Semiconductor.dic_piQ_stress[_subcategory_id]
+            _piQ = _do_select(_lst_piQ, columns['quality_id'][_pos])
+        except KeyError:
+            _piQ = np.zeros(len(_pos))
+        _piE = _do_select(Semiconductor.dic_piE[_subcategory_id],
+                          columns['environment_active_id'][_pos])
+
+        _hazard_rate = _lambda_b * _piT * _piQ * _piE
+
+        # Calculate the application, power rating and electrical stress
+        # factors used by the subcategory.
+        _power_rated = columns['power_rated'][_pos]
+        _voltage_ratio = columns['voltage_ratio'][_pos]
+        if _subcategory_id in [2, 3, 4]:
+            _piA = _do_select(Semiconductor.dic_piA[_subcategory_id],
+                              columns['application_id'][_pos])
+        if _subcategory_id == 2 and _type_id == 4:
+            _piR = np.where(
+                _power_rated > 0.0,
+                0.326 * np.log(np.where(_power_rated > 0.0, _power_rated,
+                                        1.0)) - 0.25, 0.0)
+        elif _subcategory_id == 2:
+            _piR = 1.0
+        elif _subcategory_id in [3, 6]:
+            _piR = np.where(_power_rated < 0.1, 0.43,
+                            np.maximum(_power_rated, 0.1)**0.37)
+            _piS = 0.045 * np.exp(3.1 * _voltage_ratio)
+        elif _subcategory_id == 10:
+            _piR = columns['current_rated'][_pos]**0.4
+            _piS = np.where(_voltage_ratio <= 0.3, 0.1,
+                            np.maximum(_voltage_ratio, 0.3)**1.9)
+
+        # Calculate the active hazard rate.
+        if _subcategory_id == 1:
+            if _type_id > 5:
+                _piS = 1.0
+            else:
+                _piS = np.where(_voltage_ratio <= 0.3, 0.054,
+                                np.maximum(_voltage_ratio, 0.3)**2.43)
+            _piC = _do_select(Semiconductor.lst_piC,
+                              columns['construction_id'][_pos])
+            _hazard_rate = _hazard_rate * _piS * _piC
+        elif _subcategory_id == 2:
+            _hazard_rate = _hazard_rate * _piA * _piR
+        elif _subcategory_id == 3:
+            _hazard_rate = _hazard_rate * _piA * _piR * _piS
+        elif _subcategory_id == 4:
+            _hazard_rate = _hazard_rate * _piA
+        elif _subcategory_id in [6, 10]:
+            _hazard_rate = _hazard_rate * _piR * _piS
+
+        results[_pos] = np.column_stack((_lambda_b, _piQ, _piE, _hazard_rate))
+
+
+# The vectorized part stress calculations.  The key is the category ID.
+_DIC_KERNELS = {
+    1: _do_calculate_integrated_circuits,
+    2: _do_calculate_semiconductors,
+    3: _do_calculate_resistors,
+    4: _do_calculate_capacitors
+}
+
+
+def calculate_217f_part_stress(parts):
+    """
+    Calculate the MIL-HDBK-217F part stress hazard rate for many parts at once.
+
+    The parts are grouped by category and subcategory, and the temperature,
+    stress and power factors of each group are calculated as array
+    expressions.  Integrated circuits, semiconductors, resistors and
+    capacitors are calculated this way.  Parts in every other category, and
+    any part the array expressions can't calculate, are passed to
+    Component.do_calculate_217f_part_stress() one at a time, so the frame
+    needs every attribute the scalar functions use.
+
+    The stress ratios are read from the frame, so calculate them before
+    calling this function.
+
+    :param parts: the hardware attributes, one row per part and one column per
+                  attribute.
+    :type parts: :class:`pandas.DataFrame`
+    :return: the lambda_b, piQ, piE and hazard_rate_active of each part, with
+             the same index as parts.
+    :rtype: :class:`pandas.DataFrame`
+    """
+    _columns = dict((_key, parts[_key].values) for _key in _LST_INPUTS)
+    _results = np.full((len(parts), len(_LST_RESULTS)), np.nan)
+
+    for (_category_id, ), _rows in _do_group(_columns['category_id']):
+        try:
+            _kernel = _DIC_KERNELS[_category_id]
+        except KeyError:
+            continue
+        _kernel(_columns, _rows, _results)
+
+    # Anything that wasn't calculated, or that calculated to NaN or infinity,
+    # goes through the scalar functions so errors are raised the same way.
+    _rows = np.flatnonzero(~np.isfinite(_results).all(axis=1))
+    for _row, _attributes in zip(_rows,
+                                 parts.iloc[_rows].to_dict('records')):
+        _attributes, __ = Component.do_calculate_217f_part_stress(
+            **_attributes)
+        _results[_row] = [_attributes[_key] for _key in _LST_RESULTS]
+
+    return pd.DataFrame(_results, index=parts.index, columns=_LST_RESULTS)
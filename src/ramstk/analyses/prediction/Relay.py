@@ -13,6 +13,88 @@ from math import exp
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id.  Current subcategory IDs are:
+#
+#    1. Mechanical
+#    2. Solid-State
+#
+# These keys return a list of base hazard rate lists.  The proper internal
+# list is selected by the type ID.  The hazard rate in to use is selected
+# from the list depending on the active environment.
+_dic_lambda_b = {
+    1: [[
+        0.13, 0.28, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
+        10.0, 0.0
+    ], [
+        0.43, 0.89, 6.9, 3.6, 12.0, 3.4, 4.4, 6.2, 6.7, 22.0, 0.21, 11.0,
+        32.0, 0.0
+    ], [
+        0.13, 0.26, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
+        10.0, 0.0
+    ], [
+        0.11, 0.23, 1.8, 0.92, 3.3, 0.96, 1.2, 2.1, 2.3, 6.5, 0.54, 3.0,
+        9.0, 0.0
+    ], [
+        0.29, 0.60, 4.8, 2.4, 8.2, 2.3, 2.9, 4.1, 4.5, 15.0, 0.14, 7.6,
+        22.0, 0.0
+    ], [
+        0.88, 1.8, 14.0, 7.4, 26.0, 7.1, 9.1, 13.0, 14.0, 46.0, 0.44, 24.0,
+        67.0, 0.0
+    ]],
+    2: [[
+        0.40, 1.2, 4.8, 2.4, 6.8, 4.8, 7.6, 8.4, 13.0, 9.2, 0.16, 4.8,
+        13.0, 240.0
+    ], [
+        0.50, 1.5, 6.0, 3.0, 8.5, 5.0, 9.5, 11.0, 16.0, 12.0, 0.20, 5.0,
+        17.0, 300.0
+    ]]
+}
+# List containing piQ values for parts count method.  The list positions
+# corrspond to the following quality levels:
+#
+#   0. Established reliability (mechanical only)
+#   1. MIL-SPEC
+#   2. Non-MIL
+#
+# The quality_id attribute is used to select the proper value of piQ.
+_dic_piQ_count = {1: [0.6, 3.0, 9.0], 2: [0.0, 1.0, 4.0]}
+
+# Constants used in the part stress calculations.
+_dic_factors = {
+    1: [[0.00555, 352.0, 15.7], [0.0054, 377.0, 10.4]],
+    2: [0.4, 0.5, 0.5]
+}
+_dic_piC = {1: [1.0, 1.5, 1.75, 2.0, 2.5, 3.0, 4.25, 5.5, 8.0]}
+_dic_piF = {
+    1: [[[4.0, 8.0], [6.0, 18.0], [1.0, 3.0], [4.0, 8.0], [7.0, 14.0],
+         [7.0, 14.0]]],
+    2:
+    [[[3.0, 6.0], [5.0, 10.0],
+      [6.0, 12.0]], [[5.0, 10.0], [2.0, 6.0], [6.0, 12.0], [100.0, 100.0],
+                     [10.0, 20.0]], [[10.0, 20.0], [100.0, 100.0]],
+     [[6.0, 12.0], [1.0, 3.0]], [[25.0, 0.0], [6.0, 0.0]], [[10.0, 20.0]],
+     [[9.0, 12.0]], [[10.0, 20.0], [5.0, 10.0], [5.0, 10.0]]],
+    3: [[[20.0, 40.0], [5.0, 10.0]], [[3.0, 6.0], [1.0, 3.0], [2.0, 6.0],
+                                      [3.0, 6.0], [2.0, 6.0], [2.0, 6.0]]],
+    4: [[[7.0, 14.0], [12.0, 24.0], [10.0, 20.0], [5.0, 10.0]]]
+}
+_dic_piQ_stress = {1: [0.1, 0.3, 0.45, 0.6, 1.0, 1.5, 3.0], 2: [1.0, 4.0]}
+_dic_piE = {
+    1: [[
+        1.0, 2.0, 15.0, 8.0, 27.0, 7.0, 9.0, 11.0, 12.0, 46.0, 0.50, 25.0,
+        66.0, 0.0
+    ], [
+        2.0, 5.0, 44.0, 24.0, 78.0, 15.0, 20.0, 28.0, 38.0, 140.0, 1.0,
+        72.0, 200.0, 0.0
+    ]],
+    2: [
+        1.0, 3.0, 12.0, 6.0, 17.0, 12.0, 19.0, 21.0, 32.0, 23.0, 0.4, 12.0,
+        33.0, 590.0
+    ]
+}
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -27,54 +109,6 @@ def calculate_217f_part_count(**attributes):
     """
     _msg = ''
 
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id.  Current subcategory IDs are:
-    #
-    #    1. Mechanical
-    #    2. Solid-State
-    #
-    # These keys return a list of base hazard rate lists.  The proper internal
-    # list is selected by the type ID.  The hazard rate in to use is selected
-    # from the list depending on the active environment.
-    _dic_lambda_b = {
-        1: [[
-            0.13, 0.28, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
-            10.0, 0.0
-        ], [
-            0.43, 0.89, 6.9, 3.6, 12.0, 3.4, 4.4, 6.2, 6.7, 22.0, 0.21, 11.0,
-            32.0, 0.0
-        ], [
-            0.13, 0.26, 2.1, 1.1, 3.8, 1.1, 1.4, 1.9, 2.0, 7.0, 0.66, 3.5,
-            10.0, 0.0
-        ], [
-            0.11, 0.23, 1.8, 0.92, 3.3, 0.96, 1.2, 2.1, 2.3, 6.5, 0.54, 3.0,
-            9.0, 0.0
-        ], [
-            0.29, 0.60, 4.8, 2.4, 8.2, 2.3, 2.9, 4.1, 4.5, 15.0, 0.14, 7.6,
-            22.0, 0.0
-        ], [
-            0.88, 1.8, 14.0, 7.4, 26.0, 7.1, 9.1, 13.0, 14.0, 46.0, 0.44, 24.0,
-            67.0, 0.0
-        ]],
-        2: [[
-            0.40, 1.2, 4.8, 2.4, 6.8, 4.8, 7.6, 8.4, 13.0, 9.2, 0.16, 4.8,
-            13.0, 240.0
-        ], [
-            0.50, 1.5, 6.0, 3.0, 8.5, 5.0, 9.5, 11.0, 16.0, 12.0, 0.20, 5.0,
-            17.0, 300.0
-        ]]
-    }
-
-    # List containing piQ values for parts count method.  The list positions
-    # corrspond to the following quality levels:
-    #
-    #   0. Established reliability (mechanical only)
-    #   1. MIL-SPEC
-    #   2. Non-MIL
-    #
-    # The quality_id attribute is used to select the proper value of piQ.
-    _dic_piQ = {1: [0.6, 3.0, 9.0], 2: [0.0, 1.0, 4.0]}
-
     # Select the base hazard rate.
     try:
         _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']][
@@ -90,7 +124,7 @@ def calculate_217f_part_count(**attributes):
 
     # Select the piQ.
     try:
-        attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+        attributes['piQ'] = _dic_piQ_count[attributes['subcategory_id']][
             attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
@@ -131,38 +165,6 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_factors = {
-        1: [[0.00555, 352.0, 15.7], [0.0054, 377.0, 10.4]],
-        2: [0.4, 0.5, 0.5]
-    }
-    _dic_piC = {1: [1.0, 1.5, 1.75, 2.0, 2.5, 3.0, 4.25, 5.5, 8.0]}
-    _dic_piF = {
-        1: [[[4.0, 8.0], [6.0, 18.0], [1.0, 3.0], [4.0, 8.0], [7.0, 14.0],
-             [7.0, 14.0]]],
-        2:
-        [[[3.0, 6.0], [5.0, 10.0],
-          [6.0, 12.0]], [[5.0, 10.0], [2.0, 6.0], [6.0, 12.0], [100.0, 100.0],
-                         [10.0, 20.0]], [[10.0, 20.0], [100.0, 100.0]],
-         [[6.0, 12.0], [1.0, 3.0]], [[25.0, 0.0], [6.0, 0.0]], [[10.0, 20.0]],
-         [[9.0, 12.0]], [[10.0, 20.0], [5.0, 10.0], [5.0, 10.0]]],
-        3: [[[20.0, 40.0], [5.0, 10.0]], [[3.0, 6.0], [1.0, 3.0], [2.0, 6.0],
-                                          [3.0, 6.0], [2.0, 6.0], [2.0, 6.0]]],
-        4: [[[7.0, 14.0], [12.0, 24.0], [10.0, 20.0], [5.0, 10.0]]]
-    }
-    _dic_piQ = {1: [0.1, 0.3, 0.45, 0.6, 1.0, 1.5, 3.0], 2: [1.0, 4.0]}
-    _dic_piE = {
-        1: [[
-            1.0, 2.0, 15.0, 8.0, 27.0, 7.0, 9.0, 11.0, 12.0, 46.0, 0.50, 25.0,
-            66.0, 0.0
-        ], [
-            2.0, 5.0, 44.0, 24.0, 78.0, 15.0, 20.0, 28.0, 38.0, 140.0, 1.0,
-            72.0, 200.0, 0.0
-        ]],
-        2: [
-            1.0, 3.0, 12.0, 6.0, 17.0, 12.0, 19.0, 21.0, 32.0, 23.0, 0.4, 12.0,
-            33.0, 590.0
-        ]
-    }
     _msg = ''
 
     # Calculate the base hazard rate.
@@ -227,7 +229,7 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
 
     # Determine the quality factor (piQ).
     try:
-        attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+        attributes['piQ'] = _dic_piQ_stress[attributes['subcategory_id']][
             attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
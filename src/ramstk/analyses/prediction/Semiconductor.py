@@ -15,7 +15,7 @@ from math import exp, log, sqrt
 _ = gettext.gettext
 
 # Constants used to calculate the application factor (piA)
-_dic_piA = {
+dic_piA = {
     2: [0.5, 2.5, 1.0],
     3: [1.5, 0.7],
     4: [1.5, 0.7, 2.0, 4.0, 8.0, 10.0],
@@ -23,7 +23,7 @@ _dic_piA = {
 }
 
 # Constants used to calculate the temperature factor (piT)
-_dic_piT = {
+dic_piT = {
     1: [3091.0, 3091.0, 3091.0, 3091.0, 3091.0, 3091.0, 1925.0, 1925.0],
     2: [5260.0, 2100.0, 2100.0, 2100.0, 2100.0, 2100.0],
     3: 2114.0,
@@ -43,11 +43,11 @@ _dic_piT = {
 }
 
 # Constants used to calculate the junction temperature.
-_lst_temp_case = [
+lst_temp_case = [
     35.0, 45.0, 50.0, 45.0, 50.0, 60.0, 60.0, 75.0, 75.0, 60.0, 35.0, 50.0,
     60.0, 45.0
 ]
-_lst_theta_jc = [
+lst_theta_jc = [
     70.0, 10.0, 70.0, 70.0, 70.0, 70.0, 70.0, 5.0, 70.0, 70.0, 10.0, 70.0,
     70.0, 70.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0, 10.0, 70.0, 70.0, 5.0, 22.0,
     70.0, 5.0, 70.0, 5.0, 5.0, 1.0, 10.0, 70.0, 70.0, 5.0, 5.0, 5.0, 10.0, 5.0,
@@ -57,11 +57,284 @@ _lst_theta_jc = [
 ]
 
 # Constants used to calculate the construction factor (piC).
-_lst_piC = [1.0, 2.0]
+lst_piC = [1.0, 2.0]
 
 # Constants used to calculate the matching factor (piM).
 _lst_piM = [1.0, 2.0, 4.0]
 
+# Constants used in the part stress base hazard rate calculations.
+dic_lambdab = {
+    1: [0.0038, 0.0010, 0.069, 0.003, 0.005, 0.0013, 0.0034, 0.002],
+    2: [0.22, 0.18, 0.0023, 0.0081, 0.027, 0.0025, 0.0025],
+    3:
+    0.00074,
+    4: [0.012, 0.0045],
+    5:
+    0.0083,
+    6:
+    0.18,
+    9: [0.06, 0.023],
+    10:
+    0.0022,
+    11: [
+        0.0055, 0.004, 0.0025, 0.013, 0.013, 0.0064, 0.0033, 0.017, 0.017,
+        0.0086, 0.0013, 0.00023
+    ],
+    13: [3.23, 5.65]
+}
+
+# Constants used in the part count base hazard rate selection.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id, second key is the type id.  Current
+# subcategory IDs are:
+#
+#    1. Diode, Low Frequency
+#    2. Diode, High Frequency
+#    3. Transistor, Low Frequency, Bipolar
+#    4. Transistor, Low Frequency, Si FET
+#    5. Transistor, Unijunction
+#    6. Transistor, High Frequency, Low Noise,Bipolar
+#    7. Transistor, High Frequency, High Power, Bipolar
+#    8. Transistor, High Frequency, GaAs FET
+#    9. Transistor, High Frequency, Si FET
+#   10. Thyristor/SCR
+#   11. Optoelectronic, Detector, Isolator, Emitter
+#   12. Optoelectronic, Alphanumeric Display
+#   13. Optoelectronic, Laser Diode
+#
+# These keys return a list of base hazard rates.  The hazard rate to use is
+# selected from the list depending on the active environment.
+_dic_lambda_b = {
+    1: {
+        1: [
+            0.00360, 0.0280, 0.049, 0.043, 0.100, 0.092, 0.210, 0.200,
+            0.44, 0.170, 0.00180, 0.076, 0.23, 1.50
+        ],
+        2: [
+            0.00094, 0.0075, 0.013, 0.011, 0.027, 0.024, 0.054, 0.054,
+            0.12, 0.045, 0.00047, 0.020, 0.06, 0.40
+        ],
+        3: [
+            0.06500, 0.5200, 0.890, 0.780, 1.900, 1.700, 3.700, 3.700,
+            8.00, 3.100, 0.03200, 1.400, 4.10, 28.0
+        ],
+        4: [
+            0.00280, 0.0220, 0.039, 0.034, 0.062, 0.073, 0.160, 0.160,
+            0.35, 0.130, 0.00140, 0.060, 0.18, 1.20
+        ],
+        5: [
+            0.00290, 0.0230, 0.040, 0.035, 0.084, 0.075, 0.170, 0.170,
+            0.36, 0.140, 0.00150, 0.062, 0.18, 1.20
+        ],
+        6: [
+            0.00330, 0.0240, 0.039, 0.035, 0.082, 0.066, 0.150, 0.130,
+            0.27, 0.120, 0.00160, 0.060, 0.16, 1.30
+        ],
+        7: [
+            0.00580, 0.0400, 0.066, 0.060, 0.140, 0.110, 0.250, 0.220,
+            0.460, 0.21, 0.00280, 0.100, 0.28, 2.10
+        ]
+    },
+    2: {
+        1: [
+            0.86, 2.80, 8.9, 5.6, 20.0, 11.0, 14.0, 36.0, 62.0, 44.0, 0.43,
+            16.0, 67.0, 350.0
+        ],
+        2: [
+            0.31, 0.76, 2.1, 1.5, 4.60, 2.00, 2.50, 4.50, 7.60, 7.90, 0.16,
+            3.70, 12.0, 94.00
+        ],
+        3: [
+            0.004, 0.0096, 0.0026, 0.0019, 0.058, 0.025, 0.032, 0.057,
+            0.097, 0.10, 0.002, 0.048, 0.15, 1.2
+        ],
+        4: [
+            0.028, 0.068, 0.19, 0.14, 0.41, 0.18, 0.22, 0.40, 0.69, 0.71,
+            0.014, 0.34, 1.1, 8.5
+        ],
+        5: [
+            0.047, 0.11, 0.31, 0.23, 0.68, 0.3, 0.37, 0.67, 1.1, 1.2,
+            0.023, 0.56, 1.8, 14.0
+        ],
+        6: [
+            0.0043, 0.010, 0.029, 0.021, 0.063, 0.028, 0.034, 0.062, 0.11,
+            0.11, 0.0022, 0.052, 0.17, 1.3
+        ]
+    },
+    3: {
+        1: [
+            0.00015, 0.0011, 0.0017, 0.0017, 0.0037, 0.0030, 0.0067,
+            0.0060, 0.013, 0.0056, 0.000073, 0.0027, 0.0074, 0.056
+        ],
+        2: [
+            0.0057, 0.042, 0.069, 0.063, 0.15, 0.12, 0.26, 0.23, 0.50,
+            0.22, 0.0029, 0.11, 0.29, 1.1
+        ]
+    },
+    4: [
+        0.014, 0.099, 0.16, 0.15, 0.34, 0.28, 0.62, 0.53, 1.1, 0.51,
+        0.0069, 0.25, 0.68, 5.3
+    ],
+    5: [
+        0.016, 0.12, 0.20, 0.18, 0.42, 0.35, 0.80, 0.74, 1.6, 0.66, 0.0079,
+        0.31, 0.88, 6.4
+    ],
+    6: [
+        0.094, 0.23, 0.63, 0.46, 1.4, 0.60, 0.75, 1.3, 2.3, 2.4, 0.047,
+        1.1, 3.6, 28.0
+    ],
+    7: [
+        0.074, 0.15, 0.37, 0.29, 0.81, 0.29, 0.37, 0.52, 0.88, 0.037, 0.33,
+        0.66, 1.8, 18.0
+    ],
+    8: {
+        1: [
+            0.17, 0.51, 1.5, 1.0, 3.4, 1.8, 2.3, 5.4, 9.2, 7.2, 0.083, 2.8,
+            11.0, 63.0
+        ],
+        2: [
+            0.42, 1.3, 3.8, 2.5, 8.5, 4.5, 5.6, 13.0, 23.0, 18.0, 0.21,
+            6.9, 27.0, 160.0
+        ]
+    },
+    9: [
+        0.014, 0.099, 0.16, 0.15, 0.34, 0.28, 0.62, 0.53, 1.1, 0.51,
+        0.0069, 0.25, 0.68, 5.3
+    ],
+    10: [
+        0.0025, 0.020, 0.034, 0.030, 0.072, 0.064, 0.14, 0.14, 0.31, 0.12,
+        0.0012, 0.053, 0.16, 1.1
+    ],
+    11: {
+        1: [
+            0.01100, 0.0290, 0.0830, 0.0590, 0.1800, 0.0840, 0.1100,
+            0.2100, 0.3500, 0.3400, 0.00570, 0.1500, 0.510, 3.70
+        ],
+        2: [
+            0.02700, 0.0700, 0.2000, 0.1400, 0.4300, 0.2000, 0.2500,
+            0.4900, 0.8300, 0.8000, 0.01300, 0.3500, 1.200, 8.70
+        ],
+        3: [
+            0.00047, 0.0012, 0.0035, 0.0025, 0.0077, 0.0035, 0.0044,
+            0.0086, 0.0150, 0.0140, 0.00024, 0.0053, 0.021, 0.15
+        ]
+    },
+    12: [
+        0.0062, 0.016, 0.045, 0.032, 0.10, 0.046, 0.058, 0.11, 0.19, 0.18,
+        0.0031, 0.082, 0.28, 2.0
+    ],
+    13: {
+        1: [
+            5.1, 16.0, 49.0, 32.0, 110.0, 58.0, 72.0, 100.0, 170.0, 230.0,
+            2.6, 87.0, 350.0, 2000.0
+        ],
+        2: [
+            8.9, 28.0, 85.0, 55.0, 190.0, 100.0, 130.0, 180.0, 300.0,
+            400.0, 4.5, 150.0, 600.0, 3500.0
+        ]
+    }
+}
+
+# Constants used in the environmental factor (piE) selection.
+dic_piE = {
+    1: [
+        1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
+        32.0, 320.0
+    ],
+    2: [
+        1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 9.0,
+        24.0, 250.0
+    ],
+    3: [
+        1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
+        32.0, 320.0
+    ],
+    4: [
+        1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
+        32.0, 320.0
+    ],
+    5: [
+        1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
+        32.0, 320.0
+    ],
+    6: [
+        1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 9.0,
+        24.0, 250.0
+    ],
+    7: [
+        1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 9.0,
+        24.0, 250.0
+    ],
+    8: [
+        1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 7.5,
+        24.0, 250.0
+    ],
+    9: [
+        1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
+        32.0, 320.0
+    ],
+    10: [
+        1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
+        32.0, 320.0
+    ],
+    11: [
+        1.0, 2.0, 8.0, 5.0, 12.0, 4.0, 6.0, 6.0, 8.0, 17.0, 0.5, 9.0, 24.0,
+        450.0
+    ],
+    12: [
+        1.0, 2.0, 8.0, 5.0, 12.0, 4.0, 6.0, 6.0, 8.0, 17.0, 0.5, 9.0, 24.0,
+        450.0
+    ],
+    13: [
+        1.0, 2.0, 8.0, 5.0, 12.0, 4.0, 6.0, 6.0, 8.0, 17.0, 0.5, 9.0, 24.0,
+        450.0
+    ]
+}
+
+# Constants used in the part count quality factor (piQ) selection.
+# Dictionary containing piQ values for parts count method.  The key is the
+# subcategory_id.  The quality_id attribute is used to select the proper
+# value of piQ from the returned list.
+_dic_piQ_count = {
+    1: [0.7, 1.0, 2.4, 5.5, 8.0],
+    2: [[0.5, 1.0, 5.0, 25, 50], [0.5, 1.0, 1.8, 2.5]],
+    3: [0.7, 1.0, 2.4, 5.5, 8.0],
+    4: [0.7, 1.0, 2.4, 5.5, 8.0],
+    5: [0.7, 1.0, 2.4, 5.5, 8.0],
+    6: [0.7, 1.0, 2.4, 5.5, 8.0],
+    7: [0.7, 1.0, 2.4, 5.5, 8.0],
+    8: [0.7, 1.0, 2.4, 5.5, 8.0],
+    9: [0.7, 1.0, 2.4, 5.5, 8.0],
+    10: [0.7, 1.0, 2.4, 5.5, 8.0],
+    11: [0.7, 1.0, 2.4, 5.5, 8.0],
+    12: [0.7, 1.0, 2.4, 5.5, 8.0],
+    13: [1.0, 1.0, 3.3],
+}
+
+# Constants used in the part stress quality factor (piQ) selection.
+dic_piQ_stress = {
+    1: [0.7, 1.0, 2.4, 5.5, 8.0],
+    2: {
+        1: [0.5, 1.0, 5.0, 25.0, 50.0],
+        2: [0.5, 1.0, 5.0, 25.0, 50.0],
+        3: [0.5, 1.0, 5.0, 25.0, 50.0],
+        4: [0.5, 1.0, 5.0, 25.0, 50.0],
+        5: [0.5, 1.0, 1.8, 2.5],
+        6: [0.5, 1.0, 5.0, 25.0, 50.0]
+    },
+    3: [0.7, 1.0, 2.4, 5.5, 8.0],
+    4: [0.7, 1.0, 2.4, 5.5, 8.0],
+    5: [0.7, 1.0, 2.4, 5.5, 8.0],
+    6: [0.5, 1.0, 2.0, 5.0],
+    7: [0.5, 1.0, 2.0, 5.0],
+    8: [0.5, 1.0, 2.0, 5.0],
+    9: [0.5, 1.0, 2.0, 5.0],
+    10: [0.7, 1.0, 2.4, 5.5, 8.0],
+    11: [0.7, 1.0, 2.4, 5.5, 8.0],
+    12: [0.7, 1.0, 2.4, 5.5, 8.0],
+    13: [1.0, 1.0, 3.3]
+}
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -140,7 +413,7 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
 
     # Retrieve the construction factor (piC).
     if attributes['subcategory_id'] == 1:
-        attributes['piC'] = _lst_piC[attributes['construction_id'] - 1]
+        attributes['piC'] = lst_piC[attributes['construction_id'] - 1]
 
     # Calculate forward current factor (piI).
     if attributes['subcategory_id'] == 13:
@@ -271,7 +544,7 @@ def _calculate_application_factor(attributes):
     """
     if attributes['subcategory_id'] in [2, 3, 4, 8]:
         try:
-            attributes['piA'] = _dic_piA[attributes['subcategory_id']][
+            attributes['piA'] = dic_piA[attributes['subcategory_id']][
                 attributes['application_id'] - 1]
         except KeyError:
             attributes['piA'] = 0.0
@@ -297,29 +570,10 @@ def _calculate_base_part_stress_hazard_rate(attributes):
              with updated values
     :rtype: dict
     """
-    _dic_lambdab = {
-        1: [0.0038, 0.0010, 0.069, 0.003, 0.005, 0.0013, 0.0034, 0.002],
-        2: [0.22, 0.18, 0.0023, 0.0081, 0.027, 0.0025, 0.0025],
-        3:
-        0.00074,
-        4: [0.012, 0.0045],
-        5:
-        0.0083,
-        6:
-        0.18,
-        9: [0.06, 0.023],
-        10:
-        0.0022,
-        11: [
-            0.0055, 0.004, 0.0025, 0.013, 0.013, 0.0064, 0.0033, 0.017, 0.017,
-            0.0086, 0.0013, 0.00023
-        ],
-        13: [3.23, 5.65]
-    }
 
     try:
         if attributes['subcategory_id'] in [3, 5, 6, 10]:
-            attributes['lambda_b'] = _dic_lambdab[attributes['subcategory_id']]
+            attributes['lambda_b'] = dic_lambdab[attributes['subcategory_id']]
         elif attributes['subcategory_id'] == 7:
             attributes['lambda_b'] = 0.032 * exp(
                 0.354 * attributes['frequency_operating'] +
@@ -340,7 +594,7 @@ def _calculate_base_part_stress_hazard_rate(attributes):
             else:
                 attributes['lambda_b'] = 0.00043 * attributes['n_elements']
         else:
-            attributes['lambda_b'] = _dic_lambdab[attributes[
+            attributes['lambda_b'] = dic_lambdab[attributes[
                 'subcategory_id']][attributes['type_id'] - 1]
     except KeyError:
         attributes['lambda_b'] = 0.0
@@ -383,10 +637,10 @@ def _calculate_junction_temperature(attributes):
     :rtype: dict
     """
     if attributes['temperature_case'] <= 0.0:
-        attributes['temperature_case'] = _lst_temp_case[
+        attributes['temperature_case'] = lst_temp_case[
             attributes['environment_active_id'] - 1]
     if attributes['theta_jc'] <= 0.0:
-        attributes['theta_jc'] = _lst_theta_jc[attributes['package_id'] - 1]
+        attributes['theta_jc'] = lst_theta_jc[attributes['package_id'] - 1]
     attributes['temperature_junction'] = (
         attributes['temperature_case'] +
         attributes['theta_jc'] * attributes['power_operating'])
@@ -435,13 +689,13 @@ def _calculate_temperature_factor(attributes):
     """
     try:
         if attributes['subcategory_id'] in [1, 2]:
-            _factors = _dic_piT[attributes['subcategory_id']][
+            _factors = dic_piT[attributes['subcategory_id']][
                 attributes['type_id'] - 1]
         elif attributes['subcategory_id'] == 7:
-            _factors = _dic_piT[attributes['subcategory_id']][attributes[
+            _factors = dic_piT[attributes['subcategory_id']][attributes[
                 'type_id']]
         else:
-            _factors = _dic_piT[attributes['subcategory_id']]
+            _factors = dic_piT[attributes['subcategory_id']]
 
         if attributes['subcategory_id'] == 7:
             _f0 = _factors[0]
@@ -475,156 +729,6 @@ def _select_base_part_count_hazard_rate(attributes):
              with updated values
     :rtype: dict
     """
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id, second key is the type id.  Current
-    # subcategory IDs are:
-    #
-    #    1. Diode, Low Frequency
-    #    2. Diode, High Frequency
-    #    3. Transistor, Low Frequency, Bipolar
-    #    4. Transistor, Low Frequency, Si FET
-    #    5. Transistor, Unijunction
-    #    6. Transistor, High Frequency, Low Noise,Bipolar
-    #    7. Transistor, High Frequency, High Power, Bipolar
-    #    8. Transistor, High Frequency, GaAs FET
-    #    9. Transistor, High Frequency, Si FET
-    #   10. Thyristor/SCR
-    #   11. Optoelectronic, Detector, Isolator, Emitter
-    #   12. Optoelectronic, Alphanumeric Display
-    #   13. Optoelectronic, Laser Diode
-    #
-    # These keys return a list of base hazard rates.  The hazard rate to use is
-    # selected from the list depending on the active environment.
-    _dic_lambda_b = {
-        1: {
-            1: [
-                0.00360, 0.0280, 0.049, 0.043, 0.100, 0.092, 0.210, 0.200,
-                0.44, 0.170, 0.00180, 0.076, 0.23, 1.50
-            ],
-            2: [
-                0.00094, 0.0075, 0.013, 0.011, 0.027, 0.024, 0.054, 0.054,
-                0.12, 0.045, 0.00047, 0.020, 0.06, 0.40
-            ],
-            3: [
-                0.06500, 0.5200, 0.890, 0.780, 1.900, 1.700, 3.700, 3.700,
-                8.00, 3.100, 0.03200, 1.400, 4.10, 28.0
-            ],
-            4: [
-                0.00280, 0.0220, 0.039, 0.034, 0.062, 0.073, 0.160, 0.160,
-                0.35, 0.130, 0.00140, 0.060, 0.18, 1.20
-            ],
-            5: [
-                0.00290, 0.0230, 0.040, 0.035, 0.084, 0.075, 0.170, 0.170,
-                0.36, 0.140, 0.00150, 0.062, 0.18, 1.20
-            ],
-            6: [
-                0.00330, 0.0240, 0.039, 0.035, 0.082, 0.066, 0.150, 0.130,
-                0.27, 0.120, 0.00160, 0.060, 0.16, 1.30
-            ],
-            7: [
-                0.00580, 0.0400, 0.066, 0.060, 0.140, 0.110, 0.250, 0.220,
-                0.460, 0.21, 0.00280, 0.100, 0.28, 2.10
-            ]
-        },
-        2: {
-            1: [
-                0.86, 2.80, 8.9, 5.6, 20.0, 11.0, 14.0, 36.0, 62.0, 44.0, 0.43,
-                16.0, 67.0, 350.0
-            ],
-            2: [
-                0.31, 0.76, 2.1, 1.5, 4.60, 2.00, 2.50, 4.50, 7.60, 7.90, 0.16,
-                3.70, 12.0, 94.00
-            ],
-            3: [
-                0.004, 0.0096, 0.0026, 0.0019, 0.058, 0.025, 0.032, 0.057,
-                0.097, 0.10, 0.002, 0.048, 0.15, 1.2
-            ],
-            4: [
-                0.028, 0.068, 0.19, 0.14, 0.41, 0.18, 0.22, 0.40, 0.69, 0.71,
-                0.014, 0.34, 1.1, 8.5
-            ],
-            5: [
-                0.047, 0.11, 0.31, 0.23, 0.68, 0.3, 0.37, 0.67, 1.1, 1.2,
-                0.023, 0.56, 1.8, 14.0
-            ],
-            6: [
-                0.0043, 0.010, 0.029, 0.021, 0.063, 0.028, 0.034, 0.062, 0.11,
-                0.11, 0.0022, 0.052, 0.17, 1.3
-            ]
-        },
-        3: {
-            1: [
-                0.00015, 0.0011, 0.0017, 0.0017, 0.0037, 0.0030, 0.0067,
-                0.0060, 0.013, 0.0056, 0.000073, 0.0027, 0.0074, 0.056
-            ],
-            2: [
-                0.0057, 0.042, 0.069, 0.063, 0.15, 0.12, 0.26, 0.23, 0.50,
-                0.22, 0.0029, 0.11, 0.29, 1.1
-            ]
-        },
-        4: [
-            0.014, 0.099, 0.16, 0.15, 0.34, 0.28, 0.62, 0.53, 1.1, 0.51,
-            0.0069, 0.25, 0.68, 5.3
-        ],
-        5: [
-            0.016, 0.12, 0.20, 0.18, 0.42, 0.35, 0.80, 0.74, 1.6, 0.66, 0.0079,
-            0.31, 0.88, 6.4
-        ],
-        6: [
-            0.094, 0.23, 0.63, 0.46, 1.4, 0.60, 0.75, 1.3, 2.3, 2.4, 0.047,
-            1.1, 3.6, 28.0
-        ],
-        7: [
-            0.074, 0.15, 0.37, 0.29, 0.81, 0.29, 0.37, 0.52, 0.88, 0.037, 0.33,
-            0.66, 1.8, 18.0
-        ],
-        8: {
-            1: [
-                0.17, 0.51, 1.5, 1.0, 3.4, 1.8, 2.3, 5.4, 9.2, 7.2, 0.083, 2.8,
-                11.0, 63.0
-            ],
-            2: [
-                0.42, 1.3, 3.8, 2.5, 8.5, 4.5, 5.6, 13.0, 23.0, 18.0, 0.21,
-                6.9, 27.0, 160.0
-            ]
-        },
-        9: [
-            0.014, 0.099, 0.16, 0.15, 0.34, 0.28, 0.62, 0.53, 1.1, 0.51,
-            0.0069, 0.25, 0.68, 5.3
-        ],
-        10: [
-            0.0025, 0.020, 0.034, 0.030, 0.072, 0.064, 0.14, 0.14, 0.31, 0.12,
-            0.0012, 0.053, 0.16, 1.1
-        ],
-        11: {
-            1: [
-                0.01100, 0.0290, 0.0830, 0.0590, 0.1800, 0.0840, 0.1100,
-                0.2100, 0.3500, 0.3400, 0.00570, 0.1500, 0.510, 3.70
-            ],
-            2: [
-                0.02700, 0.0700, 0.2000, 0.1400, 0.4300, 0.2000, 0.2500,
-                0.4900, 0.8300, 0.8000, 0.01300, 0.3500, 1.200, 8.70
-            ],
-            3: [
-                0.00047, 0.0012, 0.0035, 0.0025, 0.0077, 0.0035, 0.0044,
-                0.0086, 0.0150, 0.0140, 0.00024, 0.0053, 0.021, 0.15
-            ]
-        },
-        12: [
-            0.0062, 0.016, 0.045, 0.032, 0.10, 0.046, 0.058, 0.11, 0.19, 0.18,
-            0.0031, 0.082, 0.28, 2.0
-        ],
-        13: {
-            1: [
-                5.1, 16.0, 49.0, 32.0, 110.0, 58.0, 72.0, 100.0, 170.0, 230.0,
-                2.6, 87.0, 350.0, 2000.0
-            ],
-            2: [
-                8.9, 28.0, 85.0, 55.0, 190.0, 100.0, 130.0, 180.0, 300.0,
-                400.0, 4.5, 150.0, 600.0, 3500.0
-            ]
-        }
-    }
 
     try:
         if attributes['subcategory_id'] in [1, 2, 3, 8, 11, 13]:
@@ -652,63 +756,9 @@ def _select_environmental_factor(attributes):
              with updated values
     :rtype: dict
     """
-    _dic_piE = {
-        1: [
-            1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
-            32.0, 320.0
-        ],
-        2: [
-            1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 9.0,
-            24.0, 250.0
-        ],
-        3: [
-            1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
-            32.0, 320.0
-        ],
-        4: [
-            1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
-            32.0, 320.0
-        ],
-        5: [
-            1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
-            32.0, 320.0
-        ],
-        6: [
-            1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 9.0,
-            24.0, 250.0
-        ],
-        7: [
-            1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 9.0,
-            24.0, 250.0
-        ],
-        8: [
-            1.0, 2.0, 5.0, 4.0, 11.0, 4.0, 5.0, 7.0, 12.0, 16.0, 0.5, 7.5,
-            24.0, 250.0
-        ],
-        9: [
-            1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
-            32.0, 320.0
-        ],
-        10: [
-            1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0,
-            32.0, 320.0
-        ],
-        11: [
-            1.0, 2.0, 8.0, 5.0, 12.0, 4.0, 6.0, 6.0, 8.0, 17.0, 0.5, 9.0, 24.0,
-            450.0
-        ],
-        12: [
-            1.0, 2.0, 8.0, 5.0, 12.0, 4.0, 6.0, 6.0, 8.0, 17.0, 0.5, 9.0, 24.0,
-            450.0
-        ],
-        13: [
-            1.0, 2.0, 8.0, 5.0, 12.0, 4.0, 6.0, 6.0, 8.0, 17.0, 0.5, 9.0, 24.0,
-            450.0
-        ]
-    }
 
     try:
-        attributes['piE'] = _dic_piE[attributes['subcategory_id']][
+        attributes['piE'] = dic_piE[attributes['subcategory_id']][
             attributes['environment_active_id'] - 1]
     except (KeyError, IndexError):
         attributes['piE'] = 0.0
@@ -724,35 +774,19 @@ def _select_part_count_quality_factor(attributes):
              with updated values
     :rtype: dict
     """
-    # Dictionary containing piQ values for parts count method.  The key is the
-    # subcategory_id.  The quality_id attribute is used to select the proper
-    # value of piQ from the returned list.
-    _dic_piQ = {
-        1: [0.7, 1.0, 2.4, 5.5, 8.0],
-        2: [[0.5, 1.0, 5.0, 25, 50], [0.5, 1.0, 1.8, 2.5]],
-        3: [0.7, 1.0, 2.4, 5.5, 8.0],
-        4: [0.7, 1.0, 2.4, 5.5, 8.0],
-        5: [0.7, 1.0, 2.4, 5.5, 8.0],
-        6: [0.7, 1.0, 2.4, 5.5, 8.0],
-        7: [0.7, 1.0, 2.4, 5.5, 8.0],
-        8: [0.7, 1.0, 2.4, 5.5, 8.0],
-        9: [0.7, 1.0, 2.4, 5.5, 8.0],
-        10: [0.7, 1.0, 2.4, 5.5, 8.0],
-        11: [0.7, 1.0, 2.4, 5.5, 8.0],
-        12: [0.7, 1.0, 2.4, 5.5, 8.0],
-        13: [1.0, 1.0, 3.3],
-    }
 
     try:
         if attributes['subcategory_id'] == 2:
             if attributes['type_id'] == 5:
-                attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][1][
-                    attributes['quality_id'] - 1]
+                attributes['piQ'] = _dic_piQ_count[
+                    attributes['subcategory_id']][1][attributes['quality_id'] -
+                                                     1]
             else:
-                attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][0][
-                    attributes['quality_id'] - 1]
+                attributes['piQ'] = _dic_piQ_count[
+                    attributes['subcategory_id']][0][attributes['quality_id'] -
+                                                     1]
         else:
-            attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+            attributes['piQ'] = _dic_piQ_count[attributes['subcategory_id']][
                 attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
@@ -768,35 +802,13 @@ def _select_part_stress_quality_factor(attributes):
              with updated values
     :rtype: dict
     """
-    _dic_piQ = {
-        1: [0.7, 1.0, 2.4, 5.5, 8.0],
-        2: {
-            1: [0.5, 1.0, 5.0, 25.0, 50.0],
-            2: [0.5, 1.0, 5.0, 25.0, 50.0],
-            3: [0.5, 1.0, 5.0, 25.0, 50.0],
-            4: [0.5, 1.0, 5.0, 25.0, 50.0],
-            5: [0.5, 1.0, 1.8, 2.5],
-            6: [0.5, 1.0, 5.0, 25.0, 50.0]
-        },
-        3: [0.7, 1.0, 2.4, 5.5, 8.0],
-        4: [0.7, 1.0, 2.4, 5.5, 8.0],
-        5: [0.7, 1.0, 2.4, 5.5, 8.0],
-        6: [0.5, 1.0, 2.0, 5.0],
-        7: [0.5, 1.0, 2.0, 5.0],
-        8: [0.5, 1.0, 2.0, 5.0],
-        9: [0.5, 1.0, 2.0, 5.0],
-        10: [0.7, 1.0, 2.4, 5.5, 8.0],
-        11: [0.7, 1.0, 2.4, 5.5, 8.0],
-        12: [0.7, 1.0, 2.4, 5.5, 8.0],
-        13: [1.0, 1.0, 3.3]
-    }
 
     try:
         if attributes['subcategory_id'] == 2:
-            attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+            attributes['piQ'] = dic_piQ_stress[attributes['subcategory_id']][
                 attributes['type_id']][attributes['quality_id'] - 1]
         else:
-            attributes['piQ'] = _dic_piQ[attributes['subcategory_id']][
+            attributes['piQ'] = dic_piQ_stress[attributes['subcategory_id']][
                 attributes['quality_id'] - 1]
     except (KeyError, IndexError):
         attributes['piQ'] = 0.0
@@ -13,6 +13,76 @@ from math import exp
 
 _ = gettext.gettext
 
+# Constants used in the part count calculations.
+# Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
+# First key is the subcategory_id.  Current subcategory IDs are:
+#
+#    1. Toggle or pushbutton
+#    2. Sensitive
+#    3. Rotary
+#    4. Thumbwheel
+#    5. Circuit breaker
+#
+# These keys return a list of base hazard rates.  The hazard rate to use is
+# selected from the list depending on the active environment.
+_dic_lambda_b_count = {
+    1: [
+        0.0010, 0.0030, 0.018, 0.0080, 0.029, 0.010, 0.018, 0.013, 0.022,
+        0.046, 0.0005, 0.025, 0.067, 1.2
+    ],
+    2: [
+        0.15, 0.44, 2.7, 1.2, 4.3, 1.5, 2.7, 1.9, 3.3, 6.8, 0.74, 3.7, 9.9,
+        180.0
+    ],
+    3: [
+        0.33, 0.99, 5.9, 2.6, 9.5, 3.3, 5.9, 4.3, 7.2, 15.0, 0.16, 8.2,
+        22.0, 390.0
+    ],
+    4: [
+        0.56, 1.7, 10.0, 4.5, 16.0, 5.6, 10.0, 7.3, 12.0, 26.0, 0.26, 14.0,
+        38.0, 670.0
+    ],
+    5: {
+        1: [
+            0.11, 0.23, 1.7, 0.91, 3.1, 0.8, 1.0, 1.3, 1.4, 5.2, 0.057,
+            2.8, 7.5, 0.0
+        ],
+        2: [
+            0.060, 0.12, 0.90, 0.48, 1.6, 0.42, 0.54, 0.66, 0.72, 2.8,
+            0.030, 1.5, 4.0, 0.0
+        ]
+    }
+}
+# List containing piQ values for parts count method.  The list positions
+# corrspond to the following quality levels:
+#
+#   0. MIL-SPEC
+#   1. Non-MIL
+#
+# The quality_id attribute is used to select the proper value of piQ.
+_dic_piQ = {
+    1: [1.0, 20.0],
+    2: [1.0, 20.0],
+    3: [1.0, 50.0],
+    4: [1.0, 10.0],
+    5: [1.0, 8.4]
+}
+
+# Constants used in the part stress calculations.
+_dic_factors = {
+    2: [[0.1, 0.00045, 0.0009], [0.1, 0.23, 0.63]],
+    3: [[0.0067, 0.00003, 0.00003], [0.1, 0.02, 0.06]],
+    4: [[0.0067, 0.062], [0.086, 0.089]]
+}
+_dic_lambda_b_stress = {
+    1: [[0.00045, 0.034], [0.0027, 0.04]],
+    5: [0.02, 0.038, 0.038]
+}
+_dic_piC = {
+    1: [1.0, 1.5, 1.7, 2.0, 2.5, 3.0, 4.2, 5.5, 8.0],
+    5: [1.0, 2.0, 3.0, 4.0]
+}
+
 
 def calculate_217f_part_count(**attributes):
     """
@@ -27,68 +97,13 @@ def calculate_217f_part_count(**attributes):
     """
     _msg = ''
 
-    # Dictionary containing MIL-HDBK-217FN2 parts count base hazard rates.
-    # First key is the subcategory_id.  Current subcategory IDs are:
-    #
-    #    1. Toggle or pushbutton
-    #    2. Sensitive
-    #    3. Rotary
-    #    4. Thumbwheel
-    #    5. Circuit breaker
-    #
-    # These keys return a list of base hazard rates.  The hazard rate to use is
-    # selected from the list depending on the active environment.
-    _dic_lambda_b = {
-        1: [
-            0.0010, 0.0030, 0.018, 0.0080, 0.029, 0.010, 0.018, 0.013, 0.022,
-            0.046, 0.0005, 0.025, 0.067, 1.2
-        ],
-        2: [
-            0.15, 0.44, 2.7, 1.2, 4.3, 1.5, 2.7, 1.9, 3.3, 6.8, 0.74, 3.7, 9.9,
-            180.0
-        ],
-        3: [
-            0.33, 0.99, 5.9, 2.6, 9.5, 3.3, 5.9, 4.3, 7.2, 15.0, 0.16, 8.2,
-            22.0, 390.0
-        ],
-        4: [
-            0.56, 1.7, 10.0, 4.5, 16.0, 5.6, 10.0, 7.3, 12.0, 26.0, 0.26, 14.0,
-            38.0, 670.0
-        ],
-        5: {
-            1: [
-                0.11, 0.23, 1.7, 0.91, 3.1, 0.8, 1.0, 1.3, 1.4, 5.2, 0.057,
-                2.8, 7.5, 0.0
-            ],
-            2: [
-                0.060, 0.12, 0.90, 0.48, 1.6, 0.42, 0.54, 0.66, 0.72, 2.8,
-                0.030, 1.5, 4.0, 0.0
-            ]
-        }
-    }
-
-    # List containing piQ values for parts count method.  The list positions
-    # corrspond to the following quality levels:
-    #
-    #   0. MIL-SPEC
-    #   1. Non-MIL
-    #
-    # The quality_id attribute is used to select the proper value of piQ.
-    _dic_piQ = {
-        1: [1.0, 20.0],
-        2: [1.0, 20.0],
-        3: [1.0, 50.0],
-        4: [1.0, 10.0],
-        5: [1.0, 8.4]
-    }
-
     # Select the base hazard rate.
     try:
         if attributes['subcategory_id'] == 5:
-            _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']][
+            _lst_base_hr = _dic_lambda_b_count[attributes['subcategory_id']][
                 attributes['construction_id']]
         else:
-            _lst_base_hr = _dic_lambda_b[attributes['subcategory_id']]
+            _lst_base_hr = _dic_lambda_b_count[attributes['subcategory_id']]
     except KeyError:
         _lst_base_hr = [0.0]
 
@@ -142,24 +157,11 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
              dictionary with updated values and the error message, if any.
     :rtype: (dict, str)
     """
-    _dic_factors = {
-        2: [[0.1, 0.00045, 0.0009], [0.1, 0.23, 0.63]],
-        3: [[0.0067, 0.00003, 0.00003], [0.1, 0.02, 0.06]],
-        4: [[0.0067, 0.062], [0.086, 0.089]]
-    }
-    _dic_lambda_b = {
-        1: [[0.00045, 0.034], [0.0027, 0.04]],
-        5: [0.02, 0.038, 0.038]
-    }
-    _dic_piC = {
-        1: [1.0, 1.5, 1.7, 2.0, 2.5, 3.0, 4.2, 5.5, 8.0],
-        5: [1.0, 2.0, 3.0, 4.0]
-    }
     _msg = ''
 
     # Calculate the base hazard rate.
     if attributes['subcategory_id'] == 1:
-        attributes['lambda_b'] = _dic_lambda_b[1][attributes[
+        attributes['lambda_b'] = _dic_lambda_b_stress[1][attributes[
             'construction_id']][attributes['quality_id'] - 1]
     elif attributes['subcategory_id'] in [2, 3]:
         try:
@@ -191,7 +193,8 @@ def calculate_217f_part_stress(**attributes):  # pylint: disable=R0912
         attributes['lambda_b'] = (
             _lambda_b1 + attributes['n_elements'] * _lambda_b2)
     elif attributes['subcategory_id'] == 5:
-        attributes['lambda_b'] = _dic_lambda_b[5][attributes['application_id']]
+        attributes['lambda_b'] = _dic_lambda_b_stress[5][
+            attributes['application_id']]
     else:
         attributes['lambda_b'] = 0.0
 
@@ -7,6 +7,8 @@ import Inductor
 import IntegratedCircuit
 import Lamp
 import Meter
+import PartCount
+import PartStress
 import Relay
 import Resistor
 import Semiconductor
@@ -8,25 +8,90 @@
 
 import gettext
 
-from sqlalchemy import create_engine, exc, MetaData
+from sqlalchemy import (and_, bindparam, create_engine, event, exc, inspect,
+                        MetaData, Table)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import make_transient_to_detached, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 
 # Import tables objects for the RAMSTK Common database.
 from .RAMSTKCommonDB import create_common_db
-from .RAMSTKProgramDB import create_program_db
+from .RAMSTKProgramDB import create_program_db, create_program_indexes
 
 RAMSTK_BASE = declarative_base()
 
 # Add localization support.
 _ = gettext.gettext
 
+# The PRAGMAs set on each new connection to a SQLite database for each
+# performance profile.  The default profile leaves SQLite's own settings.  WAL
+# journaling with NORMAL synchronization can't corrupt the database on a crash
+# or power loss; at worst the last transactions are lost.  The bulk profile is
+# used while creating a database or importing into it.  A negative cache_size
+# is in KiB.
+SQLITE_PROFILES = {
+    'default': {},
+    'safe': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000
+    },
+    'performance': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000
+    },
+    'bulk': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -262144,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 30000,
+        'wal_autocheckpoint': 10000
+    }
+}
+
+# The order the PRAGMAs are set in.  The journal mode has to be set before
+# anything is read from the database.
+_LST_PRAGMAS = [
+    'journal_mode', 'busy_timeout', 'synchronous', 'cache_size', 'mmap_size',
+    'temp_store', 'wal_autocheckpoint'
+]
+
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
 __organization__ = 'ReliaQual Associates, LLC'
 __copyright__ = 'Copyright 2007 - 2015 Doyle "weibullguy" Rowland'
 
 
+def do_set_sqlite_pragmas(dbapi_connection, profile):
+    """
+    Set the PRAGMAs of a performance profile on a SQLite connection.
+
+    :param dbapi_connection: the DBAPI connection to the SQLite database.
+    :param str profile: the name of the performance profile to use.
+    :return: None
+    :rtype: None
+    :raise: KeyError if passed an unknown profile.
+    """
+    _pragmas = SQLITE_PROFILES[profile]
+
+    _cursor = dbapi_connection.cursor()
+    for _pragma in _LST_PRAGMAS:
+        try:
+            _cursor.execute('PRAGMA {0:s} = {1:s}'.format(
+                _pragma, str(_pragmas[_pragma])))
+        except KeyError:
+            pass
+    _cursor.close()
+
+    return None
+
+
 class DAO(object):
     """This is the data access controller class."""
 
@@ -42,10 +107,23 @@ class DAO(object):
         """Initialize an instance of the DAO controller."""
 
         # Initialize private dictionary instance attributes.
+        # The revision cache.  The first holds the mapper and column values of
+        # each record loaded by db_select_cached() keyed by (table name,
+        # primary key).  The second holds the tables each cached query reads
+        # and the keys of the records it returned, keyed by the query's SQL
+        # and parameters.
+        self._dic_cache = {}
+        self._dic_cache_queries = {}
 
         # Initialize private list instance attributes.
 
         # Initialize private scalar instance attributes.
+        self._cache_revision_id = None
+        # The session shared by every operation in a batch and the number of
+        # batches that have been started but not flushed.
+        self._batch_session = None
+        self._batch_depth = 0
+        self._sqlite_profile = 'default'
 
         # Initialize public dictionary instance attributes.
 
@@ -53,18 +131,32 @@ class DAO(object):
 
         # Initialize public scalar instance attributes.
 
-    def db_connect(self, database):
+    def db_connect(self, database, **kwargs):
         """
         Connect to the database using settings from the configuration file.
 
         :param str database: the absolute path to the database to connect to.
+        :keyword str profile: the name of the SQLite performance profile to
+                              use.  An unknown profile keeps the profile
+                              already in use, which is 'default' unless
+                              db_set_profile() was called.
         :return: False if successful, True if an error occurs.
         :rtype: bool
         """
+        try:
+            self.db_set_profile(kwargs['profile'])
+        except KeyError:
+            pass
+
         self.database = database
         self.engine = create_engine(self.database, echo=False)
         self.metadata = MetaData(self.engine)
 
+        if self.engine.dialect.name == 'sqlite':
+            event.listen(self.engine, 'connect', self._do_connect)
+        event.listen(self.engine, 'after_execute', self._do_invalidate)
+        self.db_cache_invalidate()
+
         self.session = self.RAMSTK_SESSION(
             bind=self.engine,
             autoflush=True,
@@ -80,6 +172,11 @@ class DAO(object):
         :return: False if successful, True if an error occurs.
         :rtype: bool
         """
+        if self._batch_session is not None:
+            self._batch_session.close()
+            self._batch_session = None
+            self._batch_depth = 0
+        self.db_cache_invalidate()
         self.session.close()
         self.RAMSTK_SESSION.close_all()
         self.engine.dispose()
@@ -90,6 +187,182 @@ class DAO(object):
 
         return False
 
+    def _do_connect(self, dbapi_connection, __):
+        """
+        Set the PRAGMAs of the current profile on a new SQLite connection.
+
+        :param dbapi_connection: the new DBAPI connection.
+        :return: None
+        :rtype: None
+        """
+        do_set_sqlite_pragmas(dbapi_connection, self._sqlite_profile)
+
+    def _do_invalidate(self, __, clauseelement, *args):
+        """
+        Invalidate the cached entities of any table a statement writes to.
+
+        Any other statement except a SELECT or a PRAGMA invalidates the whole
+        cache as the tables it writes to aren't known.
+
+        :param clauseelement: the statement that was executed.
+        :return: None
+        :rtype: None
+        """
+        # pylint: disable=unused-argument
+        if isinstance(clauseelement, UpdateBase):
+            self.db_cache_invalidate(clauseelement.table.name)
+            return None
+
+        _sql = getattr(clauseelement, 'text', clauseelement)
+        if isinstance(_sql, basestring):
+            _read_only = _sql.lstrip().upper().startswith(('SELECT', 'PRAGMA'))
+        else:
+            _read_only = getattr(clauseelement, 'is_selectable', False)
+
+        if not _read_only:
+            self.db_cache_invalidate()
+
+        return None
+
+    def db_set_profile(self, profile):
+        """
+        Set the SQLite performance profile used by new connections.
+
+        SQLite file databases aren't pooled, so the profile applies to every
+        session created after it is set.
+
+        :param str profile: the name of the performance profile to use.
+        :return: the name of the profile that was in use.
+        :rtype: str
+        :raise: KeyError if passed an unknown profile.
+        """
+        if profile not in SQLITE_PROFILES:
+            raise KeyError(profile)
+
+        _profile = self._sqlite_profile
+        self._sqlite_profile = profile
+
+        return _profile
+
+    def db_begin_batch(self):
+        """
+        Start a batch of operations that are committed as one transaction.
+
+        Until the matching db_flush_batch(), db_get_session() returns the same
+        session and the db_add(), db_update(), and db_delete() methods only
+        flush their changes when passed that session.  Batches can be nested;
+        only the outermost db_flush_batch() commits.  An error in any
+        operation marks the batch failed; db_flush_batch() then rolls back
+        the entire batch instead of committing the operations that succeeded.
+
+        :return: the session shared by the operations in the batch.
+        :rtype: :class:`sqlalchemy.orm.Session`
+        """
+        if self._batch_session is None:
+            self._batch_session = self.RAMSTK_SESSION(
+                bind=self.engine,
+                autoflush=True,
+                autocommit=False,
+                expire_on_commit=False)
+            self._batch_session.info['batch'] = True
+            self._batch_session.info['failed'] = False
+
+        self._batch_depth += 1
+
+        return self._batch_session
+
+    def db_flush_batch(self):
+        """
+        End a batch of operations and commit it if it is the outermost batch.
+
+        A failed batch is rolled back instead of committed.
+
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Updating the RAMSTK Program database."
+
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0 and self._batch_session is not None:
+            try:
+                if self._batch_session.info['failed']:
+                    self._batch_session.rollback()
+                    _error_code = 1
+                    _msg = "RAMSTK ERROR: Updating the RAMSTK Program " \
+                           "database."
+                else:
+                    self._batch_session.commit()
+            except (exc.SQLAlchemyError, exc.DBAPIError) as error:
+                print error
+                self._batch_session.rollback()
+                _error_code = 1
+                _msg = "RAMSTK ERROR: Updating the RAMSTK Program database."
+
+            self._batch_session.close()
+            self._batch_session = None
+
+        return _error_code, _msg
+
+    def db_get_session(self, **kwargs):
+        """
+        Retrieve the session to use for an operation.
+
+        :return: the batch session if a batch has been started, otherwise a
+                 new session created with the keyword arguments passed.
+        :rtype: :class:`sqlalchemy.orm.Session`
+        """
+        if self._batch_session is not None:
+            return self._batch_session
+
+        return self.RAMSTK_SESSION(bind=self.engine, **kwargs)
+
+    def db_release_session(self, session):
+        """
+        Close a session returned by db_get_session() unless it is in a batch.
+
+        :param session: the SQLAlchemy session to release.
+        :type session: :class:`sqlalchemy.orm.Session`
+        :return: None
+        :rtype: None
+        """
+        if session is not self._batch_session:
+            session.close()
+
+    @staticmethod
+    def _db_commit(session):
+        """
+        Commit the session, or only flush it if the session is a batch.
+
+        :param session: the SQLAlchemy session to commit.
+        :type session: :class:`sqlalchemy.orm.Session`
+        :return: None
+        :rtype: None
+        """
+        if session.info.get('batch', False):
+            session.flush()
+        else:
+            session.commit()
+
+    @staticmethod
+    def _db_rollback(session):
+        """
+        Roll back the session and mark it failed if the session is a batch.
+
+        Rolling back a batch session discards the operations done earlier in
+        the batch, so the batch is marked failed to keep db_flush_batch() from
+        committing the operations done after this one.
+
+        :param session: the SQLAlchemy session to roll back.
+        :type session: :class:`sqlalchemy.orm.Session`
+        :return: None
+        :rtype: None
+        """
+        session.rollback()
+        if session.info.get('batch', False):
+            session.info['failed'] = True
+
     def _db_table_create(self, table):
         """
         Check if the passed table exists and create it if not.
@@ -154,53 +427,250 @@ class DAO(object):
             print "Bad program database URI: {0:s}".format(database)
             return True
 
+    def db_create_indexes(self):
+        """
+        Add the missing indexes to the connected RAMSTK Program database.
+
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Indexing the RAMSTK Program database."
+
+        try:
+            _indexes = create_program_indexes(self.engine)
+            if _indexes:
+                _msg = _msg + '  Created {0:s}.'.format(', '.join(_indexes))
+        except (exc.SQLAlchemyError, exc.DBAPIError) as error:
+            print error
+            _error_code = 1
+            _msg = "RAMSTK ERROR: Indexing the RAMSTK Program database."
+
+        return _error_code, _msg
+
     @staticmethod
-    def db_add(item, session):
+    def _db_add_error(error):
+        """
+        Build the error code and message for an item that couldn't be added.
+
+        :param error: the exception raised while adding the item.
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error = '{0:s}'.format(error)
+        if isinstance(error, ValueError):
+            _error_code = 4
+            _msg = ('RAMSTK ERROR: Date field did not contain Python '
+                    'date object: {0:s}').format(_error)
+        elif 'Could not locate a bind' in _error:
+            _error_code = 2
+            _msg = ('RAMSTK ERROR: No database open when attempting '
+                    'to insert record.')
+        elif ('PRIMARY KEY must be unique' in _error) or (
+                'UNIQUE constraint failed:' in _error):
+            _error_code = 3
+            _msg = ('RAMSTK ERROR: Primary key error: '
+                    '{0:s}').format(_error)
+        elif 'Date type only accepts Python date objects as input' in _error:
+            _error_code = 4
+            _msg = ('RAMSTK ERROR: Date field did not contain Python '
+                    'date object: {0:s}').format(_error)
+        else:
+            print _error
+            _error_code = 1
+            _msg = ('RAMSTK ERROR: Adding one or more items to the RAMSTK '
+                    'Program database.')
+
+        return _error_code, _msg
+
+    @staticmethod
+    def _db_add_one(item, session):
+        """
+        Add a single item to the RAMSTK Program database.
+
+        :param item: the object to add to the RAMSTK Program database.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RAMSTK Program database.
+        :type session: :class:`sqlalchemy.orm.scoped_session`
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = ''
+
+        try:
+            session.add(item)
+            DAO._db_commit(session)
+        except (exc.SQLAlchemyError, exc.DBAPIError) as error:
+            DAO._db_rollback(session)
+            _error_code, _msg = DAO._db_add_error(error)
+        except ValueError as error:
+            DAO._db_rollback(session)
+            _error_code, _msg = DAO._db_add_error(error)
+
+        return _error_code, _msg
+
+    @staticmethod
+    def db_add(item, session, **kwargs):
         """
         Add a new item to the RAMSTK Program database.
 
+        By default each item is added and committed separately.  When a
+        chunk_size greater than one is passed, the items are inserted in
+        chunks with one bulk (executemany) INSERT per table and one COMMIT per
+        chunk.  If a chunk fails, it is rolled back and its items are added one
+        at a time to pinpoint the failing item(s).  In a batch a failed chunk
+        fails the entire batch, so its items aren't retried.  Items inserted in
+        bulk are not attached to the session, so database generated primary
+        keys are not refreshed on them; callers that need the new IDs should
+        leave the chunk_size at one.
+
         :param item: the object to add to the RAMSTK Program database.
         :param session: the SQLAlchemy scoped_session instance used to
                         communicate with the RAMSTK Program database.
         :type session: :class:`sqlalchemy.orm.scoped_session`
+        :keyword int chunk_size: the number of items to add in each
+                                 transaction.  Default is 1.
         :return: (_error_code, _msg); the error code and associated error
                                       message.
         :rtype: (int, str)
         """
+        try:
+            _chunk_size = max(1, int(kwargs['chunk_size']))
+        except KeyError:
+            _chunk_size = 1
+
         _error_code = 0
         _msg = "RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program " \
                "database."
-        # TODO: Determine if the add_many option can work with Foreign Keys.
-        for _item in item:
-            try:
-                session.add(_item)
-                session.commit()
-            except (exc.SQLAlchemyError, exc.DBAPIError) as error:
-                _error = '{0:s}'.format(error)
-                session.rollback()
-                if 'Could not locate a bind' in _error:
-                    _error_code = 2
-                    _msg = ('RAMSTK ERROR: No database open when attempting '
-                            'to insert record.')
-                elif ('PRIMARY KEY must be unique' in _error) or (
-                        'UNIQUE constraint failed:' in _error):
-                    _error_code = 3
-                    _msg = ('RAMSTK ERROR: Primary key error: '
-                            '{0:s}').format(_error)
-                elif 'Date type only accepts Python date objects as input' in _error:
-                    _error_code = 4
-                    _msg = ('RAMSTK ERROR: Date field did not contain Python '
-                            'date object: {0:s}').format(_error)
-                else:
-                    print _error
-                    _error_code = 1
-                    _msg = (
-                        'RAMSTK ERROR: Adding one or more items to the RAMSTK '
-                        'Program database.')
-            except ValueError as _error:
-                _error_code = 4
-                _msg = ('RAMSTK ERROR: Date field did not contain Python '
-                        'date object: {0:s}').format(_error)
+
+        for _idx in range(0, len(item), _chunk_size):
+            _chunk = item[_idx:_idx + _chunk_size]
+
+            if len(_chunk) > 1:
+                # Group the chunk by entity type, in the order each type first
+                # appears, so there is one executemany() per table and parent
+                # records are still inserted before their children.
+                _order = {}
+                for _item in _chunk:
+                    _order.setdefault(type(_item), len(_order))
+                try:
+                    session.bulk_save_objects(
+                        sorted(_chunk, key=lambda x: _order[type(x)]))
+                    DAO._db_commit(session)
+                    continue
+                except (exc.SQLAlchemyError, exc.DBAPIError, AttributeError,
+                        ValueError) as error:
+                    DAO._db_rollback(session)
+                    if session.info.get('batch', False):
+                        _error_code, _msg = DAO._db_add_error(error)
+                        continue
+
+            for _item in _chunk:
+                _code, _message = DAO._db_add_one(_item, session)
+                if _code != 0:
+                    _error_code = _code
+                    _msg = _message
+
+        return _error_code, _msg
+
+    @staticmethod
+    def _db_add_rows(tables, session, start, end):
+        """
+        Insert a slice of the records of each table in one transaction.
+
+        :param list tables: the (table, records) pairs to insert, in order.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RAMSTK Program database.
+        :type session: :class:`sqlalchemy.orm.scoped_session`
+        :param int start: the index of the first record to insert.
+        :param int end: the index after the last record to insert.
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = ''
+
+        try:
+            for _table, _records in tables:
+                _records = _records[start:end]
+                if not _records:
+                    continue
+
+                # The records are keyed by attribute, but Core inserts by
+                # column.
+                _keys = dict((_attribute.key, _attribute.columns[0].key)
+                             for _attribute in inspect(_table).column_attrs)
+                session.execute(_table.__table__.insert(), [
+                    dict((_keys[_key], _value)
+                         for _key, _value in _record.iteritems())
+                    for _record in _records
+                ])
+            DAO._db_commit(session)
+        except (exc.SQLAlchemyError, exc.DBAPIError, ValueError) as error:
+            DAO._db_rollback(session)
+            _error_code, _msg = DAO._db_add_error(error)
+
+        return _error_code, _msg
+
+    @staticmethod
+    def db_add_records(tables, session, **kwargs):
+        """
+        Add records to RAMSTK Program database tables without ORM objects.
+
+        Each record is an {attribute:value} dict and is inserted with
+        SQLAlchemy Core; one executemany() INSERT per table per chunk and one
+        COMMIT per chunk.  The tables are inserted in the order passed, so
+        parent tables must come before the tables that reference them.  The
+        nth chunk of every table is inserted in the same transaction, so
+        records of different tables at the same index, such as the records of
+        one hardware item, are added together.  If a chunk fails, it is rolled
+        back and its records are added one index at a time to pinpoint the
+        failing record(s).  In a batch a failed chunk fails the entire batch,
+        so its records aren't retried.
+
+        :param list tables: the (table, records) pairs to insert, parent
+                            tables first.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RAMSTK Program database.
+        :type session: :class:`sqlalchemy.orm.scoped_session`
+        :keyword int chunk_size: the number of records of each table to add in
+                                 each transaction.  Default is 1000.
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        try:
+            _chunk_size = max(1, int(kwargs['chunk_size']))
+        except KeyError:
+            _chunk_size = 1000
+
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Adding one or more items to the RAMSTK " \
+               "Program database."
+
+        _n_records = max([len(_records) for __, _records in tables] + [0])
+        for _idx in range(0, _n_records, _chunk_size):
+            _code, _message = DAO._db_add_rows(tables, session, _idx,
+                                               _idx + _chunk_size)
+            if _code == 0:
+                continue
+
+            if _chunk_size == 1 or session.info.get('batch', False):
+                _error_code = _code
+                _msg = _message
+                continue
+
+            for _row in range(_idx, min(_idx + _chunk_size, _n_records)):
+                _code, _message = DAO._db_add_rows(tables, session, _row,
+                                                   _row + 1)
+                if _code != 0:
+                    _error_code = _code
+                    _msg = _message
 
         return _error_code, _msg
 
@@ -219,6 +689,10 @@ class DAO(object):
         _error_code = 0
         _msg = "RAMSTK SUCCESS: Updating the RAMSTK Program database."
 
+        # The changes in a batch are committed by db_flush_batch().
+        if session.info.get('batch', False):
+            return _error_code, _msg
+
         try:
             session.commit()
         except (exc.SQLAlchemyError, exc.DBAPIError) as error:
@@ -229,6 +703,67 @@ class DAO(object):
 
         return _error_code, _msg
 
+    @staticmethod
+    def db_update_mappings(table, session, **kwargs):
+        """
+        Insert, update, and delete table records without ORM objects.
+
+        Each record is an {attribute:value} dict.  There is one bulk statement
+        per operation and the operations are committed as one transaction.  If
+        any of them fails, they are all rolled back.
+
+        :param table: the RAMSTK Program database table to write to.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RAMSTK Program database.
+        :type session: :class:`sqlalchemy.orm.scoped_session`
+        :keyword list inserts: the records to insert.
+        :keyword list updates: the records to update, including their primary
+                               key.
+        :keyword list deletes: the primary keys of the records to delete.
+        :return: (_error_code, _msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+        try:
+            _inserts = kwargs['inserts']
+        except KeyError:
+            _inserts = []
+        try:
+            _updates = kwargs['updates']
+        except KeyError:
+            _updates = []
+        try:
+            _deletes = kwargs['deletes']
+        except KeyError:
+            _deletes = []
+
+        _error_code = 0
+        _msg = "RAMSTK SUCCESS: Updating the RAMSTK Program database."
+
+        try:
+            session.bulk_insert_mappings(table, _inserts)
+            session.bulk_update_mappings(table, _updates)
+            if _deletes:
+                _keys = [(_attribute.key, _attribute.columns[0])
+                         for _attribute in inspect(table).column_attrs
+                         if _attribute.columns[0].primary_key]
+                session.execute(
+                    table.__table__.delete().where(
+                        and_(*[
+                            _column == bindparam('b_' + _key)
+                            for _key, _column in _keys
+                        ])), [
+                            dict(('b_' + _key, _record[_key])
+                                 for _key, __ in _keys)
+                            for _record in _deletes
+                        ])
+            DAO._db_commit(session)
+        except (exc.SQLAlchemyError, exc.DBAPIError, ValueError) as error:
+            DAO._db_rollback(session)
+            _error_code, _msg = DAO._db_add_error(error)
+
+        return _error_code, _msg
+
     @staticmethod
     def db_delete(item, session):
         """
@@ -248,10 +783,10 @@ class DAO(object):
 
         try:
             session.delete(item)
-            session.commit()
+            DAO._db_commit(session)
         except (exc.SQLAlchemyError, exc.DBAPIError) as error:
             print error
-            session.rollback()
+            DAO._db_rollback(session)
             _error_code = 1
             _msg = "RAMSTK ERROR: Deleting an item from the RAMSTK Program database."
 
@@ -271,6 +806,117 @@ class DAO(object):
         """
         return session.execute(query)
 
+    def db_select_cached(self, query, **kwargs):
+        """
+        Retrieve the entities selected by a query from the revision cache.
+
+        The first time a query is passed, it's run and the column values of
+        the records it returns are cached.  After that, new entities are built
+        from the cached values without querying the database until something
+        is written to one of the tables the query reads.  Every call returns
+        its own entities, so, like a new query, a cached query returns the
+        records as they are in the database and changes to the entities of one
+        data model are never seen by another.  Passing a different revision_id
+        than the last one clears the cache.
+
+        The entities built from the cache are detached, like those of any
+        closed session.
+
+        :param query: the SQLAlchemy query selecting the entities.
+        :type query: :class:`sqlalchemy.orm.Query`
+        :keyword int revision_id: the ID of the Revision the entities belong
+                                  to.
+        :return: the list of entities selected by the query.
+        :rtype: list
+        """
+        try:
+            _revision_id = kwargs['revision_id']
+        except KeyError:
+            _revision_id = self._cache_revision_id
+
+        if _revision_id != self._cache_revision_id:
+            self.db_cache_invalidate()
+            self._cache_revision_id = _revision_id
+
+        _statement = query.statement.compile()
+        _key = (str(_statement), repr(sorted(_statement.params.items())))
+
+        try:
+            _entities = [
+                self._do_make_entity(*self._dic_cache[_identity])
+                for _identity in self._dic_cache_queries[_key][1]
+            ]
+        except KeyError:
+            _entities = None
+
+        if _entities is not None:
+            return _entities
+
+        _tables = set([
+            _from.name for _from in query.statement.locate_all_froms()
+            if isinstance(_from, Table)
+        ])
+        _entities = []
+        _identities = []
+        for _entity in query.all():
+            _state = inspect(_entity)
+            _identity = (_state.mapper.local_table.name, _state.identity)
+            self._dic_cache[_identity] = (_state.mapper, dict(
+                (_attribute.key, _state.dict.get(_attribute.key))
+                for _attribute in _state.mapper.column_attrs))
+            _entities.append(_entity)
+            _identities.append(_identity)
+
+        self._dic_cache_queries[_key] = (_tables, _identities)
+
+        return _entities
+
+    @staticmethod
+    def _do_make_entity(mapper, values):
+        """
+        Build a detached entity from the cached column values of a record.
+
+        :param mapper: the mapper of the record's entity class.
+        :type mapper: :class:`sqlalchemy.orm.Mapper`
+        :param dict values: the {attribute:value} dict of the record's
+                            columns.
+        :return: the entity, as if it was loaded by a session that was then
+                 closed.
+        """
+        _entity = mapper.class_manager.new_instance()
+        for _key, _value in values.iteritems():
+            setattr(_entity, _key, _value)
+        make_transient_to_detached(_entity)
+
+        return _entity
+
+    def db_cache_invalidate(self, table=None):
+        """
+        Remove the cached entities and queries of a table from the cache.
+
+        :keyword str table: the name of the table to invalidate.  Default is
+                            None, which invalidates every table.
+        :return: None
+        :rtype: None
+        """
+        if table is None:
+            self._dic_cache.clear()
+            self._dic_cache_queries.clear()
+            return None
+
+        for _key in [
+                _key for _key, _query in self._dic_cache_queries.items()
+                if table in _query[0]
+        ]:
+            self._dic_cache_queries.pop(_key)
+        for _identity in [
+                _identity for _identity in self._dic_cache
+                if _identity[0] == table
+        ]:
+            self._dic_cache.pop(_identity)
+
+        return None
+
     @property
     def db_last_id(self):
         """
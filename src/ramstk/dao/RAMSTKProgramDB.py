@@ -6,7 +6,7 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """RAMSTKProgramDB File."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
 
@@ -29,11 +29,19 @@ def create_program_db(**kwargs):
         RAMSTKSoftwareReview, RAMSTKSoftwareTest, RAMSTKStakeholder,
         RAMSTKSurvival, RAMSTKSurvivalData, RAMSTKTest, RAMSTKTestMethod,
         RAMSTKUnits, RAMSTKValidation)
+    from ramstk.dao.DAO import do_set_sqlite_pragmas
 
     uri = kwargs['database']
 
     # Create and populate the RAMSTK Program test database.
     engine = create_engine(uri, echo=False)
+
+    # Creating a database is a bulk load.
+    if engine.dialect.name == 'sqlite':
+        event.listen(
+            engine, 'connect',
+            lambda dbapi_connection, __: do_set_sqlite_pragmas(
+                dbapi_connection, 'bulk'))
     session = scoped_session(sessionmaker())
 
     session.remove()
@@ -105,6 +113,43 @@ def create_program_db(**kwargs):
     return None
 
 
+def create_program_indexes(engine):
+    """
+    Add the missing indexes to the tables in a RAMSTK Program database.
+
+    Program databases created before the indexes were declared on the table
+    models don't have them.  Indexes that already exist and tables that aren't
+    in the database are skipped, so this is safe to call every time a
+    database is opened.
+
+    :param engine: the SQLAlchemy engine connected to the RAMSTK Program
+                   database.
+    :return: the names of the indexes that were created.
+    :rtype: list
+    """
+    # Importing the package registers every table model with the metadata.
+    import ramstk.dao  # pylint: disable=unused-variable
+    from ramstk.dao.RAMSTKCommonDB import RAMSTK_BASE as _base
+
+    _created = []
+
+    _inspector = inspect(engine)
+    _tables = _inspector.get_table_names()
+    for _table in _base.metadata.sorted_tables:
+        if not _table.indexes or _table.name not in _tables:
+            continue
+
+        _existing = [
+            _index['name'] for _index in _inspector.get_indexes(_table.name)
+        ]
+        for _index in sorted(_table.indexes, key=lambda x: x.name):
+            if _index.name not in _existing:
+                _index.create(bind=engine)
+                _created.append(_index.name)
+
+    return _created
+
+
 def do_create_test_database(database):
     """
     Create a new RAMSTK Program test database.
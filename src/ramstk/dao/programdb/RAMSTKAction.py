@@ -30,6 +30,7 @@ class RAMSTKAction(RAMSTK_BASE):
         'fld_cause_id',
         Integer,
         ForeignKey('ramstk_cause.fld_cause_id'),
+        index=True,
         nullable=False)
     action_id = Column(
         'fld_action_id',
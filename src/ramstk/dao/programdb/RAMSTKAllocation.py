@@ -30,6 +30,7 @@ class RAMSTKAllocation(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     hardware_id = Column(
         'fld_hardware_id',
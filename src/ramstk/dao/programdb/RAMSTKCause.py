@@ -35,11 +35,13 @@ class RAMSTKCause(RAMSTK_BASE):
         'fld_mode_id',
         Integer,
         ForeignKey('ramstk_mode.fld_mode_id'),
+        index=True,
         nullable=False)
     mechanism_id = Column(
         'fld_mechanism_id',
         Integer,
         ForeignKey('ramstk_mechanism.fld_mechanism_id'),
+        index=True,
         nullable=False)
     cause_id = Column(
         'fld_cause_id',
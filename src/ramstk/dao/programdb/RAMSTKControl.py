@@ -28,6 +28,7 @@ class RAMSTKControl(RAMSTK_BASE):
         'fld_cause_id',
         Integer,
         ForeignKey('ramstk_cause.fld_cause_id'),
+        index=True,
         nullable=False)
     control_id = Column(
         'fld_control_id',
@@ -28,6 +28,7 @@ class RAMSTKEnvironment(RAMSTK_BASE):
         'fld_phase_id',
         Integer,
         ForeignKey('ramstk_mission_phase.fld_phase_id'),
+        index=True,
         nullable=False)
     # test_id = Column('fld_test_id', Integer,
     #                  ForeignKey('ramstk_test.fld_test_id'),
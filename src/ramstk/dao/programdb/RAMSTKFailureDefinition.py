@@ -28,6 +28,7 @@ class RAMSTKFailureDefinition(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     definition_id = Column(
         'fld_definition_id',
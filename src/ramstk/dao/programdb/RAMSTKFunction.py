@@ -34,6 +34,7 @@ class RAMSTKFunction(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     function_id = Column(
         'fld_function_id',
@@ -60,7 +61,7 @@ class RAMSTKFunction(RAMSTK_BASE):
     mtbf_mission = Column('fld_mtbf_mission', Float, default=0.0)
     mttr = Column('fld_mttr', Float, default=0.0)
     name = Column('fld_name', String(256), default='Function Name')
-    parent_id = Column('fld_parent_id', Integer, default=0)
+    parent_id = Column('fld_parent_id', Integer, index=True, default=0)
     remarks = Column('fld_remarks', BLOB, default='')
     safety_critical = Column('fld_safety_critical', Integer, default=0)
     total_mode_count = Column('fld_mode_count', Integer, default=0)
@@ -38,6 +38,7 @@ class RAMSTKHardware(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     hardware_id = Column(
         'fld_hardware_id',
@@ -65,7 +66,7 @@ class RAMSTKHardware(RAMSTK_BASE):
     name = Column('fld_name', String(256), default='')
     nsn = Column('fld_nsn', String(256), default='')
     page_number = Column('fld_page_number', String(256), default='')
-    parent_id = Column('fld_parent_id', Integer, default=0)
+    parent_id = Column('fld_parent_id', Integer, index=True, default=0)
     part = Column('fld_part', Integer, default=0)
     part_number = Column('fld_part_number', String(256), default='')
     quantity = Column('fld_quantity', Integer, default=1)
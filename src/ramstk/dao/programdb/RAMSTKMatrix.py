@@ -6,7 +6,7 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """RAMSTKMatrix Table Module."""
 
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 # Import other RAMSTK modules.
@@ -44,12 +44,18 @@ class RAMSTKMatrix(RAMSTK_BASE):
         +-------------+--------------+--------------+
 
     The primary key for this table consists of the revision_id, matrix_id,
-    column_item_id, and row_item_id.
+    column_item_id, and row_item_id.  Matrices are loaded by revision_id and
+    matrix_type, so those two columns are also indexed.
 
     This table shares a Many-to-One relationship with ramstk_revision.
     """
     __tablename__ = 'ramstk_matrix'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        Index('ix_ramstk_matrix_fld_revision_id_fld_matrix_type',
+              'fld_revision_id', 'fld_matrix_type'),
+        {
+            'extend_existing': True
+        })
 
     revision_id = Column(
         'fld_revision_id',
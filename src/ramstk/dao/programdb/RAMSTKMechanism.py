@@ -39,6 +39,7 @@ class RAMSTKMechanism(RAMSTK_BASE):
         'fld_mode_id',
         Integer,
         ForeignKey('ramstk_mode.fld_mode_id'),
+        index=True,
         nullable=False)
     mechanism_id = Column(
         'fld_mechanism_id',
@@ -29,6 +29,7 @@ class RAMSTKMission(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     mission_id = Column(
         'fld_mission_id',
@@ -29,6 +29,7 @@ class RAMSTKMissionPhase(RAMSTK_BASE):
         'fld_mission_id',
         Integer,
         ForeignKey('ramstk_mission.fld_mission_id'),
+        index=True,
         nullable=False)
     phase_id = Column(
         'fld_phase_id',
@@ -40,12 +40,14 @@ class RAMSTKMode(RAMSTK_BASE):
         Integer,
         ForeignKey('ramstk_function.fld_function_id'),
         default=-1,
+        index=True,
         nullable=False)
     hardware_id = Column(
         'fld_hardware_id',
         Integer,
         ForeignKey('ramstk_hardware.fld_hardware_id'),
         default=-1,
+        index=True,
         nullable=False)
     mode_id = Column(
         'fld_mode_id',
@@ -30,6 +30,7 @@ class RAMSTKOpLoad(RAMSTK_BASE):
         'fld_mechanism_id',
         Integer,
         ForeignKey('ramstk_mechanism.fld_mechanism_id'),
+        index=True,
         nullable=False)
     load_id = Column(
         'fld_load_id',
@@ -28,6 +28,7 @@ class RAMSTKOpStress(RAMSTK_BASE):
         'fld_load_id',
         Integer,
         ForeignKey('ramstk_op_load.fld_load_id'),
+        index=True,
         nullable=False)
     stress_id = Column(
         'fld_stress_id',
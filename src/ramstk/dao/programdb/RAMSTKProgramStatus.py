@@ -30,6 +30,7 @@ class RAMSTKProgramStatus(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     status_id = Column(
         'fld_status_id',
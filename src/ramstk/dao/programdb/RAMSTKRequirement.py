@@ -30,6 +30,7 @@ class RAMSTKRequirement(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     requirement_id = Column(
         'fld_requirement_id',
@@ -43,7 +44,7 @@ class RAMSTKRequirement(RAMSTK_BASE):
     figure_number = Column('fld_figure_number', String(256), default='')
     owner = Column('fld_owner', String(256), default='')
     page_number = Column('fld_page_number', String(256), default='')
-    parent_id = Column('fld_parent_id', Integer, default=0)
+    parent_id = Column('fld_parent_id', Integer, index=True, default=0)
     priority = Column('fld_priority', Integer, default=0)
     requirement_code = Column('fld_requirement_code', String(256), default='')
     specification = Column('fld_specification', String(256), default='')
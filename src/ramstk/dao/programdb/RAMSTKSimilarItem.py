@@ -29,6 +29,7 @@ class RAMSTKSimilarItem(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     hardware_id = Column(
         'fld_hardware_id',
@@ -28,6 +28,7 @@ class RAMSTKStakeholder(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     stakeholder_id = Column(
         'fld_stakeholder_id',
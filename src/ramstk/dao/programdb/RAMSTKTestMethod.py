@@ -28,6 +28,7 @@ class RAMSTKTestMethod(RAMSTK_BASE):
         'fld_load_id',
         Integer,
         ForeignKey('ramstk_op_load.fld_load_id'),
+        index=True,
         nullable=False)
     test_id = Column(
         'fld_test_id',
@@ -31,6 +31,7 @@ class RAMSTKValidation(RAMSTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('ramstk_revision.fld_revision_id'),
+        index=True,
         nullable=False)
     validation_id = Column(
         'fld_validation_id',
@@ -7,6 +7,10 @@
 # Copyright 2007, 2018 Doyle "weibullguy" Rowland
 """Import Assistant Module."""
 
+from multiprocessing import cpu_count
+
+from pubsub import pub
+
 # Import other RAMSTK modules.
 from ramstk import Utilities
 from ramstk.gui.gtk import ramstk
@@ -17,6 +21,9 @@ __email__ = 'doyle.rowland@reliaqual.com'
 __organization__ = 'ReliaQual Associates, LLC'
 __copyright__ = 'Copyright 2007, 2018 Doyle "weibullguy" Rowland'
 
+# The number of input rows to read and insert at a time.
+_IMPORT_CHUNKSIZE = 10000
+
 
 class RAMSTKImport(gtk.Assistant):
     """Assistant to walk user through the process of importing records."""
@@ -50,6 +57,7 @@ class RAMSTKImport(gtk.Assistant):
         self._cmb_select_module = ramstk.RAMSTKComboBox(
             tooltip=_(u"Select the RAMSTK module to map."))
         self._module = None
+        self._pbr_import = gtk.ProgressBar(adjustment=None)
 
         # Initialize public dict variables.
 
@@ -87,6 +95,8 @@ class RAMSTKImport(gtk.Assistant):
         self.connect('close', self._do_quit)
         self.connect('apply', self._do_request_insert)
 
+        pub.subscribe(self._on_imported_chunk, 'importedChunk')
+
         self.show_all()
 
     def _do_edit_cell(self, __cell, path, new_text, model):
@@ -125,6 +135,7 @@ class RAMSTKImport(gtk.Assistant):
         :return: None
         :rtype: None
         """
+        pub.unsubscribe(self._on_imported_chunk, 'importedChunk')
         self.destroy()
 
         return None
@@ -141,7 +152,8 @@ class RAMSTKImport(gtk.Assistant):
         set_cursor(self._mdcRAMSTK, gtk.gdk.WATCH)
 
         (_count, _error_code,
-         _msg) = self._dtc_data_controller.request_do_insert(self._module)
+         _msg) = self._dtc_data_controller.request_do_insert(
+             self._module, validate=True, processes=cpu_count())
 
         set_cursor(self._mdcRAMSTK, gtk.gdk.LEFT_PTR)
 
@@ -156,6 +168,11 @@ class RAMSTKImport(gtk.Assistant):
             _user_msg = _(u"One or more import records violated PRIMARY KEY "
                           u"constraints.  Check your import file data and try "
                           u"again.")
+        elif _error_code == 5:
+            _msg_type = 'error'
+            _user_msg = _(u"One or more import records failed validation and "
+                          u"nothing was imported.  Check the import log for "
+                          u"the rows and fields in error and try again.")
         elif _error_code == 4:
             _msg_type = 'error'
             _user_msg = _(
@@ -195,7 +212,7 @@ class RAMSTKImport(gtk.Assistant):
         print _file
         if _file is not None:
             self._dtc_data_controller.request_do_read_input(
-                _file_type, _file)
+                _file_type, _file, chunksize=_IMPORT_CHUNKSIZE)
 
         # Load the field map treeview.
         self._module = self._cmb_select_module.get_active_text()
@@ -336,8 +353,7 @@ class RAMSTKImport(gtk.Assistant):
 
         return _page
 
-    @staticmethod
-    def _make_confirm_page():
+    def _make_confirm_page(self):
         """
         Make the Import Assistant confimation page.
 
@@ -357,4 +373,28 @@ class RAMSTKImport(gtk.Assistant):
 
         _page.put(_label, 25, 5)
 
+        self._pbr_import.set_pulse_step(0.25)
+        _page.put(self._pbr_import, 25, 310)
+
         return _page
+
+    def _on_imported_chunk(self, count, total):
+        """
+        Update the progress bar after each chunk of rows is imported.
+
+        :param int count: the number of rows in the chunk just imported.
+        :param int total: the total number of rows imported so far.
+        :return: None
+        :rtype: None
+        """
+        self._pbr_import.pulse()
+        self._pbr_import.set_text(
+            _(u"Imported {0:d} rows ({1:d} in the last chunk).").format(
+                total, count))
+
+        # The insert runs in the GTK main loop so let the progress bar redraw
+        # before the next chunk is read.
+        while gtk.events_pending():
+            gtk.main_iteration()
+
+        return None
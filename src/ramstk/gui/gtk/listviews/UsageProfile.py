@@ -7,7 +7,6 @@
 """Usage Profile List View Module."""
 
 from pubsub import pub
-from sortedcontainers import SortedDict
 
 # Modules required for the GUI.
 import pango
@@ -252,7 +251,7 @@ class ListView(RAMSTKListView):
         _data = []
         _model = self.treeview.get_model()
 
-        _node = _tree.nodes[SortedDict(_tree.nodes).keys()[0]]
+        _node = _tree.get_node(_tree.root)
         _entity = _node.data
         try:
             if _entity.is_mission:
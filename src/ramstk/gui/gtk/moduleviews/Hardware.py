@@ -62,6 +62,8 @@ class ModuleView(RAMSTKModuleView):
             self.treeview.connect('cursor_changed', self._do_change_row))
         self._lst_handler_id.append(
             self.treeview.connect('button_press_event', self._on_button_press))
+        self._lst_handler_id.append(
+            self.treeview.connect('test-expand-row', self._do_expand_row))
 
         self._img_tab.set_from_file(self._dic_icons['tab'])
         _label = ramstk.RAMSTKLabel(
@@ -170,7 +172,8 @@ class ModuleView(RAMSTKModuleView):
         if not self._dtc_data_controller.request_do_calculate_all(
                 node_id=self._hardware_id,
                 hr_multiplier=self._mdcRAMSTK.RAMSTK_CONFIGURATION.
-                RAMSTK_HR_MULTIPLIER):
+                RAMSTK_HR_MULTIPLIER,
+                incremental=True):
             # Update Revision attributes with system-level attribute values.
             _sys_attributes = self._dtc_data_controller.request_get_attributes(
                 1)
@@ -659,7 +662,7 @@ class ModuleView(RAMSTKModuleView):
         # It is defined in RAMSTKBaseView.__init__
         self._dtc_data_controller = self._mdcRAMSTK.dic_controllers['hardware']
         _hardware = self._dtc_data_controller.request_do_select_all(
-            revision_id=self._revision_id)
+            revision_id=self._revision_id, depth=self._load_depth)
 
         _return = RAMSTKModuleView.on_select_revision(self, tree=_hardware)
         if _return:
@@ -6,6 +6,8 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """The RAMSTKModuleView Module."""
 
+from treelib import Tree
+
 # Import other RAMSTK modules.
 from ramstk.gui.gtk.assistants import ExportModule
 from ramstk.gui.gtk.ramstk.Widget import gobject, gtk
@@ -45,6 +47,9 @@ class RAMSTKModuleView(gtk.HBox, ramstk.RAMSTKBaseView):
 
         # Initialize private scalar attributes.
         self._img_tab = gtk.Image()
+        # The number of levels of the Module tree to load when a Revision is
+        # selected.  The rest is loaded as the rows are expanded.
+        self._load_depth = 2
 
         # Initialize public dictionary attributes.
 
@@ -57,6 +62,46 @@ class RAMSTKModuleView(gtk.HBox, ramstk.RAMSTKBaseView):
 
         self.pack_end(_scrolledwindow, expand=True, fill=True)
 
+    def _do_expand_row(self, treeview, row, __path):
+        """
+        Load the children of the rows below the row being expanded.
+
+        Module trees are loaded a few levels at a time.  The children of the
+        expanded row are already displayed, so their children are loaded to
+        give them an expander.  Connect this to the 'test-expand-row' signal
+        of the Module View gtk.TreeView().
+
+        :param treeview: the Module View gtk.TreeView() being expanded.
+        :type treeview: :class:`gtk.TreeView`
+        :param row: the gtk.TreeIter() of the row being expanded.
+        :type row: :class:`gtk.TreeIter`
+        :param __path: the gtk.TreeView() path of the row being expanded.
+        :return: False to allow the row to expand.
+        :rtype: bool
+        """
+        _model = treeview.get_model()
+
+        _row = _model.iter_children(row)
+        while _row is not None:
+            _loaded = []
+            _child = _model.iter_children(_row)
+            while _child is not None:
+                _loaded.append(_model.get_value(_child, 1))
+                _child = _model.iter_next(_child)
+
+            _children = self._dtc_data_controller.request_do_select_children(
+                _model.get_value(_row, 1))
+            for _node in _children or []:
+                if _node.identifier not in _loaded:
+                    _tree = Tree()
+                    _tree.create_node(
+                        _node.tag, _node.identifier, data=_node.data)
+                    self.treeview.do_load_tree(_tree, _row)
+
+            _row = _model.iter_next(_row)
+
+        return False
+
     @staticmethod
     def _do_edit_cell(__cell, path, new_text, position, model):
         """
@@ -59,6 +59,8 @@ class ModuleView(RAMSTKModuleView):
             self.treeview.connect('cursor_changed', self._do_change_row))
         self._lst_handler_id.append(
             self.treeview.connect('button_press_event', self._on_button_press))
+        self._lst_handler_id.append(
+            self.treeview.connect('test-expand-row', self._do_expand_row))
 
         self._img_tab.set_from_file(self._dic_icons['tab'])
         _label = ramstk.RAMSTKLabel(
@@ -546,7 +548,7 @@ class ModuleView(RAMSTKModuleView):
                 'requirement']
 
         _requirements = self._dtc_data_controller.request_do_select_all(
-            revision_id=self._revision_id)
+            revision_id=self._revision_id, depth=self._load_depth)
         _return = RAMSTKModuleView.on_select_revision(self, tree=_requirements)
         if _return:
             _prompt = _(u"An error occured while loading the Requirements for "
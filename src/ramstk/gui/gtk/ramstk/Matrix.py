@@ -25,6 +25,10 @@ class RAMSTKBaseMatrix(object):
 
     :ivar list _dic_icons: dictionary of icons to use in the various RAMSTKMatrix
                            views.
+    :ivar _dtc_data_controller: the data controller whose matrix is displayed
+                                in the Matrix View.
+    :ivar str _matrix_type: the type of the matrix displayed in the Matrix
+                            View.
     :ivar _ramstk_matrix: the RAMSTKDataMatrix to display in the Matrix View.
     :ivar int _n_columns: the number of columns in the matrix.
     :ivar int _n_rows: the number rows in the matrix.
@@ -65,6 +69,8 @@ class RAMSTKBaseMatrix(object):
 
         # Initialize private scalar attributes.
         self._mdcRAMSTK = controller
+        self._dtc_data_controller = None
+        self._matrix_type = None
         self._ramstk_matrix = None
         self._n_columns = 0
         self._n_rows = 0
@@ -205,21 +211,21 @@ class RAMSTKBaseMatrix(object):
         _column_item_id = col_index
         _row_item_id = model[path][0]
         if _model.get_value(row, 0) == 'Partial':
-            self._ramstk_matrix[_column_item_id][_row_item_id] = 1
-            _pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(
-                self._dic_icons[1], 22, 22)
+            _value = 1
         elif _model.get_value(row, 0) == 'Complete':
-            self._ramstk_matrix[_column_item_id][_row_item_id] = 2
-            _pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(
-                self._dic_icons[2], 22, 22)
+            _value = 2
         else:
-            self._ramstk_matrix[_column_item_id][_row_item_id] = 0
-            _pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(
-                self._dic_icons[0], 22, 22)
+            _value = 0
 
-        model[path][position - 1] = _pixbuf
+        _return = self._dtc_data_controller.request_do_set_matrix(
+            self._matrix_type, _column_item_id, _row_item_id, _value)
 
-        return False
+        if not _return:
+            _pixbuf = gtk.gdk.pixbuf_new_from_file_at_size(
+                self._dic_icons[_value], 22, 22)
+            model[path][position - 1] = _pixbuf
+
+        return _return
 
     def _do_set_properties(self, cell, editable, position, col_index, model):
         """
@@ -6,6 +6,7 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Datamodels Package RAMSTKDataMatrix."""
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import and_, func
 
@@ -84,6 +85,128 @@ class RAMSTKDataMatrix(object):
         self.n_row = 1
         self.n_col = 1
 
+    def _do_select_item_ids(self, revision_id, rkey, ckey):
+        """
+        Select the module IDs of the matrix rows and columns.
+
+        Only the module ID field is selected from the row and column tables.
+
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str rkey: the key in the row table attributes containing the
+                         module ID.
+        :param str ckey: the key in the column table attributes containing the
+                         module ID.
+        :return: (_lst_row_id, _lst_column_id); the list of row module IDs and
+                 the list of column module IDs.
+        :rtype: (list, list)
+        """
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+
+        _lst_row_id = [
+            _row[0] for _row in _session.query(
+                getattr(self._row_table, rkey)).filter(
+                    self._row_table.revision_id == revision_id).all()
+        ]
+        _lst_column_id = [
+            _column[0] for _column in _session.query(
+                getattr(self._column_table, ckey)).filter(
+                    self._column_table.revision_id == revision_id).all()
+        ]
+
+        _session.close()
+
+        return _lst_row_id, _lst_column_id
+
+    def _do_select_headings(self, session, revision_id, matrix_type,
+                            **kwargs):
+        """
+        Select the row and column headings for the matrix.
+
+        :param session: the SQLAlchemy session used to communicate with the
+                        RAMSTK Program database.
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select the headings
+                                for.
+        :return: (_lst_row_id, _lst_column_id); the list of row module IDs and
+                 the list of column module IDs in the order they were read.
+        :rtype: (list, list)
+        """
+        _rkey = kwargs['rkey']
+        _ckey = kwargs['ckey']
+        _rheader = kwargs['rheader']
+        _cheader = kwargs['cheader']
+
+        _lst_row_id = []
+        _lst_column_id = []
+
+        self.n_col = 0
+        self.n_row = 0
+
+        # Retrieve the dictionary of row headings.  The key is the row table's
+        # module ID.  The value is the row table field with string data
+        # (typically the code, description, or name field).
+        for _row in self.dao.db_select_cached(
+                session.query(self._row_table).filter(
+                    self._row_table.revision_id == revision_id),
+                revision_id=revision_id):
+            _attributes = _row.get_attributes()
+            self.dic_row_hdrs[_attributes[_rkey]] = _attributes[_rheader]
+            _lst_row_id.append(_attributes[_rkey])
+
+            self.n_row += 1
+
+        # Retrieve the dictionary of column headings.  The key is the column
+        # table's module ID.  The value is the column table field with string
+        # data (typically the code, description, or name field).
+        for _column in self.dao.db_select_cached(
+                session.query(self._column_table).filter(
+                    self._column_table.revision_id == revision_id),
+                revision_id=revision_id):
+            _attributes = _column.get_attributes()
+            try:
+                self.dic_column_hdrs[
+                    _attributes[_ckey]] = _attributes[_cheader]
+                _lst_column_id.append(_attributes[_ckey])
+            except TypeError:
+                print 'FIXME: Handle TypeError in ' \
+                      'RAMSTKDataMatrix.do_select_all().  Tuple indices must ' \
+                      'be integers, not str.  This will be fixed when all ' \
+                      'the RAMSTK database tables are converted to return ' \
+                      'dicts from the get_attributes() method.  Matrix {0:s} ' \
+                      'is not working.  See issue #59'.format(matrix_type)
+
+            self.n_col += 1
+
+        return _lst_row_id, _lst_column_id
+
+    @staticmethod
+    def _do_select_matrix_id(session, matrix_type):
+        """
+        Select the Matrix ID to use for new cells of the matrix type.
+
+        :param session: the SQLAlchemy session used to communicate with the
+                        RAMSTK Program database.
+        :param str matrix_type: the type of the Matrix.
+        :return: _matrix_id; the ID of the existing matrix of this type or the
+                 next available Matrix ID.
+        :rtype: int
+        """
+        try:
+            _matrix_id = session.query(RAMSTKMatrix).filter(
+                RAMSTKMatrix.matrix_type == matrix_type).first().matrix_id
+        except AttributeError:
+            _matrix_id = session.query(
+                func.max(RAMSTKMatrix.matrix_id).label("last_id")).one()
+            try:
+                _matrix_id = int(_matrix_id.last_id) + 1
+            except TypeError:
+                _matrix_id = 1
+
+        return _matrix_id
+
     def do_create(self, revision_id, matrix_type, rkey='rkey', ckey='ckey'):
         """
         Create or refresh a data matrix.
@@ -99,31 +222,18 @@ class RAMSTKDataMatrix(object):
         """
         _return = False
 
-        _lst_row_id = []
-        _lst_value = []
-        _dic_column = {}
+        # Read the row (records from the "row" table) and column (records
+        # from the "column" table) module IDs once each and allocate the
+        # zero-filled pandas dataframe representation of the matrix from them.
+        # Update the RAMSTK Program database with the contents of this
+        # dataframe.
+        _lst_row_id, _lst_column_id = self._do_select_item_ids(
+            revision_id, rkey, ckey)
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        # Iterate over the rows (records from the "row" table) and then the
-        # columns (records from the "column" table) to create, ultimately, a
-        # pandas dataframe representation of the matrix.  Update the RAMSTK
-        # Program database with the contents of this dataframe.
-        for _row in _session.query(self._row_table).filter(
-                self._row_table.revision_id == revision_id).all():
-            _attributes = _row.get_attributes()
-            _lst_row_id.append(_attributes[rkey])
-            _lst_value.append(0)
-
-            for _column in _session.query(self._column_table).filter(
-                    self._column_table.revision_id == revision_id).all():
-                _attributes = _column.get_attributes()
-                _column_id = _attributes[ckey]
-                _dic_column[_column_id] = pd.Series(
-                    _lst_value, index=_lst_row_id)
-
-        self.dtf_matrix = pd.DataFrame(_dic_column)
+        self.dtf_matrix = pd.DataFrame(
+            np.zeros((len(_lst_row_id), len(_lst_column_id)), dtype=int),
+            index=_lst_row_id,
+            columns=_lst_column_id)
 
         self.do_update(revision_id, matrix_type)
 
@@ -196,42 +306,24 @@ class RAMSTKDataMatrix(object):
         _lst_value = []
         _dic_column = {}
 
-        self.n_col = 0
-        self.n_row = 0
-
-        # Retrieve the dictionary of row headings.  The key is the row table's
-        # module ID.  The value is the row table field with string data
-        # (typically the code, description, or name field).
-        for _row in _session.query(self._row_table).filter(
-                self._row_table.revision_id == revision_id).all():
-            _attributes = _row.get_attributes()
-            self.dic_row_hdrs[_attributes[_rkey]] = _attributes[_rheader]
-
-            self.n_row += 1
-
-        # Retrieve the dictionary of column headings.  The key is the column
-        # table's module ID.  The value is the column table field with string
-        # data (typically the code, description, or name field).
-        for _column in _session.query(self._column_table).filter(
-                self._column_table.revision_id == revision_id).all():
-            _attributes = _column.get_attributes()
-            try:
-                self.dic_column_hdrs[
-                    _attributes[_ckey]] = _attributes[_cheader]
-            except TypeError:
-                print 'FIXME: Handle TypeError in ' \
-                      'RAMSTKDataMatrix.do_select_all().  Tuple indices must ' \
-                      'be integers, not str.  This will be fixed when all ' \
-                      'the RAMSTK database tables are converted to return ' \
-                      'dicts from the get_attributes() method.  Matrix {0:s} ' \
-                      'is not working.  See issue #59'.format(matrix_type)
-
-            self.n_col += 1
-
-        # Retrieve the matrix values for the desired Matrix ID.
-        for _matrix in _session.query(RAMSTKMatrix).filter(
-                and_(RAMSTKMatrix.revision_id == revision_id,
-                     RAMSTKMatrix.matrix_type == matrix_type)).all():
+        _lst_row_ids, _lst_column_ids = self._do_select_headings(
+            _session,
+            revision_id,
+            matrix_type,
+            rkey=_rkey,
+            ckey=_ckey,
+            rheader=_rheader,
+            cheader=_cheader)
+
+        # Retrieve the matrix values for the desired Matrix ID.  The cells are
+        # grouped by column to build the matrix one column at a time.
+        for _matrix in self.dao.db_select_cached(
+                _session.query(RAMSTKMatrix).filter(
+                    and_(RAMSTKMatrix.revision_id == revision_id,
+                         RAMSTKMatrix.matrix_type == matrix_type)).order_by(
+                             RAMSTKMatrix.column_item_id,
+                             RAMSTKMatrix.row_item_id),
+                revision_id=revision_id):
             if _matrix.column_item_id == _column_id:
                 _lst_row_id.append(_matrix.row_item_id)
                 _lst_value.append(_matrix.value)
@@ -242,7 +334,12 @@ class RAMSTKDataMatrix(object):
 
             _dic_column[_column_id] = pd.Series(_lst_value, index=_lst_row_id)
 
-        self.dtf_matrix = pd.DataFrame(_dic_column)
+        # Cells without a record in the RAMSTK Program database, such as the
+        # zero cells of a matrix saved by RAMSTKSparseDataMatrix, are zero.
+        # The rows and columns without any record are added the same way.
+        self.dtf_matrix = pd.DataFrame(_dic_column).reindex(
+            index=_lst_row_ids, columns=_lst_column_ids,
+            fill_value=0).fillna(0).astype(int)
 
         _session.close()
 
@@ -335,6 +432,12 @@ class RAMSTKDataMatrix(object):
         """
         Update the Matrix associated with Matrix type.
 
+        The persisted cell values for the Matrix are read with a single query
+        and compared against the matrix DataFrame.  Only the cells that have
+        been added or changed are written, with one bulk INSERT and one bulk
+        UPDATE, and committed as a single transaction, or with the batch if
+        one has been started.
+
         :param int revision_id: the Revision ID the matrix is associated with.
         :param str matrix_type: the type of the Matrix to update.
         :return: (_error_code, _msg); the error code and associated message.
@@ -343,56 +446,71 @@ class RAMSTKDataMatrix(object):
         _error_code = 0
         _msg = 'RAMSTK SUCCESS: Updating Matrix {0:s}.'.format(matrix_type)
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
 
-        try:
-            _matrix_id = _session.query(RAMSTKMatrix).filter(
-                RAMSTKMatrix.matrix_type == matrix_type).first().matrix_id
-        except AttributeError:
-            _matrix_id = _session.query(
-                func.max(RAMSTKMatrix.matrix_id).label("last_id")).one()
-            try:
-                _matrix_id = int(_matrix_id.last_id) + 1
-            except TypeError:
-                _matrix_id = 1
+        _matrix_id = self._do_select_matrix_id(_session, matrix_type)
 
-        for _column_item_id in list(self.dtf_matrix.columns):
-            for _row_item_id in list(self.dtf_matrix.index):
-                _entity = _session.query(RAMSTKMatrix).filter(
-                    and_(RAMSTKMatrix.revision_id == revision_id,
-                         RAMSTKMatrix.matrix_type == matrix_type,
-                         RAMSTKMatrix.column_item_id == int(_column_item_id),
-                         RAMSTKMatrix.row_item_id == int(
-                             _row_item_id))).first()
-
-                try:
-                    # If there is no corresponding record in RAMSTKMatrix, then
-                    # create a new RAMSTKMatrix record and add it.
-                    if _entity is None:
-                        _entity = RAMSTKMatrix()
-                        _entity.revision_id = revision_id
-                        _entity.matrix_id = _matrix_id
-                        _entity.matrix_type = matrix_type
-                        _entity.column_item_id = int(_column_item_id)
-                        _entity.row_item_id = int(_row_item_id)
-
-                    _entity.value = int(
-                        self.dtf_matrix[_column_item_id][_row_item_id])
-                    _session.add(_entity)
-                    _error_code, _msg = self.dao.db_update(_session)
-
-                except AttributeError:
-                    _error_code = 6
-                    _msg = 'RAMSTK ERROR: Attempted to save non-existent ' \
-                           'entity with Column ID {0:s} and Row ID {1:s} to ' \
-                           'Matrix {2:s}.'.format(
-                               str(_column_item_id), str(_row_item_id),
-                               matrix_type)
-
-        _session.close()
+        # Read the persisted values for the entire matrix at once and line
+        # them up against the cells in the DataFrame by (column item ID, row
+        # item ID).
+        _query = _session.query(
+            RAMSTKMatrix.column_item_id, RAMSTKMatrix.row_item_id,
+            RAMSTKMatrix.matrix_id, RAMSTKMatrix.value).filter(
+                and_(RAMSTKMatrix.revision_id == revision_id,
+                     RAMSTKMatrix.matrix_type == matrix_type))
+        _dtf_stored = pd.DataFrame(
+            _query.all(),
+            columns=['column_item_id', 'row_item_id', 'matrix_id', 'stored'])
+        _row_item_ids, _column_item_ids = np.meshgrid(
+            self.dtf_matrix.index, self.dtf_matrix.columns, indexing='ij')
+        _dtf_cells = pd.DataFrame({
+            'column_item_id': _column_item_ids.ravel(),
+            'row_item_id': _row_item_ids.ravel(),
+            'value': self.dtf_matrix.values.ravel()
+        }).dropna()
+        _dtf_cells = pd.merge(
+            _dtf_cells.astype(int),
+            _dtf_stored,
+            how='left',
+            on=['column_item_id', 'row_item_id'])
+
+        _inserts = _dtf_cells[_dtf_cells['stored'].isnull()]
+        _updates = _dtf_cells[_dtf_cells['stored'].notnull()
+                              & (_dtf_cells['stored'] != _dtf_cells['value'])]
+
+        _lst_inserts = []
+        for _column_item_id, _row_item_id, _value in zip(
+                _inserts['column_item_id'], _inserts['row_item_id'],
+                _inserts['value']):
+            _lst_inserts.append({
+                'revision_id': revision_id,
+                'matrix_id': _matrix_id,
+                'matrix_type': matrix_type,
+                'column_item_id': int(_column_item_id),
+                'row_item_id': int(_row_item_id),
+                'value': int(_value)
+            })
+
+        _lst_updates = []
+        for _column_item_id, _row_item_id, _cell_matrix_id, _value in zip(
+                _updates['column_item_id'], _updates['row_item_id'],
+                _updates['matrix_id'], _updates['value']):
+            _lst_updates.append({
+                'revision_id': revision_id,
+                'matrix_id': int(_cell_matrix_id),
+                'column_item_id': int(_column_item_id),
+                'row_item_id': int(_row_item_id),
+                'value': int(_value)
+            })
+
+        if _lst_inserts or _lst_updates:
+            _error_code, _msg = self.dao.db_update_mappings(
+                RAMSTKMatrix,
+                _session,
+                inserts=_lst_inserts,
+                updates=_lst_updates)
+
+        self.dao.db_release_session(_session)
 
         return _error_code, _msg
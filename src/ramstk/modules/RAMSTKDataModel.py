@@ -6,6 +6,8 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Datamodels Package RAMSTKDataModel."""
 
+from sqlalchemy import inspect
+from sqlalchemy.exc import NoInspectionAvailable
 from treelib import tree, Tree  # pylint: disable=E0401
 
 __author__ = 'Doyle Rowland'
@@ -13,6 +15,10 @@ __email__ = 'doyle.rowland@reliaqual.com'
 __organization__ = 'ReliaQual Associates, LLC'
 __copyright__ = 'Copyright 2017 Doyle "weibullguy" Rowland'
 
+# The number of IDs bound in each IN clause when a tree is loaded lazily.
+# This stays well under SQLite's limit of 999 bound parameters per statement.
+SELECT_CHUNK_SIZE = 500
+
 
 class RAMSTKDataModel(object):  # pragma: no cover
     """
@@ -22,8 +28,18 @@ class RAMSTKDataModel(object):  # pragma: no cover
                 structure of the RAMSTK module being modeled..
     :ivar dao: the :class:`ramstk.dao.DAO` object used to communicate
                with the RAMSTK Program database.
+
+    Data models whose tree can be loaded lazily set _table to the RAMSTK
+    Program database table the tree is built from, _table_key to the name of
+    the attribute holding the entity ID, and _table_tag to the name of the
+    attribute used as the node tag.  The table must have a parent_id and a
+    revision_id column.
     """
 
+    _table = None
+    _table_key = None
+    _table_tag = None
+
     def __init__(self, dao):
         """
         Initialize an RAMSTK data model instance.
@@ -35,9 +51,13 @@ class RAMSTKDataModel(object):  # pragma: no cover
         # Initialize private dictionary attributes.
 
         # Initialize private list attributes.
+        # The IDs of the nodes whose children have been loaded.  This is None
+        # when the entire tree has been loaded.
+        self._set_expanded = None
 
         # Initialize private scalar attributes.
         self._last_id = None
+        self._revision_id = None
 
         # Initialize public dictionary attributes.
 
@@ -75,6 +95,39 @@ class RAMSTKDataModel(object):  # pragma: no cover
 
         return _entity
 
+    def is_modified(self, node_id):
+        """
+        Check whether the entity of a node has changed since it was saved.
+
+        SQLAlchemy keeps the committed value of every attribute that has been
+        set since the entity was loaded or last saved.  The entity is modified
+        if any of those values differ from the current value; setting an
+        attribute to the value it already has does not modify the entity.
+
+        :param node_id: the Node ID of the entity to check.
+        :return: True if the entity has unsaved changes or has never been
+                 saved, otherwise False.  Nodes without an entity return
+                 False.
+        :rtype: bool
+        """
+        try:
+            _state = inspect(self.tree.get_node(node_id).data)
+        except (AttributeError, NoInspectionAvailable, tree.NodeIDAbsentError):
+            return False
+
+        if _state.key is None:
+            return True
+
+        if not _state.modified:
+            return False
+
+        _values = _state.dict
+        for _key, _value in _state.committed_state.items():
+            if _values.get(_key) != _value:
+                return True
+
+        return False
+
     def do_select_all(self, **kwargs):  # pylint: disable=unused-argument
         """
         Retrieve and build the RAMSTK Module tree.
@@ -89,22 +142,193 @@ class RAMSTKDataModel(object):  # pragma: no cover
         return self.dao.RAMSTK_SESSION(
             bind=self.dao.engine, autoflush=False, expire_on_commit=False)
 
+    def _do_select_children(self, session, parent_ids):
+        """
+        Load the entities that are immediate children of the parents.
+
+        The parent IDs are bound in chunks of SELECT_CHUNK_SIZE so each query
+        uses the index on the parent ID whatever the number of parents.
+
+        :param session: the SQLAlchemy scoped_session to query with.
+        :param list parent_ids: the Node IDs to load the children of.
+        :return: the Node IDs of the children that were loaded.
+        :rtype: list
+        """
+        _table = self._table
+        _children = []
+
+        _parent_ids = list(parent_ids)
+        for _idx in range(0, len(_parent_ids), SELECT_CHUNK_SIZE):
+            _chunk = _parent_ids[_idx:_idx + SELECT_CHUNK_SIZE]
+            for _entity in session.query(_table).filter(
+                    _table.revision_id == self._revision_id,
+                    _table.parent_id.in_(_chunk)).order_by(
+                        getattr(_table, self._table_key)):
+                # We get and then set the attributes to replace any None
+                # values (NULL fields in the database) with their default
+                # value.
+                _attributes = _entity.get_attributes()
+                _entity.set_attributes(_attributes)
+                _node_id = getattr(_entity, self._table_key)
+                try:
+                    self.tree.create_node(
+                        getattr(_entity, self._table_tag),
+                        _node_id,
+                        parent=_entity.parent_id,
+                        data=_entity)
+                    _children.append(_node_id)
+
+                    self.last_id = max(self.last_id, _node_id)
+                except (tree.DuplicatedNodeIdError, tree.NodeIDAbsentError):
+                    pass
+
+        self._set_expanded.update(_parent_ids)
+
+        return _children
+
+    def _do_select_levels(self, session, depth):
+        """
+        Load the top levels of the RAMSTK Module tree, one query per level.
+
+        The rest of the tree is loaded as each node is expanded with
+        do_select_children() or do_select_subtree().
+
+        :param session: the SQLAlchemy scoped_session to query with.
+        :param int depth: the number of levels of the tree to load.
+        :return: the Node IDs that were loaded, each parent ahead of its
+                 children.
+        :rtype: list
+        """
+        self._set_expanded = set()
+
+        _loaded = []
+        _parent_ids = [0]
+        for __ in range(depth):
+            _parent_ids = self._do_select_children(session, _parent_ids)
+            _loaded.extend(_parent_ids)
+
+        return _loaded
+
+    def do_select_children(self, node_id):
+        """
+        Select a list containing the immediate child nodes.
+
+        When the tree was loaded lazily, the children of the passed Node ID
+        are loaded from the RAMSTK Program database the first time they're
+        selected.
+
+        :param int node_id: the Node ID to select the children for.
+        :return: a list of the immediate child nodes of the passed Node ID or
+                 None if the Node ID does not exist.
+        :rtype: list
+        """
+        if (self._set_expanded is not None
+                and node_id not in self._set_expanded
+                and self.tree.contains(node_id)):
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            self._do_select_children(_session, [node_id])
+            _session.close()
+
+        try:
+            _children = self.tree.children(node_id)
+        except tree.NodeIDAbsentError:
+            _children = None
+
+        return _children
+
+    def do_select_subtree(self, node_id):
+        """
+        Load every node below the passed Node ID that isn't loaded yet.
+
+        Anything that walks a subtree, such as a roll-up calculation, needs
+        the entire subtree rather than the levels that have been expanded.
+        The subtree is loaded one query per level.  Nothing is loaded when the
+        entire tree has already been loaded.
+
+        :param int node_id: the Node ID at the top of the subtree.
+        :return: the Node IDs that were loaded, each parent ahead of its
+                 children.
+        :rtype: list
+        """
+        _loaded = []
+
+        if self._set_expanded is None or not self.tree.contains(node_id):
+            return _loaded
+
+        _parent_ids = []
+        _stack = [node_id]
+        while _stack:
+            _node_id = _stack.pop()
+            if _node_id not in self._set_expanded:
+                _parent_ids.append(_node_id)
+            _stack.extend(self.tree.get_node(_node_id).fpointer)
+
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        while _parent_ids:
+            _parent_ids = self._do_select_children(_session, _parent_ids)
+            _loaded.extend(_parent_ids)
+        _session.close()
+
+        return _loaded
+
+    def do_load_tree(self, entities, tag, key):
+        """
+        Rebuild the RAMSTK Module tree from a list of selected entities.
+
+        This is used by the aggregate data models, which select the entities
+        for every level at once, to load each level's data model without it
+        querying the RAMSTK Program database again.
+
+        :param list entities: the RAMSTK Program database entities to load.
+        :param str tag: the name of the attribute to use as the node tag.
+        :param str key: the name of the attribute holding the entity ID.
+        :return: entities; the list of entities loaded.
+        :rtype: list
+        """
+        _root = self.tree.root
+        for _node in self.tree.children(_root):
+            self.tree.remove_node(_node.identifier)
+
+        for _entity in entities:
+            # We get and then set the attributes to replace any None values
+            # (NULL fields in the database) with their default value.
+            _attributes = _entity.get_attributes()
+            _entity.set_attributes(_attributes)
+            self.tree.create_node(
+                getattr(_entity, tag),
+                getattr(_entity, key),
+                parent=0,
+                data=_entity)
+
+            self.last_id = max(self.last_id, getattr(_entity, key))
+
+        return entities
+
     def do_insert(self, **kwargs):
         """
         Add the list of RAMSTK<MODULE> instance to the RAMSTK Program database.
 
         :param list entities: the list of RAMSTK<MODULE> entities to add to the
                               RAMSTK Program database.
+        :keyword int chunk_size: the number of entities to add in each
+                                 transaction.  Default is 1.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
         _entities = kwargs['entities']
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        try:
+            _chunk_size = kwargs['chunk_size']
+        except KeyError:
+            _chunk_size = 1
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
-        _error_code, _msg = self.dao.db_add(_entities, _session)
+        _error_code, _msg = self.dao.db_add(
+            _entities, _session, chunk_size=_chunk_size)
 
-        _session.close()
+        self.dao.db_release_session(_session)
 
         return _error_code, _msg
 
@@ -119,8 +343,8 @@ class RAMSTKDataModel(object):  # pragma: no cover
         """
         _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
         try:
             _entity = self.tree.get_node(node_id).data
@@ -132,7 +356,7 @@ class RAMSTKDataModel(object):  # pragma: no cover
         except AttributeError:
             _error_code = 2005
 
-        _session.close()
+        self.dao.db_release_session(_session)
 
         return _error_code, _msg
 
@@ -148,11 +372,8 @@ class RAMSTKDataModel(object):  # pragma: no cover
         _error_code = 0
         _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
 
         try:
             _entity = self.tree.get_node(node_id).data
@@ -164,6 +385,55 @@ class RAMSTKDataModel(object):  # pragma: no cover
             _msg = ('RAMSTK ERROR: Attempted to save non-existent '
                     'entity with Node ID {0:s}.').format(str(node_id))
 
-        _session.close()
+        self.dao.db_release_session(_session)
+
+        return _error_code, _msg
+
+    def _do_update_all(self, nodes, error_msg, success_msg, key=None):
+        """
+        Update the modified entities of the nodes passed as one transaction.
+
+        The entities are saved in a DAO batch so they are committed together
+        or not at all.  Only the messages of the nodes that fail to update are
+        returned; the other nodes aren't committed until the batch is.
+
+        :param list nodes: the treelib Node()s whose entities are to be saved.
+        :param str error_msg: the message to return for a node whose entity
+                              can't be saved.
+        :param str success_msg: the message to return if every entity is
+                                saved.
+        :keyword str key: the name of the entity attribute to pass to
+                          do_update().  Default is to pass the Node ID.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = ''
+
+        self.dao.db_begin_batch()
+        try:
+            for _node in nodes:
+                if not self.is_modified(_node.identifier):
+                    continue
+                try:
+                    if key is None:
+                        _code, _debug_msg = self.do_update(_node.identifier)
+                    else:
+                        _code, _debug_msg = self.do_update(
+                            getattr(_node.data, key))
+                except AttributeError:
+                    _code = 1
+                    _debug_msg = error_msg
+                if _code != 0:
+                    _error_code = _code
+                    _msg = _msg + _debug_msg + '\n'
+        finally:
+            _code, _debug_msg = self.dao.db_flush_batch()
+        if _code != 0:
+            _error_code = _code
+            _msg = _msg + _debug_msg + '\n'
+
+        if _error_code == 0:
+            _msg = success_msg
 
         return _error_code, _msg
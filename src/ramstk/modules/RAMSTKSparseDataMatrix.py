@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.modules.RAMSTKSparseDataMatrix.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Datamodels Package RAMSTKSparseDataMatrix."""
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from sqlalchemy import and_
+
+# Import other RAMSTK modules.
+from ramstk.dao import RAMSTKMatrix
+from .RAMSTKDataMatrix import RAMSTKDataMatrix
+
+
+class RAMSTKSparseDataMatrix(RAMSTKDataMatrix):
+    """
+    The RAMSTK Sparse Data Matrix model.
+
+    Traceability matrices are almost entirely zeros.  The Sparse Data Matrix
+    keeps only the non-zero cells in memory, as a dictionary of
+    {(column item ID, row item ID):value} pairs, and only persists the
+    non-zero cells to the RAMSTK Program database.  Zero cells have no
+    RAMSTKMatrix record.  The attributes of a Sparse Matrix, in addition to
+    those of the RAMSTKDataMatrix, are:
+
+    :ivar dict dic_cells: dictionary of the non-zero cells in the matrix.  Key
+                          is the (column item ID, row item ID) tuple; value is
+                          the value of the cell.
+    :ivar list lst_row_id: the list of row item IDs in the matrix.
+    :ivar list lst_column_id: the list of column item IDs in the matrix.
+
+    The sdf_matrix attribute is a :class:`pd.SparseDataFrame` of the matrix
+    built from the non-zero cells.  It's a copy; cells are changed with
+    do_set().
+
+    The dtf_matrix attribute is a dense :class:`pd.DataFrame` view of the
+    matrix that is built when it's first requested.  Changes made to the view
+    are folded back into the sparse cells when the matrix is saved or a row or
+    column is inserted or deleted.  Saving keeps the view, so it can go on
+    being edited; inserting or deleting a row or column rebuilds it.
+    """
+
+    def __init__(self, dao, row_table, column_table):
+        """Initialize a Sparse Matrix data model instance."""
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+
+        # Initialize private scalar attributes.
+        self._dtf_view = None
+
+        # Initialize public dictionary attributes.
+        self.dic_cells = {}
+
+        # Initialize public list attributes.
+        self.lst_row_id = []
+        self.lst_column_id = []
+
+        RAMSTKDataMatrix.__init__(self, dao, row_table, column_table)
+
+        # Initialize public scalar attributes.
+
+    @property
+    def dtf_matrix(self):
+        """
+        Get the dense pandas DataFrame view of the matrix.
+
+        :return: the matrix as a :class:`pd.DataFrame` with the row item IDs
+                 as the index and the column item IDs as the columns.
+        :rtype: :class:`pd.DataFrame`
+        """
+        if self._dtf_view is None:
+            _row_position = dict(
+                zip(self.lst_row_id, range(len(self.lst_row_id))))
+            _column_position = dict(
+                zip(self.lst_column_id, range(len(self.lst_column_id))))
+
+            _values = np.zeros((len(self.lst_row_id), len(self.lst_column_id)),
+                               dtype=int)
+            for (_column_id, _row_id), _value in self.dic_cells.items():
+                _values[_row_position[_row_id], _column_position[
+                    _column_id]] = _value
+
+            self._dtf_view = pd.DataFrame(
+                _values, index=self.lst_row_id, columns=self.lst_column_id)
+
+        return self._dtf_view
+
+    @dtf_matrix.setter
+    def dtf_matrix(self, dtf_matrix):
+        """
+        Replace the contents of the matrix with a dense pandas DataFrame.
+
+        :param dtf_matrix: the :class:`pd.DataFrame` to load or None to empty
+                           the matrix.
+        """
+        self._dtf_view = dtf_matrix
+        self.dic_cells = {}
+        self.lst_row_id = []
+        self.lst_column_id = []
+        self._do_fold_view()
+
+    @property
+    def sdf_matrix(self):
+        """
+        Get the pandas SparseDataFrame of the matrix.
+
+        :return: the matrix as a :class:`pd.SparseDataFrame` with the row item
+                 IDs as the index, the column item IDs as the columns, and a
+                 fill value of zero.
+        :rtype: :class:`pd.SparseDataFrame`
+        """
+        self._do_fold_view(keep=True)
+
+        _row_position = dict(
+            zip(self.lst_row_id, range(len(self.lst_row_id))))
+        _column_position = dict(
+            zip(self.lst_column_id, range(len(self.lst_column_id))))
+
+        _cells = [(_row_position[_row_id], _column_position[_column_id],
+                   _value)
+                  for (_column_id, _row_id), _value in self.dic_cells.items()]
+        _rows, _columns, _values = (
+            [np.array(_list, dtype=int) for _list in zip(*_cells)]
+            or [np.array([], dtype=int)] * 3)
+
+        return pd.SparseDataFrame(
+            coo_matrix((_values, (_rows, _columns)),
+                       shape=(len(self.lst_row_id), len(self.lst_column_id))),
+            index=self.lst_row_id,
+            columns=self.lst_column_id,
+            default_fill_value=0)
+
+    def _do_fold_view(self, keep=False):
+        """
+        Fold the dense DataFrame view of the matrix back into the sparse cells.
+
+        :keyword bool keep: whether to keep the view after folding it.  Default
+                            is to discard it.
+        :return: None
+        :rtype: None
+        """
+        if self._dtf_view is not None:
+            self.lst_row_id = list(self._dtf_view.index)
+            self.lst_column_id = list(self._dtf_view.columns)
+
+            _values = self._dtf_view.fillna(0).values
+            _rows, _columns = np.nonzero(_values)
+            self.dic_cells = dict(
+                ((self.lst_column_id[_column], self.lst_row_id[_row]),
+                 int(_values[_row, _column]))
+                for _row, _column in zip(_rows, _columns))
+
+            if not keep:
+                self._dtf_view = None
+
+    def do_create(self, revision_id, matrix_type, rkey='rkey', ckey='ckey'):
+        """
+        Create or refresh a data matrix.
+
+        A new matrix has no non-zero cells so nothing but the removal of any
+        existing cells is written to the RAMSTK Program database.
+
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select all rows and
+                                all columns for.
+        :keyword int rkey: the key in the row table attributes containing the
+                           module ID.
+        :keyword int ckey: the key in the column table attributes containing
+                           the module ID.
+        """
+        _return = False
+
+        self._dtf_view = None
+        self.dic_cells = {}
+        self.lst_row_id, self.lst_column_id = self._do_select_item_ids(
+            revision_id, rkey, ckey)
+        self.n_row = len(self.lst_row_id)
+        self.n_col = len(self.lst_column_id)
+
+        self.do_update(revision_id, matrix_type)
+
+        return _return
+
+    def do_select(self, col, row):
+        """
+        Select the value from the cell identified by col and row.
+
+        :param str col: the column of the cell.
+        :param str row: the row of the cell.
+        :return: the value in the cell at (col, row).
+        :rtype: int
+        :raise: KeyError if the column or row doesn't exist in the matrix.
+        """
+        # The DataFrame view may have been edited since it was last folded
+        # into the sparse cells, so read the cell from it if there is one.
+        if self._dtf_view is not None:
+            _value = self._dtf_view[col][row]
+            if pd.isnull(_value):
+                _value = 0
+
+            return int(_value)
+
+        if col not in self.lst_column_id:
+            raise KeyError(col)
+        if row not in self.lst_row_id:
+            raise KeyError(row)
+
+        try:
+            _value = self.dic_cells[(col, row)]
+        except KeyError:
+            _value = 0
+
+        return _value
+
+    def do_set(self, col, row, value):
+        """
+        Set the value of the cell identified by col and row.
+
+        :param int col: the column item ID of the cell.
+        :param int row: the row item ID of the cell.
+        :param int value: the new value of the cell.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Setting a cell in the matrix.'
+
+        if col not in self.lst_column_id or row not in self.lst_row_id:
+            _error_code = 6
+            _msg = 'RAMSTK ERROR: Attempted to set non-existent cell ' \
+                   '({0:s}, {1:s}) in the matrix.'.format(str(col), str(row))
+        else:
+            if value:
+                self.dic_cells[(col, row)] = int(value)
+            else:
+                self.dic_cells.pop((col, row), None)
+
+            if self._dtf_view is not None:
+                self._dtf_view.at[row, col] = value
+
+        return _error_code, _msg
+
+    def do_select_all(self, revision_id, matrix_type, **kwargs):
+        r"""
+        Select everything needed to build the matrix.
+
+        This method selects the row headings, the column headings, and the
+        non-zero cell values for the matrix.
+
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select all rows and
+                                all columns for.
+        :param \**kwargs: See RAMSTKDataMatrix.do_select_all()
+        :return: False if successful or True if an error occurs.
+        :rtype: bool
+        """
+        try:
+            _rkey = kwargs['rkey']
+        except KeyError:
+            _rkey = 'rkey'
+        try:
+            _ckey = kwargs['ckey']
+        except KeyError:
+            _ckey = 'ckey'
+        try:
+            _rheader = kwargs['rheader']
+        except KeyError:
+            _rheader = 0
+        try:
+            _cheader = kwargs['cheader']
+        except KeyError:
+            _cheader = 0
+
+        _return = False
+
+        _session = self.dao.RAMSTK_SESSION(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+
+        self._dtf_view = None
+        self.lst_row_id, self.lst_column_id = self._do_select_headings(
+            _session,
+            revision_id,
+            matrix_type,
+            rkey=_rkey,
+            ckey=_ckey,
+            rheader=_rheader,
+            cheader=_cheader)
+
+        # Retrieve the non-zero matrix values for the desired Matrix ID.
+        # Matrices saved by RAMSTKDataMatrix also have records for the zero
+        # cells; these are skipped, as are the cells of rows and columns that
+        # are no longer in the matrix.
+        _query = _session.query(
+            RAMSTKMatrix.column_item_id, RAMSTKMatrix.row_item_id,
+            RAMSTKMatrix.value).filter(
+                and_(RAMSTKMatrix.revision_id == revision_id,
+                     RAMSTKMatrix.matrix_type == matrix_type,
+                     RAMSTKMatrix.value != 0))
+        _row_ids = set(self.lst_row_id)
+        _column_ids = set(self.lst_column_id)
+        self.dic_cells = {}
+        for _column_item_id, _row_item_id, _value in _query.all():
+            if _column_item_id in _column_ids and _row_item_id in _row_ids:
+                self.dic_cells[(_column_item_id, _row_item_id)] = _value
+
+        _session.close()
+
+        return _return
+
+    def do_insert(self, item_id, heading, row=True):
+        """
+        Insert a row or a column into the matrix.
+
+        :param int item_id: the ID of the row or column item to insert into the
+                            Matrix (this is the module ID associated with the
+                            row or column to be inserted).
+        :param str heading: the heading for the new row or column.
+        :keyword bool row: indicates whether to insert a row (default) or a
+                           column.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Inserting a row or column into the matrix.'
+
+        self._do_fold_view()
+
+        if row:
+            if item_id in self.lst_row_id:
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Attempting to insert row {0:d} into a ' \
+                       'matrix already containing a row {0:d}.'.format(item_id)
+            else:
+                self.dic_row_hdrs[item_id] = heading
+                self.lst_row_id.append(item_id)
+                self.n_row = len(self.lst_row_id)
+        else:
+            if item_id in self.lst_column_id:
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Inserting column into matrix.  Column ' \
+                       '{0:d} already exists or adjacent column {1:d} does ' \
+                       'NOT exist.'.format(item_id, self.n_col)
+            else:
+                self.dic_column_hdrs[item_id] = heading
+                self.lst_column_id.append(item_id)
+                self.n_col = len(self.lst_column_id)
+
+        return _error_code, _msg
+
+    def do_delete(self, item_id, row=True):
+        """
+        Delete a column or row from the Matrix.
+
+        :param int item_id: the ID of the row or column item to delete from the
+                            Matrix.
+        :param bool row: indicates whether to delete a row (default) or a
+                         column identified by identifier.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Removing a row or column from the matrix.'
+
+        self._do_fold_view()
+
+        if row:
+            try:
+                self.lst_row_id.remove(item_id)
+                self.dic_row_hdrs.pop(item_id)
+                self.n_row = len(self.lst_row_id)
+                for _key in [_key for _key in self.dic_cells
+                             if _key[1] == item_id]:
+                    self.dic_cells.pop(_key)
+            except (KeyError, ValueError):
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Attempted to drop non-existent row ' \
+                       '{0:d} from the matrix.'.format(item_id)
+        else:
+            try:
+                self.lst_column_id.remove(item_id)
+                self.dic_column_hdrs.pop(item_id)
+                self.n_col = len(self.lst_column_id)
+                for _key in [_key for _key in self.dic_cells
+                             if _key[0] == item_id]:
+                    self.dic_cells.pop(_key)
+            except (KeyError, ValueError):
+                _error_code = 6
+                _msg = 'RAMSTK ERROR: Attempted to drop non-existent column ' \
+                       '{0:d} from the matrix.'.format(item_id)
+
+        return _error_code, _msg
+
+    def do_update(self, revision_id, matrix_type):
+        """
+        Update the Matrix associated with Matrix type.
+
+        Only the non-zero cells are saved.  Records for cells in the matrix
+        that are now zero are deleted from the RAMSTK Program database.  All
+        the changes are committed as a single transaction, or with the batch
+        if one has been started.
+
+        :param int revision_id: the Revision ID the matrix is associated with.
+        :param str matrix_type: the type of the Matrix to update.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Updating Matrix {0:s}.'.format(matrix_type)
+
+        self._do_fold_view(keep=True)
+
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
+
+        _matrix_id = self._do_select_matrix_id(_session, matrix_type)
+
+        _row_ids = set(self.lst_row_id)
+        _column_ids = set(self.lst_column_id)
+
+        _lst_inserts = []
+        _lst_updates = []
+        _lst_deletes = []
+        _dic_stored = {}
+        _query = _session.query(
+            RAMSTKMatrix.column_item_id, RAMSTKMatrix.row_item_id,
+            RAMSTKMatrix.matrix_id, RAMSTKMatrix.value).filter(
+                and_(RAMSTKMatrix.revision_id == revision_id,
+                     RAMSTKMatrix.matrix_type == matrix_type))
+        for (_column_item_id, _row_item_id, _cell_matrix_id,
+             _value) in _query.all():
+            _key = (_column_item_id, _row_item_id)
+            _dic_stored[_key] = _value
+            try:
+                if self.dic_cells[_key] != _value:
+                    _lst_updates.append({
+                        'revision_id': revision_id,
+                        'matrix_id': _cell_matrix_id,
+                        'column_item_id': _column_item_id,
+                        'row_item_id': _row_item_id,
+                        'value': int(self.dic_cells[_key])
+                    })
+            except KeyError:
+                # Only remove the records for cells that are still part of
+                # the matrix.
+                if _column_item_id in _column_ids and _row_item_id in _row_ids:
+                    _lst_deletes.append({
+                        'revision_id': revision_id,
+                        'matrix_id': _cell_matrix_id,
+                        'column_item_id': _column_item_id,
+                        'row_item_id': _row_item_id
+                    })
+
+        for (_column_item_id, _row_item_id), _value in self.dic_cells.items():
+            if (_column_item_id, _row_item_id) not in _dic_stored:
+                _lst_inserts.append({
+                    'revision_id': revision_id,
+                    'matrix_id': _matrix_id,
+                    'matrix_type': matrix_type,
+                    'column_item_id': int(_column_item_id),
+                    'row_item_id': int(_row_item_id),
+                    'value': int(_value)
+                })
+
+        if _lst_inserts or _lst_updates or _lst_deletes:
+            _error_code, _msg = self.dao.db_update_mappings(
+                RAMSTKMatrix,
+                _session,
+                inserts=_lst_inserts,
+                updates=_lst_updates,
+                deletes=_lst_deletes)
+
+        self.dao.db_release_session(_session)
+
+        return _error_code, _msg
@@ -1,3 +1,4 @@
 from .RAMSTKDataModel import RAMSTKDataModel
 from .RAMSTKDataMatrix import RAMSTKDataMatrix
+from .RAMSTKSparseDataMatrix import RAMSTKSparseDataMatrix
 from .RAMSTKDataController import RAMSTKDataController
@@ -54,8 +54,10 @@ class AllocationDataModel(RAMSTKDataModel):
         _revision_id = kwargs['revision_id']
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _allocation in _session.query(RAMSTKAllocation).filter(
-                RAMSTKAllocation.revision_id == _revision_id).all():
+        for _allocation in self.dao.db_select_cached(
+                _session.query(RAMSTKAllocation).filter(
+                    RAMSTKAllocation.revision_id == _revision_id),
+                revision_id=_revision_id):
             # We get and then set the attributes to replace any None values
             # (NULL fields in the database) with their default value.
             _attributes = _allocation.get_attributes()
@@ -170,27 +172,14 @@ class AllocationDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more line items in the "
+                      "reliability allocation analysis worksheet did not "
+                      "update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all line items in the "
+                        "reliability allocation analysis worksheet.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more line items in the reliability "
-                    "allocation analysis worksheet did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all line items in the reliability "
-                "allocation analysis worksheet.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
     def do_calculate(self, node_id, **kwargs):
         """
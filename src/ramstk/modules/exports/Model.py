@@ -12,6 +12,14 @@ import pandas as pd
 # Export other RAMSTK modules.
 from ramstk.modules import RAMSTKDataModel
 
+# The number of rows written to the export file at a time.
+_EXPORT_CHUNK_SIZE = 10000
+
+# The RAMSTK modules that can be loaded for export.  The Design Mechanic
+# headers aren't attribute names, so it can't be loaded yet.
+_EXPORT_MODULES = ('Function', 'Requirement', 'Hardware', 'Design Electric',
+                   'Reliability', 'Validation')
+
 
 class ExportDataModel(RAMSTKDataModel):
     """Contains the attributes and methods of an Export data model."""
@@ -154,10 +162,13 @@ class ExportDataModel(RAMSTKDataModel):
 
         # Initialize public scalar attributes.
 
-    def do_export(self, file_type, file_name):
+    def do_export(self, file_type, file_name, **kwargs):
         """
         Export selected RAMSTK module data to external file.
 
+        The data is written a chunk of rows at a time so only one chunk of
+        rows is formatted for the file at once.
+
         :param str file_type: the type of file to export the data to.
                               Currently supported files types are:
                                   - CSV (with semi-colon (;) delimiter.
@@ -166,11 +177,25 @@ class ExportDataModel(RAMSTKDataModel):
                                   - PDF
         :param str file_name: the name, with full path, of the file to export
                               the RAMSTK Progam database data to.
+        :keyword int chunk_size: the number of rows to write at a time.
+                                 Default is 10000.
         :return: None
         :rtype: None
         """
-        if file_type == 'csv':
-            self._output_data.to_csv(file_name, sep=';', index=False)
+        try:
+            _chunk_size = max(1, int(kwargs['chunk_size']))
+        except KeyError:
+            _chunk_size = _EXPORT_CHUNK_SIZE
+
+        # Always write at least one chunk so the header row is written.
+        _rows = range(0, max(1, len(self._output_data)), _chunk_size)
+
+        if file_type in ['csv', 'text']:
+            _sep = ';' if file_type == 'csv' else ' '
+            with open(file_name, 'w') as _file:
+                for _idx in _rows:
+                    self._output_data.iloc[_idx:_idx + _chunk_size].to_csv(
+                        _file, sep=_sep, index=False, header=(_idx == 0))
         elif file_type == 'excel':
             __, _extension = os.path.splitext(file_name)
             if _extension == '.xls':
@@ -179,11 +204,16 @@ class ExportDataModel(RAMSTKDataModel):
                 _writer = pd.ExcelWriter(file_name, engine='xlsxwriter')
             elif _extension == '.xlsm':
                 _writer = pd.ExcelWriter(file_name, engine='openpyxl')
-            self._output_data.to_excel(_writer, 'Sheet 1', index=False)
+            for _idx in _rows:
+                # The first chunk is written below the header row.
+                self._output_data.iloc[_idx:_idx + _chunk_size].to_excel(
+                    _writer,
+                    'Sheet 1',
+                    index=False,
+                    header=(_idx == 0),
+                    startrow=(_idx + 1 if _idx > 0 else 0))
             _writer.save()
             _writer.close()
-        elif file_type == 'text':
-            self._output_data.to_csv(file_name, sep=' ', index=False)
         elif file_type == 'pdf':
             print "Portable Document Format"
 
@@ -200,150 +230,44 @@ class ExportDataModel(RAMSTKDataModel):
         :return: None
         :rtype: None
         """
-        if module == 'Function':
-            self._do_load_function(tree)
-        elif module == 'Requirement':
-            self._do_load_requirement(tree)
-        elif module == 'Hardware':
-            self._do_load_hardware(tree)
-        elif module == 'Design Electric':
-            self._do_load_design_electric(tree)
-        elif module == 'Reliability':
-            self._do_load_reliability(tree)
-        elif module == 'Validation':
-            self._do_load_validation(tree)
+        if module in _EXPORT_MODULES:
+            self._do_load_tree(module, tree)
 
         return None
 
-    def _do_load_function(self, tree):
-        """
-        Load the Function entities into a Pandas DataFrame.
-
-        :param tree: the treelib Tree() containing the data entities for the
-                     module to load.
-        :type tree: :class:`treelib.Tree`
-        :return: None
-        :rtype: None
+    def _do_load_tree(self, module, tree):
         """
-        _dic_output_data = {}
-
-        for _header in self._dic_column_headers['Function']:
-            _temp = []
-            for _node in tree.nodes.values()[1:]:
-                _temp.append(_node.data.get_attributes()[_header])
-            _dic_output_data[_header] = _temp
+        Load the entities in a RAMSTK module's tree into a Pandas DataFrame.
 
-        self._output_data = pd.DataFrame(_dic_output_data)
-
-        return None
-
-    def _do_load_requirement(self, tree):
-        """
-        Load the Requirement entities into a Pandas DataFrame.
+        The attributes of each entity are retrieved once and the entity's
+        values for the module's column headers are kept as one record.  The
+        DataFrame is built from the list of records with the columns in the
+        order of the headers.
 
+        :param str module: the RAMSTK module to load.
         :param tree: the treelib Tree() containing the data entities for the
                      module to load.
         :type tree: :class:`treelib.Tree`
         :return: None
         :rtype: None
         """
-        _dic_output_data = {}
-
-        for _header in self._dic_column_headers['Requirement']:
-            _temp = []
-            for _node in tree.nodes.values()[1:]:
-                _temp.append(_node.data.get_attributes()[_header])
-            _dic_output_data[_header] = _temp
-
-        self._output_data = pd.DataFrame(_dic_output_data)
-
-        return None
-
-    def _do_load_hardware(self, tree):
-        """
-        Load the Hardware entities into a Pandas DataFrame.
-
-        :param tree: the treelib Tree() containing the data entities for the
-                     module to load.
-        :type tree: :class:`treelib.Tree`
-        :return: None
-        :rtype: None
-        """
-        _dic_output_data = {}
-
-        for _header in self._dic_column_headers['Hardware']:
-            _temp = []
-            for _node in tree.nodes.values()[1:]:
-                _temp.append(_node.data[_header])
-            _dic_output_data[_header] = _temp
-
-        self._output_data = pd.DataFrame(_dic_output_data)
-
-        return None
-
-    def _do_load_design_electric(self, tree):
-        """
-        Load the Design Electric entities into a Pandas DataFrame.
-
-        :param tree: the treelib Tree() containing the data entities for the
-                     module to load.
-        :type tree: :class:`treelib.Tree`
-        :return: None
-        :rtype: None
-        """
-        _dic_output_data = {}
-
-        for _header in self._dic_column_headers['Design Electric']:
-            _temp = []
-            for _node in tree.nodes.values()[1:]:
-                _temp.append(_node.data.get_attributes()[_header])
-            _dic_output_data[_header] = _temp
-
-        self._output_data = pd.DataFrame(_dic_output_data)
-
-        return None
-
-    def _do_load_reliability(self, tree):
-        """
-        Load the Reliability entities into a Pandas DataFrame.
-
-        :param tree: the treelib Tree() containing the data entities for the
-                     module to load.
-        :type tree: :class:`treelib.Tree`
-        :return: None
-        :rtype: None
-        """
-        _dic_output_data = {}
-
-        for _header in self._dic_column_headers['Reliability']:
-            _temp = []
-            for _node in tree.nodes.values()[1:]:
-                print _node.data.get_attributes()
-                _temp.append(_node.data.get_attributes()[_header])
-            _dic_output_data[_header] = _temp
-
-        self._output_data = pd.DataFrame(_dic_output_data)
-
-        return None
-
-    def _do_load_validation(self, tree):
-        """
-        Load the Validation entities into a Pandas DataFrame.
-
-        :param tree: the treelib Tree() containing the data entities for the
-                     module to load.
-        :type tree: :class:`treelib.Tree`
-        :return: None
-        :rtype: None
-        """
-        _dic_output_data = {}
-
-        for _header in self._dic_column_headers['Validation']:
-            _temp = []
-            for _node in tree.nodes.values()[1:]:
-                _temp.append(_node.data.get_attributes()[_header])
-            _dic_output_data[_header] = _temp
-
-        self._output_data = pd.DataFrame(_dic_output_data)
+        _headers = self._dic_column_headers[module]
+        _records = []
+
+        for _node in tree.all_nodes():
+            _data = _node.data
+            if _data is None:
+                continue
+
+            # The Hardware BoM nodes hold attribute records rather than
+            # entities.
+            try:
+                _attributes = _data.get_attributes()
+            except AttributeError:
+                _attributes = _data
+            _records.append([_attributes[_header] for _header in _headers])
+
+        self._output_data = pd.DataFrame.from_records(
+            _records, columns=_headers)
 
         return None
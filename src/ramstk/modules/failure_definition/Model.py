@@ -58,8 +58,10 @@ class FailureDefinitionDataModel(RAMSTKDataModel):
         _revision_id = kwargs['revision_id']
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _definition in _session.query(RAMSTKFailureDefinition).filter(
-                RAMSTKFailureDefinition.revision_id == _revision_id).all():
+        for _definition in self.dao.db_select_cached(
+                _session.query(RAMSTKFailureDefinition).filter(
+                    RAMSTKFailureDefinition.revision_id == _revision_id),
+                revision_id=_revision_id):
             self.tree.create_node(
                 _definition.definition,
                 _definition.definition_id,
@@ -146,22 +148,10 @@ class FailureDefinitionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more records in the failure "
+                      "definition table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the failure "
+                        "definition table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the failure "
-                        "definition table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the failure "
-                    "definition table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
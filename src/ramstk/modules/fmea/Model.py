@@ -154,25 +154,13 @@ class ModeDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the FMEA modes "
-                        "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the FMEA modes "
-                    "table.")
+        _error_msg = ("RAMSTK ERROR: One or more records in the FMEA modes "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the FMEA "
+                        "modes table.")
 
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class MechanismDataModel(RAMSTKDataModel):
@@ -312,26 +300,13 @@ class MechanismDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more records in the FMEA "
+                      "mechanisms table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the FMEA "
+                        "mechanisms table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the FMEA "
-                        "mechanisms table did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the FMEA mechanisms "
-                "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class CauseDataModel(RAMSTKDataModel):
@@ -474,25 +449,13 @@ class CauseDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more records in the FMEA causes "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the FMEA "
+                        "causes table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the FMEA causes "
-                        "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the FMEA causes "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class ControlDataModel(RAMSTKDataModel):
@@ -635,27 +598,13 @@ class ControlDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more records in the FMEA controls "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the FMEA "
+                        "controls table.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the FMEA controls "
-                    "table did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the FMEA controls "
-                "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class ActionDataModel(RAMSTKDataModel):
@@ -799,26 +748,13 @@ class ActionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more records in the FMEA actions "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the FMEA "
+                        "actions table.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the FMEA actions "
-                    "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the FMEA actions "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class FMEADataModel(RAMSTKDataModel):
@@ -885,7 +821,9 @@ class FMEADataModel(RAMSTKDataModel):
         Retrieve and build the FMEA tree for Parent ID.
 
         The Parent ID is one of Function ID (functional FMEA) or Hardware ID
-        (hardware FMEA).
+        (hardware FMEA).  Each of the Mechanism, Cause, Control and Action
+        tables is read with a single query for the whole FMEA and the tree is
+        then assembled in memory.
 
         :return: tree; the FMEA treelib Tree().
         :rtype: :class:`treelib.Tree`
@@ -893,12 +831,45 @@ class FMEADataModel(RAMSTKDataModel):
         _parent_id = kwargs['parent_id']
         self._functional = kwargs['functional']
 
-        RAMSTKDataModel.do_select_all(self)
+        _session = RAMSTKDataModel.do_select_all(self)
 
         _modes = self.dtm_mode.do_select_all(
             parent_id=_parent_id, functional=self._functional).nodes
 
-        for _key in _modes:
+        if self._functional:
+            _mode_ids = _session.query(RAMSTKMode.mode_id).filter(
+                RAMSTKMode.function_id == _parent_id)
+            _mechanisms = []
+            _cause_ids = _session.query(RAMSTKCause.cause_id).filter(
+                RAMSTKCause.mode_id.in_(_mode_ids))
+        else:
+            _mode_ids = _session.query(RAMSTKMode.mode_id).filter(
+                RAMSTKMode.hardware_id == _parent_id)
+            _mechanisms = _session.query(RAMSTKMechanism).filter(
+                RAMSTKMechanism.mode_id.in_(_mode_ids)).order_by(
+                    RAMSTKMechanism.mechanism_id).all()
+            _cause_ids = _session.query(RAMSTKCause.cause_id).filter(
+                RAMSTKCause.mechanism_id.in_(
+                    _session.query(RAMSTKMechanism.mechanism_id).filter(
+                        RAMSTKMechanism.mode_id.in_(_mode_ids))))
+
+        _causes = _session.query(RAMSTKCause).filter(
+            RAMSTKCause.cause_id.in_(_cause_ids)).order_by(
+                RAMSTKCause.cause_id).all()
+        _controls = _session.query(RAMSTKControl).filter(
+            RAMSTKControl.cause_id.in_(_cause_ids)).order_by(
+                RAMSTKControl.control_id).all()
+        _actions = _session.query(RAMSTKAction).filter(
+            RAMSTKAction.cause_id.in_(_cause_ids)).order_by(
+                RAMSTKAction.action_id).all()
+
+        _session.close()
+
+        # Build each level of the tree in turn.  The dicts map the ID of each
+        # entity added to the tree to its Node ID so the next level can find
+        # its parent node.
+        _mode_nodes = {}
+        for _key in sorted(_modes):
             _mode = _modes[_key].data
             if _mode is not None:
                 _node_id = '0.' + str(_mode.mode_id)
@@ -907,121 +878,59 @@ class FMEADataModel(RAMSTKDataModel):
                     identifier=_node_id,
                     parent=0,
                     data=_mode)
-                if self._functional:
-                    self._do_add_causes(_mode.mode_id, _node_id, True)
-                else:
-                    self._do_add_mechanisms(_mode.mode_id, _node_id)
+                _mode_nodes[_mode.mode_id] = _node_id
 
-        return self.tree
-
-    def _do_add_mechanisms(self, mode_id, parent_id):
-        """
-        Add the failure mechanisms to the FMEA tree for Mode ID.
-
-        :param int mode_id: the Mode ID to add the failure mechanisms to.
-        :param str parent_id: the Node ID to add the failure mechanisms to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _mechanisms = self.dtm_mechanism.do_select_all(parent_id=mode_id).nodes
-        for _key in _mechanisms:
-            _mechanism = _mechanisms[_key].data
-            if _mechanism is not None:
-                _node_id = parent_id + '.' + str(_mechanism.mechanism_id)
-                self.tree.create_node(
-                    tag=_mechanism.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_mechanism)
-
-                self._do_add_causes(_mechanism.mechanism_id, _node_id, False)
-
-        return _return
-
-    def _do_add_causes(self, parent_id, parent_node, functional):
-        """
-        Add the failure causes to the FMEA tree for Mechanism ID.
-
-        :param int parent_id: the Mode ID (functional FMEA) or Mechanism ID
-                              (hardware FMEA) to add the failure causes to.
-        :param str parent_node: the Node ID to add the failure causes to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _causes = self.dtm_cause.do_select_all(
-            parent_id=parent_id, functional=functional).nodes
-        for _key in _causes:
-            _cause = _causes[_key].data
-            if _cause is not None:
-                _node_id = parent_node + '.' + str(_cause.cause_id)
-                self.tree.create_node(
-                    tag=_cause.description,
-                    identifier=_node_id,
-                    parent=parent_node,
-                    data=_cause)
-
-                self._do_add_controls(_cause.cause_id, _node_id)
-                self._do_add_actions(_cause.cause_id, _node_id)
-
-        return _return
-
-    def _do_add_controls(self, cause_id, parent_id):
-        """
-        Add the control methods to the FMEA tree for Mode ID or Cause ID.
-
-        :param int cause_id: the Mode ID (functional FMEA) or Cause ID
-                             (hardware FMEA) to add the control methods to.
-        :param str parent_id: the Node ID to add the control methods to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _controls = self.dtm_control.do_select_all(parent_id=cause_id).nodes
-
-        for _key in _controls:
-            _control = _controls[_key].data
-            if _control is not None:
-                # Since Controls and Actions are at the same level in the FMEA
-                # tree, we prepend a zero to the Control ID to differentiate it
-                # from an Action.
-                _node_id = parent_id + '.' + str(_control.control_id) + 'c'
-                self.tree.create_node(
-                    tag=_control.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_control)
-
-        return _return
-
-    def _do_add_actions(self, cause_id, parent_id):
-        """
-        Add the action to the FMEA tree for Mode ID or Cause ID.
+        _mechanism_nodes = {}
+        for _mechanism in self.dtm_mechanism.do_load_tree(
+                _mechanisms, 'description', 'mechanism_id'):
+            _node_id = _mode_nodes[_mechanism.mode_id] + '.' + str(
+                _mechanism.mechanism_id)
+            self.tree.create_node(
+                tag=_mechanism.description,
+                identifier=_node_id,
+                parent=_mode_nodes[_mechanism.mode_id],
+                data=_mechanism)
+            _mechanism_nodes[_mechanism.mechanism_id] = _node_id
 
-        :param int cause_id: the Mode ID (functional FMEA) or Cause ID
-                             (hardware FMEA) to add the action to.
-        :param str parent_id: the Node ID to add the action to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
+        _cause_nodes = {}
+        for _cause in self.dtm_cause.do_load_tree(_causes, 'description',
+                                                  'cause_id'):
+            if self._functional:
+                _parent_node = _mode_nodes[_cause.mode_id]
+            else:
+                _parent_node = _mechanism_nodes[_cause.mechanism_id]
+            _node_id = _parent_node + '.' + str(_cause.cause_id)
+            self.tree.create_node(
+                tag=_cause.description,
+                identifier=_node_id,
+                parent=_parent_node,
+                data=_cause)
+            _cause_nodes[_cause.cause_id] = _node_id
+
+        for _control in self.dtm_control.do_load_tree(
+                _controls, 'description', 'control_id'):
+            # Since Controls and Actions are at the same level in the FMEA
+            # tree, we append a 'c' to the Control ID to differentiate it
+            # from an Action.
+            _node_id = _cause_nodes[_control.cause_id] + '.' + str(
+                _control.control_id) + 'c'
+            self.tree.create_node(
+                tag=_control.description,
+                identifier=_node_id,
+                parent=_cause_nodes[_control.cause_id],
+                data=_control)
 
-        _actions = self.dtm_action.do_select_all(parent_id=cause_id).nodes
-        for _key in _actions:
-            _action = _actions[_key].data
-            if _action is not None:
-                _node_id = parent_id + '.' + str(_action.action_id) + 'a'
-                self.tree.create_node(
-                    tag=_action.action_category,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_action)
+        for _action in self.dtm_action.do_load_tree(
+                _actions, 'action_status', 'action_id'):
+            _node_id = _cause_nodes[_action.cause_id] + '.' + str(
+                _action.action_id) + 'a'
+            self.tree.create_node(
+                tag=_action.action_category,
+                identifier=_node_id,
+                parent=_cause_nodes[_action.cause_id],
+                data=_action)
 
-        return _return
+        return self.tree
 
     def do_insert(self, **kwargs):
         """
@@ -1157,26 +1066,12 @@ class FMEADataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more line items in the FMEA did "
+                      "not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all line items in the FMEA.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _err_code, _debug_msg = self.do_update(_node.identifier)
-
-                if _err_code != 0:
-                    _error_code = 1
-                    _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the FMEA did "
-                        "not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all line items in the FMEA.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
     def do_calculate(self, node_id, **kwargs):  # pylint: disable=unused-argument
         """
@@ -12,7 +12,7 @@ from pubsub import pub
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKSparseDataMatrix
 from ramstk.dao import RAMSTKFunction, RAMSTKHardware, RAMSTKSoftware
 from . import dtmFunction
 
@@ -49,10 +49,10 @@ class FunctionDataController(RAMSTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_fctn_hw_matrix = RAMSTKDataMatrix(dao, RAMSTKFunction,
-                                                    RAMSTKHardware)
-        self._dmx_fctn_sw_matrix = RAMSTKDataMatrix(dao, RAMSTKFunction,
-                                                    RAMSTKSoftware)
+        self._dmx_fctn_hw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKFunction, RAMSTKHardware)
+        self._dmx_fctn_sw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKFunction, RAMSTKSoftware)
 
         # Initialize public dictionary attributes.
 
@@ -108,10 +108,10 @@ class FunctionDataController(RAMSTKDataController):
                                 fnctn_sftwr = Function:Software
                                 fnctn_vldtn = Function:Validation
 
-        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas Dataframe,
-                 noun names to use for column headings, noun names to use for
-                 row headings.
-        :rtype: (:class:`pandas.DataFrame`, dict, dict)
+        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas
+                 SparseDataFrame, noun names to use for column headings, noun
+                 names to use for row headings.
+        :rtype: (:class:`pandas.SparseDataFrame`, dict, dict)
         """
         _matrix = None
         _column_hdrs = []
@@ -125,7 +125,7 @@ class FunctionDataController(RAMSTKDataController):
                 ckey='hardware_id',
                 rheader='function_code',
                 cheader='comp_ref_des')
-            _matrix = self._dmx_fctn_hw_matrix.dtf_matrix
+            _matrix = self._dmx_fctn_hw_matrix.sdf_matrix
             _column_hdrs = self._dmx_fctn_hw_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_fctn_hw_matrix.dic_row_hdrs
 
@@ -216,6 +216,33 @@ class FunctionDataController(RAMSTKDataController):
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
                                                       'deletedMatrix')
 
+    def request_do_set_matrix(self, matrix_type, column_item_id,
+                              row_item_id, value):
+        """
+        Request to set the value of a cell in the selected Data Matrix.
+
+        :param str matrix_type: the type of the Matrix to set the cell in.
+                                Current Function matrix types are:
+
+                                fnctn_hrdwr = Function:Hardware
+
+        :param int column_item_id: the ID of the column item of the cell.
+        :param int row_item_id: the ID of the row item of the cell.
+        :param int value: the new value of the cell.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        if matrix_type == 'fnctn_hrdwr':
+            _error_code, _msg = self._dmx_fctn_hw_matrix.do_set(
+                column_item_id, row_item_id, value)
+        else:
+            _error_code = 6
+            _msg = 'RAMSTK ERROR: Attempted to set a cell in non-existent ' \
+                   'matrix {0:s}.'.format(matrix_type)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
     def request_do_update(self, node_id):
         """
         Request to update an RAMSTKFunction table record.
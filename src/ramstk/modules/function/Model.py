@@ -23,6 +23,9 @@ class FunctionDataModel(RAMSTKDataModel):
     """
 
     _tag = 'Functions'
+    _table = RAMSTKFunction
+    _table_key = 'function_id'
+    _table_tag = 'name'
 
     def __init__(self, dao, **kwargs):
         """
@@ -55,28 +58,46 @@ class FunctionDataModel(RAMSTKDataModel):
         the connected RAMSTK Program database.  It then add each to the
         Function data model treelib.Tree().
 
+        When depth is passed only the top levels of the Function tree are
+        loaded, one query per level.  The rest is loaded as each Function is
+        expanded with do_select_children().
+
         :param int revision_id: the Revision ID to select the Functions for.
+        :param int depth: the number of levels of the Function tree to load.
+                          Default is to load the entire tree.
         :return: None
         :rtype: None
         """
         _revision_id = kwargs['revision_id']
+        try:
+            _depth = kwargs['depth']
+        except KeyError:
+            _depth = None
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _function in _session.query(RAMSTKFunction).filter(
-                RAMSTKFunction.revision_id == _revision_id).all():
-            # We get and then set the attributes to replace any None values
-            # (NULL fields in the database) with their default value.
-            _attributes = _function.get_attributes()
-            _function.set_attributes(_attributes)
-            self.tree.create_node(
-                tag=_function.name,
-                identifier=_function.function_id,
-                parent=_function.parent_id,
-                data=_function)
-
-            # pylint: disable=attribute-defined-outside-init
-            # It is defined in RAMSTKDataModel.__init__
-            self.last_id = max(self.last_id, _function.function_id)
+        self._revision_id = _revision_id
+        if _depth is not None:
+            self._do_select_levels(_session, _depth)
+        else:
+            self._set_expanded = None
+            for _function in self.dao.db_select_cached(
+                    _session.query(RAMSTKFunction).filter(
+                        RAMSTKFunction.revision_id == _revision_id),
+                    revision_id=_revision_id):
+                # We get and then set the attributes to replace any None
+                # values (NULL fields in the database) with their default
+                # value.
+                _attributes = _function.get_attributes()
+                _function.set_attributes(_attributes)
+                self.tree.create_node(
+                    tag=_function.name,
+                    identifier=_function.function_id,
+                    parent=_function.parent_id,
+                    data=_function)
+
+                # pylint: disable=attribute-defined-outside-init
+                # It is defined in RAMSTKDataModel.__init__
+                self.last_id = max(self.last_id, _function.function_id)
 
         _session.close()
 
@@ -177,22 +198,10 @@ class FunctionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the function "
-                        "table did not update.")
+        _error_msg = ("RAMSTK ERROR: One or more records in the function "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the function "
+                        "table.")
 
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the function "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
@@ -11,9 +11,10 @@ from pubsub import pub
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKSparseDataMatrix
 from ramstk.dao import RAMSTKHardware, RAMSTKRequirement, RAMSTKTest, RAMSTKValidation
 from . import dtmHardwareBoM
+from .Model import HardwareBoMRecord
 
 
 # Set default attributes to be returned when there are none to return.  This
@@ -319,12 +320,12 @@ class HardwareBoMDataController(RAMSTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_hw_rqrmnt_matrix = RAMSTKDataMatrix(dao, RAMSTKHardware,
-                                                      RAMSTKRequirement)
-        self._dmx_hw_tstng_matrix = RAMSTKDataMatrix(dao, RAMSTKHardware,
-                                                     RAMSTKTest)
-        self._dmx_hw_vldtn_matrix = RAMSTKDataMatrix(dao, RAMSTKHardware,
-                                                     RAMSTKValidation)
+        self._dmx_hw_rqrmnt_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKHardware, RAMSTKRequirement)
+        self._dmx_hw_tstng_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKHardware, RAMSTKTest)
+        self._dmx_hw_vldtn_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKHardware, RAMSTKValidation)
 
         # Initialize public dictionary attributes.
 
@@ -367,10 +368,10 @@ class HardwareBoMDataController(RAMSTKDataController):
                                 hrdwr_tstng = Hardware:Testing
                                 hrdwr_vldtn = Hardware:Validation
 
-        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas Dataframe,
-                 noun names to use for column headings, noun names to use for
-                 row headings.
-        :rtype: (:class:`pandas.DataFrame`, dict, dict)
+        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas
+                 SparseDataFrame, noun names to use for column headings, noun
+                 names to use for row headings.
+        :rtype: (:class:`pandas.SparseDataFrame`, dict, dict)
         """
         _matrix = None
         _column_hdrs = []
@@ -384,7 +385,7 @@ class HardwareBoMDataController(RAMSTKDataController):
                 ckey='requirement_id',
                 rheader='comp_ref_des',
                 cheader='requirement_code')
-            _matrix = self._dmx_hw_rqrmnt_matrix.dtf_matrix
+            _matrix = self._dmx_hw_rqrmnt_matrix.sdf_matrix
             _column_hdrs = self._dmx_hw_rqrmnt_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_hw_rqrmnt_matrix.dic_row_hdrs
 
@@ -396,7 +397,7 @@ class HardwareBoMDataController(RAMSTKDataController):
                 ckey='test_id',
                 rheader='comp_ref_des',
                 cheader='name')
-            _matrix = self._dmx_hw_tstng_matrix.dtf_matrix
+            _matrix = self._dmx_hw_tstng_matrix.sdf_matrix
             _column_hdrs = self._dmx_hw_tstng_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_hw_tstng_matrix.dic_row_hdrs
 
@@ -408,12 +409,23 @@ class HardwareBoMDataController(RAMSTKDataController):
                 ckey='validation_id',
                 rheader='comp_ref_des',
                 cheader='name')
-            _matrix = self._dmx_hw_vldtn_matrix.dtf_matrix
+            _matrix = self._dmx_hw_vldtn_matrix.sdf_matrix
             _column_hdrs = self._dmx_hw_vldtn_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_hw_vldtn_matrix.dic_row_hdrs
 
         return (_matrix, _column_hdrs, _row_hdrs)
 
+    def request_do_select_children(self, node_id):
+        """
+        Request the immediate children of the passed Hardware ID.
+
+        :param int node_id: the PyPubSub Tree() ID of the Hardware item to
+                            select the children for.
+        :return: a list of the immediate child nodes.
+        :rtype: list
+        """
+        return self._dtm_data_model.do_select_children(node_id)
+
     def request_do_insert(self, **kwargs):
         """
         Request to add an RAMSTKHardware table record.
@@ -545,6 +557,41 @@ class HardwareBoMDataController(RAMSTKDataController):
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
                                                       'deletedMatrix')
 
+    def request_do_set_matrix(self, matrix_type, column_item_id,
+                              row_item_id, value):
+        """
+        Request to set the value of a cell in the selected Data Matrix.
+
+        :param str matrix_type: the type of the Matrix to set the cell in.
+                                Current Hardware matrix types are:
+
+                                hrdwr_rqrmnt = Hardware:Requirement
+                                hrdwr_tstng = Hardware:Testing
+                                hrdwr_vldtn = Hardware:Validation
+
+        :param int column_item_id: the ID of the column item of the cell.
+        :param int row_item_id: the ID of the row item of the cell.
+        :param int value: the new value of the cell.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        if matrix_type == 'hrdwr_rqrmnt':
+            _error_code, _msg = self._dmx_hw_rqrmnt_matrix.do_set(
+                column_item_id, row_item_id, value)
+        elif matrix_type == 'hrdwr_tstng':
+            _error_code, _msg = self._dmx_hw_tstng_matrix.do_set(
+                column_item_id, row_item_id, value)
+        elif matrix_type == 'hrdwr_vldtn':
+            _error_code, _msg = self._dmx_hw_vldtn_matrix.do_set(
+                column_item_id, row_item_id, value)
+        else:
+            _error_code = 6
+            _msg = 'RAMSTK ERROR: Attempted to set a cell in non-existent ' \
+                   'matrix {0:s}.'.format(matrix_type)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
     def request_do_update(self, node_id):
         """
         Request to update an RAMSTKHardware table record.
@@ -632,7 +679,13 @@ class HardwareBoMDataController(RAMSTKDataController):
         """
         _return = False
 
+        # Mark the hardware item for calculation if any of the inputs changed.
+        # This has to be done before the individual tables are updated.
+        self._dtm_data_model.do_set_dirty(node_id, attributes=attributes)
+
         # Set the overall BoM attributes.
+        if not isinstance(attributes, HardwareBoMRecord):
+            attributes = HardwareBoMRecord(attributes)
         self._dtm_data_model.tree.get_node(node_id).data = attributes
 
         # Set the attributes for the individual tables.
@@ -733,7 +786,13 @@ class HardwareBoMDataController(RAMSTKDataController):
         """
         Request to calculate the hardware item.
 
+        Only the hardware items that were calculated have their attributes set
+        afterwards.
+
         :param int node_id: the Hardware ID to calculate.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :param bool incremental: whether to only calculate the hardware items
+                                 that changed since the last calculation.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
@@ -742,7 +801,7 @@ class HardwareBoMDataController(RAMSTKDataController):
         self._dtm_data_model.do_calculate_all(**kwargs)
 
         if not self._test:
-            for _node_id in self._dtm_data_model.tree.nodes:
+            for _node_id in self._dtm_data_model.lst_calculated_ids:
                 if _node_id != 0:
                     _attributes = self.request_get_attributes(_node_id)
                     self.request_set_attributes(_node_id, _attributes)
@@ -6,16 +6,319 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Hardware Package Data Model."""
 
+from collections import MutableMapping
 from math import exp
+from multiprocessing import Pool
 from treelib.exceptions import DuplicatedNodeIdError, NodeIDAbsentError
 
 # Import other RAMSTK modules.
 from ramstk.analyses.prediction import Component
 from ramstk.modules import RAMSTKDataModel
+from ramstk.modules.RAMSTKDataModel import SELECT_CHUNK_SIZE
 from ramstk.dao import (RAMSTKHardware, RAMSTKDesignElectric,
                      RAMSTKDesignMechanic, RAMSTKMilHdbkF, RAMSTKNSWC,
                      RAMSTKReliability)
 
+# The hardware attributes that hold calculation results.  A change to any other
+# attribute means the hardware item needs to be calculated again.
+_SET_RESULTS = frozenset([
+    'A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'avail_log_variance',
+    'avail_mis_variance', 'availability_logistics', 'availability_mission',
+    'cost_failure', 'cost_hour', 'current_ratio', 'hazard_rate_active',
+    'hazard_rate_dormant', 'hazard_rate_logistics', 'hazard_rate_mission',
+    'hazard_rate_software', 'hr_active_variance', 'hr_dormant_variance',
+    'hr_logistics_variance', 'hr_mission_variance', 'lambdaBD', 'lambdaBP',
+    'lambdaCYC', 'lambdaEOS', 'lambda_b', 'mtbf_log_variance',
+    'mtbf_logistics', 'mtbf_miss_variance', 'mtbf_mission', 'overstress',
+    'piA', 'piC', 'piCD', 'piCF', 'piCR', 'piCV', 'piCYC', 'piE', 'piF', 'piI',
+    'piK', 'piL', 'piM', 'piMFG', 'piN', 'piNR', 'piP', 'piPT', 'piQ', 'piR',
+    'piS', 'piT', 'piTAPS', 'piU', 'piV', 'power_ratio', 'reason',
+    'reliability_log_variance', 'reliability_logistics',
+    'reliability_miss_variance', 'reliability_mission',
+    'temperature_hot_spot', 'temperature_junction', 'temperature_rise',
+    'total_cost', 'total_part_count', 'total_power_dissipation',
+    'voltage_ratio'
+])
+
+# The attributes of a Hardware BoM item; the union of the attributes of the
+# six hardware tables.
+_BOM_KEYS = (
+    'A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'Cac', 'Calt', 'Cb', 'Cbl', 'Cbt',
+    'Cbv', 'Cc', 'Ccf', 'Ccp', 'Ccs', 'Ccv', 'Ccw', 'Cd', 'Cdc', 'Cdl', 'Cdp',
+    'Cds', 'Cdt', 'Cdw', 'Cdy', 'Ce', 'Cf', 'Cg', 'Cga', 'Cgl', 'Cgp', 'Cgs',
+    'Cgt', 'Cgv', 'Ch', 'Ci', 'Ck', 'Cl', 'Clc', 'Cm', 'Cmu', 'Cn', 'Cnp',
+    'Cnw', 'Cp', 'Cpd', 'Cpf', 'Cpv', 'Cq', 'Cr', 'Crd', 'Cs', 'Csc', 'Csf',
+    'Cst', 'Csv', 'Csw', 'Csz', 'Ct', 'Cv', 'Cw', 'Cy', 'add_adj_factor',
+    'alt_part_num', 'altitude_operating', 'application_id', 'area',
+    'attachments', 'avail_log_variance', 'avail_mis_variance',
+    'availability_logistics', 'availability_mission', 'balance_id',
+    'cage_code', 'capacitance', 'casing_id', 'category_id', 'clearance',
+    'comp_ref_des', 'configuration_id', 'construction_id', 'contact_form_id',
+    'contact_gauge', 'contact_pressure', 'contact_rating_id', 'cost',
+    'cost_failure', 'cost_hour', 'cost_type_id', 'current_operating',
+    'current_rated', 'current_ratio', 'deflection', 'description',
+    'diameter_coil', 'diameter_inner', 'diameter_outer', 'diameter_wire',
+    'duty_cycle', 'environment_active_id', 'environment_dormant_id',
+    'failure_distribution_id', 'family_id', 'feature_size', 'figure_number',
+    'filter_size', 'flow_design', 'flow_operating', 'frequency_operating',
+    'friction', 'hardware_id', 'hazard_rate_active', 'hazard_rate_dormant',
+    'hazard_rate_logistics', 'hazard_rate_method_id', 'hazard_rate_mission',
+    'hazard_rate_model', 'hazard_rate_percent', 'hazard_rate_software',
+    'hazard_rate_specified', 'hazard_rate_type_id', 'hr_active_variance',
+    'hr_dormant_variance', 'hr_logistics_variance', 'hr_mission_variance',
+    'hr_specified_variance', 'impact_id', 'insert_id', 'insulation_id',
+    'lambdaBD', 'lambdaBP', 'lambdaCYC', 'lambdaEOS', 'lambda_b', 'lcn',
+    'leakage_allowable', 'length', 'length_compressed', 'length_relaxed',
+    'level', 'load_design', 'load_id', 'load_operating', 'location_parameter',
+    'lubrication_id', 'manufacturer_id', 'manufacturing_id', 'matching_id',
+    'material_id', 'meyer_hardness', 'misalignment_angle', 'mission_time',
+    'mtbf_log_variance', 'mtbf_logistics', 'mtbf_miss_variance',
+    'mtbf_mission', 'mtbf_spec_variance', 'mtbf_specified', 'mult_adj_factor',
+    'n_active_pins', 'n_circuit_planes', 'n_cycles', 'n_elements',
+    'n_hand_soldered', 'n_ten', 'n_wave_soldered', 'name', 'nsn', 'offset',
+    'operating_life', 'overstress', 'package_id', 'page_number', 'parent_id',
+    'part', 'part_number', 'particle_size', 'piA', 'piC', 'piCD', 'piCF',
+    'piCR', 'piCV', 'piCYC', 'piE', 'piF', 'piI', 'piK', 'piL', 'piM', 'piMFG',
+    'piN', 'piNR', 'piP', 'piPT', 'piQ', 'piR', 'piS', 'piT', 'piTAPS', 'piU',
+    'piV', 'power_operating', 'power_rated', 'power_ratio', 'pressure_contact',
+    'pressure_delta', 'pressure_downstream', 'pressure_rated',
+    'pressure_upstream', 'quality_id', 'quantity', 'reason', 'ref_des',
+    'reliability_goal', 'reliability_goal_measure_id',
+    'reliability_log_variance', 'reliability_logistics',
+    'reliability_miss_variance', 'reliability_mission', 'remarks',
+    'repairable', 'resistance', 'revision_id', 'rpm_design', 'rpm_operating',
+    'scale_parameter', 'service_id', 'shape_parameter', 'specification_id',
+    'specification_number', 'spring_index', 'subcategory_id', 'surface_finish',
+    'survival_analysis_id', 'tagged_part', 'technology_id',
+    'temperature_active', 'temperature_case', 'temperature_dormant',
+    'temperature_hot_spot', 'temperature_junction', 'temperature_knee',
+    'temperature_rated_max', 'temperature_rated_min', 'temperature_rise',
+    'theta_jc', 'thickness', 'torque_id', 'total_cost', 'total_part_count',
+    'total_power_dissipation', 'type_id', 'viscosity_design',
+    'viscosity_dynamic', 'voltage_ac_operating', 'voltage_dc_operating',
+    'voltage_esd', 'voltage_rated', 'voltage_ratio', 'water_per_cent',
+    'weight', 'width_minimum', 'year_of_manufacture', 'years_in_production'
+)
+_SET_BOM_KEYS = frozenset(_BOM_KEYS)
+
+
+class HardwareBoMRecord(object):
+    """
+    Contain the aggregate attributes of a Hardware BoM item.
+
+    The attribute values are held in fixed slots rather than a dict so each
+    BoM node takes a fraction of the memory.  The record is used the same way
+    as the {attribute:value} dict; record['key'], get(), update(), copy(),
+    iterating over the keys, and ** expansion all work.  Keys that aren't
+    hardware attributes are held in a dict that is only created when one is
+    set.
+    """
+
+    __slots__ = _BOM_KEYS + ('_dic_extra', )
+    __hash__ = None
+
+    def __init__(self, attributes=None, **kwargs):
+        """
+        Initialize a Hardware BoM record instance.
+
+        :param dict attributes: the {attribute:value} dict to initialize the
+                                record with.
+        """
+        self._dic_extra = None
+        self.update(attributes, **kwargs)
+
+    def __getitem__(self, key):
+        """Return the value of the attribute key."""
+        if key in _SET_BOM_KEYS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+
+        if self._dic_extra is None:
+            raise KeyError(key)
+
+        return self._dic_extra[key]
+
+    def __setitem__(self, key, value):
+        """Set the value of the attribute key."""
+        if key in _SET_BOM_KEYS:
+            setattr(self, key, value)
+        else:
+            if self._dic_extra is None:
+                self._dic_extra = {}
+            self._dic_extra[key] = value
+
+    def __delitem__(self, key):
+        """Remove the attribute key."""
+        if key in _SET_BOM_KEYS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self._dic_extra is None:
+            raise KeyError(key)
+        else:
+            del self._dic_extra[key]
+
+    def __contains__(self, key):
+        """Return True if the attribute key is set."""
+        try:
+            self[key]
+        except KeyError:
+            return False
+
+        return True
+
+    def __iter__(self):
+        """Iterate over the attribute keys that are set."""
+        for _key in _BOM_KEYS:
+            if hasattr(self, _key):
+                yield _key
+
+        if self._dic_extra is not None:
+            for _key in self._dic_extra:
+                yield _key
+
+    def __len__(self):
+        """Return the number of attributes that are set."""
+        return sum(1 for __ in self)
+
+    def __eq__(self, other):
+        """Compare the attributes with another record or dict."""
+        try:
+            return dict(self.iteritems()) == dict(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __ne__(self, other):
+        """Compare the attributes with another record or dict."""
+        _equal = self.__eq__(other)
+        if _equal is NotImplemented:
+            return _equal
+
+        return not _equal
+
+    def __repr__(self):
+        """Return the representation of the attributes dict."""
+        return repr(dict(self.iteritems()))
+
+    def __getstate__(self):
+        """Return the attributes dict for pickling."""
+        return dict(self.iteritems())
+
+    def __setstate__(self, state):
+        """Set the attributes from the pickled attributes dict."""
+        self._dic_extra = None
+        self.update(state)
+
+    def copy(self):
+        """Return a shallow copy of the record."""
+        return HardwareBoMRecord(self)
+
+    def get(self, key, default=None):
+        """Return the value of the attribute key or default if not set."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def iteritems(self):
+        """Iterate over the (attribute, value) pairs that are set."""
+        for _key in self:
+            yield _key, self[_key]
+
+    def iterkeys(self):
+        """Iterate over the attribute keys that are set."""
+        return iter(self)
+
+    def itervalues(self):
+        """Iterate over the values of the attributes that are set."""
+        for _key in self:
+            yield self[_key]
+
+    def items(self):
+        """Return the list of (attribute, value) pairs that are set."""
+        return list(self.iteritems())
+
+    def keys(self):
+        """Return the list of attribute keys that are set."""
+        return list(self)
+
+    def values(self):
+        """Return the list of values of the attributes that are set."""
+        return list(self.itervalues())
+
+    def pop(self, key, *default):
+        """Remove the attribute key and return its value."""
+        try:
+            _value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+
+        del self[key]
+
+        return _value
+
+    def setdefault(self, key, default=None):
+        """Return the value of the attribute key, setting it if not set."""
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def update(self, attributes=None, **kwargs):
+        """Set the attributes from an {attribute:value} dict or record."""
+        if attributes is not None:
+            if hasattr(attributes, 'keys'):
+                for _key in attributes.keys():
+                    self[_key] = attributes[_key]
+            else:
+                for _key, _value in attributes:
+                    self[_key] = _value
+
+        for _key, _value in kwargs.iteritems():
+            self[_key] = _value
+
+
+MutableMapping.register(HardwareBoMRecord)
+
+
+def _do_calculate_parts(chunk):
+    """
+    Calculate the contribution of each hardware part in a list.
+
+    This is a module function so it can be passed to the worker processes
+    used by HardwareBoMDataModel.do_calculate_all().  Only the values rolled
+    up into the parent assemblies are returned so the calculated attribute
+    dicts can be discarded as soon as each part is done.
+
+    :param tuple chunk: the list of hardware part attribute dicts and the
+                        hazard rate multiplier.
+    :return: the list of (active hazard rate, dormant hazard rate, software
+             hazard rate, total cost, part count, power dissipation) tuples in
+             the same order as the parts.
+    :rtype: list
+    """
+    _records, _hr_multiplier = chunk
+
+    _results = []
+    for _attributes in _records:
+        _attributes, __ = Component.calculate(**_attributes)
+        _attributes = HardwareBoMDataModel.do_calculate_hardware(
+            _attributes, _hr_multiplier)
+        _results.append((_attributes['hazard_rate_active'],
+                         _attributes['hazard_rate_dormant'],
+                         _attributes['hazard_rate_software'],
+                         _attributes['total_cost'],
+                         int(_attributes['total_part_count']),
+                         _attributes['total_power_dissipation']))
+
+    return _results
+
 
 class HardwareBoMDataModel(RAMSTKDataModel):
     """
@@ -33,7 +336,8 @@ class HardwareBoMDataModel(RAMSTKDataModel):
             - NSWC-11 Model Parameters
             - Reliability Parameters
 
-    Attribute keys for the aggregate model are:
+    The data of each node is a HardwareBoMRecord holding the attributes from
+    all six tables.  Attribute keys for the aggregate model are:
 
     ['A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'Cac', 'Calt', 'Cb', 'Cbl', 'Cbt',
      'Cbv', 'Cc', 'Ccf', 'Ccp', 'Ccs', 'Ccv', 'Ccw', 'Cd', 'Cdc', 'Cdl', 'Cdp',
@@ -105,14 +409,24 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         RAMSTKDataModel.__init__(self, dao)
 
         # Initialize private dictionary attributes.
+        # The cumulative results of each hardware item from the last time it
+        # was calculated.
+        self._dic_results = {}
 
         # Initialize private list attributes.
+        # The IDs of the hardware items that need to be calculated again.
+        self._set_dirty = set()
 
         # Initialize private scalar attributes.
+        # The hazard rate multiplier the results were calculated with.
+        self._hr_multiplier = None
 
         # Initialize public dictionary attributes.
 
         # Initialize public list attributes.
+        # The IDs of the hardware items calculated by the last call to
+        # do_calculate_all().
+        self.lst_calculated_ids = []
 
         # Initialize public scalar attributes.
         self.dtm_hardware = HardwareDataModel(dao)
@@ -156,57 +470,25 @@ class HardwareBoMDataModel(RAMSTKDataModel):
 
         return _entity
 
-    def do_select_all(self, **kwargs):
+    def _do_add_nodes(self, nodes, trees):
         """
-        Retrieve all the Hardware BoM data from the RAMSTK Program database.
+        Merge the records of each hardware item and add them to the BoM tree.
 
-        :param int revision_id: the Revision ID to select the Hardware BoM for.
-        :return: tree; the Tree() of data models.
-        :rtype: :class:`treelib.Tree`
+        :param list nodes: the Hardware data model nodes to add to the BoM.
+        :param list trees: the design data model trees to merge the records
+                           from.
+        :return: None
+        :rtype: None
         """
-        _revision_id = kwargs['revision_id']
-        for _node in self.dtm_hardware.do_select_all(
-                revision_id=_revision_id).all_nodes()[1:]:
-            _data = {}
+        for _node in nodes:
             _hardware_id = _node.data.hardware_id
-            _data = _node.data.get_attributes()
-            try:
-                _electrical = self.dtm_design_electric.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _electrical.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _mechanical = self.dtm_design_mechanic.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _mechanical.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _mil_hdbk_f = self.dtm_mil_hdbk_f.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _mil_hdbk_f.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _nswc = self.dtm_nswc.do_select_all(hardware_id=_hardware_id)
-                _data.update(_nswc.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
-
-            try:
-                _reliability = self.dtm_reliability.do_select_all(
-                    hardware_id=_hardware_id)
-                _data.update(
-                    _reliability.nodes[_hardware_id].data.get_attributes())
-            except KeyError:
-                pass
+            _data = HardwareBoMRecord(_node.data.get_attributes())
+            for _tree in trees:
+                try:
+                    _data.update(
+                        _tree.nodes[_hardware_id].data.get_attributes())
+                except KeyError:
+                    pass
 
             try:
                 self.tree.create_node(
@@ -221,8 +503,182 @@ class HardwareBoMDataModel(RAMSTKDataModel):
             except DuplicatedNodeIdError:
                 pass
 
+    def _do_select_design(self, nodes):
+        """
+        Load the design records of the hardware items and add them to the BoM.
+
+        :param list nodes: the Hardware data model nodes that were loaded.
+        :return: None
+        :rtype: None
+        """
+        _hardware_ids = [_node.identifier for _node in nodes]
+        _dtms = [
+            self.dtm_design_electric, self.dtm_design_mechanic,
+            self.dtm_mil_hdbk_f, self.dtm_nswc, self.dtm_reliability
+        ]
+        for _dtm in _dtms:
+            for _idx in range(0, len(_hardware_ids), SELECT_CHUNK_SIZE):
+                _dtm.do_select_all(
+                    hardware_ids=_hardware_ids[_idx:_idx + SELECT_CHUNK_SIZE])
+
+        self._do_add_nodes(nodes, [_dtm.tree for _dtm in _dtms])
+
+    def do_select_all(self, **kwargs):
+        """
+        Retrieve all the Hardware BoM data from the RAMSTK Program database.
+
+        Each of the six hardware tables is loaded for the entire revision with
+        a single query and the records are then merged into the aggregate
+        attribute dicts by Hardware ID.  The number of queries is independent
+        of the number of hardware items in the BoM.
+
+        When depth is passed only the top levels of the BoM are loaded and the
+        rest is loaded as each hardware item is expanded with
+        do_select_children().  This keeps the memory used to open a large
+        program bounded by what is displayed rather than by the BoM size.
+
+        :param int revision_id: the Revision ID to select the Hardware BoM for.
+        :param int depth: the number of levels of the BoM to load.  Default is
+                          to load the entire BoM.
+        :return: tree; the Tree() of data models.
+        :rtype: :class:`treelib.Tree`
+        """
+        _revision_id = kwargs['revision_id']
+        try:
+            _depth = kwargs['depth']
+        except KeyError:
+            _depth = None
+
+        self._dic_results = {}
+        self._set_dirty.clear()
+
+        if _depth is not None:
+            for _tree in [
+                    self.tree, self.dtm_design_electric.tree,
+                    self.dtm_design_mechanic.tree, self.dtm_mil_hdbk_f.tree,
+                    self.dtm_nswc.tree, self.dtm_reliability.tree
+            ]:
+                for _node in _tree.children(_tree.root):
+                    _tree.remove_node(_node.identifier)
+
+            _hardware = self.dtm_hardware.do_select_all(
+                revision_id=_revision_id, depth=_depth)
+            self._do_select_design([
+                _hardware[_node_id]
+                for _node_id in _hardware.expand_tree(sorting=False)
+                if _node_id != _hardware.root
+            ])
+
+            return self.tree
+
+        _hardware = self.dtm_hardware.do_select_all(revision_id=_revision_id)
+        _trees = [
+            self.dtm_design_electric.do_select_all(revision_id=_revision_id),
+            self.dtm_design_mechanic.do_select_all(revision_id=_revision_id),
+            self.dtm_mil_hdbk_f.do_select_all(revision_id=_revision_id),
+            self.dtm_nswc.do_select_all(revision_id=_revision_id),
+            self.dtm_reliability.do_select_all(revision_id=_revision_id)
+        ]
+
+        self._do_add_nodes(_hardware.all_nodes()[1:], _trees)
+
         return self.tree
 
+    def do_select_children(self, node_id):
+        """
+        Select a list containing the immediate child nodes.
+
+        When the BoM was loaded lazily, the children of the passed Node ID are
+        loaded from the RAMSTK Program database the first time they're
+        selected.
+
+        :param int node_id: the Node (Hardware) ID to select the children for.
+        :return: a list of the immediate child nodes of the passed Node
+                 (Hardware) ID.
+        :rtype: list
+        """
+        _children = self.dtm_hardware.do_select_children(node_id)
+        if _children is not None:
+            _new = [
+                _node for _node in _children
+                if not self.tree.contains(_node.identifier)
+            ]
+            if _new:
+                self._do_select_design(_new)
+
+        try:
+            _children = self.tree.children(node_id)
+        except NodeIDAbsentError:
+            _children = None
+
+        return _children
+
+    def do_select_subtree(self, node_id):
+        """
+        Load every hardware item below the passed Node ID not loaded yet.
+
+        :param int node_id: the Node (Hardware) ID at the top of the subtree.
+        :return: the Hardware IDs that were loaded, each parent ahead of its
+                 children.
+        :rtype: list
+        """
+        _hardware_ids = self.dtm_hardware.do_select_subtree(node_id)
+        if _hardware_ids:
+            self._do_select_design([
+                self.dtm_hardware.tree.get_node(_hardware_id)
+                for _hardware_id in _hardware_ids
+            ])
+
+        return _hardware_ids
+
+    def _do_insert_records(self, **kwargs):
+        """
+        Add the records of a new hardware item to the six hardware tables.
+
+        The records are added as one transaction so a hardware item is never
+        saved without its design and reliability records.  If any record can't
+        be added, none are and the hardware item is removed from the data
+        model trees again.
+
+        :param int revision_id: the Revision ID to add the hardware item to.
+        :param int parent_id: the Hardware ID of the parent hardware item.
+        :param int part: whether the hardware item is a part (1) or an
+                         assembly (0).
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _dtms = [
+            self.dtm_hardware, self.dtm_design_electric,
+            self.dtm_design_mechanic, self.dtm_mil_hdbk_f, self.dtm_nswc,
+            self.dtm_reliability
+        ]
+        _last_ids = [_dtm.last_id for _dtm in _dtms]
+
+        self.dao.db_begin_batch()
+        try:
+            _error_code, _msg = self.dtm_hardware.do_insert(**kwargs)
+            if _error_code == 0:
+                _hardware_id = self.dtm_hardware.last_id
+                for _dtm in _dtms[1:]:
+                    _code, _message = _dtm.do_insert(hardware_id=_hardware_id)
+                    if _code != 0:
+                        _error_code = _code
+                        _msg = _message
+        finally:
+            _code, _message = self.dao.db_flush_batch()
+        if _code != 0 and _error_code == 0:
+            _error_code = _code
+            _msg = _message
+
+        if _error_code != 0 and self.dtm_hardware.last_id != _last_ids[0]:
+            _hardware_id = self.dtm_hardware.last_id
+            for _dtm, _last_id in zip(_dtms, _last_ids):
+                if _dtm.tree.contains(_hardware_id):
+                    _dtm.tree.remove_node(_hardware_id)
+                _dtm.last_id = _last_id
+
+        return _error_code, _msg
+
     def do_insert(self, **kwargs):
         """
         Add a new hardware item.
@@ -253,62 +709,27 @@ class HardwareBoMDataModel(RAMSTKDataModel):
                 "RAMSTK ERROR: You can not have a component/piece part as a "
                 "child of another component/piece part.")
         else:
-            _error_code, _error_msg = self.dtm_hardware.do_insert(
+            _error_code, _error_msg = self._do_insert_records(
                 revision_id=_revision_id, parent_id=_parent_id, part=_part)
 
         if _error_code != 0:
             _msg = _msg + _error_msg + '\n'
         else:
-            _data = {}
             _hardware_id = self.dtm_hardware.last_id
             _hardware = self.dtm_hardware.do_select(_hardware_id)
-            _data = _hardware.get_attributes()
-
-            _error_code, _error_msg = self.dtm_design_electric.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _electrical = self.dtm_design_electric.do_select(_hardware_id)
-                _data.update(_electrical.get_attributes())
-
-            _error_code, _error_msg = self.dtm_design_mechanic.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _mechanical = self.dtm_design_mechanic.do_select(_hardware_id)
-                _data.update(_mechanical.get_attributes())
-
-            _error_code, _error_msg = self.dtm_mil_hdbk_f.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _mil_hdbk_f = self.dtm_mil_hdbk_f.do_select(_hardware_id)
-                _data.update(_mil_hdbk_f.get_attributes())
-
-            _error_code, _error_msg = self.dtm_nswc.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _nswc = self.dtm_nswc.do_select(_hardware_id)
-                _data.update(_nswc.get_attributes())
-
-            _error_code, _error_msg = self.dtm_reliability.do_insert(
-                hardware_id=_hardware_id)
-            if _error_code != 0:
-                _msg = _msg + _error_msg + '\n'
-            else:
-                _reliability = self.dtm_reliability.do_select(_hardware_id)
-                _data.update(_reliability.get_attributes())
+            _data = HardwareBoMRecord(_hardware.get_attributes())
+            for _dtm in [
+                    self.dtm_design_electric, self.dtm_design_mechanic,
+                    self.dtm_mil_hdbk_f, self.dtm_nswc, self.dtm_reliability
+            ]:
+                _data.update(_dtm.do_select(_hardware_id).get_attributes())
 
             self.tree.create_node(
                 _hardware.comp_ref_des,
                 _hardware_id,
                 parent=_hardware.parent_id,
                 data=_data)
+            self._set_dirty.add(_hardware_id)
 
             # pylint: disable=attribute-defined-outside-init
             # It is defined in RAMSTKDataModel.__init__
@@ -333,8 +754,8 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         _error_code = 0
         _msg = ''
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=False, expire_on_commit=False)
 
         # Delete the RAMSTKHardware entry.  Other RAMSTK Program database tables will
         # delete their entries based on CASCADE behavior.
@@ -347,11 +768,14 @@ class HardwareBoMDataModel(RAMSTKDataModel):
             _msg = ('RAMSTK ERROR: Attempted to delete non-existent Hardware '
                     'BoM record ID {0:s}.').format(str(node_id))
 
-        _session.close()
+        self.dao.db_release_session(_session)
 
         # pylint: disable=attribute-defined-outside-init
         # It is defined in RAMSTKDataModel.__init__
         if _error_code == 0:
+            # The parent's results have to be rolled up again without the
+            # removed hardware item.
+            self._set_dirty.add(self.tree.get_node(node_id).bpointer)
             self.tree.remove_node(node_id)
             # CASCADE DELETE removes the records from the database.  Now they
             # need to be reomved from the data model trees.
@@ -376,32 +800,40 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         _error_code = 0
         _msg = ''
 
-        _code, _message = self.dtm_hardware.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
-
-        _code, _message = self.dtm_reliability.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
-
-        _code, _message = self.dtm_design_electric.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
-
-        _code, _message = self.dtm_design_mechanic.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
-
-        _code, _message = self.dtm_mil_hdbk_f.do_update(node_id)
-        if _code != 0:
-            _error_code += _code
-            _msg = _msg + _message + '\n'
-
-        _code, _message = self.dtm_nswc.do_update(node_id)
+        # Save the six tables of the hardware item as one transaction.
+        self.dao.db_begin_batch()
+        try:
+            _code, _message = self.dtm_hardware.do_update(node_id)
+            if _code != 0:
+                _error_code += _code
+                _msg = _msg + _message + '\n'
+
+            _code, _message = self.dtm_reliability.do_update(node_id)
+            if _code != 0:
+                _error_code += _code
+                _msg = _msg + _message + '\n'
+
+            _code, _message = self.dtm_design_electric.do_update(node_id)
+            if _code != 0:
+                _error_code += _code
+                _msg = _msg + _message + '\n'
+
+            _code, _message = self.dtm_design_mechanic.do_update(node_id)
+            if _code != 0:
+                _error_code += _code
+                _msg = _msg + _message + '\n'
+
+            _code, _message = self.dtm_mil_hdbk_f.do_update(node_id)
+            if _code != 0:
+                _error_code += _code
+                _msg = _msg + _message + '\n'
+
+            _code, _message = self.dtm_nswc.do_update(node_id)
+            if _code != 0:
+                _error_code += _code
+                _msg = _msg + _message + '\n'
+        finally:
+            _code, _message = self.dao.db_flush_batch()
         if _code != 0:
             _error_code += _code
             _msg = _msg + _message + '\n'
@@ -411,6 +843,24 @@ class HardwareBoMDataModel(RAMSTKDataModel):
 
         return _error_code, _msg
 
+    def is_modified(self, node_id):
+        """
+        Check whether any of the six records of a hardware item has changed.
+
+        :param int node_id: the ID of the hardware item to check.
+        :return: True if any record has unsaved changes, otherwise False.
+        :rtype: bool
+        """
+        for _dtm in [
+                self.dtm_hardware, self.dtm_design_electric,
+                self.dtm_design_mechanic, self.dtm_mil_hdbk_f, self.dtm_nswc,
+                self.dtm_reliability
+        ]:
+            if _dtm.is_modified(node_id):
+                return True
+
+        return False
+
     def do_update_all(self, **kwargs):  # pylint: disable=unused-argument
         """
         Update all RAMSTKHardware table records in the RAMSTK Program database.
@@ -418,26 +868,13 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more line items in the hardware "
+                      "bill of materials did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the hardware "
+                        "bill of materials.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the hardware "
-                        "bill of materials did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the hardware bill "
-                "of materials.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
     def do_calculate(self, node_id, **kwargs):
         """
@@ -453,33 +890,54 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         if _attributes is not None:
             if _attributes['category_id'] > 0:
                 _attributes, __ = Component.calculate(**_attributes)
-            else:
-                # If the assembly is to be assessed, set the attributes that
-                # are the sum of the child attributes to zero.  Without doing
-                # this, they will increment each time the system is calculated.
-                if _attributes['hazard_rate_type_id'] in [0, 1]:
-                    _attributes['hazard_rate_active'] = 0.0
-                    _attributes['hazard_rate_dormant'] = 0.0
-                    _attributes['hazard_rate_software'] = 0.0
-                    _attributes['total_part_count'] = 0
-                    _attributes['total_power_dissipation'] = 0.0
-
-                if _attributes['cost_type_id'] in [0, 2]:
-                    _attributes['total_cost'] = 0.0
-
-            _attributes['hazard_rate_active'] = (
-                _attributes['hazard_rate_active'] / _hr_multiplier)
-            _attributes['hazard_rate_dormant'] = (
-                _attributes['hazard_rate_dormant'] / _hr_multiplier)
-            _attributes['hazard_rate_software'] = (
-                _attributes['hazard_rate_software'] / _hr_multiplier)
-
-            _attributes = self._do_calculate_reliability_metrics(_attributes)
-            _attributes = self._do_calculate_cost_metrics(_attributes)
-            _attributes = self._do_calculate_metric_variances(_attributes)
+
+            _attributes = self.do_calculate_hardware(_attributes,
+                                                     _hr_multiplier)
 
         return _attributes
 
+    @classmethod
+    def do_calculate_hardware(cls, attributes, hr_multiplier):
+        """
+        Calculate the RAMS metrics for a hardware item.
+
+        Hardware parts must already have been calculated with
+        Component.calculate().
+
+        :param dict attributes: the attributes of the hardware item being
+                                calculated.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :return: attributes; the attributes dict with updated metrics.
+        :rtype: dict
+        """
+        if attributes['category_id'] <= 0:
+            # Set the attributes that are the sum of the child attributes to
+            # zero.  Without doing this, they will increment each time the
+            # system is calculated.  This is done for every type of hazard
+            # rate assessment; a specified hazard rate or MTBF replaces the
+            # active hazard rate in _do_calculate_reliability_metrics().
+            attributes['hazard_rate_active'] = 0.0
+            attributes['hazard_rate_dormant'] = 0.0
+            attributes['hazard_rate_software'] = 0.0
+            attributes['total_part_count'] = 0
+            attributes['total_power_dissipation'] = 0.0
+
+            if attributes['cost_type_id'] in [0, 2]:
+                attributes['total_cost'] = 0.0
+
+        attributes['hazard_rate_active'] = (
+            attributes['hazard_rate_active'] / hr_multiplier)
+        attributes['hazard_rate_dormant'] = (
+            attributes['hazard_rate_dormant'] / hr_multiplier)
+        attributes['hazard_rate_software'] = (
+            attributes['hazard_rate_software'] / hr_multiplier)
+
+        attributes = cls._do_calculate_reliability_metrics(attributes)
+        attributes = cls._do_calculate_cost_metrics(attributes)
+        attributes = cls._do_calculate_metric_variances(attributes)
+
+        return attributes
+
     @staticmethod
     def _do_calculate_cost_metrics(attributes):
         """
@@ -585,6 +1043,21 @@ class HardwareBoMDataModel(RAMSTKDataModel):
         """
         Calculate all items in the system.
 
+        The calculation is done in two passes over the tree without recursion.
+        The first pass calculates every hardware part, which are independent
+        of each other, and optionally spreads the parts over a pool of worker
+        processes.  The second pass visits the nodes in post-order and rolls
+        the results of the children up into each assembly.
+
+        In incremental mode only the hardware items marked with do_set_dirty()
+        and the assemblies above them are calculated.  The rest of the
+        assemblies are rolled up from their results of the last calculation.
+        The whole tree is calculated if there are no results to reuse.
+
+        When the BoM was loaded lazily, the rest of the hardware items below
+        the node are loaded before calculating.  Otherwise an assembly whose
+        children haven't been loaded would be rolled up as if it had none.
+
         :param float hr_multiplier: the hazard rate multiplier.  This is used
                                     to allow the hazard rates to be entered and
                                     displayed in more human readable numbers,
@@ -594,6 +1067,12 @@ class HardwareBoMDataModel(RAMSTKDataModel):
                                     failures/million hours.
         :param int node_id: the ID of the treelib Tree() node to start the
                             calculation at.
+        :param int processes: the number of worker processes to calculate the
+                              hardware parts with.  Default is 1, which
+                              calculates the parts in this process.
+        :param bool incremental: whether to only calculate the hardware items
+                                 that changed since the last calculation.
+                                 Default is False.
         :return: _cum_results; the list of cumulative results.  The list order
                  is:
 
@@ -606,59 +1085,262 @@ class HardwareBoMDataModel(RAMSTKDataModel):
 
         :rtype: list
         """
-        _hr_multiplier = kwargs['hr_multiplier']
+        _hr_multiplier = float(kwargs['hr_multiplier'])
         _node_id = kwargs['node_id']
-        _cum_results = [0.0, 0.0, 0.0, 0.0, 0, 0.0]
+        try:
+            _processes = int(kwargs['processes'])
+        except KeyError:
+            _processes = 1
+        try:
+            _incremental = kwargs['incremental']
+        except KeyError:
+            _incremental = False
+
+        # The assemblies above any hardware items loaded now were rolled up
+        # without them, so their results can't be reused.
+        if self.do_select_subtree(_node_id):
+            _incremental = False
+
+        # The results can't be reused with a different multiplier.
+        if _hr_multiplier != self._hr_multiplier:
+            self._dic_results = {}
+            self._hr_multiplier = _hr_multiplier
+
+        if _incremental and _node_id in self._dic_results:
+            _nodes = self._do_select_dirty(_node_id)
+            if not _nodes:
+                self.lst_calculated_ids = []
+                return list(self._dic_results[_node_id])
+            try:
+                return self._do_roll_up(_nodes, _hr_multiplier, _processes)
+            except KeyError:
+                # An assembly has a child that was never calculated, so
+                # calculate everything.
+                pass
+
+        # Find the nodes to calculate.  Reversing this list puts every child
+        # ahead of its parent.
+        _nodes = []
+        _stack = [self.tree.get_node(_node_id)]
+        while _stack:
+            _node = _stack.pop()
+            _nodes.append(_node)
+            _stack.extend(
+                [self.tree.get_node(_child) for _child in _node.fpointer])
+        _nodes.reverse()
 
-        # Check if there are children nodes of the node passed.
-        if self.tree.get_node(_node_id).fpointer:
-            _attributes = self.tree.get_node(_node_id).data
+        return self._do_roll_up(_nodes, _hr_multiplier, _processes)
+
+    def _do_select_dirty(self, node_id):
+        """
+        Select the dirty hardware items below a node and their assemblies.
+
+        :param int node_id: the ID of the treelib Tree() node to start the
+                            calculation at.
+        :return: _nodes; the list of treelib Node() to calculate with every
+                 child ahead of its parent.
+        :rtype: list
+        """
+        _dic_depth = {}
+        for _dirty_id in list(self._set_dirty):
+            if not self.tree.contains(_dirty_id):
+                self._set_dirty.discard(_dirty_id)
+                continue
+
+            # Walk up the tree until reaching the starting node or a node
+            # that is already on the path of another dirty hardware item.
+            _path = []
+            _depth = None
+            _node_id = _dirty_id
+            while _node_id is not None:
+                if _node_id in _dic_depth:
+                    _depth = _dic_depth[_node_id]
+                    break
+                _path.append(_node_id)
+                if _node_id == node_id:
+                    _depth = -1
+                    break
+                _node_id = self.tree.get_node(_node_id).bpointer
+
+            # Dirty hardware items that aren't below the starting node are
+            # left for a later calculation.
+            if _depth is not None:
+                for _node_id in reversed(_path):
+                    _depth += 1
+                    _dic_depth[_node_id] = _depth
+
+        return [
+            self.tree.get_node(_node_id)
+            for _node_id in sorted(_dic_depth, key=_dic_depth.get,
+                                   reverse=True)
+        ]
+
+    def _do_roll_up(self, nodes, hr_multiplier, processes):
+        """
+        Calculate the hardware items and roll the results up into assemblies.
+
+        :param list nodes: the list of treelib Node() to calculate with every
+                           child ahead of its parent.  The last node is the
+                           one to return the results for.
+        :param float hr_multiplier: the hazard rate multiplier.
+        :param int processes: the number of worker processes to calculate the
+                              hardware parts with.
+        :return: _cum_results; the list of cumulative results for the last
+                 node.
+        :rtype: list
+        :raise: KeyError if a child of an assembly is not being calculated and
+                has no results from a previous calculation.
+        """
+        # Make sure every child has results before changing any assembly.
+        _node_ids = set([_node.identifier for _node in nodes])
+        for _node in nodes:
+            for _child_id in _node.fpointer:
+                if (_child_id not in _node_ids
+                        and _child_id not in self._dic_results):
+                    raise KeyError(_child_id)
+
+        # Calculate the contribution of every hardware part.
+        _parts = [
+            _node for _node in nodes
+            if _node.data is not None and _node.data['category_id'] > 0
+        ]
+        _records = [_node.data for _node in _parts]
+        if processes > 1 and len(_records) > processes:
+            _size = -(-len(_records) // (4 * processes))
+            _pool = Pool(processes)
+            try:
+                _chunks = _pool.map(
+                    _do_calculate_parts,
+                    [(_records[_idx:_idx + _size], hr_multiplier)
+                     for _idx in range(0, len(_records), _size)])
+            finally:
+                _pool.close()
+                _pool.join()
+            _records = [_part for _chunk in _chunks for _part in _chunk]
+        else:
+            _records = _do_calculate_parts((_records, hr_multiplier))
+        _dic_parts = dict(
+            (_node.identifier, _record)
+            for _node, _record in zip(_parts, _records))
+
+        # Roll the results up the tree.
+        for _node in nodes:
+            _cum_results = [0.0, 0.0, 0.0, 0.0, 0, 0.0]
+            for _child_id in _node.fpointer:
+                _results = self._dic_results[_child_id]
+                _cum_results[0] += _results[0]
+                _cum_results[1] += _results[1]
+                _cum_results[2] += _results[2]
+                _cum_results[3] += _results[3]
+                _cum_results[4] += int(_results[4])
+                _cum_results[5] += _results[5]
 
-            # If there are children, calculate each of them first.
-            for _subnode_id in self.tree.get_node(_node_id).fpointer:
-                _results = self.do_calculate_all(
-                    node_id=_subnode_id, hr_multiplier=_hr_multiplier)
+            try:
+                _results = _dic_parts[_node.identifier]
                 _cum_results[0] += _results[0]
                 _cum_results[1] += _results[1]
                 _cum_results[2] += _results[2]
                 _cum_results[3] += _results[3]
                 _cum_results[4] += int(_results[4])
                 _cum_results[5] += _results[5]
-            # Then calculate the parent node.
-            _attributes = self.do_calculate(
-                _node_id, hr_multiplier=_hr_multiplier)
-            if _attributes is not None:
-                _cum_results[0] += _attributes['hazard_rate_active']
-                _cum_results[1] += _attributes['hazard_rate_dormant']
-                _cum_results[2] += _attributes['hazard_rate_software']
-                _cum_results[3] += _attributes['total_cost']
-                _cum_results[4] += int(_attributes['total_part_count'])
-                _cum_results[5] += _attributes['total_power_dissipation']
+            except KeyError:
+                _attributes = _node.data
+                if _attributes is not None:
+                    _attributes = self.do_calculate_hardware(
+                        _attributes, hr_multiplier)
+                    _cum_results[0] += _attributes['hazard_rate_active']
+                    _cum_results[1] += _attributes['hazard_rate_dormant']
+                    _cum_results[2] += _attributes['hazard_rate_software']
+                    _cum_results[3] += _attributes['total_cost']
+                    _cum_results[4] += int(_attributes['total_part_count'])
+                    _cum_results[5] += _attributes['total_power_dissipation']
+
+                    if _attributes['part'] == 0:
+                        _attributes['hazard_rate_active'] = _cum_results[0]
+                        _attributes['hazard_rate_dormant'] = _cum_results[1]
+                        _attributes['hazard_rate_software'] = _cum_results[2]
+                        _attributes['total_cost'] = _cum_results[3]
+                        _attributes['total_part_count'] = int(_cum_results[4])
+                        _attributes['total_power_dissipation'] = \
+                            _cum_results[5]
+
+                        _attributes = self._do_calculate_reliability_metrics(
+                            _attributes)
+                        _attributes = self._do_calculate_cost_metrics(
+                            _attributes)
+                        _attributes = self._do_calculate_metric_variances(
+                            _attributes)
+
+            self._dic_results[_node.identifier] = _cum_results
+
+        self._set_dirty.difference_update(_node_ids)
+        self.lst_calculated_ids = [_node.identifier for _node in nodes]
+
+        return list(self._dic_results[nodes[-1].identifier])
+
+    def do_set_dirty(self, node_id, **kwargs):
+        """
+        Mark a hardware item as needing to be calculated again.
+
+        When attributes are passed, the hardware item is only marked if one of
+        the calculation inputs differs from the value in the RAMSTK Program
+        database tables.
+
+        :param int node_id: the ID of the hardware item to mark.
+        :keyword dict attributes: the new {attribute:value} dict for the
+                                  hardware item.
+        :return: True if the hardware item was marked, False otherwise.
+        :rtype: bool
+        """
+        try:
+            _attributes = kwargs['attributes']
+        except KeyError:
+            _attributes = None
+
+        if _attributes is None or node_id in self._set_dirty:
+            self._set_dirty.add(node_id)
+            return True
+
+        # The total cost is a calculation result only when it is calculated
+        # from the unit cost and quantity.  For the other cost types it is
+        # entered by the user, so a change to it is a calculation input.
+        try:
+            _cost_type_id = _attributes['cost_type_id']
+        except KeyError:
+            try:
+                _cost_type_id = self.dtm_hardware.do_select(
+                    node_id).cost_type_id
+            except AttributeError:
+                _cost_type_id = 1
+        if _cost_type_id == 1:
+            _set_results = _SET_RESULTS
         else:
-            if self.tree.get_node(_node_id).data is not None:
-                _attributes = self.do_calculate(
-                    _node_id, hr_multiplier=_hr_multiplier)
-                _cum_results[0] += _attributes['hazard_rate_active']
-                _cum_results[1] += _attributes['hazard_rate_dormant']
-                _cum_results[2] += _attributes['hazard_rate_software']
-                _cum_results[3] += _attributes['total_cost']
-                _cum_results[4] += int(_attributes['total_part_count'])
-                _cum_results[5] += _attributes['total_power_dissipation']
-
-        if self.tree.get_node(
-                _node_id).data is not None and _attributes['part'] == 0:
-            _attributes['hazard_rate_active'] = _cum_results[0]
-            _attributes['hazard_rate_dormant'] = _cum_results[1]
-            _attributes['hazard_rate_software'] = _cum_results[2]
-            _attributes['total_cost'] = _cum_results[3]
-            _attributes['total_part_count'] = int(_cum_results[4])
-            _attributes['total_power_dissipation'] = _cum_results[5]
-
-            _attributes = self._do_calculate_reliability_metrics(_attributes)
-            _attributes = self._do_calculate_cost_metrics(_attributes)
-            _attributes = self._do_calculate_metric_variances(_attributes)
-
-        return _cum_results
+            _set_results = _SET_RESULTS.difference(['total_cost'])
+
+        _dirty = False
+        for _dtm in [
+                self.dtm_hardware, self.dtm_design_electric,
+                self.dtm_design_mechanic, self.dtm_mil_hdbk_f, self.dtm_nswc,
+                self.dtm_reliability
+        ]:
+            try:
+                _old = _dtm.do_select(node_id).get_attributes()
+            except AttributeError:
+                continue
+
+            for _key, _value in _old.iteritems():
+                if (_key not in _set_results and _key in _attributes
+                        and _attributes[_key] != _value):
+                    _dirty = True
+                    break
+
+            if _dirty:
+                break
+
+        if _dirty:
+            self._set_dirty.add(node_id)
+
+        return _dirty
 
 
 class HardwareDataModel(RAMSTKDataModel):
@@ -670,6 +1352,9 @@ class HardwareDataModel(RAMSTKDataModel):
     """
 
     _tag = 'Hardware'  # pragma: no cover
+    _table = RAMSTKHardware
+    _table_key = 'hardware_id'
+    _table_tag = 'comp_ref_des'
 
     def __init__(self, dao):
         """
@@ -701,15 +1386,35 @@ class HardwareDataModel(RAMSTKDataModel):
         connected RAMSTK Program database.  It then add each to the Hardware data
         model treelib.Tree().
 
+        When depth is passed only the top levels of the BoM are loaded, one
+        query per level.  The rest of the BoM is loaded as each hardware item
+        is expanded with do_select_children().
+
         :param int revision_id: the Revision ID to select the hardware for.
+        :param int depth: the number of levels of the BoM to load.  Default is
+                          to load the entire BoM.
         :return: tree; the Tree() of RAMSTKHardware data models.
         :rtype: :class:`treelib.Tree`
         """
         _revision_id = kwargs['revision_id']
+        try:
+            _depth = kwargs['depth']
+        except KeyError:
+            _depth = None
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _hardware in _session.query(RAMSTKHardware).filter(
-                RAMSTKHardware.revision_id == _revision_id).all():
+        self._revision_id = _revision_id
+        if _depth is not None:
+            self._do_select_levels(_session, _depth)
+            _session.close()
+
+            return self.tree
+
+        self._set_expanded = None
+        for _hardware in self.dao.db_select_cached(
+                _session.query(RAMSTKHardware).filter(
+                    RAMSTKHardware.revision_id == _revision_id),
+                revision_id=_revision_id):
             # We get and then set the attributes to replace any None values
             # (NULL fields in the database) with their default value.
             _attributes = _hardware.get_attributes()
@@ -806,26 +1511,13 @@ class HardwareDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more records in the hardware "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the hardware "
+                        "table.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the hardware table "
-                    "did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the hardware table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
     def do_make_composite_ref_des(self, node_id=1):
         """
@@ -891,20 +1583,50 @@ class DesignElectricDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         Design Electric data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                parameters for.
+        :param list hardware_ids: the IDs of the Hardware items to retrieve the
+                                  parameters for.  When passed, hardware_id
+                                  is ignored.
+        :param int revision_id: the ID of the Revision to retrieve the
+                                parameters for all Hardware items.  When
+                                passed, hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKDesignElectric data models that
                  comprise the DesignElectric tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        for _design in _session.query(RAMSTKDesignElectric).\
-                filter(RAMSTKDesignElectric.hardware_id == _hardware_id).all():
+        try:
+            _revision_id = kwargs['revision_id']
+        except KeyError:
+            _revision_id = None
+
+        if _revision_id is not None:
+            # Load the records for every hardware item in the revision with a
+            # single query.  The tree is being rebuilt for the entire revision
+            # so it's cleared first.
+            _session = RAMSTKDataModel.do_select_all(self)
+            _query = _session.query(RAMSTKDesignElectric).join(
+                RAMSTKHardware, RAMSTKHardware.hardware_id ==
+                RAMSTKDesignElectric.hardware_id).filter(
+                    RAMSTKHardware.revision_id == _revision_id)
+            _entities = self.dao.db_select_cached(
+                _query, revision_id=_revision_id)
+        else:
+            try:
+                _hardware_ids = kwargs['hardware_ids']
+            except KeyError:
+                _hardware_ids = [kwargs['hardware_id']]
+
+            # Don't use the RAMSTKDataModel.do_select_all() method because we
+            # don't want to clear the tree or we'll only be left with the last
+            # hardware ID passed.
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            _query = _session.query(RAMSTKDesignElectric).\
+                filter(RAMSTKDesignElectric.hardware_id.in_(_hardware_ids))
+            _entities = _query.all()
+
+        for _design in _entities:
             try:
                 self.tree.create_node(
                     _design.hardware_id,
@@ -997,26 +1719,13 @@ class DesignElectricDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more line items in the electrical "
+                      "design table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "electrical design table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more line items in the electrical "
-                    "design table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the electrical "
-                    "design table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class DesignMechanicDataModel(RAMSTKDataModel):
@@ -1054,20 +1763,50 @@ class DesignMechanicDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         Mechanical Design parameter data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                parameters for.
+        :param list hardware_ids: the IDs of the Hardware items to retrieve the
+                                  parameters for.  When passed, hardware_id
+                                  is ignored.
+        :param int revision_id: the ID of the Revision to retrieve the
+                                parameters for all Hardware items.  When
+                                passed, hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKDesignMechanic data models that
                  comprise the DesignMechanic tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        for _design in _session.query(RAMSTKDesignMechanic).\
-                filter(RAMSTKDesignMechanic.hardware_id == _hardware_id).all():
+        try:
+            _revision_id = kwargs['revision_id']
+        except KeyError:
+            _revision_id = None
+
+        if _revision_id is not None:
+            # Load the records for every hardware item in the revision with a
+            # single query.  The tree is being rebuilt for the entire revision
+            # so it's cleared first.
+            _session = RAMSTKDataModel.do_select_all(self)
+            _query = _session.query(RAMSTKDesignMechanic).join(
+                RAMSTKHardware, RAMSTKHardware.hardware_id ==
+                RAMSTKDesignMechanic.hardware_id).filter(
+                    RAMSTKHardware.revision_id == _revision_id)
+            _entities = self.dao.db_select_cached(
+                _query, revision_id=_revision_id)
+        else:
+            try:
+                _hardware_ids = kwargs['hardware_ids']
+            except KeyError:
+                _hardware_ids = [kwargs['hardware_id']]
+
+            # Don't use the RAMSTKDataModel.do_select_all() method because we
+            # don't want to clear the tree or we'll only be left with the last
+            # hardware ID passed.
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            _query = _session.query(RAMSTKDesignMechanic).\
+                filter(RAMSTKDesignMechanic.hardware_id.in_(_hardware_ids))
+            _entities = _query.all()
+
+        for _design in _entities:
             try:
                 self.tree.create_node(
                     _design.hardware_id,
@@ -1160,26 +1899,13 @@ class DesignMechanicDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
+        _error_msg = ("RAMSTK ERROR: One or more line items in the mechanical "
+                      "design table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "mechanical design table.")
 
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more line items in the mechanical "
-                    "design table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the mechanical "
-                    "design table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class MilHdbkFDataModel(RAMSTKDataModel):
@@ -1217,20 +1943,50 @@ class MilHdbkFDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         MIL-HDBK-217F data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                parameters for.
+        :param list hardware_ids: the IDs of the Hardware items to retrieve the
+                                  parameters for.  When passed, hardware_id
+                                  is ignored.
+        :param int revision_id: the ID of the Revision to retrieve the
+                                parameters for all Hardware items.  When
+                                passed, hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKMilHdbkF data models that
                  comprise the MilHdbkF tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        for _milhdbkf in _session.query(RAMSTKMilHdbkF).\
-                filter(RAMSTKMilHdbkF.hardware_id == _hardware_id).all():
+        try:
+            _revision_id = kwargs['revision_id']
+        except KeyError:
+            _revision_id = None
+
+        if _revision_id is not None:
+            # Load the records for every hardware item in the revision with a
+            # single query.  The tree is being rebuilt for the entire revision
+            # so it's cleared first.
+            _session = RAMSTKDataModel.do_select_all(self)
+            _query = _session.query(RAMSTKMilHdbkF).join(
+                RAMSTKHardware, RAMSTKHardware.hardware_id ==
+                RAMSTKMilHdbkF.hardware_id).filter(
+                    RAMSTKHardware.revision_id == _revision_id)
+            _entities = self.dao.db_select_cached(
+                _query, revision_id=_revision_id)
+        else:
+            try:
+                _hardware_ids = kwargs['hardware_ids']
+            except KeyError:
+                _hardware_ids = [kwargs['hardware_id']]
+
+            # Don't use the RAMSTKDataModel.do_select_all() method because we
+            # don't want to clear the tree or we'll only be left with the last
+            # hardware ID passed.
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            _query = _session.query(RAMSTKMilHdbkF).\
+                filter(RAMSTKMilHdbkF.hardware_id.in_(_hardware_ids))
+            _entities = _query.all()
+
+        for _milhdbkf in _entities:
             try:
                 self.tree.create_node(
                     _milhdbkf.hardware_id,
@@ -1323,26 +2079,13 @@ class MilHdbkFDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more records in the MIL-HDBK-217 "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "MIL-HDBK-217 table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the MIL-HDBK-217 "
-                    "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the MIL-HDBK-217 "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class NSWCDataModel(RAMSTKDataModel):
@@ -1380,20 +2123,50 @@ class NSWCDataModel(RAMSTKDataModel):
         in the connected RAMSTK Program database.  It then add each to the
         NSWC data model treelib.Tree().
 
+        :param int hardware_id: the ID of the Hardware item to retrieve the
+                                parameters for.
+        :param list hardware_ids: the IDs of the Hardware items to retrieve the
+                                  parameters for.  When passed, hardware_id
+                                  is ignored.
+        :param int revision_id: the ID of the Revision to retrieve the
+                                parameters for all Hardware items.  When
+                                passed, hardware_id is ignored.
         :return: tree; the treelib Tree() of RAMSTKNSWC data models that
                  comprise the NSWC tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        for _nswc in _session.query(RAMSTKNSWC).\
-                filter(RAMSTKNSWC.hardware_id == _hardware_id).all():
+        try:
+            _revision_id = kwargs['revision_id']
+        except KeyError:
+            _revision_id = None
+
+        if _revision_id is not None:
+            # Load the records for every hardware item in the revision with a
+            # single query.  The tree is being rebuilt for the entire revision
+            # so it's cleared first.
+            _session = RAMSTKDataModel.do_select_all(self)
+            _query = _session.query(RAMSTKNSWC).join(
+                RAMSTKHardware, RAMSTKHardware.hardware_id ==
+                RAMSTKNSWC.hardware_id).filter(
+                    RAMSTKHardware.revision_id == _revision_id)
+            _entities = self.dao.db_select_cached(
+                _query, revision_id=_revision_id)
+        else:
+            try:
+                _hardware_ids = kwargs['hardware_ids']
+            except KeyError:
+                _hardware_ids = [kwargs['hardware_id']]
+
+            # Don't use the RAMSTKDataModel.do_select_all() method because we
+            # don't want to clear the tree or we'll only be left with the last
+            # hardware ID passed.
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            _query = _session.query(RAMSTKNSWC).\
+                filter(RAMSTKNSWC.hardware_id.in_(_hardware_ids))
+            _entities = _query.all()
+
+        for _nswc in _entities:
             try:
                 self.tree.create_node(
                     _nswc.hardware_id, _nswc.hardware_id, parent=0, data=_nswc)
@@ -1480,24 +2253,13 @@ class NSWCDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more records in the NSWC table "
+                      "did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the NSWC "
+                        "table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the NSWC table "
-                        "did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the NSWC table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class ReliabilityDataModel(RAMSTKDataModel):
@@ -1537,20 +2299,49 @@ class ReliabilityDataModel(RAMSTKDataModel):
 
         :param int hardware_id: the ID of the Hardware item to retrieve the
                                 Reliability parameters for.
+        :param list hardware_ids: the IDs of the Hardware items to retrieve
+                                  the Reliability parameters for.  When
+                                  passed, hardware_id is ignored.
+        :param int revision_id: the ID of the Revision to retrieve the
+                                Reliability parameters for all Hardware
+                                items.  When passed, hardware_id is
+                                ignored.
         :return: tree; the treelib Tree() of RAMSTKReliability data models that
                  comprise the Reliability tree.
         :rtype: :class:`treelib.Tree`
         """
-        _hardware_id = kwargs['hardware_id']
-
-        # Don't use the RAMSTKDataModel.do_select_all() method because we don't
-        # want to clear the tree or we'll only be left with the last hardware
-        # ID passed.
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        for _reliability in _session.query(RAMSTKReliability).\
-                filter(RAMSTKReliability.hardware_id == _hardware_id).all():
+        try:
+            _revision_id = kwargs['revision_id']
+        except KeyError:
+            _revision_id = None
+
+        if _revision_id is not None:
+            # Load the records for every hardware item in the revision with a
+            # single query.  The tree is being rebuilt for the entire revision
+            # so it's cleared first.
+            _session = RAMSTKDataModel.do_select_all(self)
+            _query = _session.query(RAMSTKReliability).join(
+                RAMSTKHardware, RAMSTKHardware.hardware_id ==
+                RAMSTKReliability.hardware_id).filter(
+                    RAMSTKHardware.revision_id == _revision_id)
+            _entities = self.dao.db_select_cached(
+                _query, revision_id=_revision_id)
+        else:
+            try:
+                _hardware_ids = kwargs['hardware_ids']
+            except KeyError:
+                _hardware_ids = [kwargs['hardware_id']]
+
+            # Don't use the RAMSTKDataModel.do_select_all() method because we
+            # don't want to clear the tree or we'll only be left with the last
+            # hardware ID passed.
+            _session = self.dao.RAMSTK_SESSION(
+                bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+            _query = _session.query(RAMSTKReliability).\
+                filter(RAMSTKReliability.hardware_id.in_(_hardware_ids))
+            _entities = _query.all()
+
+        for _reliability in _entities:
             try:
                 self.tree.create_node(
                     _reliability.hardware_id,
@@ -1643,22 +2434,10 @@ class ReliabilityDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
+        _error_msg = ("RAMSTK ERROR: One or more records in the reliability "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "reliability table.")
 
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the reliability "
-                        "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the reliability "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
@@ -57,8 +57,10 @@ class HazardAnalysisDataModel(RAMSTKDataModel):
         _revision_id = kwargs['revision_id']
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _hazard_analysis in _session.query(RAMSTKHazardAnalysis).filter(
-                RAMSTKHazardAnalysis.revision_id == _revision_id).all():
+        for _hazard_analysis in self.dao.db_select_cached(
+                _session.query(RAMSTKHazardAnalysis).filter(
+                    RAMSTKHazardAnalysis.revision_id == _revision_id),
+                revision_id=_revision_id):
             # We get and then set the attributes to replace any None values
             # (NULL fields in the database) with their default value.
             _attributes = _hazard_analysis.get_attributes()
@@ -189,27 +191,16 @@ class HazardAnalysisDataModel(RAMSTKDataModel):
         :rtype: bool
         """
         _hardware_id = kwargs['hardware_id']
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.do_select_children(_hardware_id).all_nodes()[1:]:
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-                _msg = _msg + _debug_msg + '\n'
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the HazOps table "
-                    "for Hardware ID {0:d} did not "
-                    "update.").format(_hardware_id)
-            except NodeIDAbsentError:
-                pass
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the HazOps table "
-                    "for Hardware ID {0:d}.").format(_hardware_id)
-
-        return _error_code, _msg
+        _error_msg = ("RAMSTK ERROR: One or more records in the HazOps table "
+                      "for Hardware ID {0:d} did not "
+                      "update.").format(_hardware_id)
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the HazOps "
+                        "table for Hardware ID {0:d}.").format(_hardware_id)
+
+        return self._do_update_all(
+            self.do_select_children(_hardware_id).all_nodes()[1:],
+            _error_msg,
+            _success_msg)
 
     def do_calculate(self, node_id, **kwargs):  # pylint: disable=unused-argument
         """
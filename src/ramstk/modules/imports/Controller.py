@@ -79,16 +79,33 @@ class ImportDataController(RAMSTKDataController):
 
         return _import
 
-    def request_do_read_input(self, file_type, file_name):
+    @staticmethod
+    def _do_report_progress(count, total):
+        """
+        Publish the progress of an import after each chunk is inserted.
+
+        :param int count: the number of input rows in the chunk.
+        :param int total: the number of input rows inserted so far.
+        :return: None
+        :rtype: None
+        """
+        pub.sendMessage('importedChunk', count=count, total=total)
+
+        return None
+
+    def request_do_read_input(self, file_type, file_name, **kwargs):
         """
         Request to read the input file of file type.
 
         :param str file_type: the type of input file to be read.
         :param str file_name: the URL to the file to be read.
+        :keyword int chunksize: the number of input rows to read and insert at
+                                a time.  Default is to read the entire file.
         :return: None
         :rtype: None
         """
-        return self._dtm_data_model.do_read_input(file_type, file_name)
+        return self._dtm_data_model.do_read_input(file_type, file_name,
+                                                  **kwargs)
 
     def request_do_map_to_field(self, module, exim_field, format_field):
         """
@@ -105,17 +122,64 @@ class ImportDataController(RAMSTKDataController):
         return self._dtm_data_model.do_map_to_field(module, exim_field,
                                                     format_field)
 
-    def request_do_insert(self, module):
+    def request_do_validate(self, module, **kwargs):
+        """
+        Request to validate the input file before it is inserted.
+
+        Each error found is written to the import log and a 'validatedImport'
+        message is published with the list of errors.
+
+        :param str module: the RAMSTK module to validate the input for.
+        :keyword int processes: the number of worker processes to check the
+                                input with.  Default is 1.
+        :return: (_errors, _error_code, _msg); the list of (row, field, error
+                 message) tuples, the error code and error message.
+        :rtype: (list, int, str)
+        """
+        (_errors, _error_code, _msg) = self._dtm_data_model.do_validate(
+            module=module, **kwargs)
+
+        if _error_code != 0:
+            self._configuration.RAMSTK_IMPORT_LOG.error(_msg)
+            for _row, _field, _error in _errors:
+                self._configuration.RAMSTK_IMPORT_LOG.error(
+                    u'Row {0:d}, {1:s}: {2:s}'.format(_row, _field, _error))
+
+        pub.sendMessage('validatedImport', errors=_errors)
+
+        return _errors, _error_code, _msg
+
+    def request_do_insert(self, module, **kwargs):
         """
         Request to insert an entity.
 
+        An 'importedChunk' message is published after each chunk of input rows
+        is inserted.
+
         :param str module: the RAMSTK module to insert a new entity for.th
+        :keyword bool validate: whether to validate the input file first and
+                                insert nothing if any errors are found.
+                                Default is False.
+        :keyword int processes: the number of worker processes to validate
+                                the input with.  Default is 1.
         :return: (_count, _error_code, _msg); the number of entities inserted,
                  the error code and error message returned from the DAO object.
         :rtype: (int, int, str)
         """
+        try:
+            _validate = kwargs.pop('validate')
+        except KeyError:
+            _validate = False
+
+        if _validate:
+            (__, _error_code, _msg) = self.request_do_validate(
+                module, **kwargs)
+            if _error_code != 0:
+                return 0, _error_code, _msg
+
         (_revision_id, _count, _error_code,
-         _msg) = self._dtm_data_model.do_insert(module=module)
+         _msg) = self._dtm_data_model.do_insert(
+             module=module, progress=self._do_report_progress)
 
         if _error_code != 0:
             self._configuration.RAMSTK_IMPORT_LOG.error(_msg)
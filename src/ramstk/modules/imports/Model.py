@@ -8,7 +8,7 @@
 
 from collections import OrderedDict
 from datetime import date
-from dateutil import parser
+from multiprocessing import Pool
 import numpy as np
 import pandas as pd
 
@@ -17,9 +17,376 @@ from ramstk.dao import (RAMSTKDesignElectric, RAMSTKDesignMechanic,
                      RAMSTKFunction, RAMSTKHardware, RAMSTKMilHdbkF,
                      RAMSTKNSWC, RAMSTKReliability, RAMSTKAllocation,
                      RAMSTKSimilarItem, RAMSTKRequirement,
-                     RAMSTKValidation)
+                     RAMSTKRevision, RAMSTKValidation)
 from ramstk.modules import RAMSTKDataModel
 
+# The RAMSTK Program database tables each module imports to.  Parent tables
+# come before the tables that reference them.
+_DIC_MODULE_TABLES = {
+    'Function': [RAMSTKFunction],
+    'Requirement': [RAMSTKRequirement],
+    'Hardware': [
+        RAMSTKHardware, RAMSTKAllocation, RAMSTKSimilarItem,
+        RAMSTKDesignElectric, RAMSTKMilHdbkF, RAMSTKDesignMechanic, RAMSTKNSWC,
+        RAMSTKReliability
+    ],
+    'Validation': [RAMSTKValidation]
+}
+
+# The (field map, field, attribute, default) of each table attribute that is
+# set from the input file.  A callable default is called each time the input
+# is mapped.
+_DIC_TABLE_FIELDS = {
+    RAMSTKFunction: [
+        ('Function', 'Revision ID', 'revision_id', 1),
+        ('Function', 'Function ID', 'function_id', 1),
+        ('Function', 'Function Code', 'function_code', ''),
+        ('Function', 'Level', 'level', 0),
+        ('Function', 'Function Name', 'name', ''),
+        ('Function', 'Parent', 'parent_id', 1),
+        ('Function', 'Remarks', 'remarks', ''),
+        ('Function', 'Safety Critical', 'safety_critical', 0),
+        ('Function', 'Type', 'type_id', '')
+    ],
+    RAMSTKRequirement: [
+        ('Requirement', 'Revision ID', 'revision_id', 1),
+        ('Requirement', 'Requirement ID', 'requirement_id', 1),
+        ('Requirement', 'Derived?', 'derived', 0),
+        ('Requirement', 'Requirement', 'description', ''),
+        ('Requirement', 'Figure Number', 'figure_number', ''),
+        ('Requirement', 'Owner', 'owner', ''),
+        ('Requirement', 'Page Number', 'page_number', ''),
+        ('Requirement', 'Parent ID', 'parent_id', 1),
+        ('Requirement', 'Priority', 'priority', 1),
+        ('Requirement', 'Requirement Code', 'requirement_code', ''),
+        ('Requirement', 'Specification', 'specification', ''),
+        ('Requirement', 'Requirement Type', 'requirement_type', ''),
+        ('Requirement', 'Validated?', 'validated', 0),
+        ('Requirement', 'Validated Date', 'validated_date', date.today)
+    ],
+    RAMSTKHardware: [
+        ('Hardware', 'Revision ID', 'revision_id', 1),
+        ('Hardware', 'Hardware ID', 'hardware_id', 1),
+        ('Hardware', 'Alternate Part Number', 'alt_part_number', ''),
+        ('Hardware', 'CAGE Code', 'cage_code', ''),
+        ('Hardware', 'Category ID', 'category_id', 0),
+        ('Hardware', 'Composite Ref. Des.', 'comp_ref_des', ''),
+        ('Hardware', 'Cost', 'cost', 0.0),
+        ('Hardware', 'Cost Type', 'cost_type_id', 0),
+        ('Hardware', 'Description', 'description', ''),
+        ('Hardware', 'Duty Cycle', 'duty_cycle', 100.0),
+        ('Hardware', 'Figure Number', 'figure_number', ''),
+        ('Hardware', 'LCN', 'lcn', ''),
+        ('Hardware', 'Level', 'level', 0),
+        ('Hardware', 'Manufacturer', 'manufacturer_id', 0),
+        ('Hardware', 'Mission Time', 'mission_time', 24.0),
+        ('Hardware', 'Name', 'name', ''),
+        ('Hardware', 'NSN', 'nsn', ''),
+        ('Hardware', 'Page Number', 'page_number', ''),
+        ('Hardware', 'Parent Assembly', 'parent_id', 1),
+        ('Hardware', 'Part', 'part', 0),
+        ('Hardware', 'Part Number', 'part_number', ''),
+        ('Hardware', 'Quantity', 'quantity', 1),
+        ('Hardware', 'Reference Designator', 'ref_des', ''),
+        ('Hardware', 'Remarks', 'remarks', ''),
+        ('Hardware', 'Repairable', 'repairable', 1),
+        ('Hardware', 'Specification', 'specification_number', ''),
+        ('Hardware', 'Subcategory ID', 'subcategory_id', 0),
+        ('Hardware', 'Tagged Part', 'tagged_part', 0),
+        ('Hardware', 'Year of Manufacture', 'year_of_manufacture', 1900)
+    ],
+    RAMSTKAllocation: [
+        ('Hardware', 'Revision ID', 'revision_id', 1),
+        ('Hardware', 'Hardware ID', 'hardware_id', 1),
+        ('Hardware', 'Parent Assembly', 'parent_id', 1)
+    ],
+    RAMSTKSimilarItem: [
+        ('Hardware', 'Revision ID', 'revision_id', 1),
+        ('Hardware', 'Hardware ID', 'hardware_id', 1),
+        ('Hardware', 'Parent Assembly', 'parent_id', 1)
+    ],
+    RAMSTKDesignElectric: [
+        ('Hardware', 'Hardware ID', 'hardware_id', 1),
+        ('Design Electric', 'Application ID', 'application_id', 0),
+        ('Design Electric', 'Area', 'area', 1.0),
+        ('Design Electric', 'Capacitance', 'capacitance', 0.000001),
+        ('Design Electric', 'Configuration ID', 'configuration_id', 0),
+        ('Design Electric', 'Construction ID', 'construction_id', 0),
+        ('Design Electric', 'Contact Form ID', 'contact_form_id', 0),
+        ('Design Electric', 'Contact Gauge', 'contact_gauge', 20),
+        ('Design Electric', 'Contact Rating ID', 'contact_rating_id', 0),
+        ('Design Electric', 'Current Operating', 'current_operating', 0.0),
+        ('Design Electric', 'Current Rated', 'current_rated', 0.0),
+        ('Design Electric', 'Current Ratio', 'current_ratio', 0.0),
+        ('Design Electric', 'Environment Active ID', 'environment_active_id',
+         0),
+        ('Design Electric', 'Environment Dormant ID', 'environment_dormant_id',
+         0),
+        ('Design Electric', 'Family ID', 'family_id', 0),
+        ('Design Electric', 'Feature Size', 'feature_size', 1.0),
+        ('Design Electric', 'Frequency Operating', 'frequency_operating', 0.0),
+        ('Design Electric', 'Insert ID', 'insert_id', 0),
+        ('Design Electric', 'Insulation ID', 'insulation_id', 0),
+        ('Design Electric', 'Manufacturing ID', 'manufacturing_id', 0),
+        ('Design Electric', 'Matching ID', 'matching_id', 0),
+        ('Design Electric', 'N Active Pins', 'n_active_pins', 0),
+        ('Design Electric', 'N Circuit Planes', 'n_circuit_planes', 0),
+        ('Design Electric', 'N Cycles', 'n_cycles', 0),
+        ('Design Electric', 'N Elements', 'n_elements', 0),
+        ('Design Electric', 'N Hand Soldered', 'n_hand_soldered', 0),
+        ('Design Electric', 'N Wave Soldered', 'n_wave_soldered', 0),
+        ('Design Electric', 'Operating Life', 'operating_life', 0),
+        ('Design Electric', 'Overstress', 'overstress', 0),
+        ('Design Electric', 'Package ID', 'package_id', 0),
+        ('Design Electric', 'Power Operating', 'power_operating', 0.0),
+        ('Design Electric', 'Power Rated', 'power_rated', 0.0),
+        ('Design Electric', 'Power Ratio', 'power_ratio', 0.0),
+        ('Design Electric', 'Reason', 'reason', ''),
+        ('Design Electric', 'Resistance', 'resistance', 0.0),
+        ('Design Electric', 'Specification ID', 'specification_id', 0),
+        ('Design Electric', 'Technology ID', 'technology_id', 0),
+        ('Design Electric', 'Temperature, Active', 'temperature_active', 30.0),
+        ('Design Electric', 'Temperature, Case', 'temperature_case', 0.0),
+        ('Design Electric', 'Temperature, Dormant', 'temperature_dormant',
+         25.0),
+        ('Design Electric', 'Temperature, Hot Spot', 'temperature_hot_spot',
+         0.0),
+        ('Design Electric', 'Temperature, Junction', 'temperature_junction',
+         0.0),
+        ('Design Electric', 'Temperature, Knee', 'temperature_knee', 0.0),
+        ('Design Electric', 'Temperature, Rated Max', 'temperature_rated_max',
+         0.0),
+        ('Design Electric', 'Temperature, Rated Min', 'temperature_rated_min',
+         0.0),
+        ('Design Electric', 'Temperature Rise', 'temperature_rise', 0.0),
+        ('Design Electric', 'Theta JC', 'theta_jc', 0.0),
+        ('Design Electric', 'Type ID', 'type_id', 0),
+        ('Design Electric', 'Voltage, AC Operating', 'voltage_ac_operating',
+         0.0),
+        ('Design Electric', 'Voltage, DC Operating', 'voltage_dc_operating',
+         0.0),
+        ('Design Electric', 'Voltage ESD', 'voltage_esd', 0.0),
+        ('Design Electric', 'Voltage, Rated', 'voltage_rated', 0.0),
+        ('Design Electric', 'Voltage Ratio', 'voltage_ratio', 0.0),
+        ('Design Electric', 'Weight', 'weight', 1.0),
+        ('Design Electric', 'Years in Production', 'years_in_production', 2)
+    ],
+    RAMSTKMilHdbkF: [
+        ('Hardware', 'Hardware ID', 'hardware_id', 1)
+    ],
+    RAMSTKDesignMechanic: [
+        ('Hardware', 'Hardware ID', 'hardware_id', 1),
+        ('Design Mechanic', 'Altitude, Operating', 'altitude_operating', 0.0),
+        ('Design Mechanic', 'Application ID', 'application_id', 0),
+        ('Design Mechanic', 'Balance ID', 'balance_id', 0),
+        ('Design Mechanic', 'Clearance', 'clearance', 0.0),
+        ('Design Mechanic', 'Casing ID', 'casing_id', 0),
+        ('Design Mechanic', 'Contact Pressure', 'contact_pressure', 0.0),
+        ('Design Mechanic', 'Deflection', 'deflection', 0.0),
+        ('Design Mechanic', 'Diameter, Coil', 'diameter_coil', 0.0),
+        ('Design Mechanic', 'Diameter, Inner', 'diameter_inner', 0.0),
+        ('Design Mechanic', 'Diameter, Outer', 'diameter_outer', 0.0),
+        ('Design Mechanic', 'Diameter, Wire', 'diameter_wire', 0.0),
+        ('Design Mechanic', 'Filter Size', 'filter_size', 0.0),
+        ('Design Mechanic', 'Flow, Design', 'flow_design', 0.0),
+        ('Design Mechanic', 'Flow, Operating', 'flow_operating', 0.0),
+        ('Design Mechanic', 'Frequency, Operating', 'frequency_operating',
+         0.0),
+        ('Design Mechanic', 'Friction', 'friction', 0.0),
+        ('Design Mechanic', 'Impact ID', 'impact_id', 0),
+        ('Design Mechanic', 'Allowable Leakage', 'leakage_allowable', 0.0),
+        ('Design Mechanic', 'Length', 'length', 0.0),
+        ('Design Mechanic', 'Length, Compressed', 'length_compressed', 0.0),
+        ('Design Mechanic', 'Length, Relaxed', 'length_relaxed', 0.0),
+        ('Design Mechanic', 'Design Load', 'load_design', 0.0),
+        ('Design Mechanic', 'Load ID', 'load_id', 0),
+        ('Design Mechanic', 'Operating Load', 'load_operating', 0.0),
+        ('Design Mechanic', 'Lubrication ID', 'lubrication_id', 0),
+        ('Design Mechanic', 'Manufacturing ID', 'manufacturing_id', 0),
+        ('Design Mechanic', 'Material ID', 'material_id', 0),
+        ('Design Mechanic', 'Meyer Hardness', 'meyer_hardness', 0.0),
+        ('Design Mechanic', 'Misalignment Angle', 'misalignment_angle', 0.0),
+        ('Design Mechanic', 'N Ten', 'n_ten', 0),
+        ('Design Mechanic', 'N Cycles', 'n_cycles', 0.0),
+        ('Design Mechanic', 'N Elements', 'n_elements', 0),
+        ('Design Mechanic', 'Offset', 'offset', 0.0),
+        ('Design Mechanic', 'Particle Size', 'particle_size', 0.0),
+        ('Design Mechanic', 'Contact Pressure', 'pressure_contact', 0.0),
+        ('Design Mechanic', 'Differential Pressure', 'pressure_delta', 0.0),
+        ('Design Mechanic', 'Downstream Pressure', 'pressure_downstream', 0.0),
+        ('Design Mechanic', 'Rated Pressure', 'pressure_rated', 0.0),
+        ('Design Mechanic', 'Upstream Pressure', 'pressure_upstream', 0.0),
+        ('Design Mechanic', 'Design RPM', 'rpm_design', 0.0),
+        ('Design Mechanic', 'Operating RPM', 'rpm_operating', 0.0),
+        ('Design Mechanic', 'Service ID', 'service_id', 0),
+        ('Design Mechanic', 'Spring Index', 'spring_index', 0),
+        ('Design Mechanic', 'Surface Finish', 'surface_finish', 0.0),
+        ('Design Mechanic', 'Technology ID', 'technology_id', 0),
+        ('Design Mechanic', 'Thickness', 'thickness', 0.0),
+        ('Design Mechanic', 'Torque ID', 'torque_id', 0),
+        ('Design Mechanic', 'Type ID', 'type_id', 0),
+        ('Design Mechanic', 'Design Viscosity', 'viscosity_design', 0.0),
+        ('Design Mechanic', 'Dynamic Viscosity', 'viscosity_dynamic', 0.0),
+        ('Design Mechanic', '% Water', 'water_per_cent', 0.0),
+        ('Design Mechanic', 'Minimum Width', 'width_minimum', 0.0)
+    ],
+    RAMSTKNSWC: [
+        ('Hardware', 'Hardware ID', 'hardware_id', 1)
+    ],
+    RAMSTKReliability: [
+        ('Hardware', 'Hardware ID', 'hardware_id', 1),
+        ('Reliability', 'Additive Adjustment Factor', 'add_adj_factor', 0.0),
+        ('Reliability', 'Failure Distribution ID', 'failure_distribution_id',
+         0),
+        ('Reliability', 'Failure Rate Method ID', 'hazard_rate_method_id', 0),
+        ('Reliability', 'Failure Rate Model', 'hazard_rate_model', ''),
+        ('Reliability', 'Specified Failure Rate', 'hazard_rate_specified',
+         0.0),
+        ('Reliability', 'Failure Rate Type ID', 'hazard_rate_type_id', 0),
+        ('Reliability', 'Location Parameter', 'location_parameter', 0.0),
+        ('Reliability', 'Specified MTBF', 'mtbf_specified', 0.0),
+        ('Reliability', 'Multiplicative Adjustment Factor', 'mult_adj_factor',
+         1.0),
+        ('Reliability', 'Quality ID', 'quality_id', 0),
+        ('Reliability', 'Reliability Goal', 'reliability_goal', 100.0),
+        ('Reliability', 'Reliability Goal Measure ID',
+         'reliability_goal_measure_id', 0),
+        ('Reliability', 'Scale Parameter', 'scale_parameter', 0.0),
+        ('Reliability', 'Shape Parameter', 'shape_parameter', 0.0),
+        ('Reliability', 'Survival Analysis ID', 'survival_analysis_id', 0)
+    ],
+    RAMSTKValidation: [
+        ('Validation', 'Revision ID', 'revision_id', 1),
+        ('Validation', 'Validation ID', 'validation_id', 1),
+        ('Validation', 'Acceptable Maximum', 'acceptable_maximum', 0.0),
+        ('Validation', 'Acceptable Mean', 'acceptable_mean', 0.0),
+        ('Validation', 'Acceptable Minimum', 'acceptable_minimum', 0.0),
+        ('Validation', 'Acceptable Variance', 'acceptable_variance', 0.0),
+        ('Validation', 's-Confidence', 'confidence', 75.0),
+        ('Validation', 'Average Task Cost', 'cost_average', 0.0),
+        ('Validation', 'Maximum Task Cost', 'cost_maximum', 0.0),
+        ('Validation', 'Minimum Task Cost', 'cost_minimum', 0.0),
+        ('Validation', 'Start Date', 'date_start', date.today),
+        ('Validation', 'End Date', 'date_end', date.today),
+        ('Validation', 'Task Description', 'description', ''),
+        ('Validation', 'Unit of Measure', 'measurement_unit', ''),
+        ('Validation', 'Name', 'name', ''),
+        ('Validation', 'Task Status', 'status', 0.0),
+        ('Validation', 'Task Type', 'task_type', ''),
+        ('Validation', 'Task Specification', 'task_specification', ''),
+        ('Validation', 'Average Task Time', 'time_average', 0.0),
+        ('Validation', 'Maximum Task Time', 'time_maximum', 0.0),
+        ('Validation', 'Minimum Task Time', 'time_minimum', 0.0)
+    ]
+}
+
+
+# The attribute holding the ID of the records in each module's parent table.
+_DIC_MODULE_KEYS = {
+    'Function': 'function_id',
+    'Requirement': 'requirement_id',
+    'Hardware': 'hardware_id',
+    'Validation': 'validation_id'
+}
+
+# The (minimum, maximum) value of attributes set from the input file.  A None
+# limit means the value isn't bounded on that side.
+_DIC_ATTRIBUTE_RANGES = {
+    'revision_id': (1, None),
+    'function_id': (1, None),
+    'requirement_id': (1, None),
+    'hardware_id': (1, None),
+    'validation_id': (1, None),
+    'parent_id': (0, None),
+    'level': (0, None),
+    'quantity': (0, None),
+    'cost': (0.0, None),
+    'duty_cycle': (0.0, 100.0),
+    'mission_time': (0.0, None),
+    'confidence': (0.0, 100.0),
+    'status': (0.0, 100.0),
+    'derived': (0, 1),
+    'part': (0, 1),
+    'repairable': (0, 1),
+    'safety_critical': (0, 1),
+    'tagged_part': (0, 1),
+    'validated': (0, 1)
+}
+
+# The description of each type of value checked in the input file.
+_DIC_TYPE_NAMES = {'date': 'a date', 'float': 'a number', 'int': 'an integer'}
+
+
+def _do_validate_chunk(chunk):
+    """
+    Check the values in a chunk of input rows.
+
+    This is a module function so it can be passed to the worker processes
+    used by ImportDataModel.do_validate().  Each check is applied to a whole
+    column of the chunk at once; only the rows that fail a check are visited
+    to build their error messages.
+
+    :param tuple chunk: the chunk of input rows, the list of (column,
+                        attribute, type, minimum, maximum) checks, the list of
+                        Revision IDs in the RAMSTK Program database, and the
+                        (column, default) of the ID and the parent ID.
+    :return: (_errors, _ids, _parent_ids); the list of (row, column, error
+             message) tuples for the chunk, and the ID and parent ID of each
+             row.  The parent IDs are None if the module has no parents.
+    :rtype: (list, :class:`pandas.Series`, :class:`pandas.Series`)
+    """
+    _data, _checks, _revision_ids, _keys = chunk
+
+    _errors = []
+    for _column, _attribute, _type, _minimum, _maximum in _checks:
+        _raw = _data[_column]
+        if _type == 'date':
+            _values = pd.to_datetime(_raw, errors='coerce')
+        else:
+            _values = pd.to_numeric(_raw, errors='coerce')
+        _invalid = _raw.notnull() & _values.isnull()
+        if _type == 'int':
+            _invalid |= _values.notnull() & (_values % 1 != 0)
+        _errors.extend([(_row + 1, _column, u"'{0}' is not {1:s}.".format(
+            _value, _DIC_TYPE_NAMES[_type]))
+                        for _row, _value in _raw[_invalid].iteritems()])
+
+        if _minimum is not None:
+            _errors.extend([
+                (_row + 1, _column,
+                 u'{0} is less than the minimum of {1}.'.format(
+                     _value, _minimum))
+                for _row, _value in _raw[_values < _minimum].iteritems()
+            ])
+        if _maximum is not None:
+            _errors.extend([
+                (_row + 1, _column,
+                 u'{0} is greater than the maximum of {1}.'.format(
+                     _value, _maximum))
+                for _row, _value in _raw[_values > _maximum].iteritems()
+            ])
+        if _attribute == 'revision_id':
+            _missing = (_values.notnull() & ~_invalid
+                        & ~_values.isin(_revision_ids))
+            _errors.extend([(_row + 1, _column,
+                             u'Revision ID {0} does not exist.'.format(_value))
+                            for _row, _value in _raw[_missing].iteritems()])
+
+    # Missing and invalid IDs are replaced with the default, the same as when
+    # the rows are inserted.
+    _ids = []
+    for _column, _default in _keys:
+        if _default is None:
+            _ids.append(None)
+        elif _column in _data:
+            _ids.append(
+                pd.to_numeric(_data[_column], errors='coerce').fillna(
+                    _default).astype(np.int64))
+        else:
+            _ids.append(pd.Series(_default, index=_data.index, dtype=np.int64))
+
+    return _errors, _ids[0], _ids[1]
+
 
 class ImportDataModel(RAMSTKDataModel):
     """Contains the attributes and methods of an Import data model."""
@@ -215,6 +582,10 @@ class ImportDataModel(RAMSTKDataModel):
 
         # Initialize private scalar attributes.
         self._input_data = None
+        # The *.csv file whose rows are streamed by do_insert() and the number
+        # of rows to read and insert at a time.
+        self._input_file = None
+        self._chunksize = None
 
         # Initialize public dictionary attributes.
 
@@ -222,14 +593,37 @@ class ImportDataModel(RAMSTKDataModel):
 
         # Initialize public stcalar attributes.
 
-    def do_read_input(self, file_type, file_name):
+    def do_read_input(self, file_type, file_name, **kwargs):
         """
         Read contents of input file into a pandas DataFrame().
 
+        When a chunksize is passed the input rows are read and inserted
+        chunksize rows at a time by do_insert() so the memory used by an import
+        doesn't grow with the size of the input file.  Only the column headers
+        of a *.csv file are read here; the rows are streamed from the file.  An
+        Excel workbook is read whole since xlrd loads the entire workbook, but
+        its rows are still inserted one chunk at a time.
+
+        :param str file_type: the type of input file to be read.
+        :param str file_name: the URL to the file to be read.
+        :keyword int chunksize: the number of input rows to read and insert at
+                                a time.  Default is to read the entire file.
         :return: None
         :rtype: None
         """
-        if file_type == 'csv':
+        try:
+            _chunksize = kwargs['chunksize']
+        except KeyError:
+            _chunksize = None
+
+        self._input_file = None
+        self._chunksize = _chunksize
+
+        if file_type == 'csv' and _chunksize is not None:
+            self._input_file = file_name
+            self._input_data = pd.read_table(
+                file_name, sep=';', na_values=[''], nrows=0)
+        elif file_type == 'csv':
             self._input_data = pd.read_table(
                 file_name, sep=';', na_values=[''], parse_dates=True)
         elif file_type == 'excel':
@@ -237,6 +631,33 @@ class ImportDataModel(RAMSTKDataModel):
 
         return None
 
+    def _do_read_chunks(self, slices=1):
+        """
+        Iterate over the input data one chunk of rows at a time.
+
+        :param int slices: the number of chunks to split the input data into
+                           when it was read without a chunksize.  Default is
+                           one chunk with every row.
+        :return: the next chunk of input rows.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if self._input_file is not None:
+            for _chunk in pd.read_table(
+                    self._input_file,
+                    sep=';',
+                    na_values=[''],
+                    parse_dates=True,
+                    chunksize=self._chunksize):
+                yield _chunk
+        elif self._chunksize is None:
+            _size = max(1, -(-len(self._input_data) // max(1, slices)))
+            for _idx in range(0, max(1, len(self._input_data)), _size):
+                yield self._input_data.iloc[_idx:_idx + _size]
+        else:
+            for _idx in range(0, max(1, len(self._input_data)),
+                              self._chunksize):
+                yield self._input_data.iloc[_idx:_idx + self._chunksize]
+
     def do_map_to_field(self, module, exim_field, format_field):
         """
         Map the external column to the RAMSTK database table field.
@@ -244,8 +665,8 @@ class ImportDataModel(RAMSTKDataModel):
         :param str module: the RAMSTK module to map header fields for.
         :param str exim_field: the string used for the column header in the
                                import file.
-        :param str format_field: the string used for default titles in the RAMSTK
-                                 layout file.
+        :param str format_field: the string used for default titles in the
+                                 RAMSTK layout file.
         :return: None
         :rtype: None
         """
@@ -253,11 +674,156 @@ class ImportDataModel(RAMSTKDataModel):
 
         return None
 
+    def do_validate(self, **kwargs):
+        """
+        Validate the input file before any of it is inserted.
+
+        Each chunk of input rows is checked for values that aren't the type of
+        the field they're mapped to, values outside the range allowed for the
+        field, and Revision IDs that don't exist.  The chunks are checked by a
+        pool of worker processes.  Input read without a chunksize is split
+        into one chunk per worker process.  The IDs and parent IDs of every
+        row are then checked together for IDs that are duplicated in the input
+        file or already exist in the RAMSTK Program database, and for parents
+        that exist in neither.
+
+        :keyword str module: the name of the RAMSTK module to validate the
+                             input for.
+        :keyword int processes: the number of worker processes to check the
+                                chunks of input rows with.  Default is 1.
+        :return: (_errors, _error_code, _msg); the list of (row, field, error
+                 message) tuples sorted by row, the error code, and the
+                 associated message.  Rows are numbered from one, not counting
+                 the header row.
+        :rtype: (list, int, str)
+        """
+        _module = kwargs['module']
+        try:
+            _processes = int(kwargs['processes'])
+        except KeyError:
+            _processes = 1
+        try:
+            _tables = _DIC_MODULE_TABLES[_module]
+            _key = _DIC_MODULE_KEYS[_module]
+        except KeyError:
+            _tables = []
+            _key = None
+        _errors = []
+        _error_code = 0
+        _msg = 'RAMSTK SUCCESS: Validating the input file.'
+
+        if not _tables:
+            return _errors, _error_code, _msg
+
+        # Each input column is checked once, even if several tables use it.
+        _checks = OrderedDict()
+        _keys = {_key: (None, None, None), 'parent_id': (None, None, None)}
+        for _table in _tables:
+            for _map, _field, _attribute, _default in _DIC_TABLE_FIELDS[
+                    _table]:
+                _column = self._dic_field_map[_map][_field]
+                if _table == _tables[0] and _attribute in _keys:
+                    _keys[_attribute] = (_column, _default, _field)
+                if (_column not in self._input_data.columns
+                        or _column in _checks):
+                    continue
+
+                if callable(_default):
+                    _default = _default()
+                if isinstance(_default, date):
+                    _type = 'date'
+                elif isinstance(_default, int):
+                    _type = 'int'
+                elif isinstance(_default, float):
+                    _type = 'float'
+                else:
+                    continue
+                _minimum, _maximum = _DIC_ATTRIBUTE_RANGES.get(
+                    _attribute, (None, None))
+                _checks[_column] = (_column, _attribute, _type, _minimum,
+                                    _maximum)
+        _keys = [_keys[_key], _keys['parent_id']]
+        _fields = [
+            _column if _column in self._input_data.columns else _field
+            for _column, __, _field in _keys
+        ]
+
+        _session = self.dao.db_get_session()
+        _revision_ids = [
+            _row[0]
+            for _row in _session.query(RAMSTKRevision.revision_id).all()
+        ]
+        _db_ids = [
+            _row[0]
+            for _row in _session.query(getattr(_tables[0], _key)).all()
+        ]
+        self.dao.db_release_session(_session)
+
+        # Input read without a chunksize is split so each worker process gets
+        # a share of the rows.
+        _chunks = ((_chunk[list(_checks)], _checks.values(), _revision_ids,
+                    [_id[:2] for _id in _keys])
+                   for _chunk in self._do_read_chunks(slices=_processes))
+        if _processes > 1:
+            _pool = Pool(_processes)
+            try:
+                _results = list(_pool.imap(_do_validate_chunk, _chunks))
+            finally:
+                _pool.close()
+                _pool.join()
+        else:
+            _results = [_do_validate_chunk(_chunk) for _chunk in _chunks]
+
+        for _chunk_errors, __, __ in _results:
+            _errors.extend(_chunk_errors)
+
+        # Check the IDs of the whole input file together.
+        _ids = pd.concat([_result[1] for _result in _results])
+        _errors.extend([(_row + 1, _fields[0],
+                         u'ID {0:d} is duplicated in the input file.'.format(
+                             _value))
+                        for _row, _value in _ids[_ids.duplicated()].iteritems()
+                        ])
+        _errors.extend([
+            (_row + 1, _fields[0],
+             u'ID {0:d} already exists in the RAMSTK Program database.'.format(
+                 _value))
+            for _row, _value in _ids[_ids.isin(_db_ids)].iteritems()
+        ])
+        if _keys[1][1] is not None:
+            _parent_ids = pd.concat([_result[2] for _result in _results])
+            _orphans = ((_parent_ids != 0) & ~_parent_ids.isin(_ids)
+                        & ~_parent_ids.isin(_db_ids))
+            _errors.extend([
+                (_row + 1, _fields[1],
+                 u'Parent ID {0:d} does not exist.'.format(_value))
+                for _row, _value in _parent_ids[_orphans].iteritems()
+            ])
+
+        if _errors:
+            _errors.sort(key=lambda _error: _error[0])
+            _error_code = 5
+            _msg = ('RAMSTK ERROR: {0:d} error(s) found in {1:d} row(s) of '
+                    'the input file.').format(
+                        len(_errors),
+                        len(set([_error[0] for _error in _errors])))
+
+        return _errors, _error_code, _msg
+
     def do_insert(self, **kwargs):
         """
         Insert a new entity to the RAMSTK db with values from external file.
 
+        The entire import is added in one transaction, so if any record fails
+        to be added none of them are.
+
         :param str module: the name of the RAMSTK module to import.
+        :keyword int chunk_size: the number of rows to add to the RAMSTK
+                                 Program database with each INSERT.  Default
+                                 is 1000.
+        :keyword progress: the function to call after each chunk of input rows
+                           is inserted.  It is passed the number of rows in
+                           the chunk and the number of rows inserted so far.
         :return: (_revision_id, _count, _error_code, _msg; the Revision ID the
                  import is associated with, the total number of entities added,
                  the error code and associated message from the RAMSTK Program
@@ -265,611 +831,58 @@ class ImportDataModel(RAMSTKDataModel):
         :rtype: (int, int, int, str)
         """
         _module = kwargs['module']
+        try:
+            _chunk_size = kwargs['chunk_size']
+        except KeyError:
+            _chunk_size = 1000
+        try:
+            _progress = kwargs['progress']
+        except KeyError:
+            _progress = None
+        try:
+            _tables = _DIC_MODULE_TABLES[_module]
+        except KeyError:
+            _tables = []
         _revision_id = 1
-
-        _entities = []
-        for _idx, _row in self._input_data.iterrows():
-            if _module == 'Function':
-                _entity = self._do_insert_function(_row)
-                _entities.append(_entity)
-                _revision_id = _entity.revision_id
-            elif _module == 'Requirement':
-                _entity = self._do_insert_requirement(_row)
-                _entities.append(_entity)
-                _revision_id = _entity.revision_id
-            elif _module == 'Hardware':
-                _entity = self._do_insert_hardware(_row)
-                _entities.append(_entity)
-                _revision_id = _entity.revision_id
-                _entity = self._do_insert_allocation(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_similar_item(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_electric(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_mil_hdbk_f(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_mechanic(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_nswc(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_reliability(_row)
-                _entities.append(_entity)
-            elif _module == 'Validation':
-                _entity = self._do_insert_validation(_row)
-                _entities.append(_entity)
-                _revision_id = _entity.revision_id
-
-        _error_code, _msg = RAMSTKDataModel.do_insert(self, entities=_entities)
-
-        if _error_code == 0:
-            _count = len(_entities)
-        else:
+        _count = 0
+        _rows = 0
+        _error_code = 0
+        _msg = ''
+
+        # Use the bulk load profile while adding the records.  The records are
+        # inserted with SQLAlchemy Core, so no ORM entities are built.
+        _profile = self.dao.db_set_profile('bulk')
+        _session = self.dao.db_begin_batch()
+        try:
+            # Only one chunk of input rows and its records are held at a time.
+            for _chunk in self._do_read_chunks():
+                _records = [(_table, self._do_map_fields(_chunk, _table))
+                            for _table in _tables]
+                if _records and _records[0][1]:
+                    _revision_id = _records[0][1][-1]['revision_id']
+
+                _error_code, _msg = self.dao.db_add_records(
+                    _records, _session, chunk_size=_chunk_size)
+                if _error_code != 0:
+                    break
+
+                _count += sum([len(_table[1]) for _table in _records])
+                _rows += len(_chunk)
+                if _progress is not None:
+                    _progress(len(_chunk), _rows)
+        finally:
+            _code, _message = self.dao.db_flush_batch()
+            self.dao.db_set_profile(_profile)
+
+        # Nothing was added if the batch was rolled back.
+        if _error_code == 0 and _code != 0:
+            _error_code = _code
+            _msg = _message
+        if _error_code != 0:
             _count = 0
 
         return _revision_id, _count, _error_code, _msg
 
-    def _do_insert_function(self, row):
-        """
-        Insert a new Function entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKFunction.RAMSTKFunction`
-        """
-        _function = RAMSTKFunction()
-        _map = self._dic_field_map['Function']
-
-        _function.revision_id = self._get_input_value(_map, row, 'Revision ID',
-                                                      1)
-        _function.function_id = self._get_input_value(_map, row, 'Function ID',
-                                                      1)
-        _function.function_code = self._get_input_value(
-            _map, row, 'Function Code', '')
-        _function.level = self._get_input_value(_map, row, 'Level', 0)
-        _function.name = self._get_input_value(_map, row, 'Function Name', '')
-        _function.parent_id = self._get_input_value(_map, row, 'Parent', 1)
-        _function.remarks = self._get_input_value(_map, row, 'Remarks', '')
-        _function.safety_critical = self._get_input_value(
-            _map, row, 'Safety Critical', 0)
-        _function.type_id = self._get_input_value(_map, row, 'Type', '')
-
-        return _function
-
-    def _do_insert_requirement(self, row):
-        """
-        Insert a new Requirement entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKRequirement.RAMSTKRequirement`
-        """
-        _requirement = RAMSTKRequirement()
-        _map = self._dic_field_map['Requirement']
-
-        _requirement.revision_id = self._get_input_value(
-            _map, row, 'Revision ID', 1)
-        _requirement.requirement_id = self._get_input_value(
-            _map, row, 'Requirement ID', 1)
-        _requirement.derived = self._get_input_value(_map, row, 'Derived?', 0)
-        _requirement.description = self._get_input_value(
-            _map, row, 'Requirement', '')
-        _requirement.figure_number = self._get_input_value(
-            _map, row, 'Figure Number', '')
-        _requirement.owner = self._get_input_value(_map, row, 'Owner', '')
-        _requirement.page_number = self._get_input_value(
-            _map, row, 'Page Number', '')
-        _requirement.parent_id = self._get_input_value(_map, row, 'Parent ID',
-                                                       1)
-        _requirement.priority = self._get_input_value(_map, row, 'Priority', 1)
-        _requirement.requirement_code = self._get_input_value(
-            _map, row, 'Requirement Code', '')
-        _requirement.specification = self._get_input_value(
-            _map, row, 'Specification', '')
-        _requirement.requirement_type = self._get_input_value(
-            _map, row, 'Requirement Type', '')
-        _requirement.validated = self._get_input_value(_map, row, 'Validated?',
-                                                       0)
-        _requirement.validated_date = self._get_input_value(
-            _map, row, 'Validated Date', date.today())
-
-        return _requirement
-
-    def _do_insert_hardware(self, row):
-        """
-        Insert a new Hardware entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKHardware.RAMSTKHardware`
-        """
-        _hardware = RAMSTKHardware()
-        _map = self._dic_field_map['Hardware']
-
-        _hardware.revision_id = self._get_input_value(_map, row, 'Revision ID',
-                                                      1)
-        _hardware.hardware_id = self._get_input_value(_map, row, 'Hardware ID',
-                                                      1)
-        _hardware.alt_part_num = self._get_input_value(
-            _map, row, 'Alternate Part Number', '')
-        _hardware.cage_code = self._get_input_value(_map, row, 'CAGE Code', '')
-        _hardware.category_id = self._get_input_value(_map, row, 'Category ID',
-                                                      0)
-        _hardware.comp_ref_des = self._get_input_value(
-            _map, row, 'Composite Ref. Des.', '')
-        _hardware.cost = self._get_input_value(_map, row, 'Cost', 0.0)
-        _hardware.cost_type_id = self._get_input_value(_map, row, 'Cost Type',
-                                                       0)
-        _hardware.description = self._get_input_value(_map, row, 'Description',
-                                                      '')
-        _hardware.duty_cycle = self._get_input_value(_map, row, 'Duty Cycle',
-                                                     100.0)
-        _hardware.figure_number = self._get_input_value(
-            _map, row, 'Figure Number', '')
-        _hardware.lcn = self._get_input_value(_map, row, 'LCN', '')
-        _hardware.level = self._get_input_value(_map, row, 'Level', 0)
-        _hardware.manufacturer_id = self._get_input_value(
-            _map, row, 'Manufacturer', 0)
-        _hardware.mission_time = self._get_input_value(_map, row,
-                                                       'Mission Time', 24.0)
-        _hardware.name = self._get_input_value(_map, row, 'Name', '')
-        _hardware.nsn = self._get_input_value(_map, row, 'NSN', '')
-        _hardware.page_number = self._get_input_value(_map, row, 'Page Number',
-                                                      '')
-        _hardware.parent_id = self._get_input_value(_map, row,
-                                                    'Parent Assembly', 1)
-        _hardware.part = self._get_input_value(_map, row, 'Part', 0)
-        _hardware.part_number = self._get_input_value(_map, row, 'Part Number',
-                                                      '')
-        _hardware.quantity = self._get_input_value(_map, row, 'Quantity', 1)
-        _hardware.ref_des = self._get_input_value(_map, row,
-                                                  'Reference Designator', '')
-        _hardware.remarks = self._get_input_value(_map, row, 'Remarks', '')
-        _hardware.repairable = self._get_input_value(_map, row, 'Repairable',
-                                                     1)
-        _hardware.specification_number = self._get_input_value(
-            _map, row, 'Specification', '')
-        _hardware.subcategory_id = self._get_input_value(
-            _map, row, 'Subcategory ID', 0)
-        _hardware.tagged_part = self._get_input_value(_map, row, 'Tagged Part',
-                                                      0)
-        _hardware.year_of_manufacture = self._get_input_value(
-            _map, row, 'Year of Manufacture', 1900)
-
-        return _hardware
-
-    def _do_insert_design_electric(self, row):
-        """
-        Insert a new Design Electric entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKHardware.RAMSTKHardware`
-        """
-        _design_electric = RAMSTKDesignElectric()
-        _map = self._dic_field_map['Hardware']
-        _design_electric.hardware_id = self._get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        _map = self._dic_field_map['Design Electric']
-        _design_electric.application_id = self._get_input_value(
-            _map, row, 'Application ID', 0)
-        _design_electric.area = self._get_input_value(_map, row, 'Area', 1.0)
-        _design_electric.capacitance = self._get_input_value(
-            _map, row, 'Capacitance', 0.000001)
-        _design_electric.configuration_id = self._get_input_value(
-            _map, row, 'Configuration ID', 0)
-        _design_electric.construction_id = self._get_input_value(
-            _map, row, 'Construction ID', 0)
-        _design_electric.contact_form_id = self._get_input_value(
-            _map, row, 'Contact Form ID', 0)
-        _design_electric.contact_gauge = self._get_input_value(
-            _map, row, 'Contact Gauge', 20)
-        _design_electric.contact_rating_id = self._get_input_value(
-            _map, row, 'Contact Rating ID', 0)
-        _design_electric.current_operating = self._get_input_value(
-            _map, row, 'Current Operating', 0.0)
-        _design_electric.current_rated = self._get_input_value(
-            _map, row, 'Current Rated', 0.0)
-        _design_electric.current_ratio = self._get_input_value(
-            _map, row, 'Current Ratio', 0.0)
-        _design_electric.environment_active_id = self._get_input_value(
-            _map, row, 'Environment Active ID', 0)
-        _design_electric.environment_dormant_id = self._get_input_value(
-            _map, row, 'Environment Dormant ID', 0)
-        _design_electric.family_id = self._get_input_value(
-            _map, row, 'Family ID', 0)
-        _design_electric.feature_size = self._get_input_value(
-            _map, row, 'Feature Size', 1.0)
-        _design_electric.frequency_operating = self._get_input_value(
-            _map, row, 'Frequency Operating', 0.0)
-        _design_electric.insert_id = self._get_input_value(
-            _map, row, 'Insert ID', 0)
-        _design_electric.insulation_id = self._get_input_value(
-            _map, row, 'Insulation ID', 0)
-        _design_electric.manufacturing_id = self._get_input_value(
-            _map, row, 'Manufacturing ID', 0)
-        _design_electric.matching_id = self._get_input_value(
-            _map, row, 'Matching ID', 0)
-        _design_electric.n_active_pins = self._get_input_value(
-            _map, row, 'N Active Pins', 0)
-        _design_electric.n_circuit_planes = self._get_input_value(
-            _map, row, 'N Circuit Planes', 0)
-        _design_electric.n_cycles = self._get_input_value(
-            _map, row, 'N Cycles', 0)
-        _design_electric.n_elements = self._get_input_value(
-            _map, row, 'N Elements', 0)
-        _design_electric.n_hand_soldered = self._get_input_value(
-            _map, row, 'N Hand Soldered', 0)
-        _design_electric.n_wave_soldered = self._get_input_value(
-            _map, row, 'N Wave Soldered', 0)
-        _design_electric.operating_life = self._get_input_value(
-            _map, row, 'Operating Life', 0)
-        _design_electric.overstress = self._get_input_value(
-            _map, row, 'Overstress', 0)
-        _design_electric.package_id = self._get_input_value(
-            _map, row, 'Package ID', 0)
-        _design_electric.power_operating = self._get_input_value(
-            _map, row, 'Power Operating', 0.0)
-        _design_electric.power_rated = self._get_input_value(
-            _map, row, 'Power Rated', 0.0)
-        _design_electric.power_ratio = self._get_input_value(
-            _map, row, 'Power Ratio', 0.0)
-        _design_electric.reason = self._get_input_value(
-            _map, row, 'Reason', '')
-        _design_electric.resistance = self._get_input_value(
-            _map, row, 'Resistance', 0.0)
-        _design_electric.specification_id = self._get_input_value(
-            _map, row, 'Specification ID', 0)
-        _design_electric.technology_id = self._get_input_value(
-            _map, row, 'Technology ID', 0)
-        _design_electric.temperature_active = self._get_input_value(
-            _map, row, 'Temperature, Active', 30.0)
-        _design_electric.temperature_case = self._get_input_value(
-            _map, row, 'Temperature, Case', 0.0)
-        _design_electric.temperature_dormant = self._get_input_value(
-            _map, row, 'Temperature, Dormant', 25.0)
-        _design_electric.temperature_hot_spot = self._get_input_value(
-            _map, row, 'Temperature, Hot Spot', 0.0)
-        _design_electric.temperature_junction = self._get_input_value(
-            _map, row, 'Temperature, Junction', 0.0)
-        _design_electric.temperature_knee = self._get_input_value(
-            _map, row, 'Temperature, Knee', 0.0)
-        _design_electric.temperature_rated_max = self._get_input_value(
-            _map, row, 'Temperature, Rated Max', 0.0)
-        _design_electric.temperature_rated_min = self._get_input_value(
-            _map, row, 'Temperature, Rated Min', 0.0)
-        _design_electric.temperature_rise = self._get_input_value(
-            _map, row, 'Temperature Rise', 0.0)
-        _design_electric.theta_jc = self._get_input_value(
-            _map, row, 'Theta JC', 0.0)
-        _design_electric.type_id = self._get_input_value(
-            _map, row, 'Type ID', 0)
-        _design_electric.voltage_ac_operating = self._get_input_value(
-            _map, row, 'Voltage, AC Operating', 0.0)
-        _design_electric.voltage_dc_operating = self._get_input_value(
-            _map, row, 'Voltage, DC Operating', 0.0)
-        _design_electric.voltage_esd = self._get_input_value(
-            _map, row, 'Voltage ESD', 0.0)
-        _design_electric.voltage_rated = self._get_input_value(
-            _map, row, 'Voltage, Rated', 0.0)
-        _design_electric.voltage_ratio = self._get_input_value(
-            _map, row, 'Voltage Ratio', 0.0)
-        _design_electric.weight = self._get_input_value(
-            _map, row, 'Weight', 1.0)
-        _design_electric.years_in_production = self._get_input_value(
-            _map, row, 'Years in Production', 2)
-
-        return _design_electric
-
-    def _do_insert_design_mechanic(self, row):
-        """
-        Insert a new Design Mechanic entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKHardware.RAMSTKHardware`
-        """
-        # TODO: Implement NSWC predictions.  See issue #141.
-        _design_mechanic = RAMSTKDesignMechanic()
-
-        _map = self._dic_field_map['Hardware']
-        _design_mechanic.hardware_id = self._get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        _map = self._dic_field_map['Design Mechanic']
-        _design_mechanic.altitude_operating = self._get_input_value(
-            _map, row, 'Altitude, Operating', 0.0)
-        _design_mechanic.application_id = self._get_input_value(
-            _map, row, 'Application ID', 0)
-        _design_mechanic.balance_id = self._get_input_value(
-            _map, row, 'Balance ID', 0)
-        _design_mechanic.clearance = self._get_input_value(
-            _map, row, 'Clearance', 0.0)
-        _design_mechanic.casing_id = self._get_input_value(
-            _map, row, 'Casing ID', 0)
-        _design_mechanic.contact_pressure = self._get_input_value(
-            _map, row, 'Contact Pressure', 0.0)
-        _design_mechanic.deflection = self._get_input_value(
-            _map, row, 'Deflection', 0.0)
-        _design_mechanic.diameter_coil = self._get_input_value(
-            _map, row, 'Diameter, Coil', 0.0)
-        _design_mechanic.diameter_inner = self._get_input_value(
-            _map, row, 'Diameter, Inner', 0.0)
-        _design_mechanic.diameter_outer = self._get_input_value(
-            _map, row, 'Diameter, Outer', 0.0)
-        _design_mechanic.diameter_wire = self._get_input_value(
-            _map, row, 'Diameter, Wire', 0.0)
-        _design_mechanic.filter_size = self._get_input_value(
-            _map, row, 'Filter Size', 0.0)
-        _design_mechanic.flow_design = self._get_input_value(
-            _map, row, 'Flow, Design', 0.0)
-        _design_mechanic.flow_operating = self._get_input_value(
-            _map, row, 'Flow, Operating', 0.0)
-        _design_mechanic.frequency_operating = self._get_input_value(
-            _map, row, 'Frequency, Operating', 0.0)
-        _design_mechanic.friction = self._get_input_value(
-            _map, row, 'Friction', 0.0)
-        _design_mechanic.impact_id = self._get_input_value(
-            _map, row, 'Impact ID', 0)
-        _design_mechanic.leakage_allowable = self._get_input_value(
-            _map, row, 'Allowable Leakage', 0.0)
-        _design_mechanic.length = self._get_input_value(
-            _map, row, 'Length', 0.0)
-        _design_mechanic.length_compressed = self._get_input_value(
-            _map, row, 'Length, Compressed', 0.0)
-        _design_mechanic.length_relaxed = self._get_input_value(
-            _map, row, 'Length, Relaxed', 0.0)
-        _design_mechanic.load_design = self._get_input_value(
-            _map, row, 'Design Load', 0.0)
-        _design_mechanic.load_id = self._get_input_value(
-            _map, row, 'Load ID', 0)
-        _design_mechanic.load_operating = self._get_input_value(
-            _map, row, 'Operating Load', 0.0)
-        _design_mechanic.lubrication_id = self._get_input_value(
-            _map, row, 'Lubrication ID', 0)
-        _design_mechanic.manufacturing_id = self._get_input_value(
-            _map, row, 'Manufacturing ID', 0)
-        _design_mechanic.material_id = self._get_input_value(
-            _map, row, 'Material ID', 0)
-        _design_mechanic.meyer_hardness = self._get_input_value(
-            _map, row, 'Meyer Hardness', 0.0)
-        _design_mechanic.misalignment_angle = self._get_input_value(
-            _map, row, 'Misalignment Angle', 0.0)
-        _design_mechanic.n_ten = self._get_input_value(_map, row, 'N Ten', 0)
-        _design_mechanic.n_cycles = self._get_input_value(
-            _map, row, 'N Cycles', 0.0)
-        _design_mechanic.n_elements = self._get_input_value(
-            _map, row, 'N Elements', 0)
-        _design_mechanic.offset = self._get_input_value(
-            _map, row, 'Offset', 0.0)
-        _design_mechanic.particle_size = self._get_input_value(
-            _map, row, 'Particle Size', 0.0)
-        _design_mechanic.pressure_contact = self._get_input_value(
-            _map, row, 'Contact Pressure', 0.0)
-        _design_mechanic.pressure_delta = self._get_input_value(
-            _map, row, 'Differential Pressure', 0.0)
-        _design_mechanic.pressure_downstream = self._get_input_value(
-            _map, row, 'Downstream Pressure', 0.0)
-        _design_mechanic.pressure_rated = self._get_input_value(
-            _map, row, 'Rated Pressure', 0.0)
-        _design_mechanic.pressure_upstream = self._get_input_value(
-            _map, row, 'Upstream Pressure', 0.0)
-        _design_mechanic.rpm_design = self._get_input_value(
-            _map, row, 'Design RPM', 0.0)
-        _design_mechanic.rpm_operating = self._get_input_value(
-            _map, row, 'Operating RPM', 0.0)
-        _design_mechanic.service_id = self._get_input_value(
-            _map, row, 'Service ID', 0)
-        _design_mechanic.spring_index = self._get_input_value(
-            _map, row, 'Spring Index', 0)
-        _design_mechanic.surface_finish = self._get_input_value(
-            _map, row, 'Surface Finish', 0.0)
-        _design_mechanic.technology_id = self._get_input_value(
-            _map, row, 'Technology ID', 0)
-        _design_mechanic.thickness = self._get_input_value(
-            _map, row, 'Thickness', 0.0)
-        _design_mechanic.torque_id = self._get_input_value(
-            _map, row, 'Torque ID', 0)
-        _design_mechanic.type_id = self._get_input_value(
-            _map, row, 'Type ID', 0)
-        _design_mechanic.viscosity_design = self._get_input_value(
-            _map, row, 'Design Viscosity', 0.0)
-        _design_mechanic.viscosity_dynamic = self._get_input_value(
-            _map, row, 'Dynamic Viscosity', 0.0)
-        _design_mechanic.water_per_cent = self._get_input_value(
-            _map, row, '% Water', 0.0)
-        _design_mechanic.width_minimum = self._get_input_value(
-            _map, row, 'Minimum Width', 0.0)
-
-        return _design_mechanic
-
-    def _do_insert_mil_hdbk_f(self, row):
-        """
-        Insert a new MIL-HDBK-217F entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKMilHdbkF.RAMSTKMilHdbkF`
-        """
-        _mil_hdbk_f = RAMSTKMilHdbkF()
-
-        _map = self._dic_field_map['Hardware']
-        _mil_hdbk_f.hardware_id = self._get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        return _mil_hdbk_f
-
-    def _do_insert_nswc(self, row):
-        """
-        Insert a new NSWC entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKNSWC.RAMSTKNSWC`
-        """
-        _mil_hdbk_f = RAMSTKNSWC()
-
-        _map = self._dic_field_map['Hardware']
-        _mil_hdbk_f.hardware_id = self._get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        return _mil_hdbk_f
-
-    def _do_insert_reliability(self, row):
-        """
-        Insert a new Reliability entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKHardware.RAMSTKHardware`
-        """
-        _reliability = RAMSTKReliability()
-
-        _map = self._dic_field_map['Hardware']
-        _reliability.hardware_id = self._get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        _map = self._dic_field_map['Reliability']
-        _reliability.add_adj_factor = self._get_input_value(
-            _map, row, 'Additive Adjustment Factor', 0.0)
-        _reliability.failure_distribution_id = self._get_input_value(
-            _map, row, 'Failure Distribution ID', 0)
-        _reliability.hazard_rate_method_id = self._get_input_value(
-            _map, row, 'Failure Rate Method ID', 0)
-        _reliability.hazard_rate_model = self._get_input_value(
-            _map, row, 'Failure Rate Model', '')
-        _reliability.hazard_rate_specified = self._get_input_value(
-            _map, row, 'Specified Failure Rate', 0.0)
-        _reliability.hazard_rate_type_id = self._get_input_value(
-            _map, row, 'Failure Rate Type ID', 0)
-        _reliability.location_parameter = self._get_input_value(
-            _map, row, 'Location Parameter', 0.0)
-        _reliability.mtbf_specified = self._get_input_value(
-            _map, row, 'Specified MTBF', 0.0)
-        _reliability.mult_adj_factor = self._get_input_value(
-            _map, row, 'Multiplicative Adjustment Factor', 1.0)
-        _reliability.quality_id = self._get_input_value(
-            _map, row, 'Quality ID', 0)
-        _reliability.reliability_goal = self._get_input_value(
-            _map, row, 'Reliability Goal', 100.0)
-        _reliability.reliability_goal_measure_id = self._get_input_value(
-            _map, row, 'Reliability Goal Measure ID', 0)
-        _reliability.scale_parameter = self._get_input_value(
-            _map, row, 'Scale Parameter', 0.0)
-        _reliability.shape_parameter = self._get_input_value(
-            _map, row, 'Shape Parameter', 0.0)
-        _reliability.survival_analysis_id = self._get_input_value(
-            _map, row, 'Survival Analysis ID', 0)
-
-        return _reliability
-
-    def _do_insert_allocation(self, row):
-        """
-        Insert a new Allocation record to the RAMSTK db.
-
-        :param hardware: the Hardware item that was just inserted.
-        :return: _allocation; an instance of the RAMSTKAllocation database
-                 table record.
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKAllocation`
-        """
-        _allocation = RAMSTKAllocation()
-        _map = self._dic_field_map['Hardware']
-
-        _allocation.revision_id = self._get_input_value(_map, row,
-                                                        'Revision ID', 1)
-        _allocation.hardware_id = self._get_input_value(_map, row,
-                                                        'Hardware ID', 1)
-        _allocation.parent_id = self._get_input_value(_map, row,
-                                                      'Parent Assembly', 1)
-
-        return _allocation
-
-    def _do_insert_similar_item(self, row):
-        """
-        Insert a new Similar Item record to the RAMSTK db.
-
-        :param hardware: the Hardware item that was just inserted.
-        :return: _similar_item; an instance of the RAMSTKSimilarItem database
-                 table record.
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKSimilarItem`
-        """
-        _similar_item = RAMSTKSimilarItem()
-        _map = self._dic_field_map['Hardware']
-
-        _similar_item.revision_id = self._get_input_value(_map, row,
-                                                          'Revision ID', 1)
-        _similar_item.hardware_id = self._get_input_value(_map, row,
-                                                          'Hardware ID', 1)
-        _similar_item.parent_id = self._get_input_value(_map, row,
-                                                        'Parent Assembly', 1)
-
-        return _similar_item
-
-    def _do_insert_validation(self, row):
-        """
-        Insert a new Validation entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKValidation.RAMSTKValidation`
-        """
-        _validation = RAMSTKValidation()
-        _map = self._dic_field_map['Validation']
-
-        _validation.revision_id = self._get_input_value(
-            _map, row, 'Revision ID', 1)
-        _validation.validation_id = self._get_input_value(
-            _map, row, 'Validation ID', 1)
-        _validation.acceptable_maximum = self._get_input_value(
-            _map, row, 'Acceptable Maximum', 0.0)
-        _validation.acceptable_mean = self._get_input_value(
-            _map, row, 'Acceptable Mean', 0.0)
-        _validation.acceptable_minimum = self._get_input_value(
-            _map, row, 'Acceptable Minimum', 0.0)
-        _validation.acceptable_variance = self._get_input_value(
-            _map, row, 'Acceptable Variance', 0.0)
-        _validation.confidence = self._get_input_value(_map, row,
-                                                       's-Confidence', 75.0)
-        _validation.cost_average = self._get_input_value(
-            _map, row, 'Average Task Cost', 0.0)
-        _validation.cost_maximum = self._get_input_value(
-            _map, row, 'Maximum Task Cost', 0.0)
-        _validation.cost_minimum = self._get_input_value(
-            _map, row, 'Minimum Task Cost', 0.0)
-        _validation.date_start = self._get_input_value(_map, row, 'Start Date',
-                                                       date.today())
-        _validation.date_end = self._get_input_value(_map, row, 'End Date',
-                                                     date.today())
-        _validation.description = self._get_input_value(
-            _map, row, 'Task Description', '')
-        _validation.measurement_unit = self._get_input_value(
-            _map, row, 'Unit of Measure', '')
-        _validation.name = self._get_input_value(_map, row, 'Name', '')
-        _validation.status = self._get_input_value(_map, row, 'Task Status',
-                                                   0.0)
-        _validation.task_type = self._get_input_value(_map, row, 'Task Type',
-                                                      '')
-        _validation.task_specification = self._get_input_value(
-            _map, row, 'Task Specification', '')
-        _validation.time_average = self._get_input_value(
-            _map, row, 'Average Task Time', 0.0)
-        _validation.time_maximum = self._get_input_value(
-            _map, row, 'Maximum Task Time', 0.0)
-        _validation.time_minimum = self._get_input_value(
-            _map, row, 'Minimum Task Time', 0.0)
-
-        return _validation
-
     def get_db_fields(self, module):
         """
         Get the fixed field names from the field map for the requested module.
@@ -893,27 +906,41 @@ class ImportDataModel(RAMSTKDataModel):
 
         return (_db_fields, _file_fields)
 
-    @staticmethod
-    def _get_input_value(mapper, row, field, default):
+    def _do_map_fields(self, data, table):
         """
-        Retrieve the input value for a field from the Pandas dataframe.
-
-        :param dict mapper: the field mapping dict to use as the Rosetta stone.
-        :param row: the row from the pandas DataFrame containing the input data.
-        :type row: :class:`pandas.Series`
-        :param str field: the name of the RAMSTK database field to retrieve the data for.
-        :param default: the default value to assign to the field.
-        :return: _value
-        :rtype: the value of the requested input field or the default.
+        Map the input rows to records for a RAMSTK Program database table.
+
+        The field map is applied to the whole chunk of input rows at once.
+        Each mapped input column is selected, its missing values are replaced
+        with the field default, and date fields are converted in one pass.
+        Fields that aren't mapped to an input column are set to their default.
+
+        :param data: the input rows to map.
+        :type data: :class:`pandas.DataFrame`
+        :param table: the RAMSTK Program database table to map the rows to.
+        :return: the list of {attribute:value} records, one for each row.
+        :rtype: list
         """
-        try:
-            if row.at[mapper[field]] is np.nan:
-                _value = default
-            elif default == date.today():
-                _value = parser.parse(row.at[mapper[field]])
-            else:
-                _value = row.at[mapper[field]]
-        except KeyError:
-            _value = default
+        _columns = OrderedDict()
+        for _map, _field, _attribute, _default in _DIC_TABLE_FIELDS[table]:
+            if callable(_default):
+                _default = _default()
+
+            try:
+                _column = data[self._dic_field_map[_map][_field]]
+            except KeyError:
+                _columns[_attribute] = [_default] * len(data)
+                continue
+
+            if isinstance(_default, date):
+                _column = pd.to_datetime(_column).dt.date
+            _column = _column.where(_column.notnull(), _default)
+
+            # Integer columns with missing values are read as floats.
+            if (isinstance(_default, int) and _column.dtype.kind == 'f'
+                    and (_column % 1 == 0).all()):
+                _column = _column.astype(np.int64)
+
+            _columns[_attribute] = _column
 
-        return _value
+        return pd.DataFrame(_columns, index=data.index).to_dict('records')
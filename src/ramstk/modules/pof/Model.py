@@ -6,12 +6,14 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Physics of Failure Data Model."""
 
+from sqlalchemy import and_, or_
 from treelib import tree
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataModel
 from ramstk.modules.fmea import dtmMode, dtmMechanism
-from ramstk.dao import RAMSTKOpLoad, RAMSTKOpStress, RAMSTKTestMethod
+from ramstk.dao import (RAMSTKMechanism, RAMSTKMode, RAMSTKOpLoad,
+                        RAMSTKOpStress, RAMSTKTestMethod)
 
 
 class OpLoadDataModel(RAMSTKDataModel):
@@ -147,27 +149,13 @@ class OpLoadDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.data.load_id)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more operating loads in the damage "
-                    "modeling worksheet did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all operating loads in the damage "
-                "modeling worksheet.")
+        _error_msg = ("RAMSTK ERROR: One or more operating loads in the "
+                      "damage modeling worksheet did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all operating loads in the "
+                        "damage modeling worksheet.")
 
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg, key='load_id')
 
 
 class OpStressDataModel(RAMSTKDataModel):
@@ -309,25 +297,13 @@ class OpStressDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more operating stresses in the "
+                      "damage modeling worksheet did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all operating stresses in "
+                        "the damage modeling worksheet.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.data.stress_id)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more operating stresses in the "
-                        "damage modeling worksheet did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all operating stresses in the "
-                    "damage modeling worksheet.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg, key='stress_id')
 
 
 class TestMethodDataModel(RAMSTKDataModel):
@@ -469,25 +445,13 @@ class TestMethodDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more test methods in the damage "
+                      "modeling worksheet did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all test methods in the "
+                        "damage modeling worksheet.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.data.load_id)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more test methods in the damage "
-                        "modeling worksheet did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all test methods in the damage "
-                    "modeling worksheet.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg, key='load_id')
 
 
 class PhysicsOfFailureDataModel(RAMSTKDataModel):
@@ -550,17 +514,50 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         """
         Retrieve and build the Physics of Failure tree for Hardware ID.
 
+        Each of the Mechanism, OpLoad, OpStress and TestMethod tables is read
+        with a single query for the whole hardware item and the tree is then
+        assembled in memory.
+
         :param str parent_id: the Hardware ID to retrieve the Physics of
                               Failure information and build trees for.
         :return: tree; the PhysicsOfFailure treelib Tree().
         :rtype: :class:`treelib.Tree`
         """
-        _mode_id = kwargs['parent_id']
-        RAMSTKDataModel.do_select_all(self)
+        _hardware_id = kwargs['parent_id']
+        _session = RAMSTKDataModel.do_select_all(self)
 
         _modes = self.dtm_mode.do_select_all(
-            parent_id=_mode_id, functional=False).nodes
-        for _key in _modes:
+            parent_id=_hardware_id, functional=False).nodes
+
+        _mode_ids = _session.query(RAMSTKMode.mode_id).filter(
+            RAMSTKMode.hardware_id == _hardware_id)
+        _mechanisms = _session.query(RAMSTKMechanism).filter(
+            RAMSTKMechanism.mode_id.in_(_mode_ids)).order_by(
+                RAMSTKMechanism.mechanism_id).all()
+        _load_ids = _session.query(RAMSTKOpLoad.load_id).filter(
+            RAMSTKOpLoad.mechanism_id.in_(
+                _session.query(RAMSTKMechanism.mechanism_id).filter(
+                    and_(
+                        RAMSTKMechanism.mode_id.in_(_mode_ids),
+                        or_(RAMSTKMechanism.pof_include.is_(None),
+                            RAMSTKMechanism.pof_include != 0)))))
+        _oploads = _session.query(RAMSTKOpLoad).filter(
+            RAMSTKOpLoad.load_id.in_(_load_ids)).order_by(
+                RAMSTKOpLoad.load_id).all()
+        _opstresses = _session.query(RAMSTKOpStress).filter(
+            RAMSTKOpStress.load_id.in_(_load_ids)).order_by(
+                RAMSTKOpStress.stress_id).all()
+        _methods = _session.query(RAMSTKTestMethod).filter(
+            RAMSTKTestMethod.load_id.in_(_load_ids)).order_by(
+                RAMSTKTestMethod.test_id).all()
+
+        _session.close()
+
+        # Build each level of the tree in turn.  The dicts map the ID of each
+        # entity added to the tree to its Node ID so the next level can find
+        # its parent node.
+        _mode_nodes = {}
+        for _key in sorted(_modes):
             _mode = _modes[_key].data
             if _mode is not None:
                 _node_id = '0.{0:d}'.format(_mode.mode_id)
@@ -569,115 +566,55 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
                     identifier=_node_id,
                     parent=0,
                     data=_mode)
-
-                self._do_add_mechanisms(_mode.mode_id, _node_id)
-
-        return self.tree
-
-    def _do_add_mechanisms(self, mode_id, parent_id):
-        """
-        Add the failure mechanisms to Physics of Failure tree for Mode ID.
-
-        :param int mechanism_id: the Mechanism ID to add the operating loads
-                                 to.
-        :param str parent_id: the Node ID to add the operating loads to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _mechanisms = self.dtm_mechanism.do_select_all(
-            parent_id=mode_id, pof=True).nodes
-        for _key in _mechanisms:
-            _mechanism = _mechanisms[_key].data
-            if _mechanism is not None and _mechanism.pof_include:
-                _node_id = '{0:s}.{1:d}'.format(parent_id,
+                _mode_nodes[_mode.mode_id] = _node_id
+
+        _mechanism_nodes = {}
+        for _mechanism in self.dtm_mechanism.do_load_tree(
+                _mechanisms, 'description', 'mechanism_id'):
+            if _mechanism.pof_include:
+                _parent_id = _mode_nodes[_mechanism.mode_id]
+                _node_id = '{0:s}.{1:d}'.format(_parent_id,
                                                 _mechanism.mechanism_id)
                 self.tree.create_node(
                     tag=_mechanism.description,
                     identifier=_node_id,
-                    parent=parent_id,
+                    parent=_parent_id,
                     data=_mechanism)
+                _mechanism_nodes[_mechanism.mechanism_id] = _node_id
 
-                self._do_add_oploads(_mechanism.mechanism_id, _node_id)
-
-        return self.tree
-
-    def _do_add_oploads(self, mechanism_id, parent_id):
-        """
-        Add the operating loads to Physics of Failure tree for Mechanism ID.
-
-        :param int mechanism_id: the Mechanism ID to add the operating loads
-                                 to.
-        :param str parent_id: the Node ID to add the operating loads to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _oploads = self.dtm_opload.do_select_all(parent_id=mechanism_id).nodes
-        for _key in _oploads:
-            _opload = _oploads[_key].data
-            if _opload is not None:
-                _node_id = '{0:s}.{1:d}'.format(parent_id, _opload.load_id)
-                self.tree.create_node(
-                    tag=_opload.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_opload)
-
-                self._do_add_opstress(_opload.load_id, _node_id)
-                self._do_add_test_methods(_opload.load_id, _node_id)
-
-        return _return
-
-    def _do_add_opstress(self, load_id, parent_id):
-        """
-        Add the operating stresses to the PhysicsOfFailure tree for Load ID.
-
-        :param int load_id: the Load ID to add the operating stresses to.
-        :param str parent_id: the Node ID to add the operating stresses to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
-
-        _opstresses = self.dtm_opstress.do_select_all(parent_id=load_id).nodes
-
-        for _key in _opstresses:
-            _opstress = _opstresses[_key].data
-            if _opstress is not None:
-                _node_id = '{0:s}.{1:d}s'.format(parent_id,
-                                                 _opstress.stress_id)
-                self.tree.create_node(
-                    tag=_opstress.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_opstress)
-
-        return _return
-
-    def _do_add_test_methods(self, load_id, parent_id):
-        """
-        Add the test methods to the PhysicsOfFailure tree for Stress ID.
-
-        :param int load_id: the Operating Load ID to add the test method to.
-        :param str parent_id: the Node ID to add the test method to.
-        :return: False if successful or True if an error is encountered.
-        :rtype: bool
-        """
-        _return = False
+        _load_nodes = {}
+        for _opload in self.dtm_opload.do_load_tree(_oploads, 'description',
+                                                    'load_id'):
+            _parent_id = _mechanism_nodes[_opload.mechanism_id]
+            _node_id = '{0:s}.{1:d}'.format(_parent_id, _opload.load_id)
+            self.tree.create_node(
+                tag=_opload.description,
+                identifier=_node_id,
+                parent=_parent_id,
+                data=_opload)
+            _load_nodes[_opload.load_id] = _node_id
+
+        for _opstress in self.dtm_opstress.do_load_tree(
+                _opstresses, 'description', 'stress_id'):
+            _parent_id = _load_nodes[_opstress.load_id]
+            _node_id = '{0:s}.{1:d}s'.format(_parent_id, _opstress.stress_id)
+            self.tree.create_node(
+                tag=_opstress.description,
+                identifier=_node_id,
+                parent=_parent_id,
+                data=_opstress)
 
-        _methods = self.dtm_testmethod.do_select_all(parent_id=load_id).nodes
-        for _key in _methods:
-            _method = _methods[_key].data
-            if _method is not None:
-                _node_id = '{0:s}.{1:d}t'.format(parent_id, _method.test_id)
-                self.tree.create_node(
-                    tag=_method.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_method)
+        for _method in self.dtm_testmethod.do_load_tree(
+                _methods, 'description', 'test_id'):
+            _parent_id = _load_nodes[_method.load_id]
+            _node_id = '{0:s}.{1:d}t'.format(_parent_id, _method.test_id)
+            self.tree.create_node(
+                tag=_method.description,
+                identifier=_node_id,
+                parent=_parent_id,
+                data=_method)
 
-        return _return
+        return self.tree
 
     def do_insert(self, **kwargs):
         """
@@ -787,22 +724,10 @@ class PhysicsOfFailureDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
+        _error_msg = ("RAMSTK ERROR: One or more line items in the damage "
+                      "modeling worksheet did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all line items in the "
+                        "damage modeling worksheet.")
 
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the damage "
-                        "modeling worksheet did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all line items in the damage "
-                    "modeling worksheet.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
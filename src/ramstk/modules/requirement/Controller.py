@@ -10,7 +10,7 @@ from pubsub import pub
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKSparseDataMatrix
 from ramstk.dao import RAMSTKRequirement, RAMSTKHardware, RAMSTKSoftware, RAMSTKValidation
 from . import dtmRequirement
 
@@ -46,12 +46,12 @@ class RequirementDataController(RAMSTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_rqmt_hw_matrix = RAMSTKDataMatrix(dao, RAMSTKRequirement,
-                                                    RAMSTKHardware)
-        self._dmx_rqmt_sw_matrix = RAMSTKDataMatrix(dao, RAMSTKRequirement,
-                                                    RAMSTKSoftware)
-        self._dmx_rqmt_val_matrix = RAMSTKDataMatrix(dao, RAMSTKRequirement,
-                                                     RAMSTKValidation)
+        self._dmx_rqmt_hw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKRequirement, RAMSTKHardware)
+        self._dmx_rqmt_sw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKRequirement, RAMSTKSoftware)
+        self._dmx_rqmt_val_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKRequirement, RAMSTKValidation)
 
         # Initialize public dictionary attributes.
 
@@ -94,10 +94,10 @@ class RequirementDataController(RAMSTKDataController):
                                 rqrmnt_sftwr = Requirement:Software
                                 rqrmnt_vldtn = Requirement:Validation
 
-        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas Dataframe,
-                 noun names to use for column headings, noun names to use for
-                 row headings.
-        :rtype: (:class:`pandas.DataFrame`, dict, dict)
+        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas
+                 SparseDataFrame, noun names to use for column headings, noun
+                 names to use for row headings.
+        :rtype: (:class:`pandas.SparseDataFrame`, dict, dict)
         """
         _matrix = None
         _column_hdrs = []
@@ -111,7 +111,7 @@ class RequirementDataController(RAMSTKDataController):
                 ckey='hardware_id',
                 rheader='requirement_code',
                 cheader='comp_ref_des')
-            _matrix = self._dmx_rqmt_hw_matrix.dtf_matrix
+            _matrix = self._dmx_rqmt_hw_matrix.sdf_matrix
             _column_hdrs = self._dmx_rqmt_hw_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_rqmt_hw_matrix.dic_row_hdrs
 
@@ -123,7 +123,7 @@ class RequirementDataController(RAMSTKDataController):
                 ckey='software_id',
                 rheader='requirement_code',
                 cheader='description')
-            _matrix = self._dmx_rqmt_sw_matrix.dtf_matrix
+            _matrix = self._dmx_rqmt_sw_matrix.sdf_matrix
             _column_hdrs = self._dmx_rqmt_sw_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_rqmt_sw_matrix.dic_row_hdrs
 
@@ -135,12 +135,23 @@ class RequirementDataController(RAMSTKDataController):
                 ckey='validation_id',
                 rheader='requirement_code',
                 cheader='name')
-            _matrix = self._dmx_rqmt_val_matrix.dtf_matrix
+            _matrix = self._dmx_rqmt_val_matrix.sdf_matrix
             _column_hdrs = self._dmx_rqmt_val_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_rqmt_val_matrix.dic_row_hdrs
 
         return (_matrix, _column_hdrs, _row_hdrs)
 
+    def request_do_select_children(self, node_id):
+        """
+        Request the immediate children of the passed Requirement ID.
+
+        :param int node_id: the PyPubSub Tree() ID of the Requirement to
+                            select the children for.
+        :return: a list of the immediate child nodes.
+        :rtype: list
+        """
+        return self._dtm_data_model.do_select_children(node_id)
+
     def request_do_insert(self, **kwargs):
         """
         Request to add an RAMSTKRequirement table record.
@@ -253,6 +264,41 @@ class RequirementDataController(RAMSTKDataController):
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
                                                       'deletedMatrix')
 
+    def request_do_set_matrix(self, matrix_type, column_item_id,
+                              row_item_id, value):
+        """
+        Request to set the value of a cell in the selected Data Matrix.
+
+        :param str matrix_type: the type of the Matrix to set the cell in.
+                                Current Requirement matrix types are:
+
+                                rqrmnt_hrdwr = Requirement:Hardware
+                                rqrmnt_sftwr = Requirement:Software
+                                rqrmnt_vldtn = Requirement:Validation
+
+        :param int column_item_id: the ID of the column item of the cell.
+        :param int row_item_id: the ID of the row item of the cell.
+        :param int value: the new value of the cell.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        if matrix_type == 'rqrmnt_hrdwr':
+            _error_code, _msg = self._dmx_rqmt_hw_matrix.do_set(
+                column_item_id, row_item_id, value)
+        elif matrix_type == 'rqrmnt_sftwr':
+            _error_code, _msg = self._dmx_rqmt_sw_matrix.do_set(
+                column_item_id, row_item_id, value)
+        elif matrix_type == 'rqrmnt_vldtn':
+            _error_code, _msg = self._dmx_rqmt_val_matrix.do_set(
+                column_item_id, row_item_id, value)
+        else:
+            _error_code = 6
+            _msg = 'RAMSTK ERROR: Attempted to set a cell in non-existent ' \
+                   'matrix {0:s}.'.format(matrix_type)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
     def request_do_update(self, node_id):
         """
         Request to update an RAMSTKRequirement table record.
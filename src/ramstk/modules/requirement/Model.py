@@ -20,6 +20,9 @@ class RequirementDataModel(RAMSTKDataModel):
     """
 
     _tag = 'Requirements'
+    _table = RAMSTKRequirement
+    _table_key = 'requirement_id'
+    _table_tag = 'requirement_code'
 
     def __init__(self, dao):
         """
@@ -51,27 +54,48 @@ class RequirementDataModel(RAMSTKDataModel):
         the connected RAMSTK Program database.  It then adds each to the
         Requirement data model treelib.Tree().
 
+        When depth is passed only the top levels of the Requirement tree are
+        loaded, one query per level.  The rest is loaded as each Requirement
+        is expanded with do_select_children().
+
+        :param int revision_id: the Revision ID to select the Requirements
+                                for.
+        :param int depth: the number of levels of the Requirement tree to
+                          load.  Default is to load the entire tree.
         :return: tree; the Tree() of RAMSTKRequirement data models.
         :rtype: :class:`treelib.Tree`
         """
         _revision_id = kwargs['revision_id']
+        try:
+            _depth = kwargs['depth']
+        except KeyError:
+            _depth = None
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _requirement in _session.query(RAMSTKRequirement).filter(
-                RAMSTKRequirement.revision_id == _revision_id).all():
-            # We get and then set the attributes to replace any None values
-            # (NULL fields in the database) with their default value.
-            _attributes = _requirement.get_attributes()
-            _requirement.set_attributes(_attributes)
-            self.tree.create_node(
-                _requirement.requirement_code,
-                _requirement.requirement_id,
-                parent=_requirement.parent_id,
-                data=_requirement)
-
-            # pylint: disable=attribute-defined-outside-init
-            # It is defined in RAMSTKDataModel.__init__
-            self.last_id = max(self.last_id, _requirement.requirement_id)
+        self._revision_id = _revision_id
+        if _depth is not None:
+            self._do_select_levels(_session, _depth)
+        else:
+            self._set_expanded = None
+            for _requirement in self.dao.db_select_cached(
+                    _session.query(RAMSTKRequirement).filter(
+                        RAMSTKRequirement.revision_id == _revision_id),
+                    revision_id=_revision_id):
+                # We get and then set the attributes to replace any None
+                # values (NULL fields in the database) with their default
+                # value.
+                _attributes = _requirement.get_attributes()
+                _requirement.set_attributes(_attributes)
+                self.tree.create_node(
+                    _requirement.requirement_code,
+                    _requirement.requirement_id,
+                    parent=_requirement.parent_id,
+                    data=_requirement)
+
+                # pylint: disable=attribute-defined-outside-init
+                # It is defined in RAMSTKDataModel.__init__
+                self.last_id = max(self.last_id,
+                                   _requirement.requirement_id)
 
         _session.close()
 
@@ -152,22 +176,10 @@ class RequirementDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
+        _error_msg = ("RAMSTK ERROR: One or more records in the requirement "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "requirement table.")
 
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the requirement "
-                        "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the requirement "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
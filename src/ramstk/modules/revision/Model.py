@@ -147,19 +147,8 @@ class RevisionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(
-                    _node.data.revision_id)
-                _msg = _msg + _debug_msg + '\n'
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more Revisions did not update.")
+        _error_msg = ("RAMSTK ERROR: One or more Revisions did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all Revisions.")
 
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all Revisions.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg, key='revision_id')
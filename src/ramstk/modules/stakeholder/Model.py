@@ -58,8 +58,10 @@ class StakeholderDataModel(RAMSTKDataModel):
         _revision_id = kwargs['revision_id']
         _session = RAMSTKDataModel.do_select_all(self, **kwargs)
 
-        for _stakeholder in _session.query(RAMSTKStakeholder).filter(
-                RAMSTKStakeholder.revision_id == _revision_id).all():
+        for _stakeholder in self.dao.db_select_cached(
+                _session.query(RAMSTKStakeholder).filter(
+                    RAMSTKStakeholder.revision_id == _revision_id),
+                revision_id=_revision_id):
             self.tree.create_node(
                 _stakeholder.description,
                 _stakeholder.stakeholder_id,
@@ -151,25 +153,13 @@ class StakeholderDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more records in the stakeholder "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "stakeholder table.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the stakeholder "
-                        "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the stakeholder "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
     def do_calculate(self, node_id, **kwargs):  # pylint: disable=unused-argument
         """
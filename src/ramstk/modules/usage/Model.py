@@ -10,6 +10,10 @@
 from ramstk.modules import RAMSTKDataModel
 from ramstk.dao import RAMSTKEnvironment, RAMSTKMission, RAMSTKMissionPhase
 
+# The offset of each level in the Usage Profile Node IDs.  See
+# UsageProfileDataModel.get_node_id().
+_DIC_LEVEL_OFFSET = {'mission': 0, 'phase': 1, 'environment': 2}
+
 
 class UsageProfileDataModel(RAMSTKDataModel):
     """
@@ -20,17 +24,17 @@ class UsageProfileDataModel(RAMSTKDataModel):
     relationship, such as:
 
         * Mission 1
-            - Mission Phase 11
-                + Environment 111
-                + Environment 112
-                + Environment 113
-            - Mission Phase 12
-                + Environment 121
-                + Environment 122
+            - Mission Phase 1
+                + Environment 1
+                + Environment 2
+                + Environment 3
+            - Mission Phase 2
+                + Environment 4
+                + Environment 5
         * Mission 2
-            - Mission Phase 21
-                + Environment 211
-                + Environment 212
+            - Mission Phase 3
+                + Environment 6
+                + Environment 7
     """
 
     _tag = 'Usage Profiles'
@@ -64,68 +68,92 @@ class UsageProfileDataModel(RAMSTKDataModel):
         """
         Retrieve and build the Usage Profile tree for Revision ID.
 
+        The Mission, Mission Phase and Environment tables are each read with a
+        single query for the whole Revision and the tree is then assembled in
+        memory.  The Node ID of each entity is given by get_node_id().
+
         :param int revision_id: the Revision ID to retrieve the Usage Profile
                                 and build trees for.
         :return: tree; the Usage Profile treelib Tree().
         :rtype: :py:class:`treelib.Tree`
         """
         _revision_id = kwargs['revision_id']
-        RAMSTKDataModel.do_select_all(self, **kwargs)
-
-        # Build the tree.  We concatenate the Mission ID and the Phase ID to
-        # create the Node() identifier for Mission Phases.  This prevents the
-        # likely case when the first Mission and Phase have the same ID (1) in
-        # the database from causing problems when building the tree.  Do the
-        # same for the environment by concatenating the Environment ID with the
-        # Mission ID and Phase ID.
-        _missions = self.dtm_mission.do_select_all(
-            revision_id=_revision_id).nodes
-
-        # pylint: disable=too-many-nested-blocks
-        for _mkey in _missions:
-            _mission = _missions[_mkey].data
-            if _mission is not None:
-                self.tree.create_node(
-                    tag=_mission.description,
-                    identifier=_mission.mission_id,
-                    parent=0,
-                    data=_mission)
-
-                # Add the phases, if any, to the mission.
-                _phases = self.dtm_phase.do_select_all(
-                    mission_id=_mission.mission_id).nodes
-                for _pkey in _phases:
-                    _phase = _phases[_pkey].data
-                    if _phase is not None:
-                        _phase_id = int(
-                            str(_mission.mission_id) + str(_phase.phase_id))
-                        self.tree.create_node(
-                            tag=_phase.description,
-                            identifier=_phase_id,
-                            parent=_mission.mission_id,
-                            data=_phase)
-
-                        # Add the environments, if any, to the phase.
-                        _environments = self.dtm_environment.do_select_all(
-                            phase_id=_phase.phase_id).nodes
-                        for _ekey in _environments:
-                            _environment = _environments[_ekey].data
-                            if _environment is not None:
-                                _env_id = int(
-                                    str(_mission.mission_id) +
-                                    str(_phase.phase_id) +
-                                    str(_environment.environment_id))
-                                # The parent must be the concatenated phase ID
-                                # used in the tree above, not the Phase ID
-                                # attribute of the RAMSTKPhase object.
-                                self.tree.create_node(
-                                    tag=_environment.name,
-                                    identifier=_env_id,
-                                    parent=_phase_id,
-                                    data=_environment)
+        _session = RAMSTKDataModel.do_select_all(self, **kwargs)
+
+        _mission_ids = _session.query(RAMSTKMission.mission_id).filter(
+            RAMSTKMission.revision_id == _revision_id)
+        _phase_ids = _session.query(RAMSTKMissionPhase.phase_id).filter(
+            RAMSTKMissionPhase.mission_id.in_(_mission_ids))
+
+        _missions = _session.query(RAMSTKMission).filter(
+            RAMSTKMission.revision_id == _revision_id).order_by(
+                RAMSTKMission.mission_id).all()
+        _phases = _session.query(RAMSTKMissionPhase).filter(
+            RAMSTKMissionPhase.mission_id.in_(_mission_ids)).order_by(
+                RAMSTKMissionPhase.phase_id).all()
+        _environments = _session.query(RAMSTKEnvironment).filter(
+            RAMSTKEnvironment.phase_id.in_(_phase_ids)).order_by(
+                RAMSTKEnvironment.environment_id).all()
+
+        _session.close()
+
+        for _mission in self.dtm_mission.do_load_tree(
+                _missions, 'description', 'mission_id'):
+            self.tree.create_node(
+                tag=_mission.description,
+                identifier=self.get_node_id('mission', _mission.mission_id),
+                parent=0,
+                data=_mission)
+
+        for _phase in self.dtm_phase.do_load_tree(_phases, 'name',
+                                                  'phase_id'):
+            self.tree.create_node(
+                tag=_phase.description,
+                identifier=self.get_node_id('phase', _phase.phase_id),
+                parent=self.get_node_id('mission', _phase.mission_id),
+                data=_phase)
+
+        for _environment in self.dtm_environment.do_load_tree(
+                _environments, 'name', 'environment_id'):
+            self.tree.create_node(
+                tag=_environment.name,
+                identifier=self.get_node_id('environment',
+                                            _environment.environment_id),
+                parent=self.get_node_id('phase', _environment.phase_id),
+                data=_environment)
 
         return self.tree
 
+    @staticmethod
+    def get_node_id(level, entity_id):
+        """
+        Retrieve the Node ID of a Usage Profile entity.
+
+        Missions, Mission Phases and Environments are numbered independently
+        in the RAMSTK Program database, so the Node ID is the entity's ID times
+        the number of levels plus the level's offset.  This keeps the Node IDs
+        unique whatever the number of digits in the IDs and lets an entity be
+        found in the tree directly from its level and ID.
+
+        :param str level: the level of the entity; one of mission, phase, or
+                          environment.
+        :param int entity_id: the Mission ID, Phase ID, or Environment ID.
+        :return: the Node ID of the entity in the Usage Profile tree.
+        :rtype: int
+        """
+        return entity_id * len(_DIC_LEVEL_OFFSET) + _DIC_LEVEL_OFFSET[level]
+
+    def do_select_entity(self, level, entity_id):
+        """
+        Retrieve the Mission, Mission Phase, or Environment with ID.
+
+        :param str level: the level of the entity; one of mission, phase, or
+                          environment.
+        :param int entity_id: the Mission ID, Phase ID, or Environment ID.
+        :return: the entity or None if it is not in the Usage Profile.
+        """
+        return self.do_select(self.get_node_id(level, entity_id))
+
     def do_insert(self, **kwargs):
         """
         Add an entity to the Usage Profile and RAMSTK Program database..
@@ -170,13 +198,13 @@ class UsageProfileDataModel(RAMSTKDataModel):
 
         if _level == 'mission':
             _tag = _entity.description
-            _node_id = _entity.mission_id
+            _node_id = self.get_node_id(_level, _entity.mission_id)
         elif _level == 'phase':
             _tag = _entity.name
-            _node_id = int(str(_parent_id) + str(_entity.phase_id))
+            _node_id = self.get_node_id(_level, _entity.phase_id)
         elif _level == 'environment':
             _tag = _entity.name
-            _node_id = int(str(_parent_id) + str(_entity.environment_id))
+            _node_id = self.get_node_id(_level, _entity.environment_id)
 
         if _error_code == 0:
             self.tree.create_node(
@@ -237,24 +265,13 @@ class UsageProfileDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
+        _error_msg = ("RAMSTK ERROR: One or more line items in the usage "
+                      "profile did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all line items in the usage "
+                        "profile.")
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more line items in the usage "
-                        "profile did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all line items in the usage "
-                    "profile.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class MissionDataModel(RAMSTKDataModel):
@@ -397,27 +414,13 @@ class MissionDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more records in the usage profile "
+                      "mission table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the usage "
+                        "profile mission table.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the usage profile "
-                    "mission table did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the usage profile "
-                "mission table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class MissionPhaseDataModel(RAMSTKDataModel):
@@ -552,27 +555,13 @@ class MissionPhaseDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more records in the usage profile "
+                      "mission phase table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the usage "
+                        "profile mission phase table.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the usage profile "
-                    "mission phase table did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the usage profile "
-                "mission phase table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
 
 class EnvironmentDataModel(RAMSTKDataModel):
@@ -712,24 +701,10 @@ class EnvironmentDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
+        _error_msg = ("RAMSTK ERROR: One or more records in the usage profile "
+                      "environment table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the usage "
+                        "profile environment table.")
 
-                _msg = _msg + _debug_msg + '\n'
-
-            except AttributeError:
-                _error_code = 1
-                _msg = (
-                    "RAMSTK ERROR: One or more records in the usage profile "
-                    "environment table did not update.")
-
-        if _error_code == 0:
-            _msg = (
-                "RAMSTK SUCCESS: Updating all records in the usage profile "
-                "environment table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
@@ -10,7 +10,7 @@ from pubsub import pub
 
 # Import other RAMSTK modules.
 from ramstk.modules import RAMSTKDataController
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKSparseDataMatrix
 from ramstk.dao import RAMSTKHardware, RAMSTKRequirement, RAMSTKValidation
 from . import dtmValidation
 
@@ -45,10 +45,10 @@ class ValidationDataController(RAMSTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_vldtn_rqrmnt_matrix = RAMSTKDataMatrix(
+        self._dmx_vldtn_rqrmnt_matrix = RAMSTKSparseDataMatrix(
             dao, RAMSTKValidation, RAMSTKRequirement)
-        self._dmx_vldtn_hw_matrix = RAMSTKDataMatrix(dao, RAMSTKValidation,
-                                                     RAMSTKHardware)
+        self._dmx_vldtn_hw_matrix = RAMSTKSparseDataMatrix(
+            dao, RAMSTKValidation, RAMSTKHardware)
 
         # Initialize public dictionary attributes.
 
@@ -90,10 +90,10 @@ class ValidationDataController(RAMSTKDataController):
 
                                 vldtn_hrdwr = Requirement:Hardware
 
-        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas Dataframe,
-                 noun names to use for column headings, noun names to use for
-                 row headings.
-        :rtype: (:class:`pandas.DataFrame`, dict, dict)
+        :return: (_matrix, _column_hdrs, _row_hdrs); the Pandas
+                 SparseDataFrame, noun names to use for column headings, noun
+                 names to use for row headings.
+        :rtype: (:class:`pandas.SparseDataFrame`, dict, dict)
         """
         _matrix = None
         _column_hdrs = []
@@ -107,7 +107,7 @@ class ValidationDataController(RAMSTKDataController):
                 ckey='requirement_id',
                 rheader='description',
                 cheader='requirement_code')
-            _matrix = self._dmx_vldtn_rqrmnt_matrix.dtf_matrix
+            _matrix = self._dmx_vldtn_rqrmnt_matrix.sdf_matrix
             _column_hdrs = self._dmx_vldtn_rqrmnt_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_vldtn_rqrmnt_matrix.dic_row_hdrs
         elif matrix_type == 'vldtn_hrdwr':
@@ -118,7 +118,7 @@ class ValidationDataController(RAMSTKDataController):
                 ckey='hardware_id',
                 rheader='description',
                 cheader='comp_ref_des')
-            _matrix = self._dmx_vldtn_hw_matrix.dtf_matrix
+            _matrix = self._dmx_vldtn_hw_matrix.sdf_matrix
             _column_hdrs = self._dmx_vldtn_hw_matrix.dic_column_hdrs
             _row_hdrs = self._dmx_vldtn_hw_matrix.dic_row_hdrs
 
@@ -226,6 +226,37 @@ class ValidationDataController(RAMSTKDataController):
         return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
                                                       'deletedMatrix')
 
+    def request_do_set_matrix(self, matrix_type, column_item_id,
+                              row_item_id, value):
+        """
+        Request to set the value of a cell in the selected Data Matrix.
+
+        :param str matrix_type: the type of the Matrix to set the cell in.
+                                Current Validation matrix types are:
+
+                                vldtn_rqrmnt = Validation:Requirement
+                                vldtn_hrdwr = Validation:Hardware
+
+        :param int column_item_id: the ID of the column item of the cell.
+        :param int row_item_id: the ID of the row item of the cell.
+        :param int value: the new value of the cell.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+        if matrix_type == 'vldtn_rqrmnt':
+            _error_code, _msg = self._dmx_vldtn_rqrmnt_matrix.do_set(
+                column_item_id, row_item_id, value)
+        elif matrix_type == 'vldtn_hrdwr':
+            _error_code, _msg = self._dmx_vldtn_hw_matrix.do_set(
+                column_item_id, row_item_id, value)
+        else:
+            _error_code = 6
+            _msg = 'RAMSTK ERROR: Attempted to set a cell in non-existent ' \
+                   'matrix {0:s}.'.format(matrix_type)
+
+        return RAMSTKDataController.do_handle_results(self, _error_code, _msg,
+                                                      None)
+
     def request_do_update(self, node_id):
         """
         Request to update an RAMSTKValidation table record.
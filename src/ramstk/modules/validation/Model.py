@@ -77,8 +77,10 @@ class ValidationDataModel(RAMSTKDataModel):
         _revision_id = kwargs['revision_id']
         _session = RAMSTKDataModel.do_select_all(self)
 
-        for _validation in _session.query(RAMSTKValidation).filter(
-                RAMSTKValidation.revision_id == _revision_id).all():
+        for _validation in self.dao.db_select_cached(
+                _session.query(RAMSTKValidation).filter(
+                    RAMSTKValidation.revision_id == _revision_id),
+                revision_id=_revision_id):
             # We get and then set the attributes to replace any None values
             # (NULL fields in the database) with their default value.
             _attributes = _validation.get_attributes()
@@ -203,25 +205,13 @@ class ValidationDataModel(RAMSTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _debug_msg = self.do_update(_node.identifier)
-
-                _msg = _msg + _debug_msg + '\n'
+        _error_msg = ("RAMSTK ERROR: One or more records in the validation "
+                      "table did not update.")
+        _success_msg = ("RAMSTK SUCCESS: Updating all records in the "
+                        "validation table.")
 
-            except AttributeError:
-                _error_code = 1
-                _msg = ("RAMSTK ERROR: One or more records in the validation "
-                        "table did not update.")
-
-        if _error_code == 0:
-            _msg = ("RAMSTK SUCCESS: Updating all records in the validation "
-                    "table.")
-
-        return _error_code, _msg
+        return self._do_update_all(
+            self.tree.all_nodes(), _error_msg, _success_msg)
 
     def do_update_status(self):
         """
@@ -235,11 +225,8 @@ class ValidationDataModel(RAMSTKDataModel):
 
         _node_id = date_to_ordinal(date.today())
 
-        _session = self.dao.RAMSTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_get_session(
+            autoflush=True, autocommit=False, expire_on_commit=False)
 
         try:
             _entity = self.status_tree.get_node(_node_id).data
@@ -251,7 +238,7 @@ class ValidationDataModel(RAMSTKDataModel):
             _msg = 'RAMSTK ERROR: Attempted to save non-existent Program ' \
                    'Status for date {0:s}.'.format(str(_node_id))
 
-        _session.close()
+        self.dao.db_release_session(_session)
 
         return _error_code, _msg
 
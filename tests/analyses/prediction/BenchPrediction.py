@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       tests/analyses/prediction/BenchPrediction.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+#
+"""
+Helper script for timing the per-part cost of the hazard rate calculations.
+
+Invocation:
+
+    python tests/analyses/prediction/BenchPrediction.py <OPTIONS>
+
+    where <OPTIONS> are:
+
+        -n, --number    the number of calls to time for each calculation
+        -r, --repeat    the number of times to repeat each timing; the best
+                        is reported
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+from optparse import OptionParser
+
+from ramstk.analyses.data import HARDWARE_ATTRIBUTES
+from ramstk.analyses.prediction import (Capacitor, Component,
+                                        IntegratedCircuit, Resistor,
+                                        Semiconductor)
+
+# Each entry is the label, the function to time and the attribute values to
+# call it with.
+BENCHMARKS = [
+    ('Capacitor part count', Capacitor.calculate_217f_part_count, {
+        'subcategory_id': 1,
+        'specification_id': 1,
+        'environment_active_id': 4,
+        'quality_id': 2
+    }),
+    ('Capacitor part stress', Capacitor.calculate_217f_part_stress, {
+        'subcategory_id': 1,
+        'temperature_rated_max': 85.0,
+        'voltage_ratio': 0.5,
+        'capacitance': 1.0E-6,
+        'environment_active_id': 4,
+        'quality_id': 2
+    }),
+    ('Resistor part count', Resistor.calculate_217f_part_count, {
+        'subcategory_id': 1,
+        'environment_active_id': 4,
+        'quality_id': 2
+    }),
+    ('Resistor part stress', Resistor.calculate_217f_part_stress, {
+        'subcategory_id': 1,
+        'power_ratio': 0.5,
+        'n_elements': 1000,
+        'environment_active_id': 4,
+        'quality_id': 2
+    }),
+    ('Semiconductor part count', Semiconductor.calculate_217f_part_count, {
+        'subcategory_id': 1,
+        'type_id': 1,
+        'environment_active_id': 4,
+        'quality_id': 2
+    }),
+    ('IC part count', IntegratedCircuit.calculate_217f_part_count, {
+        'subcategory_id': 1,
+        'technology_id': 1,
+        'n_elements': 100,
+        'environment_active_id': 4,
+        'quality_id': 2
+    }),
+    ('IC temperature factor', IntegratedCircuit._calculate_temperature_factor,
+     {
+         'subcategory_id': 1,
+         'temperature_case': 45.0,
+         'power_operating': 0.1,
+         'theta_jc': 10.0
+     }),
+    ('Dormant hazard rate', Component.do_calculate_dormant_hazard_rate, {
+        'category_id': 4,
+        'subcategory_id': 1,
+        'environment_active_id': 4,
+        'environment_dormant_id': 3,
+        'hazard_rate_active': 0.1
+    }),
+]
+
+
+def do_parse_args():
+    """Parse command line arguments."""
+    parser = OptionParser()
+    parser.add_option(
+        "-n",
+        "--number",
+        type='int',
+        dest='number',
+        default=20000,
+        help="the number of calls to time for each calculation")
+    parser.add_option(
+        "-r",
+        "--repeat",
+        type='int',
+        dest='repeat',
+        default=5,
+        help="the number of times to repeat each timing")
+
+    return parser.parse_args()
+
+
+def main():
+    """Time each calculation and print the cost per part in microseconds."""
+    (options, __) = do_parse_args()
+
+    for _label, _function, _values in BENCHMARKS:
+        _attributes = HARDWARE_ATTRIBUTES.copy()
+        _attributes.update(_values)
+        _seconds = min(
+            timeit.repeat(
+                lambda: _function(**_attributes),
+                number=options.number,
+                repeat=options.repeat))
+        print('{0:<28s}{1:8.2f} us/part'.format(
+            _label, 1.0E6 * _seconds / options.number))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.prediction.test_partcount.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the batch parts count module."""
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from ramstk.analyses.data import HARDWARE_ATTRIBUTES
+from ramstk.analyses.prediction import Component, PartCount
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+SUBCATEGORIES = {
+    1: 9,
+    2: 13,
+    3: 15,
+    4: 19,
+    5: 4,
+    6: 2,
+    7: 5,
+    8: 5,
+    9: 2,
+    10: 4
+}
+
+
+def _do_make_bom(n_parts):
+    """Build a list of hardware attributes for random parts."""
+    _random = np.random.RandomState(2018)
+    _records = []
+    for _hardware_id in range(n_parts):
+        _attributes = HARDWARE_ATTRIBUTES.copy()
+        _category_id = _random.randint(1, 11)
+        _attributes['hardware_id'] = _hardware_id
+        _attributes['category_id'] = _category_id
+        _attributes['subcategory_id'] = _random.randint(
+            1, SUBCATEGORIES[_category_id] + 1)
+        _attributes['environment_active_id'] = _random.randint(1, 15)
+        _attributes['quality_id'] = _random.randint(1, 4)
+        _attributes['n_elements'] = _random.randint(1, 300000)
+        _attributes['piQ'] = 1.0
+        for _key in [
+                'specification_id', 'type_id', 'family_id',
+                'construction_id', 'application_id', 'technology_id'
+        ]:
+            _attributes[_key] = _random.randint(1, 3)
+
+        # Skip the combinations the scalar functions can't calculate.
+        try:
+            Component.do_calculate_217f_part_count(**_attributes.copy())
+        except IndexError:
+            continue
+        _records.append(_attributes)
+
+    return _records
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_count_matches_scalar():
+    """calculate_217f_part_count() should return the same values as the scalar functions for every part."""
+    _records = _do_make_bom(2000)
+
+    _results = PartCount.calculate_217f_part_count(
+        PartCount.do_build_columns(_records))
+
+    assert isinstance(_results, pd.DataFrame)
+    for _idx, _attributes in enumerate(_records):
+        _attributes, _msg = Component.do_calculate_217f_part_count(
+            **_attributes.copy())
+        assert _results['lambda_b'][_idx] == _attributes['lambda_b']
+        assert _results['piQ'][_idx] == _attributes['piQ']
+        assert (_results['hazard_rate_active'][_idx] ==
+                _attributes['hazard_rate_active'])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_count_arrays():
+    """calculate_217f_part_count() should return a dict of arrays when passed a dict of arrays."""
+    _results = PartCount.calculate_217f_part_count({
+        'category_id': np.array([4, 4, 3]),
+        'subcategory_id': np.array([1, 3, 1]),
+        'specification_id': np.array([2, 0, 0]),
+        'environment_active_id': np.array([1, 4, 2]),
+        'quality_id': np.array([4, 1, 2])
+    })
+
+    assert isinstance(_results, dict)
+    np.testing.assert_array_equal(_results['lambda_b'],
+                                  [0.0039, 0.010, 0.0022])
+    np.testing.assert_array_equal(_results['piQ'], [1.0, 0.030, 0.1])
+    np.testing.assert_array_equal(_results['hazard_rate_active'],
+                                  [0.0039, 0.010 * 0.030, 0.0022 * 0.1])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_count_outside_tables():
+    """calculate_217f_part_count() should fall back to the scalar functions for IDs outside the compiled tables."""
+    _results = PartCount.calculate_217f_part_count({
+        'category_id': [3],
+        'subcategory_id': [1],
+        'specification_id': [0],
+        'environment_active_id': [40],
+        'quality_id': [2]
+    })
+
+    assert _results['lambda_b'][0] == 0.0
+    assert _results['piQ'][0] == 0.1
+    assert _results['hazard_rate_active'][0] == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_count_empty():
+    """calculate_217f_part_count() should return empty arrays for an empty BoM."""
+    _results = PartCount.calculate_217f_part_count(
+        PartCount.do_build_columns([]))
+
+    assert _results.empty
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("category_id, subcategory_id, key",
+                         [(1, 1, 'technology_id'), (2, 4, 'type_id'),
+                          (5, 1, 'family_id'), (7, 5, 'construction_id'),
+                          (10, 1, 'specification_id'), (10, 2, 'type_id'),
+                          (10, 4, 'application_id'),
+                          (99, 1, 'specification_id')])
+def test_get_specification_key(category_id, subcategory_id, key):
+    """get_specification_key() should return the attribute that selects the base hazard rate list."""
+    assert PartCount.get_specification_key(category_id, subcategory_id) == key
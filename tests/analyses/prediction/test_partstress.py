@@ -0,0 +1,144 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.prediction.test_partstress.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the batch part stress module."""
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from ramstk.analyses.data import HARDWARE_ATTRIBUTES
+from ramstk.analyses.prediction import Component, PartStress
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+
+def _do_make_parts(n_parts):
+    """Build a list of hardware attributes for random parts."""
+    _random = np.random.RandomState(2018)
+    _records = []
+    for _hardware_id in range(n_parts):
+        _attributes = HARDWARE_ATTRIBUTES.copy()
+        _category_id = [1, 2, 3, 4, 10][_random.randint(0, 5)]
+        _attributes['hardware_id'] = _hardware_id
+        _attributes['category_id'] = _category_id
+        _attributes['subcategory_id'] = {
+            1: _random.randint(1, 11),
+            2: _random.randint(1, 14),
+            3: _random.randint(1, 16),
+            4: _random.randint(1, 20),
+            10: 1
+        }[_category_id]
+        _attributes['environment_active_id'] = _random.randint(1, 15)
+        _attributes['quality_id'] = _random.randint(1, 3)
+        _attributes['specification_id'] = _random.randint(1, 3)
+        _attributes['family_id'] = _random.randint(1, 4)
+        _attributes['type_id'] = _random.randint(1, 4)
+        _attributes['construction_id'] = _random.randint(1, 3)
+        _attributes['configuration_id'] = _random.randint(1, 3)
+        _attributes['n_elements'] = _random.randint(1, 2000000)
+        _attributes['temperature_active'] = _random.uniform(25.0, 85.0)
+        _attributes['temperature_rated_max'] = [85.0, 105.0,
+                                                125.0][_random.randint(0, 3)]
+        _attributes['power_ratio'] = _random.uniform(0.05, 0.9)
+        _attributes['voltage_ratio'] = _random.uniform(0.05, 0.95)
+        _attributes['capacitance'] = _random.uniform(1.0E-9, 1.0E-3)
+        _attributes['frequency_operating'] = _random.uniform(1.0, 100.0)
+        _attributes['technology_id'] = [1, 2, 11][_random.randint(0, 3)]
+        _attributes['application_id'] = _random.randint(1, 4)
+        _attributes['package_id'] = _random.randint(1, 10)
+        _attributes['n_active_pins'] = _random.randint(2, 500)
+        _attributes['temperature_case'] = _random.uniform(-10.0, 100.0)
+        _attributes['theta_jc'] = _random.uniform(-10.0, 50.0)
+        _attributes['power_operating'] = _random.uniform(0.0, 2.0)
+        _attributes['power_rated'] = _random.uniform(-0.5, 5.0)
+        _attributes['current_rated'] = _random.uniform(0.1, 5.0)
+        _attributes['years_in_production'] = _random.uniform(0.5, 5.0)
+        _attributes['lambda_b'] = _random.uniform(0.0, 1.0)
+        if _category_id == 2:
+            _attributes['type_id'] = _random.randint(1, 9)
+
+        # Skip the combinations the scalar functions can't calculate.
+        try:
+            Component.do_calculate_217f_part_stress(**_attributes.copy())
+        except (IndexError, KeyError, OverflowError, TypeError, ValueError,
+                ZeroDivisionError):
+            continue
+        _records.append(_attributes)
+
+    return _records
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_stress_matches_scalar():
+    """calculate_217f_part_stress() should return the same values as the scalar functions for every part."""
+    _records = _do_make_parts(3000)
+
+    _results = PartStress.calculate_217f_part_stress(pd.DataFrame(_records))
+
+    assert isinstance(_results, pd.DataFrame)
+    assert len(_results) == len(_records)
+    for _idx, _attributes in enumerate(_records):
+        _attributes, _msg = Component.do_calculate_217f_part_stress(
+            **_attributes.copy())
+        for _key in ['lambda_b', 'piQ', 'piE', 'hazard_rate_active']:
+            assert _results[_key][_idx] == pytest.approx(
+                _attributes[_key], rel=1.0E-12)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_stress_resistor():
+    """calculate_217f_part_stress() should return the resistor factors and hazard rate."""
+    _attributes = HARDWARE_ATTRIBUTES.copy()
+    _attributes['category_id'] = 3
+    _attributes['subcategory_id'] = 4
+    _attributes['quality_id'] = 1
+    _attributes['environment_active_id'] = 2
+    _attributes['n_elements'] = 3
+    _attributes['power_ratio'] = 0.5
+    _attributes['temperature_active'] = 30.0
+
+    _results = PartStress.calculate_217f_part_stress(
+        pd.DataFrame([_attributes], index=[7]))
+
+    assert list(_results.index) == [7]
+    assert _results['lambda_b'][7] == 0.00006
+    assert _results['piQ'][7] == 1.0
+    assert _results['piE'][7] == 2.0
+    assert _results['hazard_rate_active'][7] == pytest.approx(0.00137269)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_stress_scalar_errors():
+    """calculate_217f_part_stress() should raise the same errors as the scalar functions."""
+    _attributes = HARDWARE_ATTRIBUTES.copy()
+    _attributes['category_id'] = 3
+    _attributes['subcategory_id'] = 1
+    _attributes['quality_id'] = 20
+
+    with pytest.raises(IndexError):
+        PartStress.calculate_217f_part_stress(pd.DataFrame([_attributes]))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_217f_part_stress_empty():
+    """calculate_217f_part_stress() should return an empty frame for an empty BoM."""
+    _results = PartStress.calculate_217f_part_stress(
+        pd.DataFrame([HARDWARE_ATTRIBUTES]).iloc[:0])
+
+    assert _results.empty
+    assert list(_results.columns) == [
+        'lambda_b', 'piQ', 'piE', 'hazard_rate_active'
+    ]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       tests/dao/BenchIndexes.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2018 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+#
+"""
+Helper script for timing the module loads with and without the indexes.
+
+A synthetic program is written to two RAMSTK Program databases; one keeps the
+indexes declared on the table models and the other has them dropped.  The
+queries the data models use to load their trees are then timed on each.
+
+Invocation:
+
+    python tests/dao/BenchIndexes.py <OPTIONS>
+
+    where <OPTIONS> are:
+
+        -n, --hardware  the number of hardware items in the program
+        -s, --sample    the number of hardware FMEAs to load
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import tempfile
+import timeit
+from optparse import OptionParser
+
+from sqlalchemy import and_, create_engine
+
+from ramstk.dao import (RAMSTKAction, RAMSTKCause, RAMSTKControl,
+                        RAMSTKHardware, RAMSTKMatrix, RAMSTKMechanism,
+                        RAMSTKMode)
+from ramstk.dao.DAO import DAO
+
+TEMPDIR = tempfile.gettempdir()
+
+
+def do_parse_args():
+    """Parse command line arguments."""
+    parser = OptionParser()
+    parser.add_option(
+        "-n",
+        "--hardware",
+        type='int',
+        dest='hardware',
+        default=5000,
+        help="the number of hardware items in the program")
+    parser.add_option(
+        "-s",
+        "--sample",
+        type='int',
+        dest='sample',
+        default=200,
+        help="the number of hardware FMEAs to load")
+
+    return parser.parse_args()
+
+
+def do_create_program(database, n_hardware, indexed):
+    """Create a RAMSTK Program database holding a synthetic program."""
+    _path = database.split(':///')[1]
+    for _suffix in ['', '-wal', '-shm']:
+        if os.path.exists(_path + _suffix):
+            os.remove(_path + _suffix)
+
+    DAO.db_create_program(database)
+    _engine = create_engine(database)
+
+    if not indexed:
+        for _name in [
+                _row[0] for _row in _engine.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' "
+                    "AND name LIKE 'ix_%'")
+        ]:
+            _engine.execute('DROP INDEX {0:s}'.format(_name))
+
+    # Each hardware item gets three modes, each mode two mechanisms, each
+    # mechanism two causes, and each cause a control and an action.
+    _hardware = []
+    _modes = []
+    _mechanisms = []
+    _causes = []
+    _controls = []
+    _actions = []
+    _matrix = []
+    for _hardware_id in range(2, n_hardware + 2):
+        _hardware.append({
+            'fld_revision_id': 1,
+            'fld_hardware_id': _hardware_id,
+            'fld_parent_id': 1
+        })
+        _matrix.append({
+            'fld_revision_id': 1,
+            'fld_matrix_id': 1,
+            'fld_matrix_type': 'hrdwr_vldtn',
+            'fld_column_item_id': 1,
+            'fld_row_item_id': _hardware_id
+        })
+        for __ in range(3):
+            _mode_id = len(_modes) + 1
+            _modes.append({
+                'fld_function_id': -1,
+                'fld_hardware_id': _hardware_id,
+                'fld_mode_id': _mode_id
+            })
+            for __ in range(2):
+                _mechanism_id = len(_mechanisms) + 1
+                _mechanisms.append({
+                    'fld_mode_id': _mode_id,
+                    'fld_mechanism_id': _mechanism_id
+                })
+                for __ in range(2):
+                    _cause_id = len(_causes) + 1
+                    _causes.append({
+                        'fld_mode_id': _mode_id,
+                        'fld_mechanism_id': _mechanism_id,
+                        'fld_cause_id': _cause_id
+                    })
+                    _controls.append({'fld_cause_id': _cause_id})
+                    _actions.append({'fld_cause_id': _cause_id})
+
+    for _table, _rows in [(RAMSTKHardware, _hardware),
+                          (RAMSTKMode, _modes),
+                          (RAMSTKMechanism, _mechanisms),
+                          (RAMSTKCause, _causes),
+                          (RAMSTKControl, _controls),
+                          (RAMSTKAction, _actions),
+                          (RAMSTKMatrix, _matrix)]:
+        _engine.execute(_table.__table__.insert(), _rows)
+
+    _engine.dispose()
+
+
+def do_load(dao, hardware_ids):
+    """Run the queries the FMEA and matrix data models use to load."""
+    _session = dao.db_get_session()
+
+    for _hardware_id in hardware_ids:
+        for _mode in _session.query(RAMSTKMode).filter(
+                RAMSTKMode.hardware_id == _hardware_id).all():
+            for _mechanism in _session.query(RAMSTKMechanism).filter(
+                    RAMSTKMechanism.mode_id == _mode.mode_id).all():
+                for _cause in _session.query(RAMSTKCause).filter(
+                        RAMSTKCause.mechanism_id ==
+                        _mechanism.mechanism_id).all():
+                    _session.query(RAMSTKControl).filter(
+                        RAMSTKControl.cause_id == _cause.cause_id).all()
+                    _session.query(RAMSTKAction).filter(
+                        RAMSTKAction.cause_id == _cause.cause_id).all()
+
+    _session.query(RAMSTKMatrix).filter(
+        and_(RAMSTKMatrix.revision_id == 1,
+             RAMSTKMatrix.matrix_type == 'hrdwr_vldtn')).all()
+
+    dao.db_release_session(_session)
+
+
+def main():
+    """Time the loads on the indexed and unindexed databases."""
+    (options, __) = do_parse_args()
+
+    _step = max(1, options.hardware // options.sample)
+    _hardware_ids = range(2, options.hardware + 2, _step)[:options.sample]
+
+    for _label, _indexed in [('without indexes', False),
+                             ('with indexes', True)]:
+        _database = 'sqlite:///' + TEMPDIR + '/_ramstk_bench_{0:d}.ramstk'.\
+            format(int(_indexed))
+        do_create_program(_database, options.hardware, _indexed)
+
+        _dao = DAO()
+        _dao.db_connect(_database)
+        _seconds = min(
+            timeit.repeat(
+                lambda: do_load(_dao, _hardware_ids), number=1, repeat=3))
+        _dao.db_close()
+
+        print('{0:<20s}{1:8.3f} s for {2:d} FMEAs'.format(
+            _label, _seconds, len(_hardware_ids)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
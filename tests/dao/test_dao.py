@@ -9,6 +9,7 @@
 import os
 import tempfile
 
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import sessionmaker
 
 import pytest
@@ -44,6 +45,52 @@ def test_dao_db_connect(test_configuration):
     assert not DUT.db_connect(_database)
 
 
+@pytest.mark.integration
+def test_dao_db_connect_profile():
+    """ db_connect() should set the PRAGMAs of the SQLite performance profile on each connection. """
+    if os.path.exists(TEMPDIR + '/_ramstk_profile_db.ramstk'):
+        os.remove(TEMPDIR + '/_ramstk_profile_db.ramstk')
+
+    DUT = DAO()
+    DUT.db_connect(
+        'sqlite:///' + TEMPDIR + '/_ramstk_profile_db.ramstk',
+        profile='performance')
+
+    _session = DUT.db_get_session()
+    assert _session.execute('PRAGMA journal_mode').scalar() == 'wal'
+    assert _session.execute('PRAGMA synchronous').scalar() == 1
+    assert _session.execute('PRAGMA cache_size').scalar() == -65536
+    assert _session.execute('PRAGMA temp_store').scalar() == 2
+    DUT.db_release_session(_session)
+
+    assert DUT.db_set_profile('bulk') == 'performance'
+
+    _session = DUT.db_get_session()
+    assert _session.execute('PRAGMA cache_size').scalar() == -262144
+    assert _session.execute('PRAGMA wal_autocheckpoint').scalar() == 10000
+    DUT.db_release_session(_session)
+
+    assert DUT.db_set_profile('safe') == 'bulk'
+
+    _session = DUT.db_get_session()
+    assert _session.execute('PRAGMA journal_mode').scalar() == 'delete'
+    assert _session.execute('PRAGMA synchronous').scalar() == 2
+    DUT.db_release_session(_session)
+
+    DUT.db_close()
+
+
+@pytest.mark.integration
+def test_dao_db_set_profile_unknown():
+    """ db_set_profile() should raise a KeyError and keep the current profile when passed an unknown profile. """
+    DUT = DAO()
+
+    with pytest.raises(KeyError):
+        DUT.db_set_profile('turbo')
+
+    assert DUT.db_set_profile('safe') == 'default'
+
+
 @pytest.mark.integration
 def test_dao_db_create_common(test_configuration):
     """ db_create_common() should return False on success. """
@@ -80,6 +127,43 @@ def test_dao_db_create_program(test_configuration):
     assert not DUT.db_create_program(_database)
 
 
+@pytest.mark.integration
+def test_dao_db_create_indexes():
+    """ db_create_indexes() should add the missing indexes to a RAMSTK Program database. """
+    if os.path.exists(TEMPDIR + '/_ramstk_index_db.ramstk'):
+        os.remove(TEMPDIR + '/_ramstk_index_db.ramstk')
+
+    DUT = DAO()
+    _database = 'sqlite:///' + TEMPDIR + '/_ramstk_index_db.ramstk'
+    DUT.db_create_program(_database)
+    DUT.db_connect(_database)
+
+    _names = [
+        _index['name']
+        for _index in inspect(DUT.engine).get_indexes('ramstk_mode')
+    ]
+    assert 'ix_ramstk_mode_fld_hardware_id' in _names
+
+    # Drop two indexes to look like a database from an older version.
+    DUT.engine.execute('DROP INDEX ix_ramstk_mode_fld_hardware_id')
+    DUT.engine.execute(
+        'DROP INDEX ix_ramstk_matrix_fld_revision_id_fld_matrix_type')
+
+    _error_code, _msg = DUT.db_create_indexes()
+
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Indexing the RAMSTK Program database.  "
+                    "Created ix_ramstk_matrix_fld_revision_id_fld_matrix_type, "
+                    "ix_ramstk_mode_fld_hardware_id.")
+
+    _error_code, _msg = DUT.db_create_indexes()
+
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Indexing the RAMSTK Program database.")
+
+    DUT.db_close()
+
+
 @pytest.mark.integration
 def test_dao_db_create_program_bad_db_name(test_configuration):
     """ db_create_program() should return True on failure. """
@@ -144,6 +228,104 @@ def test_dao_db_add_many(test_configuration):
                     "Program database.")
 
 
+
+@pytest.mark.integration
+def test_dao_db_add_many_chunked(test_configuration):
+    """ db_add() should return a zero error code on success when adding multiple records to the database in chunks. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _revisions = [RAMSTKRevision() for __ in range(5)]
+
+    _error_code, _msg = DUT.db_add(_revisions, DUT.session, chunk_size=2)
+
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK "
+                    "Program database.")
+
+
+@pytest.mark.integration
+def test_dao_db_add_many_chunked_duplicate_key(test_configuration):
+    """ db_add() should return a 3 error code when a record in a chunk violates the primary key. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _revision = RAMSTKRevision()
+    DUT.db_add([
+        _revision,
+    ], DUT.session)
+    _duplicate = RAMSTKRevision()
+    _duplicate.revision_id = _revision.revision_id
+
+    _session = DUT.RAMSTK_SESSION(
+        bind=DUT.engine, autoflush=False, expire_on_commit=False)
+
+    _error_code, _msg = DUT.db_add([RAMSTKRevision(), _duplicate],
+                                   _session,
+                                   chunk_size=10)
+
+    assert _error_code == 3
+    assert _msg.startswith('RAMSTK ERROR: Primary key error: ')
+
+
+@pytest.mark.integration
+def test_dao_db_add_records(test_configuration):
+    """ db_add_records() should return a zero error code on success when adding {attribute:value} records to the database. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _records = [{
+        'revision_id': _id,
+        'name': 'Bulk Revision {0:d}'.format(_id)
+    } for _id in range(1000, 1005)]
+
+    _error_code, _msg = DUT.db_add_records([(RAMSTKRevision, _records)],
+                                           DUT.session,
+                                           chunk_size=2)
+
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK "
+                    "Program database.")
+    _revision = DUT.session.query(RAMSTKRevision).filter(
+        RAMSTKRevision.revision_id == 1003).first()
+    assert _revision.name == 'Bulk Revision 1003'
+
+
+@pytest.mark.integration
+def test_dao_db_add_records_duplicate_key(test_configuration):
+    """ db_add_records() should return a 3 error code and still add the good records when a record in a chunk violates the primary key. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _records = [{
+        'revision_id': 1010,
+        'name': 'Bulk Revision'
+    }, {
+        'revision_id': 1011,
+        'name': 'Bulk Revision'
+    }, {
+        'revision_id': 1011,
+        'name': 'Duplicate Revision'
+    }]
+
+    _error_code, _msg = DUT.db_add_records([(RAMSTKRevision, _records)],
+                                           DUT.session,
+                                           chunk_size=10)
+
+    assert _error_code == 3
+    assert _msg.startswith('RAMSTK ERROR: Primary key error: ')
+    assert DUT.session.query(RAMSTKRevision).filter(
+        RAMSTKRevision.revision_id == 1010).count() == 1
+
+
 @pytest.mark.integration
 def test_dao_db_update(test_configuration):
     """ db_update() should return a zero error code on success. """
@@ -166,6 +348,159 @@ def test_dao_db_update(test_configuration):
     assert _msg == ("RAMSTK SUCCESS: Updating the RAMSTK Program database.")
 
 
+@pytest.mark.integration
+def test_dao_db_update_mappings(test_configuration):
+    """ db_update_mappings() should return a zero error code on success when inserting, updating, and deleting {attribute:value} records. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _error_code, _msg = DUT.db_update_mappings(
+        RAMSTKRevision,
+        DUT.session,
+        inserts=[{
+            'revision_id': 1020,
+            'name': 'Mapped Revision'
+        }, {
+            'revision_id': 1021,
+            'name': 'Mapped Revision'
+        }])
+
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Updating the RAMSTK Program database.")
+
+    _error_code, _msg = DUT.db_update_mappings(
+        RAMSTKRevision,
+        DUT.session,
+        updates=[{
+            'revision_id': 1020,
+            'name': 'Updated Revision'
+        }],
+        deletes=[{
+            'revision_id': 1021
+        }])
+
+    assert _error_code == 0
+    assert DUT.session.query(RAMSTKRevision).get(1020).name == (
+        'Updated Revision')
+    assert DUT.session.query(RAMSTKRevision).filter(
+        RAMSTKRevision.revision_id == 1021).count() == 0
+
+
+@pytest.mark.integration
+def test_dao_db_update_mappings_duplicate_key(test_configuration):
+    """ db_update_mappings() should return a 3 error code and roll back every operation when an insert violates the primary key. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _error_code, _msg = DUT.db_update_mappings(
+        RAMSTKRevision,
+        DUT.session,
+        inserts=[{
+            'revision_id': 1030,
+            'name': 'Mapped Revision'
+        }, {
+            'revision_id': 1030,
+            'name': 'Duplicate Revision'
+        }])
+
+    assert _error_code == 3
+    assert _msg.startswith('RAMSTK ERROR: Primary key error: ')
+    assert DUT.session.query(RAMSTKRevision).filter(
+        RAMSTKRevision.revision_id == 1030).count() == 0
+
+
+@pytest.mark.integration
+def test_dao_db_batch(test_configuration):
+    """ db_flush_batch() should commit every change in the batch at once. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _session = DUT.db_begin_batch()
+
+    assert DUT.db_get_session() is _session
+    assert DUT.db_begin_batch() is _session
+
+    _revision = RAMSTKRevision()
+    _error_code, _msg = DUT.db_add([
+        _revision,
+    ], _session)
+    _revision_id = _revision.revision_id
+
+    assert _error_code == 0
+    assert _revision_id > 0
+
+    _revision.name = 'Batch Revision'
+    _error_code, _msg = DUT.db_update(_session)
+    DUT.db_release_session(_session)
+
+    # Nothing is committed until the outermost batch is flushed.
+    _other = DUT.RAMSTK_SESSION(bind=DUT.engine)
+    assert _other.query(RAMSTKRevision).get(_revision_id) is None
+    _other.close()
+
+    _error_code, _msg = DUT.db_flush_batch()
+    assert _error_code == 0
+    assert DUT.db_get_session() is _session
+
+    _error_code, _msg = DUT.db_flush_batch()
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Updating the RAMSTK Program database.")
+
+    _other = DUT.db_get_session()
+    assert _other is not _session
+    assert _other.query(RAMSTKRevision).get(
+        _revision_id).name == 'Batch Revision'
+    DUT.db_release_session(_other)
+
+
+@pytest.mark.integration
+def test_dao_db_batch_error(test_configuration):
+    """ db_flush_batch() should roll back the entire batch and return a 1 error code when an operation in the batch fails. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _session = DUT.db_begin_batch()
+
+    _revision = RAMSTKRevision()
+    _error_code, _msg = DUT.db_add([
+        _revision,
+    ], _session)
+    _revision_id = _revision.revision_id
+
+    assert _error_code == 0
+
+    _error_code, _msg = DUT.db_add([
+        RAMSTKRevision(revision_id=1),
+    ], _session)
+
+    assert _error_code == 3
+
+    # The operations after the failed one don't get committed either.
+    _error_code, _msg = DUT.db_add([
+        RAMSTKRevision(),
+    ], _session)
+
+    assert _error_code == 0
+
+    _error_code, _msg = DUT.db_flush_batch()
+
+    assert _error_code == 1
+    assert _msg == ("RAMSTK ERROR: Updating the RAMSTK Program database.")
+
+    _other = DUT.db_get_session()
+    assert _other.query(RAMSTKRevision).filter(
+        RAMSTKRevision.revision_id >= _revision_id).count() == 0
+    DUT.db_release_session(_other)
+
+
 @pytest.mark.integration
 def test_dao_db_delete(test_configuration):
     """ db_delete() should return a zero error code on success. """
@@ -199,3 +534,59 @@ def test_dao_db_delete_no_item(test_configuration):
     assert _error_code == 1
     assert _msg == ("RAMSTK ERROR: Deleting an item from the RAMSTK Program "
                     "database.")
+
+
+@pytest.mark.integration
+def test_dao_db_select_cached(test_configuration):
+    """ db_select_cached() should return the same entities without querying the database until the table is written to. """
+    DUT = DAO()
+    _database = (test_configuration.RAMSTK_BACKEND + ':///' + TEMPDIR +
+                 '/_ramstk_program_db.ramstk')
+    DUT.db_connect(_database)
+
+    _statements = []
+
+    def _do_count(conn, cursor, statement, parameters, context, executemany):
+        _statements.append(statement)
+
+    event.listen(DUT.engine, 'before_cursor_execute', _do_count)
+
+    _session = DUT.RAMSTK_SESSION(bind=DUT.engine, expire_on_commit=False)
+    _query = _session.query(RAMSTKRevision).filter(
+        RAMSTKRevision.revision_id == 1)
+    _revisions = DUT.db_select_cached(_query, revision_id=1)
+    _n_statements = len(_statements)
+
+    assert len(_revisions) == 1
+    assert _n_statements > 0
+
+    # Unsaved changes are discarded on a cache hit.
+    _name = _revisions[0].name
+    _revisions[0].name = 'Unsaved Name'
+    _cached = DUT.db_select_cached(_query, revision_id=1)
+
+    assert len(_statements) == _n_statements
+    assert _cached[0] is not _revisions[0]
+    assert _cached[0].name != 'Unsaved Name'
+    assert not inspect(_cached[0]).modified
+    assert inspect(_cached[0]).detached
+
+    _revisions[0].name = _name
+
+    # Writing to the table invalidates the cached query.
+    DUT.db_add([RAMSTKRevision()], _session)
+    _n_statements = len(_statements)
+    DUT.db_select_cached(_query, revision_id=1)
+
+    assert len(_statements) > _n_statements
+
+    # Selecting another revision clears the cache.
+    _n_statements = len(_statements)
+    DUT.db_select_cached(_query, revision_id=2)
+    DUT.db_select_cached(_query, revision_id=1)
+
+    assert len(_statements) == _n_statements + 2
+
+    event.remove(DUT.engine, 'before_cursor_execute', _do_count)
+    _session.close()
+    DUT.db_close()
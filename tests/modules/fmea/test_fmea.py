@@ -11,6 +11,8 @@ from treelib import Tree
 
 import pytest
 
+from sqlalchemy import event
+
 from ramstk.dao import RAMSTKMode
 from ramstk.dao import RAMSTKMechanism
 from ramstk.dao import RAMSTKCause
@@ -56,6 +58,70 @@ def test_do_select_all_hardware(test_dao):
     assert isinstance(_tree, Tree)
 
 
+def _do_walk_fmea(test_dao, parent_id, functional):
+    """Build the FMEA Node IDs by selecting each level for each parent."""
+    _node_ids = []
+    _modes = dtmMode(test_dao).do_select_all(
+        parent_id=parent_id, functional=functional)
+    for _mode in _modes.children(0):
+        _mode_node = '0.' + str(_mode.identifier)
+        _node_ids.append(_mode_node)
+        if functional:
+            _parents = [(_mode.identifier, _mode_node)]
+        else:
+            _parents = []
+            for _mechanism in dtmMechanism(test_dao).do_select_all(
+                    parent_id=_mode.identifier).children(0):
+                _node_id = _mode_node + '.' + str(_mechanism.identifier)
+                _node_ids.append(_node_id)
+                _parents.append((_mechanism.identifier, _node_id))
+        for _parent_id, _parent_node in _parents:
+            for _cause in dtmCause(test_dao).do_select_all(
+                    parent_id=_parent_id, functional=functional).children(0):
+                _node_id = _parent_node + '.' + str(_cause.identifier)
+                _node_ids.append(_node_id)
+                for _control in dtmControl(test_dao).do_select_all(
+                        parent_id=_cause.identifier).children(0):
+                    _node_ids.append(
+                        _node_id + '.' + str(_control.identifier) + 'c')
+                for _action in dtmAction(test_dao).do_select_all(
+                        parent_id=_cause.identifier).children(0):
+                    _node_ids.append(
+                        _node_id + '.' + str(_action.identifier) + 'a')
+
+    return _node_ids
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("functional", [True, False])
+def test_do_select_all_node_ids(test_dao, functional):
+    """ do_select_all() should build the same Node IDs as selecting each level for each parent with one query per table. """
+    _statements = []
+
+    def _do_count(conn, cursor, statement, parameters, context, executemany):
+        _statements.append(statement)
+
+    DUT = dtmFMEA(test_dao)
+    event.listen(test_dao.engine, 'before_cursor_execute', _do_count)
+    try:
+        _tree = DUT.do_select_all(parent_id=1, functional=functional)
+    finally:
+        event.remove(test_dao.engine, 'before_cursor_execute', _do_count)
+
+    _node_ids = _do_walk_fmea(test_dao, 1, functional)
+
+    assert len(_node_ids) > 1
+    assert sorted(_node_ids) == sorted(
+        [_node for _node in _tree.nodes if _node != 0])
+    for _node_id in _node_ids:
+        _parent = _tree.parent(_node_id).identifier
+        if _parent != 0:
+            assert _node_id.startswith(_parent + '.')
+    assert len(_statements) == 5 - int(functional)
+    assert DUT.dtm_cause.last_id >= max(
+        [DUT.dtm_cause.last_id] + DUT.dtm_cause.tree.nodes.keys())
+
+
 @pytest.mark.integration
 def test_do_select_all_non_existent_hardware_id(test_dao):
     """ do_select_all() should return an empty Tree() when passed a Hardware ID that doesn't exist. """
@@ -43,6 +43,19 @@ def test_do_select_all(test_dao):
     assert isinstance(_tree.get_node(2).data, RAMSTKDesignElectric)
 
 
+
+@pytest.mark.integration
+def test_do_select_all_revision(test_dao):
+    """ do_select_all(revision_id=) should return a Tree() object populated with the RAMSTKDesignElectric instances for every hardware item in the revision. """
+    DUT = dtmDesignElectric(test_dao)
+
+    _tree = DUT.do_select_all(revision_id=1)
+
+    assert isinstance(_tree, Tree)
+    assert isinstance(_tree.get_node(1).data, RAMSTKDesignElectric)
+    assert isinstance(_tree.get_node(2).data, RAMSTKDesignElectric)
+
+
 @pytest.mark.integration
 def test_do_select(test_dao):
     """ do_select() should return an instance of the RAMSTKDesignElectric data model on success. """
@@ -7,16 +7,24 @@
 # Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Test class for testing Hardware BoM module algorithms and models. """
 
+import pickle
+import sys
+from collections import MutableMapping
 from datetime import date
 import pandas as pd
 from treelib import Tree
 
 import pytest
 
+from ramstk.analyses.data import HARDWARE_ATTRIBUTES
 from ramstk.modules.hardware import (
     dtmHardware, dtmDesignElectric, dtmDesignMechanic, dtmMilHdbkF, dtmNSWC,
     dtmReliability, dtmHardwareBoM, dtcHardwareBoM)
-from ramstk.dao import DAO, RAMSTKHardware
+from ramstk.modules import RAMSTKDataModel
+from ramstk.modules.hardware.Model import HardwareBoMRecord
+from ramstk.dao import (DAO, RAMSTKHardware, RAMSTKDesignElectric,
+                        RAMSTKDesignMechanic, RAMSTKMilHdbkF, RAMSTKNSWC,
+                        RAMSTKReliability)
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
@@ -293,6 +301,71 @@ ATTRIBUTES = {
 }
 
 
+@pytest.mark.unit
+def test_bom_record_create():
+    """ __init__() should create a Hardware BoM record that acts like the attribute dict it was created from. """
+    DUT = HardwareBoMRecord(ATTRIBUTES)
+
+    assert isinstance(DUT, MutableMapping)
+    assert DUT == ATTRIBUTES
+    assert not DUT != ATTRIBUTES
+    assert sorted(DUT.keys()) == sorted(ATTRIBUTES.keys())
+    assert len(DUT) == len(ATTRIBUTES)
+    assert DUT['comp_ref_des'] == 'S1'
+    assert DUT.get('hardware_code') is None
+    assert 'hardware_code' not in DUT
+    assert dict(**DUT) == ATTRIBUTES
+    assert sys.getsizeof(DUT) * 4 < sys.getsizeof(ATTRIBUTES)
+
+
+@pytest.mark.unit
+def test_bom_record_set_item():
+    """ __setitem__() and __delitem__() should change the attributes, holding keys that aren't hardware attributes separately. """
+    DUT = HardwareBoMRecord(ATTRIBUTES)
+    _copy = DUT.copy()
+
+    DUT['hazard_rate_active'] = 0.5
+    DUT['hardware_code'] = 'HC-1'
+    DUT.update(remarks='Remarks')
+    del DUT['lcn']
+
+    assert DUT['hazard_rate_active'] == 0.5
+    assert DUT['hardware_code'] == 'HC-1'
+    assert DUT['remarks'] == 'Remarks'
+    assert 'lcn' not in DUT
+    assert DUT.pop('hardware_code') == 'HC-1'
+    assert DUT.pop('hardware_code', None) is None
+    assert _copy == ATTRIBUTES
+    with pytest.raises(KeyError):
+        DUT['lcn']
+    with pytest.raises(KeyError):
+        del DUT['hardware_code']
+
+
+@pytest.mark.unit
+def test_bom_record_pickle():
+    """ A Hardware BoM record should survive pickling so it can be passed to the worker processes. """
+    DUT = HardwareBoMRecord(ATTRIBUTES, hardware_code='HC-1')
+
+    _record = pickle.loads(pickle.dumps(DUT, pickle.HIGHEST_PROTOCOL))
+
+    assert isinstance(_record, HardwareBoMRecord)
+    assert _record == DUT
+
+
+@pytest.mark.unit
+def test_bom_record_keys():
+    """ The Hardware BoM record should have a slot for every attribute of the six hardware tables. """
+    _keys = set()
+    for _table in [
+            RAMSTKHardware, RAMSTKDesignElectric, RAMSTKDesignMechanic,
+            RAMSTKMilHdbkF, RAMSTKNSWC, RAMSTKReliability
+    ]:
+        _keys.update(_table().get_attributes().keys())
+
+    assert _keys == set(HardwareBoMRecord.__slots__) - set(['_dic_extra'])
+
+
 @pytest.mark.integration
 def test_data_model_create(test_dao):
     """ __init__() should return a Hardware BoM model. """
@@ -318,9 +391,53 @@ def test_do_select_all(test_dao):
     _tree = DUT.do_select_all(revision_id=1)
 
     assert isinstance(_tree, Tree)
-    assert isinstance(_tree.get_node(1).data, dict)
+    assert isinstance(_tree.get_node(1).data, HardwareBoMRecord)
+
+
+
+@pytest.mark.integration
+def test_do_select_all_populates_component_models(test_dao):
+    """ do_select_all() should load every hardware table for the revision and merge the attributes by Hardware ID. """
+    DUT = dtmHardwareBoM(test_dao)
+
+    _tree = DUT.do_select_all(revision_id=1)
+
+    assert isinstance(DUT.dtm_design_electric.do_select(2),
+                      RAMSTKDesignElectric)
+    assert isinstance(DUT.dtm_reliability.do_select(2), RAMSTKReliability)
+    for _node in DUT.dtm_reliability.tree.all_nodes()[1:]:
+        _data = _tree.get_node(_node.identifier).data
+        assert _data['hardware_id'] == _node.identifier
+        assert _data['hazard_rate_type_id'] == \
+            _node.data.hazard_rate_type_id
 
 
+@pytest.mark.integration
+def test_do_select_all_depth(test_dao):
+    """ do_select_all() should only load the top levels of the BoM when passed a depth and do_select_children() should load the rest. """
+    _full = dtmHardwareBoM(test_dao).do_select_all(revision_id=1)
+    DUT = dtmHardwareBoM(test_dao)
+
+    _tree = DUT.do_select_all(revision_id=1, depth=1)
+
+    assert [_node.identifier for _node in _tree.children(0)] == \
+        [_node.identifier for _node in _full.children(0)]
+    assert all(_tree.depth(_node) == 1 for _node in _tree.all_nodes()[1:])
+    assert isinstance(DUT.dtm_reliability.do_select(1), RAMSTKReliability)
+
+    _node_ids = [0]
+    while _node_ids:
+        _node_id = _node_ids.pop()
+        _children = DUT.do_select_children(_node_id)
+        assert sorted(_node.identifier for _node in _children) == \
+            sorted(_node.identifier for _node in _full.children(_node_id))
+        _node_ids.extend(_node.identifier for _node in _children)
+
+    assert sorted(_tree.nodes.keys()) == sorted(_full.nodes.keys())
+    for _node in _full.all_nodes()[1:]:
+        assert _tree.get_node(_node.identifier).data == _node.data
+    assert DUT.do_select_children(100) is None
+
 @pytest.mark.integration
 def test_do_select(test_dao):
     """ do_select() should return an instance of the RAMSTKHardware data model on success. """
@@ -381,6 +498,35 @@ def test_do_insert_part(test_dao):
                     "Program database.")
 
 
+@pytest.mark.integration
+def test_do_insert_rollback(test_dao):
+    """ do_insert() should add none of the hardware item's records when one of them can't be added. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _last_id = DUT.dtm_hardware.last_id
+    _session = test_dao.RAMSTK_SESSION(bind=test_dao.engine)
+    _count = _session.query(RAMSTKHardware).count()
+
+    # Hardware ID 1 already has an NSWC record, so this violates the primary
+    # key after the hardware record and four of its records were added.
+    def _do_insert(**kwargs):  # pylint: disable=unused-argument
+        return RAMSTKDataModel.do_insert(
+            DUT.dtm_nswc, entities=[RAMSTKNSWC(hardware_id=1)])
+
+    DUT.dtm_nswc.do_insert = _do_insert
+
+    _error_code, _msg = DUT.do_insert(revision_id=1, parent_id=1, part=1)
+
+    assert _error_code == 3
+    assert _msg.startswith('RAMSTK ERROR: Primary key error: ')
+    assert _session.query(RAMSTKHardware).count() == _count
+    assert DUT.dtm_hardware.last_id == _last_id
+    assert not DUT.dtm_hardware.tree.contains(_last_id + 1)
+    assert not DUT.dtm_design_electric.tree.contains(_last_id + 1)
+    assert not DUT.tree.contains(_last_id + 1)
+    _session.close()
+
+
 @pytest.mark.integration
 def test_do_delete(test_dao):
     """ do_delete() should return a zero error code on success. """
@@ -454,6 +600,173 @@ def test_do_update_all(test_dao):
                     "of materials.")
 
 
+@pytest.mark.integration
+def test_is_modified(test_dao):
+    """ is_modified() should return True when any of the six records of a hardware item has unsaved changes. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    DUT.do_update_all()
+
+    assert not DUT.is_modified(1)
+
+    DUT.dtm_nswc.do_select(1).Cac = 2
+
+    assert DUT.is_modified(1)
+
+    _error_code, _msg = DUT.do_update_all()
+
+    assert _error_code == 0
+    assert not DUT.is_modified(1)
+
+
+def _do_add_hardware(DUT, hardware_id, parent_id, part):
+    """Add a resistor or an assembly to the Hardware BoM tree."""
+    _attributes = HARDWARE_ATTRIBUTES.copy()
+    _attributes['hardware_id'] = hardware_id
+    _attributes['parent_id'] = parent_id
+    _attributes['part'] = part
+    _attributes['category_id'] = part * 3
+    _attributes['subcategory_id'] = part
+    _attributes['hazard_rate_method_id'] = 1
+    _attributes['environment_active_id'] = 3
+    _attributes['quality_id'] = 2
+    _attributes['add_adj_factor'] = 0.0
+    _attributes['cost'] = 1.5
+    _attributes['cost_type_id'] = part
+    _attributes['total_cost'] = 0.0
+    DUT.tree.create_node(
+        str(hardware_id),
+        hardware_id,
+        parent=parent_id,
+        data=HardwareBoMRecord(_attributes))
+
+
+@pytest.mark.integration
+def test_do_calculate_all(test_dao):
+    """ do_calculate_all() should return the sum of the part results and roll them up into each assembly. """
+    DUT = dtmHardwareBoM(test_dao)
+    _do_add_hardware(DUT, 1, 0, 0)
+    _do_add_hardware(DUT, 2, 1, 0)
+    _do_add_hardware(DUT, 3, 2, 1)
+    _do_add_hardware(DUT, 4, 2, 1)
+    _do_add_hardware(DUT, 5, 1, 1)
+    _hazard_rate = DUT.do_calculate(3, hr_multiplier=1.0)['hazard_rate_active']
+
+    _cum_results = DUT.do_calculate_all(node_id=0, hr_multiplier=1.0)
+
+    assert _cum_results == [3 * _hazard_rate, 0.0, 0.0, 4.5, 3, 0.0]
+    assert DUT.tree.get_node(1).data['hazard_rate_active'] == _cum_results[0]
+    assert DUT.tree.get_node(1).data['total_part_count'] == 3
+    assert DUT.tree.get_node(2).data['hazard_rate_active'] == \
+        2 * _hazard_rate
+    assert DUT.tree.get_node(2).data['total_cost'] == 3.0
+    assert DUT.do_calculate_all(node_id=2, hr_multiplier=1.0) == [
+        2 * _hazard_rate, 0.0, 0.0, 3.0, 2, 0.0
+    ]
+
+
+@pytest.mark.integration
+def test_do_calculate_all_depth(test_dao):
+    """ do_calculate_all() should load the rest of a lazily loaded BoM before calculating it. """
+    _full = dtmHardwareBoM(test_dao)
+    _full.do_select_all(revision_id=1)
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1, depth=1)
+    assert not DUT.tree.children(1)
+
+    _cum_results = DUT.do_calculate_all(node_id=1, hr_multiplier=1E6)
+
+    assert sorted(_node.identifier for _node in DUT.tree.children(1)) == \
+        sorted(_node.identifier for _node in _full.tree.children(1))
+    assert _cum_results == _full.do_calculate_all(node_id=1, hr_multiplier=1E6)
+    assert DUT.do_select_subtree(1) == []
+
+
+@pytest.mark.integration
+def test_do_calculate_all_deep_tree(test_dao):
+    """ do_calculate_all() should calculate a BoM nested deeper than the recursion limit. """
+    DUT = dtmHardwareBoM(test_dao)
+    _do_add_hardware(DUT, 1, 0, 0)
+    for _hardware_id in range(2, sys.getrecursionlimit() + 100):
+        _do_add_hardware(DUT, _hardware_id, _hardware_id - 1, 0)
+    _do_add_hardware(DUT, _hardware_id + 1, _hardware_id, 1)
+
+    _cum_results = DUT.do_calculate_all(node_id=0, hr_multiplier=1.0)
+
+    assert _cum_results[3] == 1.5
+    assert _cum_results[4] == 1
+    assert DUT.tree.get_node(1).data['total_part_count'] == 1
+
+
+@pytest.mark.integration
+def test_do_calculate_all_processes(test_dao):
+    """ do_calculate_all() should return the same results when the parts are calculated in worker processes. """
+    DUT = dtmHardwareBoM(test_dao)
+    _do_add_hardware(DUT, 1, 0, 0)
+    for _hardware_id in range(2, 42):
+        _do_add_hardware(DUT, _hardware_id, 1, 1)
+
+    _cum_results = DUT.do_calculate_all(node_id=0, hr_multiplier=1.0)
+
+    assert DUT.do_calculate_all(
+        node_id=0, hr_multiplier=1.0, processes=2) == _cum_results
+    assert _cum_results[4] == 40
+
+
+@pytest.mark.integration
+def test_do_calculate_all_incremental(test_dao):
+    """ do_calculate_all() should only calculate the dirty hardware items and their assemblies in incremental mode. """
+    DUT = dtmHardwareBoM(test_dao)
+    _do_add_hardware(DUT, 1, 0, 0)
+    _do_add_hardware(DUT, 2, 1, 0)
+    _do_add_hardware(DUT, 3, 2, 1)
+    _do_add_hardware(DUT, 4, 2, 1)
+    _do_add_hardware(DUT, 5, 1, 1)
+    DUT.do_calculate_all(node_id=0, hr_multiplier=1.0)
+
+    DUT.tree.get_node(3).data['environment_active_id'] = 5
+    assert DUT.do_set_dirty(3)
+    _cum_results = DUT.do_calculate_all(
+        node_id=0, hr_multiplier=1.0, incremental=True)
+
+    assert DUT.lst_calculated_ids == [3, 2, 1, 0]
+    assert _cum_results == DUT.do_calculate_all(node_id=0, hr_multiplier=1.0)
+    assert DUT.do_calculate_all(
+        node_id=0, hr_multiplier=1.0, incremental=True) == _cum_results
+    assert DUT.lst_calculated_ids == []
+
+
+@pytest.mark.integration
+def test_do_set_dirty(test_dao):
+    """ do_set_dirty() should only mark a hardware item when a calculation input changes. """
+    DUT = dtmHardwareBoM(test_dao)
+    DUT.do_select_all(revision_id=1)
+    _attributes = DUT.tree.get_node(2).data.copy()
+
+    assert not DUT.do_set_dirty(2, attributes=_attributes)
+
+    _attributes['hazard_rate_active'] = 0.5
+    assert not DUT.do_set_dirty(2, attributes=_attributes)
+
+    # The total cost is calculated for cost type 1 and entered for the others.
+    _cost_type_id = DUT.dtm_hardware.do_select(2).cost_type_id
+    _attributes['cost_type_id'] = 1
+    DUT.dtm_hardware.do_select(2).cost_type_id = 1
+    _attributes['total_cost'] = _attributes['total_cost'] + 10.0
+    assert not DUT.do_set_dirty(2, attributes=_attributes)
+
+    _attributes['cost_type_id'] = 2
+    DUT.dtm_hardware.do_select(2).cost_type_id = 2
+    assert DUT.do_set_dirty(2, attributes=_attributes)
+    DUT.dtm_hardware.do_select(2).cost_type_id = _cost_type_id
+
+    DUT.do_select_all(revision_id=1)
+    _attributes = DUT.tree.get_node(2).data.copy()
+    _attributes['quality_id'] = _attributes['quality_id'] + 1
+    assert DUT.do_set_dirty(2, attributes=_attributes)
+    assert DUT.do_set_dirty(2)
+
+
 @pytest.mark.integration
 def test_data_controller_create(test_dao, test_configuration):
     """ __init__() should create an instance of a Hardware data controller. """
@@ -471,6 +784,20 @@ def test_request_do_select_all(test_dao, test_configuration):
     assert isinstance(DUT.request_do_select_all(revision_id=1), Tree)
 
 
+@pytest.mark.integration
+def test_request_do_select_children(test_dao, test_configuration):
+    """ request_do_select_children() should return a list of the immediate children of a lazily loaded Hardware item. """
+    DUT = dtcHardwareBoM(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(revision_id=1, depth=1)
+
+    _children = DUT.request_do_select_children(1)
+
+    assert isinstance(_children, list)
+    assert _children
+    assert all(
+        isinstance(_node.data, HardwareBoMRecord) for _node in _children)
+
+
 @pytest.mark.integration
 def test_request_do_select_all_matrix(test_dao, test_configuration):
     """ request_do_select_all_matrix() should return a tuple containing the matrix, column headings, and row headings. """
@@ -549,8 +876,11 @@ def test_request_do_insert_matrix_row(test_dao, test_configuration):
     (_matrix, _column_hdrs, _row_hdrs) = DUT.request_do_select_all_matrix(
         1, 'hrdwr_vldtn')
 
-    assert not DUT.request_do_insert_matrix('hrdwr_vldtn', 13, 'S1:SS1:A13')
-    assert DUT._dmx_hw_vldtn_matrix.dic_row_hdrs[13] == 'S1:SS1:A13'
+    _row_id = max(DUT._dmx_hw_vldtn_matrix.lst_row_id) + 1
+
+    assert not DUT.request_do_insert_matrix('hrdwr_vldtn', _row_id,
+                                            'S1:SS1:A13')
+    assert DUT._dmx_hw_vldtn_matrix.dic_row_hdrs[_row_id] == 'S1:SS1:A13'
 
 
 @pytest.mark.integration
@@ -609,7 +939,8 @@ def test_request_get_attributes(test_dao, test_configuration):
 
     _attributes = DUT.request_get_attributes(1)
 
-    assert isinstance(_attributes, dict)
+    assert isinstance(_attributes, HardwareBoMRecord)
+    assert isinstance(_attributes, MutableMapping)
     assert _attributes['revision_id'] == 1
 
 
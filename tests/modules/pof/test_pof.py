@@ -11,11 +11,13 @@ from treelib import Tree
 
 import pytest
 
+from sqlalchemy import event
+
 from ramstk.dao import (RAMSTKMode, RAMSTKMechanism, RAMSTKOpLoad, RAMSTKOpStress,
                      RAMSTKTestMethod)
 from ramstk.modules.pof import (dtcPoF, dtmOpLoad, dtmOpStress, dtmTestMethod,
                              dtmPoF)
-from ramstk.modules.fmea import dtmMechanism
+from ramstk.modules.fmea import dtmMechanism, dtmMode
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
@@ -45,6 +47,51 @@ def test_do_select_all(test_dao):
     assert isinstance(_tree, Tree)
 
 
+@pytest.mark.integration
+def test_do_select_all_node_ids(test_dao):
+    """ do_select_all() should build the same Node IDs as selecting each level for each parent with one query per table. """
+    _statements = []
+
+    def _do_count(conn, cursor, statement, parameters, context, executemany):
+        _statements.append(statement)
+
+    DUT = dtmPoF(test_dao)
+    event.listen(test_dao.engine, 'before_cursor_execute', _do_count)
+    try:
+        _tree = DUT.do_select_all(parent_id=1)
+    finally:
+        event.remove(test_dao.engine, 'before_cursor_execute', _do_count)
+
+    _node_ids = []
+    for _mode in dtmMode(test_dao).do_select_all(
+            parent_id=1, functional=False).children(0):
+        _mode_node = '0.' + str(_mode.identifier)
+        _node_ids.append(_mode_node)
+        for _mechanism in dtmMechanism(test_dao).do_select_all(
+                parent_id=_mode.identifier).children(0):
+            if not _mechanism.data.pof_include:
+                continue
+            _mechanism_node = _mode_node + '.' + str(_mechanism.identifier)
+            _node_ids.append(_mechanism_node)
+            for _opload in dtmOpLoad(test_dao).do_select_all(
+                    parent_id=_mechanism.identifier).children(0):
+                _load_node = _mechanism_node + '.' + str(_opload.identifier)
+                _node_ids.append(_load_node)
+                for _opstress in dtmOpStress(test_dao).do_select_all(
+                        parent_id=_opload.identifier).children(0):
+                    _node_ids.append(
+                        _load_node + '.' + str(_opstress.identifier) + 's')
+                for _method in dtmTestMethod(test_dao).do_select_all(
+                        parent_id=_opload.identifier).children(0):
+                    _node_ids.append(
+                        _load_node + '.' + str(_method.identifier) + 't')
+
+    assert len(_node_ids) > 1
+    assert sorted(_node_ids) == sorted(
+        [_node for _node in _tree.nodes if _node != 0])
+    assert len(_statements) == 5
+
+
 @pytest.mark.integration
 def test_do_select_all_non_existent_id(test_dao):
     """ do_select_all() should return an empty Tree() when passed a Mechanism ID that doesn't exist. """
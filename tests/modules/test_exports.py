@@ -154,6 +154,26 @@ def test_do_load_output_validation(test_dao):
     assert DUT.do_load_output('Validation', _tree) is None
 
 
+@pytest.mark.integration
+def test_do_load_output_records(test_dao):
+    """do_load_output() should load one row per entity with the columns in the order of the headers."""
+    DUT = dtmExports(test_dao)
+
+    _function = dtmFunction(test_dao, test=True)
+    _function.do_select_all(revision_id=1)
+    DUT.do_load_output('Function', _function.tree)
+
+    _nodes = [
+        _node for _node in _function.tree.all_nodes() if _node.data is not None
+    ]
+    assert list(DUT._output_data.columns) == DUT._dic_column_headers[
+        'Function']
+    assert len(DUT._output_data) == len(_nodes)
+    assert list(DUT._output_data['function_id']) == [
+        _node.data.function_id for _node in _nodes
+    ]
+
+
 @pytest.mark.integration
 def test_do_export_to_csv(test_dao, test_export_file):
     """do_export() should return None when exporting to a CSV file."""
@@ -218,6 +238,28 @@ def test_do_export_to_text(test_dao, test_export_file):
     assert DUT.do_export('text', _test_text) is None
 
 
+@pytest.mark.integration
+def test_do_export_chunked(test_dao, test_export_file):
+    """do_export() should write the same file when the rows are written in chunks."""
+    DUT = dtmExports(test_dao)
+
+    _function = dtmFunction(test_dao, test=True)
+    _function.do_select_all(revision_id=1)
+    DUT.do_load_output('Function', _function.tree)
+
+    DUT.do_export('csv', test_export_file + '_whole.csv')
+    DUT.do_export('csv', test_export_file + '_chunked.csv', chunk_size=1)
+    DUT.do_export('excel', test_export_file + '_chunked.xls', chunk_size=1)
+
+    with open(test_export_file + '_whole.csv') as _whole:
+        with open(test_export_file + '_chunked.csv') as _chunked:
+            assert _chunked.read() == _whole.read()
+    _excel = pd.read_excel(test_export_file + '_chunked.xls')
+    assert list(_excel.columns) == DUT._dic_column_headers['Function']
+    assert list(_excel['function_id']) == list(
+        DUT._output_data['function_id'])
+
+
 @pytest.mark.integration
 def test_create_data_controller(test_dao, test_configuration):
     """__init__() should create an instance of the Export data controller."""
@@ -65,6 +65,29 @@ def test_do_select_all(test_dao):
     assert isinstance(DUT.tree.get_node(1).data, RAMSTKFunction)
 
 
+@pytest.mark.integration
+def test_do_select_all_depth(test_dao):
+    """ do_select_all() should only load the top levels of Functions when passed a depth and do_select_children() should load the rest. """
+    _full = dtmFunction(test_dao, test=True)
+    _full.do_select_all(revision_id=1)
+    DUT = dtmFunction(test_dao, test=True)
+
+    DUT.do_select_all(revision_id=1, depth=1)
+
+    assert all(
+        DUT.tree.depth(_node) == 1 for _node in DUT.tree.all_nodes()[1:])
+
+    _node_ids = [0]
+    while _node_ids:
+        _node_id = _node_ids.pop()
+        _children = DUT.do_select_children(_node_id)
+        assert sorted(_node.identifier for _node in _children) == \
+            sorted(_node.identifier for _node in _full.tree.children(_node_id))
+        _node_ids.extend(_node.identifier for _node in _children)
+
+    assert sorted(DUT.tree.nodes.keys()) == sorted(_full.tree.nodes.keys())
+
+
 @pytest.mark.integration
 def test_do_select(test_dao):
     """ do_select() should return an instance of the RAMSTKFunction data model on success. """
@@ -7,19 +7,46 @@
 """Test class for testing the Imports class."""
 #pylint: disable=protected-access
 
+import csv
 from collections import OrderedDict
+from datetime import date
 import pandas as pd
 
 import pytest
+from sqlalchemy import inspect
 
-from ramstk.dao import DAO
+from ramstk.dao import DAO, RAMSTKFunction, RAMSTKRequirement
 from ramstk.modules.imports import dtmImports, dtcImports
+from ramstk.modules.imports.Model import _DIC_TABLE_FIELDS
 
 __author__ = 'Doyle Rowland'
 __email__ = 'doyle.rowland@reliaqual.com'
 __organization__ = 'ReliaQual Associates, LLC'
 __copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
 
+FUNCTION_HEADERS = [
+    'Revision ID', 'Function ID', 'Level', 'Function Code', 'Function Name',
+    'Parent', 'Remarks', 'Safety Critical', 'Type'
+]
+
+# Function input rows with one error in each row after the first two.
+INVALID_FUNCTIONS = [
+    [1, 2000, 1, 'FUNC-2000', 'Valid function', 0, 'Remarks', 0, 0],
+    [1, 2001, 2, 'FUNC-2001', 'Valid child', 2000, 'Remarks', 1, 0],
+    [1, 2002, 'abc', 'FUNC-2002', 'Bad level', 2000, 'Remarks', 0, 0],
+    [1, 2003, 1, 'FUNC-2003', 'Bad flag', 2000, 'Remarks', 3, 0],
+    [99, 2004, 1, 'FUNC-2004', 'Bad revision', 2000, 'Remarks', 0, 0],
+    [1, 2001, 1, 'FUNC-2001', 'Duplicate ID', 2000, 'Remarks', 0, 0],
+    [1, 2006, 1, 'FUNC-2006', 'Orphan', 2999, 'Remarks', 0, 0]
+]
+INVALID_FUNCTION_ERRORS = [
+    (3, 'Level', u"'abc' is not an integer."),
+    (4, 'Safety Critical', u'3 is greater than the maximum of 1.'),
+    (5, 'Revision ID', u'Revision ID 99 does not exist.'),
+    (6, 'Function ID', u'ID 2001 is duplicated in the input file.'),
+    (7, 'Parent', u'Parent ID 2999 does not exist.')
+]
+
 
 @pytest.mark.integration
 def test_create_import_data_model(test_dao):
@@ -359,6 +386,237 @@ def test_do_insert_function(test_dao, test_csv_file_function):
     assert _msg == 'RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program database.'
 
 
+@pytest.mark.integration
+def test_do_insert_bulk_profile(test_dao, test_csv_file_function):
+    """ do_insert() should restore the SQLite performance profile used before the import. """
+    DUT = dtmImports(test_dao)
+
+    DUT.do_read_input('csv', test_csv_file_function)
+
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', list(DUT._input_data)[_idx], _key)
+
+    _profile = test_dao.db_set_profile('safe')
+    DUT.do_insert(module='Function')
+
+    assert test_dao.db_set_profile(_profile) == 'safe'
+
+
+@pytest.mark.integration
+def test_do_insert_chunked_csv(test_dao, tmpdir):
+    """ do_insert() should stream a CSV file read with a chunksize, inserting and reporting each chunk of rows. """
+    _test_file = str(tmpdir.join('test_inputs_functions_chunked.csv'))
+    with open(_test_file, 'wb') as _csv_file:
+        _writer = csv.writer(_csv_file, delimiter=';')
+        _writer.writerow(FUNCTION_HEADERS)
+        for _function_id in range(1000, 1005):
+            _writer.writerow([
+                1, _function_id, 1, 'FUNC-{0:d}'.format(_function_id),
+                'Chunked function', 0, 'Remarks', 0, 0
+            ])
+    DUT = dtmImports(test_dao)
+
+    DUT.do_read_input('csv', _test_file, chunksize=2)
+
+    assert list(DUT._input_data) == FUNCTION_HEADERS
+    assert DUT._input_data.empty
+
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', list(DUT._input_data)[_idx], _key)
+
+    _progress = []
+    _revision_id, _count, _error_code, _msg = DUT.do_insert(
+        module='Function', progress=lambda *args: _progress.append(args))
+
+    assert _revision_id == 1
+    assert _count == 5
+    assert _error_code == 0
+    assert _progress == [(2, 2), (2, 4), (1, 5)]
+
+    _session = test_dao.db_get_session()
+    assert _session.query(RAMSTKFunction).filter(
+        RAMSTKFunction.function_id >= 1000).count() == 5
+    test_dao.db_release_session(_session)
+
+
+@pytest.mark.integration
+def test_do_insert_chunked_csv_failure(test_dao, tmpdir):
+    """ do_insert() should add none of the rows when a row in a later chunk can't be added. """
+    _test_file = str(tmpdir.join('test_inputs_functions_duplicate.csv'))
+    with open(_test_file, 'wb') as _csv_file:
+        _writer = csv.writer(_csv_file, delimiter=';')
+        _writer.writerow(FUNCTION_HEADERS)
+        for _function_id in [2000, 2001, 2002, 2000]:
+            _writer.writerow([
+                1, _function_id, 1, 'FUNC-{0:d}'.format(_function_id),
+                'Duplicate function', 0, 'Remarks', 0, 0
+            ])
+    DUT = dtmImports(test_dao)
+
+    DUT.do_read_input('csv', _test_file, chunksize=2)
+
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', list(DUT._input_data)[_idx], _key)
+
+    _progress = []
+    _revision_id, _count, _error_code, _msg = DUT.do_insert(
+        module='Function', progress=lambda *args: _progress.append(args))
+
+    assert _count == 0
+    assert _error_code == 3
+    assert _msg.startswith('RAMSTK ERROR: Primary key error: ')
+    assert _progress == [(2, 2)]
+
+    _session = test_dao.db_get_session()
+    assert _session.query(RAMSTKFunction).filter(
+        RAMSTKFunction.function_id >= 2000).count() == 0
+    test_dao.db_release_session(_session)
+
+
+@pytest.mark.integration
+def test_do_read_chunks_excel(test_dao, test_excel_file):
+    """ _do_read_chunks() should split an Excel file read with a chunksize into chunks of rows. """
+    DUT = dtmImports(test_dao)
+
+    DUT.do_read_input('excel', test_excel_file, chunksize=1)
+
+    _chunks = list(DUT._do_read_chunks())
+
+    assert [len(_chunk) for _chunk in _chunks] == [1, 1]
+    assert list(_chunks[1]['Function ID']) == [5]
+
+
+@pytest.mark.integration
+def test_do_read_chunks_slices(test_dao, test_excel_file):
+    """ _do_read_chunks() should split input read without a chunksize into the number of slices passed. """
+    DUT = dtmImports(test_dao)
+
+    DUT.do_read_input('excel', test_excel_file)
+
+    assert [len(_chunk) for _chunk in DUT._do_read_chunks()] == [2]
+    assert [len(_chunk) for _chunk in DUT._do_read_chunks(slices=2)] == [1, 1]
+    assert [len(_chunk) for _chunk in DUT._do_read_chunks(slices=4)] == [1, 1]
+
+
+@pytest.mark.unit
+def test_table_fields_are_columns():
+    """ Every attribute set from an input file should be a column of the RAMSTK Program database table. """
+    for _table, _fields in _DIC_TABLE_FIELDS.items():
+        _columns = [_column.key for _column in inspect(_table).column_attrs]
+        for __, __, _attribute, __ in _fields:
+            assert _attribute in _columns
+
+
+@pytest.mark.integration
+def test_do_map_fields(test_dao, tmpdir):
+    """ _do_map_fields() should return a record for each input row with missing and unmapped fields set to their default. """
+    _test_file = str(tmpdir.join('test_inputs_requirements_mapped.csv'))
+    with open(_test_file, 'wb') as _csv_file:
+        _csv_file.write('Rev;ID;Date;Owner;Priority\n'
+                        '1;7;2019-01-02;;\n'
+                        '1;8;;Owner;3\n')
+    DUT = dtmImports(test_dao)
+    DUT.do_read_input('csv', _test_file)
+    for _key in DUT._dic_field_map['Requirement']:
+        DUT.do_map_to_field('Requirement', '', _key)
+    for _field, _key in [('Rev', 'Revision ID'), ('ID', 'Requirement ID'),
+                         ('Date', 'Validated Date'), ('Owner', 'Owner'),
+                         ('Priority', 'Priority')]:
+        DUT.do_map_to_field('Requirement', _field, _key)
+
+    _records = DUT._do_map_fields(DUT._input_data, RAMSTKRequirement)
+
+    assert len(_records) == 2
+    assert _records[0]['requirement_id'] == 7
+    assert isinstance(_records[0]['requirement_id'], int)
+    assert _records[0]['validated_date'] == date(2019, 1, 2)
+    assert _records[0]['owner'] == ''
+    assert _records[0]['priority'] == 1
+    assert isinstance(_records[0]['priority'], int)
+    assert _records[0]['derived'] == 0
+    assert _records[1]['validated_date'] == date.today()
+    assert _records[1]['owner'] == 'Owner'
+    assert _records[1]['priority'] == 3
+
+
+def _do_write_functions(test_file, rows):
+    """Write the Function input rows to a CSV file."""
+    with open(test_file, 'wb') as _csv_file:
+        _writer = csv.writer(_csv_file, delimiter=';')
+        _writer.writerow(FUNCTION_HEADERS)
+        for _row in rows:
+            _writer.writerow(_row)
+
+
+@pytest.mark.integration
+def test_do_validate(test_dao, tmpdir):
+    """ do_validate() should return a five error code and an error for each invalid value, duplicate ID, and missing parent in the input file. """
+    _test_file = str(tmpdir.join('test_inputs_functions_invalid.csv'))
+    _do_write_functions(_test_file, INVALID_FUNCTIONS)
+    DUT = dtmImports(test_dao)
+    DUT.do_read_input('csv', _test_file)
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', FUNCTION_HEADERS[_idx], _key)
+
+    _errors, _error_code, _msg = DUT.do_validate(module='Function')
+
+    assert _errors == INVALID_FUNCTION_ERRORS
+    assert _error_code == 5
+    assert _msg == ('RAMSTK ERROR: 5 error(s) found in 5 row(s) of the input '
+                    'file.')
+
+
+@pytest.mark.integration
+def test_do_validate_chunked_processes(test_dao, tmpdir):
+    """ do_validate() should find the same errors when the input file is read in chunks and checked by a pool of worker processes. """
+    _test_file = str(tmpdir.join('test_inputs_functions_invalid.csv'))
+    _do_write_functions(_test_file, INVALID_FUNCTIONS)
+    DUT = dtmImports(test_dao)
+    DUT.do_read_input('csv', _test_file, chunksize=2)
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', FUNCTION_HEADERS[_idx], _key)
+
+    _errors, _error_code, _msg = DUT.do_validate(
+        module='Function', processes=2)
+
+    assert _errors == INVALID_FUNCTION_ERRORS
+    assert _error_code == 5
+
+
+@pytest.mark.integration
+def test_do_validate_processes(test_dao, tmpdir):
+    """ do_validate() should find the same errors when the input file is read whole and checked by a pool of worker processes. """
+    _test_file = str(tmpdir.join('test_inputs_functions_invalid.csv'))
+    _do_write_functions(_test_file, INVALID_FUNCTIONS)
+    DUT = dtmImports(test_dao)
+    DUT.do_read_input('csv', _test_file)
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', FUNCTION_HEADERS[_idx], _key)
+
+    _errors, _error_code, _msg = DUT.do_validate(
+        module='Function', processes=3)
+
+    assert _errors == INVALID_FUNCTION_ERRORS
+    assert _error_code == 5
+
+
+@pytest.mark.integration
+def test_do_validate_valid(test_dao, tmpdir):
+    """ do_validate() should return a zero error code and no errors when the input file is valid. """
+    _test_file = str(tmpdir.join('test_inputs_functions_valid.csv'))
+    _do_write_functions(_test_file, INVALID_FUNCTIONS[:2])
+    DUT = dtmImports(test_dao)
+    DUT.do_read_input('csv', _test_file)
+    for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+        DUT.do_map_to_field('Function', FUNCTION_HEADERS[_idx], _key)
+
+    _errors, _error_code, _msg = DUT.do_validate(module='Function')
+
+    assert _errors == []
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Validating the input file.'
+
+
 @pytest.mark.integration
 def test_do_insert_requirement(test_dao, test_csv_file_requirement):
     """
@@ -543,3 +801,25 @@ def test_request_do_insert_function_primary_key_violation(
 
     assert _count == 0
     assert _error_code == 3
+
+
+@pytest.mark.integration
+def test_request_do_insert_validate(test_dao, test_configuration, tmpdir):
+    """ request_do_insert() should return a five error code and insert nothing when validating the input file finds an error. """
+    _test_file = str(tmpdir.join('test_inputs_functions_invalid.csv'))
+    _do_write_functions(_test_file, INVALID_FUNCTIONS)
+    DUT = dtcImports(test_dao, test_configuration, test=True)
+    DUT.request_do_read_input('csv', _test_file)
+    for _idx, _key in enumerate(
+            DUT._dtm_data_model._dic_field_map['Function']):
+        DUT.request_do_map_to_field('Function', FUNCTION_HEADERS[_idx], _key)
+
+    _count, _error_code, _msg = DUT.request_do_insert(
+        'Function', validate=True)
+
+    assert _count == 0
+    assert _error_code == 5
+    _session = test_dao.db_get_session()
+    assert _session.query(RAMSTKFunction).filter(
+        RAMSTKFunction.function_id >= 2000).count() == 0
+    test_dao.db_release_session(_session)
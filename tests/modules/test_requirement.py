@@ -14,7 +14,7 @@ import pandas as pd
 
 import pytest
 
-from ramstk.modules import RAMSTKDataMatrix
+from ramstk.modules import RAMSTKDataMatrix, RAMSTKSparseDataMatrix
 from ramstk.modules.requirement import dtmRequirement, dtcRequirement
 from ramstk.dao import DAO
 from ramstk.dao import RAMSTKRequirement
@@ -96,6 +96,24 @@ def test_do_select_all(test_dao):
     assert isinstance(_tree.get_node(1).data, RAMSTKRequirement)
 
 
+@pytest.mark.integration
+def test_do_select_all_depth(test_dao):
+    """ do_select_all() should only load the top levels of Requirements when passed a depth and do_select_subtree() should load the rest. """
+    _full = dtmRequirement(test_dao).do_select_all(revision_id=1)
+    DUT = dtmRequirement(test_dao)
+
+    _tree = DUT.do_select_all(revision_id=1, depth=1)
+
+    assert [_node.identifier for _node in _tree.children(0)] == \
+        [_node.identifier for _node in _full.children(0)]
+    assert all(_tree.depth(_node) == 1 for _node in _tree.all_nodes()[1:])
+
+    DUT.do_select_subtree(0)
+
+    assert sorted(_tree.nodes.keys()) == sorted(_full.nodes.keys())
+    assert DUT.do_select_subtree(0) == []
+
+
 @pytest.mark.integration
 def test_do_select(test_dao):
     """ do_select() should return an instance of the RAMSTKRequirement data model on success. """
@@ -216,6 +234,64 @@ def test_do_update_all(test_dao):
                     "table.")
 
 
+@pytest.mark.integration
+def test_is_modified(test_dao):
+    """ is_modified() should return True only for a Requirement with unsaved changes. """
+    DUT = dtmRequirement(test_dao)
+    DUT.do_select_all(revision_id=1)
+
+    _requirement = DUT.do_select(1)
+    _requirement.description = _requirement.description
+
+    assert not DUT.is_modified(0)
+    assert not DUT.is_modified(1)
+    assert not DUT.is_modified(100)
+
+    _requirement.description = 'Modified requirement description.'
+
+    assert DUT.is_modified(1)
+
+    _error_code, _msg = DUT.do_update_all()
+
+    assert _error_code == 0
+    assert _msg == ("RAMSTK SUCCESS: Updating all records in the requirement "
+                    "table.")
+    assert not DUT.is_modified(1)
+
+    _session = test_dao.RAMSTK_SESSION(bind=test_dao.engine)
+    assert _session.query(RAMSTKRequirement).get(1).description == (
+        'Modified requirement description.')
+    _session.close()
+
+
+@pytest.mark.integration
+def test_select_matrix_keeps_unsaved_changes(test_dao, test_configuration):
+    """ Loading a matrix should not discard the unsaved changes of a Requirement it shares with the Requirement data model. """
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(revision_id=1)
+    DUT.request_do_select_all_matrix(1, 'rqrmnt_hrdwr')
+
+    _requirement = DUT.request_do_select(1)
+    _description = _requirement.description
+    _requirement.description = 'Unsaved requirement description.'
+
+    DUT.request_do_select_all_matrix(1, 'rqrmnt_hrdwr')
+
+    assert _requirement.description == 'Unsaved requirement description.'
+    assert DUT._dtm_data_model.is_modified(1)
+
+    _error_code, _msg = DUT._dtm_data_model.do_update_all()
+
+    assert _error_code == 0
+    _session = test_dao.RAMSTK_SESSION(bind=test_dao.engine)
+    assert _session.query(RAMSTKRequirement).get(1).description == (
+        'Unsaved requirement description.')
+    _session.close()
+
+    _requirement.description = _description
+    DUT._dtm_data_model.do_update_all()
+
+
 @pytest.mark.integration
 def test_data_controller_create(test_dao, test_configuration):
     """ __init__ should return a Requirement Data Controller. """
@@ -226,6 +302,7 @@ def test_data_controller_create(test_dao, test_configuration):
     assert isinstance(DUT._dmx_rqmt_hw_matrix, RAMSTKDataMatrix)
     assert isinstance(DUT._dmx_rqmt_sw_matrix, RAMSTKDataMatrix)
     assert isinstance(DUT._dmx_rqmt_val_matrix, RAMSTKDataMatrix)
+    assert isinstance(DUT._dmx_rqmt_hw_matrix, RAMSTKSparseDataMatrix)
 
 
 @pytest.mark.integration
@@ -238,6 +315,20 @@ def test_request_do_select_all(test_dao, test_configuration):
     assert isinstance(_tree.get_node(1).data, RAMSTKRequirement)
 
 
+@pytest.mark.integration
+def test_request_do_select_children(test_dao, test_configuration):
+    """ request_do_select_children() should return a list of the immediate children of a lazily loaded Requirement. """
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all(revision_id=1, depth=1)
+
+    _children = DUT.request_do_select_children(0)
+
+    assert isinstance(_children, list)
+    assert all(
+        isinstance(_node.data, RAMSTKRequirement) for _node in _children)
+    assert DUT.request_do_select_children(100000) is None
+
+
 @pytest.mark.integration
 def test_request_do_select_all_matrix(test_dao, test_configuration):
     """ request_do_select_all_matrix() should return a tuple containing the matrix, column headings, and row headings. """
@@ -246,7 +337,7 @@ def test_request_do_select_all_matrix(test_dao, test_configuration):
     (_matrix, _column_hdrs, _row_hdrs) = DUT.request_do_select_all_matrix(
         1, 'rqrmnt_hrdwr')
 
-    assert isinstance(_matrix, pd.DataFrame)
+    assert isinstance(_matrix, pd.SparseDataFrame)
     assert _column_hdrs == {
         1: u'S1',
         2: u'S1:SS1',
@@ -388,6 +479,37 @@ def test_request_do_update_non_existent_id(test_dao, test_configuration):
     assert DUT.request_do_update(100)
 
 
+@pytest.mark.integration
+def test_request_do_set_matrix(test_dao, test_configuration):
+    """ request_do_set_matrix() should return False on successfully setting a cell. """
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+    (_matrix, _column_hdrs,
+     _row_hdrs) = DUT.request_do_select_all_matrix(1, 'rqrmnt_hrdwr')
+    _column_id = list(_matrix.columns)[0]
+    _row_id = list(_matrix.index)[0]
+
+    assert not DUT.request_do_set_matrix('rqrmnt_hrdwr', _column_id, _row_id,
+                                         1)
+    assert DUT._dmx_rqmt_hw_matrix.do_select(_column_id, _row_id) == 1
+
+
+@pytest.mark.integration
+def test_request_do_set_matrix_non_existent_cell(test_dao, test_configuration):
+    """ request_do_set_matrix() should return True when the cell doesn't exist in the matrix. """
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+    DUT.request_do_select_all_matrix(1, 'rqrmnt_hrdwr')
+
+    assert DUT.request_do_set_matrix('rqrmnt_hrdwr', 1000, 1000, 1)
+
+
+@pytest.mark.integration
+def test_request_do_set_non_existent_matrix(test_dao, test_configuration):
+    """ request_do_set_matrix() should return True when the matrix doesn't exist. """
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+
+    assert DUT.request_do_set_matrix('rqrmnt_none', 1, 1, 1)
+
+
 @pytest.mark.integration
 def test_request_do_update_matrix(test_dao, test_configuration):
     """ request_do_update_matrix() should return False on success. """
@@ -397,6 +519,26 @@ def test_request_do_update_matrix(test_dao, test_configuration):
     assert not DUT.request_do_update_matrix(1, 'rqrmnt_hrdwr')
 
 
+
+@pytest.mark.integration
+def test_request_do_update_matrix_changed_cell(test_dao, test_configuration):
+    """ request_do_update_matrix() should save only the changed cells of the matrix. """
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+    (_matrix, _column_hdrs,
+     _row_hdrs) = DUT.request_do_select_all_matrix(1, 'rqrmnt_hrdwr')
+    _column_id = list(_matrix.columns)[0]
+    _row_id = list(_matrix.index)[0]
+    DUT.request_do_set_matrix('rqrmnt_hrdwr', _column_id, _row_id, 2)
+
+    assert not DUT.request_do_update_matrix(1, 'rqrmnt_hrdwr')
+
+    DUT = dtcRequirement(test_dao, test_configuration, test=True)
+    (_matrix, _column_hdrs,
+     _row_hdrs) = DUT.request_do_select_all_matrix(1, 'rqrmnt_hrdwr')
+
+    assert _matrix[_column_id][_row_id] == 2
+
+
 @pytest.mark.integration
 def test_request_do_update_non_existent_matrix(test_dao, test_configuration):
     """ request_do_update_matrix() should return True when attempting to update a non-existent matrix. """
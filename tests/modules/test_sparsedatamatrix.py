@@ -0,0 +1,324 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       tests.modules.test_sparsedatamatrix.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the sparse data matrix. """
+
+import pandas as pd
+
+import pytest
+
+from ramstk.dao import RAMSTKHardware, RAMSTKMatrix, RAMSTKValidation
+from ramstk.modules import RAMSTKDataMatrix, RAMSTKSparseDataMatrix
+
+__author__ = 'Doyle Rowland'
+__email__ = 'doyle.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2018 Doyle "weibullguy" Rowland'
+
+
+def _do_count_cells(dao, matrix_type):
+    """Count the RAMSTKMatrix records for a matrix type."""
+    _session = dao.RAMSTK_SESSION(
+        bind=dao.engine, autoflush=False, expire_on_commit=False)
+    _count = _session.query(RAMSTKMatrix).filter(
+        RAMSTKMatrix.matrix_type == matrix_type).count()
+    _session.close()
+
+    return _count
+
+
+@pytest.mark.integration
+def test_data_matrix_create(test_dao):
+    """ __init__() should return an empty sparse data matrix. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+
+    assert isinstance(DUT, RAMSTKDataMatrix)
+    assert DUT.dic_cells == {}
+    assert DUT.lst_row_id == []
+    assert DUT.lst_column_id == []
+    assert isinstance(DUT.dtf_matrix, pd.DataFrame)
+    assert DUT.dtf_matrix.empty
+
+
+@pytest.mark.integration
+def test_do_create(test_dao):
+    """ do_create() should not persist any cells for a new matrix. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+
+    assert not DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+    assert DUT.dic_cells == {}
+    assert DUT.n_row == len(DUT.lst_row_id)
+    assert DUT.n_col == len(DUT.lst_column_id)
+    assert (DUT.dtf_matrix.values == 0).all()
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == 0
+
+
+@pytest.mark.integration
+def test_do_update_non_zero_cells(test_dao):
+    """ do_update() should persist only the non-zero cells edited through the DataFrame view. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'sparse_vldtn_hrdwr',
+        rkey='validation_id',
+        ckey='hardware_id',
+        rheader='description',
+        cheader='comp_ref_des')
+    _column_id = DUT.lst_column_id[0]
+    _row_id = DUT.lst_row_id[0]
+    DUT.dtf_matrix[_column_id][_row_id] = 2
+
+    _error_code, _msg = DUT.do_update(1, 'sparse_vldtn_hrdwr')
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Updating the RAMSTK Program database.'
+    assert DUT.dic_cells == {(_column_id, _row_id): 2}
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == 1
+
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'sparse_vldtn_hrdwr',
+        rkey='validation_id',
+        ckey='hardware_id',
+        rheader='description',
+        cheader='comp_ref_des')
+
+    assert DUT.do_select(_column_id, _row_id) == 2
+
+
+@pytest.mark.integration
+def test_dense_select_all_sparse_saved(test_dao):
+    """ RAMSTKDataMatrix.do_select_all() should read every row and column of a matrix saved by the sparse data matrix. """
+    _sparse = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation,
+                                     RAMSTKHardware)
+    _sparse.do_select_all(
+        1,
+        'sparse_vldtn_hrdwr',
+        rkey='validation_id',
+        ckey='hardware_id',
+        rheader='description',
+        cheader='comp_ref_des')
+    _column_id = _sparse.lst_column_id[-1]
+    _row_id = _sparse.lst_row_id[-1]
+
+    DUT = RAMSTKDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'sparse_vldtn_hrdwr',
+        rkey='validation_id',
+        ckey='hardware_id',
+        rheader='description',
+        cheader='comp_ref_des')
+
+    assert DUT.dtf_matrix.shape == (len(_sparse.lst_row_id),
+                                    len(_sparse.lst_column_id))
+    assert list(DUT.dtf_matrix.index) == _sparse.lst_row_id
+    assert list(DUT.dtf_matrix.columns) == _sparse.lst_column_id
+    assert DUT.dtf_matrix.values.sum() == sum(_sparse.dic_cells.values())
+    for (_column, _row), _value in _sparse.dic_cells.items():
+        assert DUT.do_select(_column, _row) == _value
+    assert DUT.do_select(_column_id, _row_id) == _sparse.do_select(
+        _column_id, _row_id)
+
+
+@pytest.mark.integration
+def test_do_update_keeps_view(test_dao):
+    """ do_update() should keep the DataFrame view so edits made to it after saving are saved too. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'sparse_vldtn_hrdwr',
+        rkey='validation_id',
+        ckey='hardware_id',
+        rheader='description',
+        cheader='comp_ref_des')
+    _column_id = DUT.lst_column_id[0]
+    _row_id = DUT.lst_row_id[0]
+    _view = DUT.dtf_matrix
+    _value = _view[_column_id][_row_id]
+    _count = _do_count_cells(test_dao, 'sparse_vldtn_hrdwr')
+
+    _view[_column_id][_row_id] = 1
+    DUT.do_update(1, 'sparse_vldtn_hrdwr')
+    _view[_column_id][_row_id] = 2
+    DUT.do_update(1, 'sparse_vldtn_hrdwr')
+
+    assert DUT.dtf_matrix is _view
+    assert DUT.dic_cells[(_column_id, _row_id)] == 2
+    _view[_column_id][_row_id] = _value
+    DUT.do_update(1, 'sparse_vldtn_hrdwr')
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == _count
+
+
+@pytest.mark.integration
+def test_do_update_zeroed_cell(test_dao):
+    """ do_update() should remove the record of a cell that was set back to zero. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_select_all(
+        1,
+        'sparse_vldtn_hrdwr',
+        rkey='validation_id',
+        ckey='hardware_id',
+        rheader='description',
+        cheader='comp_ref_des')
+    _column_id = DUT.lst_column_id[0]
+    _row_id = DUT.lst_row_id[0]
+    DUT.dtf_matrix[_column_id][_row_id] = 0
+
+    _error_code, _msg = DUT.do_update(1, 'sparse_vldtn_hrdwr')
+
+    assert _error_code == 0
+    assert DUT.dic_cells == {}
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == 0
+
+
+@pytest.mark.integration
+def test_do_select_non_existent_cell(test_dao):
+    """ do_select() should raise a KeyError when the column doesn't exist in the matrix. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+
+    with pytest.raises(KeyError):
+        DUT.do_select(1000, DUT.lst_row_id[0])
+
+
+@pytest.mark.integration
+def test_do_select_does_not_build_view(test_dao):
+    """ do_select() should read a cell from the sparse cells without building the DataFrame view. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+    _column_id = DUT.lst_column_id[0]
+    _row_id = DUT.lst_row_id[0]
+    DUT.dic_cells[(_column_id, _row_id)] = 1
+
+    assert DUT.do_select(_column_id, _row_id) == 1
+    assert DUT._dtf_view is None
+
+
+@pytest.mark.integration
+def test_do_set(test_dao):
+    """ do_set() should set and clear a cell in the sparse cells and the DataFrame view. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+    _column_id = DUT.lst_column_id[0]
+    _row_id = DUT.lst_row_id[0]
+
+    _error_code, _msg = DUT.do_set(_column_id, _row_id, 2)
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Setting a cell in the matrix.'
+    assert DUT.dic_cells == {(_column_id, _row_id): 2}
+    assert DUT._dtf_view is None
+
+    _view = DUT.dtf_matrix
+    _error_code, _msg = DUT.do_set(_column_id, _row_id, 0)
+
+    assert _error_code == 0
+    assert DUT.dic_cells == {}
+    assert _view[_column_id][_row_id] == 0
+    assert DUT.do_select(_column_id, _row_id) == 0
+
+
+@pytest.mark.integration
+def test_do_set_non_existent_cell(test_dao):
+    """ do_set() should return a 6 error code when the column doesn't exist in the matrix. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+
+    _error_code, _msg = DUT.do_set(1000, DUT.lst_row_id[0], 1)
+
+    assert _error_code == 6
+    assert _msg == ('RAMSTK ERROR: Attempted to set non-existent cell '
+                    '(1000, {0:d}) in the matrix.'.format(DUT.lst_row_id[0]))
+    assert DUT.dic_cells == {}
+
+
+@pytest.mark.integration
+def test_sdf_matrix(test_dao):
+    """ sdf_matrix should return a SparseDataFrame of the cells without building the DataFrame view. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+    _column_id = DUT.lst_column_id[-1]
+    _row_id = DUT.lst_row_id[-1]
+    DUT.do_set(_column_id, _row_id, 2)
+
+    _matrix = DUT.sdf_matrix
+
+    assert isinstance(_matrix, pd.SparseDataFrame)
+    assert DUT._dtf_view is None
+    assert list(_matrix.index) == DUT.lst_row_id
+    assert list(_matrix.columns) == DUT.lst_column_id
+    assert _matrix[_column_id][_row_id] == 2
+    assert _matrix.values.sum() == 2
+
+
+@pytest.mark.integration
+def test_do_update_in_batch(test_dao):
+    """ do_update() should save the cells with the batch when one has been started. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+    _column_id = DUT.lst_column_id[0]
+    _row_id = DUT.lst_row_id[0]
+    DUT.do_set(_column_id, _row_id, 1)
+
+    test_dao.db_begin_batch()
+    _error_code, _msg = DUT.do_update(1, 'sparse_vldtn_hrdwr')
+
+    assert _error_code == 0
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == 0
+
+    _error_code, _msg = test_dao.db_flush_batch()
+
+    assert _error_code == 0
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == 1
+
+    DUT.do_set(_column_id, _row_id, 0)
+    DUT.do_update(1, 'sparse_vldtn_hrdwr')
+
+    assert _do_count_cells(test_dao, 'sparse_vldtn_hrdwr') == 0
+
+
+@pytest.mark.integration
+def test_do_insert_delete(test_dao):
+    """ do_insert() and do_delete() should add and remove rows and columns and their cells. """
+    DUT = RAMSTKSparseDataMatrix(test_dao, RAMSTKValidation, RAMSTKHardware)
+    DUT.do_create(
+        1, 'sparse_vldtn_hrdwr', rkey='validation_id', ckey='hardware_id')
+    _n_row = DUT.n_row
+
+    _error_code, _msg = DUT.do_insert(100, 'Validation task from test')
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Inserting a row or column into the matrix.'
+    assert DUT.n_row == _n_row + 1
+    assert DUT.dic_row_hdrs[100] == 'Validation task from test'
+
+    _error_code, _msg = DUT.do_insert(100, 'Validation task from test')
+
+    assert _error_code == 6
+
+    DUT.dic_cells[(DUT.lst_column_id[0], 100)] = 1
+    _error_code, _msg = DUT.do_delete(100)
+
+    assert _error_code == 0
+    assert _msg == 'RAMSTK SUCCESS: Removing a row or column from the matrix.'
+    assert DUT.n_row == _n_row
+    assert DUT.dic_cells == {}
+
+    _error_code, _msg = DUT.do_delete(100, row=False)
+
+    assert _error_code == 6
+    assert _msg == ('RAMSTK ERROR: Attempted to drop non-existent column 100 '
+                    'from the matrix.')
@@ -92,6 +92,21 @@ def test_request_do_delete_matrix_column(test_dao, test_configuration):
     assert not DUT.request_do_delete_matrix('vldtn_hrdwr', 5, row=False)
 
 
+
+@pytest.mark.integration
+def test_request_do_create_matrix(test_dao, test_configuration):
+    """ request_do_create() should create a zero-filled matrix with a row for each Validation task and a column for each Hardware item. """
+    DUT = dtcValidation(test_dao, test_configuration, test=True)
+    DUT.request_do_create(1, 'vldtn_hrdwr')
+
+    (_matrix, _column_hdrs, _row_hdrs) = DUT.request_do_select_all_matrix(
+        1, 'vldtn_hrdwr')
+
+    assert len(_matrix.index) == len(_row_hdrs)
+    assert len(_matrix.columns) == len(_column_hdrs)
+    assert (_matrix.values == 0).all()
+
+
 @pytest.mark.integration
 def test_do_insert(test_dao):
     """ do_insert() should return False on success. """
@@ -51,9 +51,48 @@ def test_do_select_all(test_dao):
 
     assert isinstance(_tree, Tree)
     assert _tree.get_node(0).tag == 'Usage Profiles'
-    assert isinstance(_tree.get_node(1).data, RAMSTKMission)
-    assert isinstance(_tree.get_node(11).data, RAMSTKMissionPhase)
-    assert isinstance(_tree.get_node(111).data, RAMSTKEnvironment)
+    assert isinstance(_tree.get_node(3).data, RAMSTKMission)
+    assert isinstance(_tree.get_node(4).data, RAMSTKMissionPhase)
+    assert isinstance(_tree.get_node(5).data, RAMSTKEnvironment)
+    assert _tree.parent(5).identifier == 4
+    assert _tree.parent(4).identifier == 3
+
+
+@pytest.mark.integration
+def test_do_select_all_multi_digit_ids(test_dao):
+    """ do_select_all() should build unique Node IDs when the Mission, Phase and Environment IDs have different numbers of digits. """
+    _session = test_dao.RAMSTK_SESSION(
+        bind=test_dao.engine, autoflush=False, expire_on_commit=False)
+    _missions = []
+    for __ in range(12):
+        _mission = RAMSTKMission()
+        _mission.revision_id = 1
+        _missions.append(_mission)
+    test_dao.db_add(_missions, _session)
+    _phase = RAMSTKMissionPhase()
+    _phase.mission_id = 1
+    test_dao.db_add([_phase], _session)
+    _environment = RAMSTKEnvironment()
+    _environment.phase_id = _phase.phase_id
+    test_dao.db_add([_environment], _session)
+
+    DUT = dtmUsageProfile(test_dao)
+    _tree = DUT.do_select_all(revision_id=1)
+
+    # Concatenating IDs would give Mission 11 and Phase 1 of Mission 1 the
+    # same Node ID.
+    assert DUT.do_select_entity('mission', 11).mission_id == 11
+    assert DUT.do_select_entity('phase', 1).phase_id == 1
+    assert _tree.parent(
+        DUT.get_node_id('environment', _environment.environment_id)
+    ).identifier == DUT.get_node_id('phase', _phase.phase_id)
+    assert len(_tree.nodes) == (
+        len(DUT.dtm_mission.tree.nodes) + len(DUT.dtm_phase.tree.nodes) +
+        len(DUT.dtm_environment.tree.nodes) - 2)
+
+    for _entity in [_environment, _phase] + _missions:
+        test_dao.db_delete(_entity, _session)
+    _session.close()
 
 
 @pytest.mark.integration
@@ -73,7 +112,7 @@ def test_do_select(test_dao):
     DUT = dtmUsageProfile(test_dao)
     DUT.do_select_all(revision_id=1)
 
-    _entity = DUT.do_select(1)
+    _entity = DUT.do_select(DUT.get_node_id('mission', 1))
 
     assert isinstance(_entity, RAMSTKMission)
     assert _entity.description == 'Test Mission'
@@ -91,7 +130,7 @@ def test_do_insert_mission(test_dao):
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program "
                     "database.")
-    assert isinstance(DUT.do_select(2), RAMSTKMission)
+    assert isinstance(DUT.do_select_entity('mission', 2), RAMSTKMission)
 
 
 @pytest.mark.integration
@@ -100,12 +139,15 @@ def test_do_insert_phase(test_dao):
     DUT = dtmUsageProfile(test_dao)
     DUT.do_select_all(revision_id=1)
 
-    _error_code, _msg = DUT.do_insert(entity_id=2, parent_id=1, level='phase')
+    _error_code, _msg = DUT.do_insert(
+        entity_id=2, parent_id=DUT.get_node_id('mission', 2), level='phase')
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program "
                     "database.")
-    assert isinstance(DUT.do_select(12), RAMSTKMissionPhase)
+    _phase = DUT.tree.children(DUT.get_node_id('mission', 2))[-1].data
+    assert isinstance(_phase, RAMSTKMissionPhase)
+    assert DUT.do_select_entity('phase', _phase.phase_id) == _phase
 
 
 @pytest.mark.integration
@@ -115,12 +157,16 @@ def test_do_insert_environment(test_dao):
     DUT.do_select_all(revision_id=1)
 
     _error_code, _msg = DUT.do_insert(
-        entity_id=2, parent_id=11, level='environment')
+        entity_id=1, parent_id=DUT.get_node_id('phase', 1),
+        level='environment')
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Adding one or more items to the RAMSTK Program "
                     "database.")
-    assert isinstance(DUT.tree.get_node(112).data, RAMSTKEnvironment)
+    _environment = DUT.tree.children(DUT.get_node_id('phase', 1))[-1].data
+    assert isinstance(_environment, RAMSTKEnvironment)
+    assert DUT.do_select_entity('environment',
+                                _environment.environment_id) == _environment
 
 
 @pytest.mark.integration
@@ -145,7 +191,8 @@ def test_do_delete_environment(test_dao):
     DUT = dtmUsageProfile(test_dao)
     DUT.do_select_all(revision_id=1)
 
-    _error_code, _msg = DUT.do_delete(223)
+    _error_code, _msg = DUT.do_delete(
+        DUT.get_node_id('environment', DUT.dtm_environment.last_id))
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Deleting an item from the RAMSTK Program "
@@ -158,11 +205,11 @@ def test_do_delete_non_existent_node_id(test_dao):
     DUT = dtmUsageProfile(test_dao)
     DUT.do_select_all(revision_id=1)
 
-    _error_code, _msg = DUT.do_delete(4)
+    _error_code, _msg = DUT.do_delete(400)
 
     assert _error_code == 2005
     assert _msg == ("  RAMSTK ERROR: Attempted to delete non-existent Usage "
-                    "Profile entity with Node ID 4.")
+                    "Profile entity with Node ID 400.")
 
 
 @pytest.mark.integration
@@ -171,7 +218,7 @@ def test_do_update(test_dao):
     DUT = dtmUsageProfile(test_dao)
     DUT.do_select_all(revision_id=1)
 
-    _error_code, _msg = DUT.do_update(1)
+    _error_code, _msg = DUT.do_update(DUT.get_node_id('mission', 1))
 
     assert _error_code == 0
     assert _msg == ("RAMSTK SUCCESS: Updating the RAMSTK Program database.")
@@ -235,7 +282,7 @@ def test_request_do_delete(test_dao, test_configuration):
     DUT = dtcUsageProfile(test_dao, test_configuration, test=True)
     DUT.request_do_select_all(revision_id=1)
 
-    assert not DUT.request_do_delete(3)
+    assert not DUT.request_do_delete(dtmUsageProfile.get_node_id('mission', 3))
 
 
 @pytest.mark.integration
@@ -253,7 +300,8 @@ def test_request_get_attributes(test_dao, test_configuration):
     DUT = dtcUsageProfile(test_dao, test_configuration, test=True)
     DUT.request_do_select_all(revision_id=1)
 
-    _attributes = DUT.request_get_attributes(1)
+    _attributes = DUT.request_get_attributes(
+        dtmUsageProfile.get_node_id('mission', 1))
 
     assert isinstance(_attributes, dict)
     assert _attributes['revision_id'] == 1
@@ -265,7 +313,8 @@ def test_request_set_attributes(test_dao, test_configuration):
     DUT = dtcUsageProfile(test_dao, test_configuration, test=True)
     DUT.request_do_select_all(revision_id=1)
 
-    _error_code, _msg = DUT.request_set_attributes(1, ATTRIBUTES)
+    _error_code, _msg = DUT.request_set_attributes(
+        dtmUsageProfile.get_node_id('mission', 1), ATTRIBUTES)
 
     assert _error_code == 0
     assert _msg == ('RAMSTK SUCCESS: Updating RAMSTKMission 1 attributes.')
@@ -100,6 +100,22 @@ def test_do_open_program(test_common_dao, test_dao, test_configuration):
         'RAMSTK SUCCESS: Opening RAMSTK Program database {0:s}.'.format(_database))
 
 
+@pytest.mark.integration
+def test_do_open_program_default_profile(test_common_dao, test_dao,
+                                         test_configuration):
+    """ do_open_program() should use the SQLite performance profile in the RAMSTK configuration when no profile is passed. """
+    DUT = Model(test_common_dao, test_dao)
+
+    _configuration = test_configuration
+    _database = _configuration.RAMSTK_BACKEND + ':///' + \
+                _configuration.RAMSTK_PROG_INFO['database']
+    _profile = test_dao.db_set_profile('safe')
+    DUT.do_open_program(_database)
+
+    assert test_dao.db_set_profile(_profile) == (
+        RAMSTK.RAMSTK_CONFIGURATION.RAMSTK_SQLITE_PROFILE)
+
+
 @pytest.mark.integration
 def test_load_globals(test_common_dao, test_dao):
     """ load_globals() should return False on success. """